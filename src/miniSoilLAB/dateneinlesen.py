@@ -21,6 +21,12 @@ dateneinlesen.py   v0.7 (2023-09)
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
 
+# Dateigroesse und Zeitpunkt der letzten Aenderung aller eingelesenen Dateien zum Zeitpunkt des
+# Einlesens (fuer die Erstellung eines Manifests, siehe ManifestErstellen). Dateien, die in
+# Unterprozessen eingelesen werden, werden nach deren Abschluss ebenfalls hier eingetragen.
+_eingelesene_dateien = dict()
+
+
 # -------------------------------------------------------------------------------------------------
 def ExistiertDatei(dateiname):
     """Pruefe die Existenz einer Datei. Gibt True zurueck, falls die Datei vorhanden ist.
@@ -70,7 +76,7 @@ def BodenmusterdateiEinlesen(dateiname):
                     continue
 
                 schluessel = einzelteile[0].strip()
-                if (schluessel in eintraege.keys()):
+                if (schluessel in eintraege):
                     print('# Warnung: Eintrag in Zeile ' + str(idx_zeile) \
                         + ' wird ignoriert (Bodenname ' + schluessel + ' bereits eingelesen)')
                     continue
@@ -87,11 +93,15 @@ def BodenmusterdateiEinlesen(dateiname):
 
 # -------------------------------------------------------------------------------------------------
 def BodendatenMitSchluesselAusMusterEinlesen(muster, schluessel=None, ignoriere=['rohdaten', '.dta',
-    '.eax', '.gds', '.tvc'], verarbeitet=True):
+    '.eax', '.gds', '.tvc'], verarbeitet=True, prozesse=1, bodenprozesse=1, max_gleichzeitig=None,
+    fortschritt=None):
     """Lese alle Dateien der Boeden ein, die in muster hinterlegt sind (falls schluessel=None),
     oder nur diejenigen, die als Liste an schluessel uebergeben worden sind. Die Werte der Schluessel
     in muster entsprechen dem dateimuster und dem zielordner fuer den jeweiligen Bodennamen. Es
     werden alle Dateien ignoriert, in deren Namen sich ein in ignoriere definierter Begriff befindet.
+    Die Dateien eines Bodens werden in (maximal) prozesse Prozessen eingelesen. Ist bodenprozesse
+    groesser als eins, werden stattdessen ganze Boeden parallel verarbeitet (siehe
+    BodendatenAusMusterParallelEinlesen fuer max_gleichzeitig und fortschritt).
     """
     from .datenstruktur import Datenstruktur
 
@@ -99,6 +109,22 @@ def BodendatenMitSchluesselAusMusterEinlesen(muster, schluessel=None, ignoriere=
         schluessel = muster.keys()
 
     bodendaten = Datenstruktur()
+    if ((bodenprozesse is None) or (bodenprozesse > 1)):
+        eingelesen = dict()
+        for bodenname, tempboden in BodendatenAusMusterParallelEinlesen(muster=muster,
+            schluessel=schluessel, ignoriere=ignoriere, verarbeitet=verarbeitet,
+            prozesse=bodenprozesse, max_gleichzeitig=max_gleichzeitig, fortschritt=fortschritt):
+            eingelesen.update([(bodenname, tempboden)])
+
+        # Unabhaengig von der Reihenfolge der Fertigstellung in der Reihenfolge von schluessel einfuegen
+        for bodenname in schluessel:
+            if (eingelesen.get(bodenname, None) is not None):
+                bodendaten.update(eingelesen[bodenname])
+
+        return bodendaten
+
+    # Alle Zielordner nur einmal gemeinsam durchsuchen
+    verzeichnisindex = _VerzeichnisindexAusMuster(muster=muster, schluessel=schluessel)
     for bodenname in schluessel:
         try:
             dateimuster, zielordner = muster[bodenname]
@@ -107,7 +133,8 @@ def BodendatenMitSchluesselAusMusterEinlesen(muster, schluessel=None, ignoriere=
             continue
 
         tempboden = BodendatenEinlesen(bodenname=bodenname, dateimuster=dateimuster,
-            zielordner=zielordner, ignoriere=ignoriere, verarbeitet=verarbeitet)
+            zielordner=zielordner, ignoriere=ignoriere, verarbeitet=verarbeitet, prozesse=prozesse,
+            verzeichnisindex=verzeichnisindex)
         if (tempboden is None):
             print('# Warnung: Boden ' + bodenname + ' ungueltig (Pfad/Muster korrekt?)')
             continue
@@ -118,20 +145,174 @@ def BodendatenMitSchluesselAusMusterEinlesen(muster, schluessel=None, ignoriere=
 
 
 
+# -------------------------------------------------------------------------------------------------
+def BodendatenAusMusterParallelEinlesen(muster, schluessel=None, ignoriere=['rohdaten', '.dta',
+    '.eax', '.gds', '.tvc'], verarbeitet=True, prozesse=None, max_gleichzeitig=None,
+    fortschritt=None):
+    """Generator, der alle Boeden aus muster (bzw. nur die in schluessel angegebenen) auf (maximal)
+    prozesse Prozesse verteilt einliest (prozesse=None verwendet alle verfuegbaren Prozessoren).
+    Jeder Boden wird vollstaendig (inklusive Kennwertberechnungen, falls verarbeitet=True) in einem
+    Prozess verarbeitet. Es werden hoechstens max_gleichzeitig Boeden gleichzeitig bearbeitet
+    (Standard: doppelte Anzahl an Prozessen), um den Speicherbedarf zu begrenzen. Sobald ein Boden
+    fertig ist, wird [bodenname, boden] zurueckgegeben (boden ist None, falls der Boden nicht
+    eingelesen werden konnte). Falls eine Funktion fortschritt uebergeben wird, wird sie nach jedem
+    fertigen Boden mit fortschritt(anzahl_fertig, anzahl_gesamt, bodenname) aufgerufen.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    from .konstanten import EinstellungenAusgeben
+
+    if (schluessel is None):
+        schluessel = muster.keys()
+
+    # Alle Zielordner nur einmal gemeinsam durchsuchen und die Dateien je Boden direkt auswaehlen
+    verzeichnisindex = _VerzeichnisindexAusMuster(muster=muster, schluessel=schluessel)
+    auftraege = []
+    for bodenname in schluessel:
+        try:
+            dateimuster, zielordner = muster[bodenname]
+        except:
+            print('# Warnung: ' + bodenname + ' ist kein gueltiger Schluessel fuer die uebergebenen Muster')
+            continue
+
+        auftraege += [(bodenname, _BodendateienAuswaehlen(dateimuster=dateimuster,
+            zielordner=zielordner, ignoriere=ignoriere, verzeichnisindex=verzeichnisindex))]
+
+    if (len(auftraege) == 0):
+        return
+
+    if (prozesse is None):
+        prozesse = os.cpu_count() or 1
+
+    prozesse = max(1, min(prozesse, len(auftraege)))
+    if (max_gleichzeitig is None):
+        max_gleichzeitig = 2*prozesse
+
+    max_gleichzeitig = max(1, max_gleichzeitig)
+    anzahl_fertig = 0
+    with ProcessPoolExecutor(max_workers=prozesse, initializer=_ProzessInitialisieren,
+        initargs=(EinstellungenAusgeben(),)) as prozesspool:
+        laufend = dict()
+        idx_auftrag = 0
+        while ((idx_auftrag < len(auftraege)) or (len(laufend) > 0)):
+            # Neue Boeden erst starten, wenn die Anzahl laufender Boeden es zulaesst
+            while ((idx_auftrag < len(auftraege)) and (len(laufend) < max_gleichzeitig)):
+                bodenname, dateiliste = auftraege[idx_auftrag]
+                laufend.update([(prozesspool.submit(_BodenDateilisteOderNichts, bodenname=bodenname,
+                    dateiliste=dateiliste, verarbeitet=verarbeitet), bodenname)])
+                idx_auftrag += 1
+
+            fertig, _ = wait(list(laufend.keys()), return_when=FIRST_COMPLETED)
+            for auftrag in fertig:
+                bodenname = laufend.pop(auftrag)
+                tempboden, dateikennungen = auftrag.result()
+                # Die Dateikennungen sind im Unterprozess gemerkt worden und werden fuer ein
+                # spaeteres Manifest im Hauptprozess uebernommen
+                _eingelesene_dateien.update(dateikennungen)
+                if (tempboden is None):
+                    print('# Warnung: Boden ' + bodenname + ' ungueltig (Pfad/Muster korrekt?)')
+
+                anzahl_fertig += 1
+                if (fortschritt is not None):
+                    fortschritt(anzahl_fertig, len(auftraege), bodenname)
+
+                yield [bodenname, tempboden]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _BodenDateilisteOderNichts(bodenname, dateiliste, verarbeitet):
+    """Hilfsfunktion fuer parallele Prozesse, die alle Dateien aus dateiliste mit
+    BodendatenDateilisteEinlesen einliest. Gibt [boden, dateikennungen] zurueck, wobei boden None
+    ist, falls dateiliste leer ist. dateikennungen enthaelt die beim Einlesen gemerkten
+    Dateikennungen (siehe _DateikennungenMerken), damit sie im Hauptprozess uebernommen werden
+    koennen.
+    """
+    from os import path as os_path
+
+    if (dateiliste == []):
+        return [None, dict()]
+
+    boden = BodendatenDateilisteEinlesen(bodenname=bodenname, dateiliste=dateiliste,
+        verarbeitet=verarbeitet)
+    dateikennungen = dict()
+    for dateiname in dateiliste:
+        dateiname = os_path.abspath(dateiname)
+        if (dateiname in _eingelesene_dateien):
+            dateikennungen.update([(dateiname, _eingelesene_dateien[dateiname])])
+
+    return [boden, dateikennungen]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _VerzeichnisindexAusMuster(muster, schluessel):
+    """Erstellt einen gemeinsamen Verzeichnisindex fuer die Zielordner aller Boeden aus muster,
+    die in schluessel enthalten sind.
+    """
+    import os
+
+    zielordnerliste = []
+    for bodenname in schluessel:
+        try:
+            dateimuster, zielordner = muster[bodenname]
+        except:
+            continue
+
+        if ((zielordner != '') and (zielordner[-1] == os.sep)):
+            zielordner = zielordner[:-1]
+
+        zielordnerliste += [zielordner]
+
+    return VerzeichnisindexErstellen(zielordnerliste=zielordnerliste)
+
+
+
 # -------------------------------------------------------------------------------------------------
 def BodendatenEinlesen(bodenname, dateimuster, zielordner, ignoriere=['rohdaten', '.dta', '.eax',
-    '.gds', '.tvc'], verarbeitet=True):
+    '.gds', '.tvc'], verarbeitet=True, prozesse=1, verzeichnisindex=None, altdaten=None,
+    manifest=None):
     """Lese alle Dateien aus dem zielordner ein, die dateimuster enthalten. Speichere die
     eingelesenen Dateien in einer Struktur mit dem Schluessel bodenname und gib diese zurueck.
     Es werden alle Dateien ignoriert, in deren Namen sich ein in ignoriere definierter Begriff
-    befindet. Gibt None zurueck, falls keine Daten eingelesen werden koennen.
+    befindet. Die Dateien werden in (maximal) prozesse Prozessen eingelesen (siehe
+    BodendatenDateilisteEinlesen). Falls ein verzeichnisindex uebergeben wird, werden die Dateien
+    darin gesucht (siehe ZieldateienFinden). Gibt None zurueck, falls keine Daten eingelesen werden
+    koennen.
+
+    Falls bereits eingelesene altdaten des Bodens uebergeben werden, werden nur neue oder
+    veraenderte Dateien eingelesen (siehe BodendatenAktualisieren). Ohne manifest wird dazu das
+    Manifest der im aktuellen Programmlauf eingelesenen Dateien verwendet (siehe ManifestErstellen).
+    """
+    dateiliste = _BodendateienAuswaehlen(dateimuster=dateimuster, zielordner=zielordner,
+        ignoriere=ignoriere, verzeichnisindex=verzeichnisindex)
+    if (dateiliste == []):
+        return None
+
+    if (altdaten is not None):
+        if (manifest is None):
+            manifest = ManifestErstellen(bodendaten=altdaten)
+
+        return BodendatenAktualisieren(bodenname=bodenname, dateiliste=dateiliste,
+            altdaten=altdaten, manifest=manifest, verarbeitet=verarbeitet, prozesse=prozesse)
+
+    return BodendatenDateilisteEinlesen(bodenname=bodenname, dateiliste=dateiliste,
+        verarbeitet=verarbeitet, prozesse=prozesse)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _BodendateienAuswaehlen(dateimuster, zielordner, ignoriere, verzeichnisindex=None):
+    """Gibt die Liste aller Dateien aus dem zielordner zurueck, die dateimuster enthalten und in
+    deren Namen sich kein in ignoriere definierter Begriff befindet.
     """
     import os
 
     if (zielordner[-1] == os.sep):
         zielordner = zielordner[:-1]
 
-    temp_dateiliste = ZieldateienFinden(zielordner=zielordner, dateimuster=dateimuster)
+    temp_dateiliste = ZieldateienFinden(zielordner=zielordner, dateimuster=dateimuster,
+        verzeichnisindex=verzeichnisindex)
     dateiliste = []
     for dateiname in temp_dateiliste:
         ueberspringen = False
@@ -143,10 +324,7 @@ def BodendatenEinlesen(bodenname, dateimuster, zielordner, ignoriere=['rohdaten'
         if (not ueberspringen):
             dateiliste += [dateiname]
 
-    if (dateiliste == []):
-        return None
-    else:
-        return BodendatenDateilisteEinlesen(bodenname=bodenname, dateiliste=dateiliste, verarbeitet=verarbeitet)
+    return dateiliste
 
 
 
@@ -211,14 +389,15 @@ def ListendateiEinlesen(dateiname):
 
 
 # -------------------------------------------------------------------------------------------------
-def BodendatenListeEinlesen(dateiname, verarbeitet=True):
+def BodendatenListeEinlesen(dateiname, verarbeitet=True, prozesse=1):
     """Liest den Inhalt einer Listendatei (dateiname) ein, die eine Dateiliste fuer einen oder
     mehrere Boeden enthaelt. Die erste Zeile einer Liste enthaelt den Namen des Bodens mit einem
     abschliessenden Doppelpunkt und danach folgt eine Liste an Dateinamen (die nicht auf einem
     Doppelpunkt enden duerfen). Jede Zeile muss genau einem Dateinamen entsprechen, leer sein oder
     eine Kommentarzeile sein (Raute # als erstes Zeichen).
     Fuer alle Boeden werden alle Dateien eingelesen und in einer Struktur mit dem jeweiligen
-    Bodennamen als Schluessel gespeichert. Diese Struktur wird zurueckgegeben.
+    Bodennamen als Schluessel gespeichert. Diese Struktur wird zurueckgegeben. Die Dateien eines
+    Bodens werden in (maximal) prozesse Prozessen eingelesen.
     """
     from .datenstruktur import Datenstruktur
 
@@ -229,7 +408,7 @@ def BodendatenListeEinlesen(dateiname, verarbeitet=True):
     else:
         for bodenname, dateiliste in bodenliste.items():
             tempboden = BodendatenDateilisteEinlesen(bodenname=bodenname, dateiliste=dateiliste,
-                verarbeitet=verarbeitet)
+                verarbeitet=verarbeitet, prozesse=prozesse)
             if (tempboden is None):
                 print('# Warnung: Boden ' + bodenname + ' ungueltig (Dateinamen in Liste korrekt?)')
                 continue
@@ -288,9 +467,14 @@ def StrukturZuSchluesselInBasisstrukturHinzufuegen(basisstruktur, schluessel, st
 
 
 # -------------------------------------------------------------------------------------------------
-def BodendatenDateilisteEinlesen(bodenname, dateiliste, verarbeitet=True):
+def BodendatenDateilisteEinlesen(bodenname, dateiliste, verarbeitet=True, prozesse=1,
+    xlsxmodul='openpyxl'):
     """Lese alle Dateien aus dateiliste ein, speichere die eingelesenen Daten in einer Struktur mit
-    dem Schluessel bodenname und gib diese zurueck.
+    dem Schluessel bodenname und gib diese zurueck. Falls prozesse groesser als eins ist, werden die
+    Dateien parallel in (maximal) prozesse Prozessen eingelesen (prozesse=None verwendet alle
+    verfuegbaren Prozessoren) und die Kennwerte unabhaengiger Versuchsarten parallel berechnet. Die
+    Ergebnisse werden unabhaengig davon immer in der Reihenfolge von dateiliste zusammengefuehrt.
+    Das Modul zum Einlesen von xlsx-Dateien kann ueber xlsxmodul gewaehlt werden (siehe DateiEinlesen).
     """
     from .konstanten import debugmodus
     from .datenstruktur import Datenstruktur
@@ -303,9 +487,9 @@ def BodendatenDateilisteEinlesen(bodenname, dateiliste, verarbeitet=True):
 
         print('# ---')
 
+    _DateikennungenMerken(dateiliste=dateiliste)
     bodendaten = Datenstruktur()
-    for dateiname in dateiliste:
-        eingelesen = DateiEinlesen(dateiname=dateiname, verarbeitet=False)
+    for eingelesen in _DateienEinlesen(dateiliste=dateiliste, prozesse=prozesse, xlsxmodul=xlsxmodul):
         if (eingelesen is not None):
             if (len(eingelesen.keys()) == 0):
                 print('# Warnung: Keine Daten aus aktueller Datei eingelesen')
@@ -333,7 +517,7 @@ def BodendatenDateilisteEinlesen(bodenname, dateiliste, verarbeitet=True):
         if (debugmodus):
             print('# --- Berechne Kennwerte zu ' + bodenname)
 
-        if (not Kennwertberechnungen(daten=bodendaten)):
+        if (not Kennwertberechnungen(daten=bodendaten, prozesse=prozesse)):
             print('# Warnung: Es konnten nicht alle Kennwerte fuer Boden ' + bodenname + ' berechnet werden')
 
     boden = Datenstruktur()
@@ -347,9 +531,73 @@ def BodendatenDateilisteEinlesen(bodenname, dateiliste, verarbeitet=True):
 
 
 # -------------------------------------------------------------------------------------------------
-def DateiEinlesen(dateiname, verarbeitet=True):
+def _DateikennungenMerken(dateiliste):
+    """Merkt sich Dateigroesse und Zeitpunkt der letzten Aenderung aller Dateien aus dateiliste vor
+    dem Einlesen, damit spaetere Aenderungen an den Dateien im Manifest erkannt werden koennen.
+    """
+    from .zwischenspeicher import Dateikennung
+
+    for dateiname in dateiliste:
+        dateikennung = Dateikennung(dateiname=dateiname)
+        if (dateikennung is not None):
+            _eingelesene_dateien.update([(dateikennung[0], dateikennung[1:])])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DateienEinlesen(dateiliste, prozesse=1, xlsxmodul='openpyxl'):
+    """Lese alle Dateien aus dateiliste (unverarbeitet und xlsx-Dateien mit xlsxmodul) ein und gib
+    eine Liste der eingelesenen Strukturen in der gleichen Reihenfolge wie dateiliste zurueck. Bei
+    mehr als einem Prozess werden die Dateien auf einen Pool von Prozessen verteilt, in denen die
+    Vorlagen jeweils nur einmal beim Start eingelesen werden.
+    """
+    import os
+    from functools import partial
+    from concurrent.futures import ProcessPoolExecutor
+    from .konstanten import EinstellungenAusgeben
+
+    if (prozesse is None):
+        prozesse = os.cpu_count() or 1
+
+    prozesse = min(prozesse, len(dateiliste))
+    if (prozesse <= 1):
+        return [DateiEinlesen(dateiname=dateiname, verarbeitet=False, xlsxmodul=xlsxmodul)
+            for dateiname in dateiliste]
+
+    with ProcessPoolExecutor(max_workers=prozesse, initializer=_ProzessInitialisieren,
+        initargs=(EinstellungenAusgeben(),)) as prozesspool:
+        return list(prozesspool.map(partial(_DateiUnverarbeitetEinlesen, xlsxmodul=xlsxmodul),
+            dateiliste))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _ProzessInitialisieren(einstellungen):
+    """Wird beim Start jedes zusaetzlichen Prozesses aufgerufen. Uebernimmt die globalen
+    einstellungen des aufrufenden Prozesses und liest die Vorlagen einmalig ein.
+    """
+    from .konstanten import EinstellungenSetzen
+    from .xlshilfen import VorlagenLaden
+
+    EinstellungenSetzen(einstellungen=einstellungen)
+    VorlagenLaden()
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DateiUnverarbeitetEinlesen(dateiname, xlsxmodul='openpyxl'):
+    """Hilfsfunktion fuer parallele Prozesse, um die Datei namens dateiname unverarbeitet einzulesen.
+    """
+    return DateiEinlesen(dateiname=dateiname, verarbeitet=False, xlsxmodul=xlsxmodul)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def DateiEinlesen(dateiname, verarbeitet=True, xlsxmodul='openpyxl'):
     """Lese die Datei namens dateiname ein, sofern es sich um einen unterstuetzten Dateityp/-namen
-    handelt.
+    handelt. Die Messdaten der Tabellen (siehe xlshilfen.MessreihenAusVorlagenErstellen) und die
+    Datenspalten von Rohdaten werden als Messreihe gespeichert. xlsx-Dateien werden mit dem ueber
+    xlsxmodul gewaehlten Modul eingelesen (siehe xlshilfen.LeseXLSDaten).
     """
     from .konstanten import debugmodus
     from .xlshilfen import LeseXLSDaten
@@ -360,51 +608,55 @@ def DateiEinlesen(dateiname, verarbeitet=True):
         if (not verarbeitet):
             ignoriere = []
 
-        return LeseXLSDaten(dateiname=dateiname, verarbeitet=verarbeitet, ignoriere=ignoriere)
+        eingelesen = LeseXLSDaten(dateiname=dateiname, verarbeitet=verarbeitet, ignoriere=ignoriere,
+            xlsxmodul=xlsxmodul)
     elif (dateiname[-3:].lower() == 'dta'):
         if (debugmodus):
             print('# - LeseDTA: ' + dateiname)
 
-        return LeseDTADaten(dateiname=dateiname)
+        eingelesen = LeseDTADaten(dateiname=dateiname, als_array=True)
     elif (dateiname[-3:].lower() == 'eax'):
         if (debugmodus):
             print('# - LeseEAX: ' + dateiname)
 
-        return LeseEAXDaten(dateiname=dateiname)
+        eingelesen = LeseEAXDaten(dateiname=dateiname, als_array=True)
     elif (dateiname[-3:].lower() == 'gds'):
         if (debugmodus):
             print('# - LeseGDS: ' + dateiname)
 
-        return LeseGDSDaten(dateiname=dateiname)
+        eingelesen = LeseGDSDaten(dateiname=dateiname, als_array=True)
     elif (dateiname[-3:].lower() == 'tvc'):
         if (debugmodus):
             print('# - LeseTVC: ' + dateiname)
 
-        return LeseTVCDaten(dateiname=dateiname)
+        eingelesen = LeseTVCDaten(dateiname=dateiname, als_array=True)
     elif (dateiname[-3:].lower() == 'kvs'):
         if (debugmodus):
             print('# - LeseKVS: ' + dateiname)
 
-        return LeseKVSDaten(dateiname=dateiname)
+        eingelesen = LeseKVSDaten(dateiname=dateiname)
     else:
         #print('# Hinweis: Ignoriere ' + dateiname)
         return None
 
+    return eingelesen
+
 
 
 # -------------------------------------------------------------------------------------------------
-def ZieldateienFinden(zielordner, dateimuster, ignoriereOrdnernamen=['alt']):
+def ZieldateienFinden(zielordner, dateimuster, ignoriereOrdnernamen=['alt'], verzeichnisindex=None):
     """Ermittle im zielordner und allen Unterordnern alle Dateien, deren Namen dateimuster enthaelt.
     Falls ignoriereOrdnernamen keine leere Liste ist, werden alle Unterordner in der Liste ignoriert
     (deren Name einem der Eintraege entspricht).
-    Gibt eine Liste aller Dateinamen der so ausgewaehlten Dateien zurueck.
+    Gibt eine Liste aller Dateinamen der so ausgewaehlten Dateien zurueck. Falls ein mit
+    VerzeichnisindexErstellen() erstellter verzeichnisindex uebergeben wird, der zielordner enthaelt,
+    werden die Dateien dort gesucht anstatt das Dateisystem erneut zu durchlaufen.
 
     Kann auch zum Testen von Bodenmusterdatei-Eintraegen verwendet werden. Wenn Pfad und regulaerer
     Ausdruck richtig gewaehlt sind, sollten exakt die gewuenschten Dateien aufgelistet/eingelesen
     werden. Fuer die Wahl von sinnvollen regulaeren Ausdrucken sei auf das Python-Modul re und
     die offizielle Dokumentation verwiesen (Standard Library Reference unter https://docs.python.org)
     """
-    from os import walk as os_walk
     from os import sep as os_sep
     from os.path import join as os_join
     from re import compile as re_compile
@@ -413,11 +665,7 @@ def ZieldateienFinden(zielordner, dateimuster, ignoriereOrdnernamen=['alt']):
     if ((dateimuster == '*') or (dateimuster == '*.*')):
         dateimuster = ''
 
-    if (zielordner == ''):
-        zielordner = '.'
-
-    if (zielordner[-1] != os_sep):
-        zielordner += os_sep
+    zielordner = _Zielordnerpfad(zielordner=zielordner)
 
     try:
         remuster = re_compile(dateimuster)
@@ -425,14 +673,22 @@ def ZieldateienFinden(zielordner, dateimuster, ignoriereOrdnernamen=['alt']):
         print('# Warnung: Fehler im regulaeren Ausdruck \"' + dateimuster + '\"')
         return []
 
+    if ((verzeichnisindex is None) or ((zielordner not in verzeichnisindex)
+        and (zielordner[:-1] not in verzeichnisindex))):
+        verzeichnisindex = VerzeichnisindexErstellen(zielordnerliste=[zielordner],
+            ignoriereOrdnernamen=ignoriereOrdnernamen)
+
     zieldateiliste = []
-    for (pfad, _, dateiliste) in os_walk(zielordner):
+    for pfad in verzeichnisindex.keys():
+        if (not (pfad + os_sep).startswith(zielordner)):
+            continue
+
         # Ignoriere alle Dateien aus (Unter-)ordner eines Eintrags aus ignoriereOrdnernamen
         unterpfad = pfad[len(zielordner):].split(os_sep)
         if (any([pfadteil in ignoriereOrdnernamen for pfadteil in unterpfad])):
             continue
 
-        for datei in dateiliste:
+        for datei in verzeichnisindex[pfad]:
             if (re_search(remuster, datei)):
                 zieldateiliste += [os_join(pfad, datei)]
 
@@ -443,12 +699,93 @@ def ZieldateienFinden(zielordner, dateimuster, ignoriereOrdnernamen=['alt']):
 
 
 
+# -------------------------------------------------------------------------------------------------
+def _Zielordnerpfad(zielordner):
+    """Gibt zielordner in der in ZieldateienFinden() verwendeten Form zurueck (mit abschliessendem
+    Trennzeichen und "." fuer einen leeren zielordner).
+    """
+    from os import sep as os_sep
+
+    if (zielordner == ''):
+        zielordner = '.'
+
+    if (zielordner[-1] != os_sep):
+        zielordner += os_sep
+
+    return zielordner
+
+
+
+# -------------------------------------------------------------------------------------------------
+def VerzeichnisindexErstellen(zielordnerliste, ignoriereOrdnernamen=['alt']):
+    """Durchlaeuft alle Ordner aus zielordnerliste (und deren Unterordner) einmalig und gibt einen
+    Verzeichnisindex zurueck, der fuer jeden besuchten Ordner die Liste der enthaltenen Dateinamen
+    enthaelt. Ordner, die in einem anderen Ordner der Liste liegen, werden dabei nicht erneut
+    durchlaufen. Unterordner, deren Name in ignoriereOrdnernamen enthalten ist, werden bereits beim
+    Durchlaufen uebersprungen (ausser sie sind fuer einen der Zielordner selbst erforderlich).
+    Der Verzeichnisindex kann an ZieldateienFinden() uebergeben werden, um fuer viele Muster in
+    den gleichen Ordnern nur einmal das Dateisystem zu durchsuchen.
+    """
+    from os import walk as os_walk
+    from os import sep as os_sep
+
+    zielordnerliste = sorted(set([_Zielordnerpfad(zielordner=zielordner)
+        for zielordner in zielordnerliste]))
+    verzeichnisindex = dict()
+    startordnerliste = []
+    for zielordner in zielordnerliste:
+        if (not any([zielordner.startswith(startordner) for startordner in startordnerliste])):
+            startordnerliste += [zielordner]
+
+    for startordner in startordnerliste:
+        for (pfad, ordnerliste, dateiliste) in os_walk(startordner):
+            verzeichnisindex.update([(pfad, dateiliste)])
+            # Ignorierte Unterordner gar nicht erst durchlaufen, sofern sie nicht auf dem Weg zu
+            # einem anderen Zielordner liegen
+            ordnerliste[:] = [ordner for ordner in ordnerliste if ((ordner not in ignoriereOrdnernamen)
+                or any([zielordner.startswith(pfad + ordner + os_sep) or zielordner.startswith(
+                    pfad + os_sep + ordner + os_sep) for zielordner in zielordnerliste]))]
+
+    # Zielordner, die (bspw. wegen symbolischer Verknuepfungen) nicht erreicht worden sind, separat
+    # durchlaufen
+    for zielordner in zielordnerliste:
+        if ((zielordner not in verzeichnisindex) and (zielordner[:-1] not in verzeichnisindex)):
+            for (pfad, ordnerliste, dateiliste) in os_walk(zielordner):
+                verzeichnisindex.update([(pfad, dateiliste)])
+                ordnerliste[:] = [ordner for ordner in ordnerliste if (ordner not in ignoriereOrdnernamen)]
+
+    return verzeichnisindex
+
+
+
 # -------------------------------------------------------------------------------------------------
 def DatensatzEinlesen(dateiname):
     """Lade eine JSON-formatierte Datei, die mit Datensatz_Speichern erstellt worden ist. Gib die
-    eingelesene Struktur zurueck.
+    eingelesene Struktur zurueck, in der die Messdaten aller Versuche als Messreihe gespeichert sind
+    (siehe xlshilfen.MessreihenAusVorlagenErstellen).
     """
-    return _JSONDateiEinlesen(dateiname, bezeichnung='Datensatz')
+    from .konstanten import gueltige_vorlagen
+    from .xlshilfen import MessreihenAusVorlagenErstellen
+
+    datensatz = _JSONDateiEinlesen(dateiname, bezeichnung='Datensatz')
+    if (datensatz is None):
+        return None
+
+    for bodenname in datensatz.keys():
+        boden = datensatz[bodenname]
+        if (not isinstance(boden, dict)):
+            continue
+
+        for versuchsart in boden.keys():
+            if ((versuchsart not in gueltige_vorlagen) or (not isinstance(boden[versuchsart], dict))):
+                continue
+
+            for referenz in boden[versuchsart].keys():
+                if (referenz.startswith('_Ref_') and isinstance(boden[versuchsart][referenz], dict)):
+                    MessreihenAusVorlagenErstellen(daten=boden[versuchsart][referenz],
+                        versuchsart=versuchsart)
+
+    return datensatz
 
 
 
@@ -488,12 +825,16 @@ def _DatensatzSpeichern(datensatz, dateiname):
     """Speichere die Stuktur datensatz als JSON-formatierte Datei namens dateiname.
     """
     import json
+    from .datenstruktur import Messreihe
 
     class DatenstrukturEncoder(json.JSONEncoder):
         """Einfacher Encoder fuer Objekte der Datenstruktur-Klasse. Kovertiert Datenstruktur-Elemente
-        in dicts und schreibt alle Listeneintraege in eine Zeile.
+        in dicts, Messreihen in Listen und schreibt alle Listeneintraege in eine Zeile.
         """
         def default(self, o):
+            if (isinstance(o, Messreihe)):
+                return o.tolist()
+
             return o.__dict__
 
         def iterencode(self, eintrag, _one_shot=False):
@@ -524,9 +865,11 @@ def _DatensatzSpeichern(datensatz, dateiname):
 
 
 # -------------------------------------------------------------------------------------------------
-def DatensatzSpeichern(datensatz, dateiname, refspeichern=True):
+def DatensatzSpeichern(datensatz, dateiname, refspeichern=True, manifest=False):
     """Speichere die Stuktur datensatz als JSON-formatierte Datei namens dateiname. Mit
     respeichern=False werden die Rohdaten und Verweise darauf nicht der Datei gespeichert.
+    Mit manifest=True wird zusaetzlich ein Manifest der eingelesenen Dateien gespeichert
+    (siehe ManifestSpeichern), mit dem der Datensatz spaeter inkrementell aktualisiert werden kann.
     """
     import copy
     from .datenstruktur import EintraegeEntfernen
@@ -538,4 +881,304 @@ def DatensatzSpeichern(datensatz, dateiname, refspeichern=True):
 
     _DatensatzSpeichern(datensatz=ausgabedaten, dateiname=dateiname)
 
+    if (manifest):
+        if (not refspeichern):
+            print('# Warnung: Ohne gespeicherte Rohdaten wird kein Manifest gespeichert')
+        else:
+            ManifestSpeichern(datensatz=datensatz, dateiname=dateiname)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Manifestdateiname(dateiname):
+    """Gibt den Namen der Manifestdatei zum Datensatz dateiname zurueck.
+    """
+    return dateiname + '.manifest'
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ManifestErstellen(bodendaten):
+    """Erstellt ein Manifest aller Dateien, aus denen die Versuche in bodendaten eingelesen worden
+    sind. Gibt eine Liste zurueck, die fuer jede Datei ein dict mit Dateiname, Groesse, Aenderung
+    (Zeitpunkt der letzten Aenderung in ns), Pruefsumme (des Dateiinhalts), Vorlage (Pruefsumme der
+    verwendeten Vorlagen), Versuchsart und Referenz (_Ref_-Bezeichnung in bodendaten) enthaelt.
+    Groesse und Aenderung entsprechen dem Zustand der Datei beim Einlesen. Falls die Datei seitdem
+    veraendert worden ist, wird keine Pruefsumme gespeichert, damit sie beim naechsten
+    Aktualisieren erneut eingelesen wird.
+    """
+    from os import path as os_path
+    from .xlshilfen import VorlagenpruefsummeVersuchsart
+    from .zwischenspeicher import Dateikennung
+
+    manifest = []
+    for versuchsart in bodendaten.keys():
+        versuch = bodendaten[versuchsart]
+        if (not isinstance(versuch, dict)):
+            continue
+
+        for referenz in versuch.keys():
+            if ((not referenz.startswith('_Ref_')) or (not isinstance(versuch[referenz], dict))):
+                continue
+
+            dateiname = versuch[referenz].get('Dateiname', None)
+            if (dateiname is None):
+                continue
+
+            dateikennung = Dateikennung(dateiname=dateiname)
+            if (dateikennung is None):
+                print('# Warnung: Datei ' + dateiname + ' fuer Manifest nicht gefunden')
+                continue
+
+            eingelesen = _eingelesene_dateien.get(dateikennung[0], dateikennung[1:])
+            pruefsumme = None
+            if (eingelesen == dateikennung[1:]):
+                pruefsumme = _DateiPruefsumme(dateiname=dateiname)
+
+            vorlage = ''
+            if ((dateiname[-3:].lower() == 'xls') or (dateiname[-4:].lower() == 'xlsx')):
+                vorlage = VorlagenpruefsummeVersuchsart(versuchsart=versuchsart)
+
+            manifest += [dict([('Dateiname', os_path.abspath(dateiname)), ('Groesse', eingelesen[0]),
+                ('Aenderung', eingelesen[1]), ('Pruefsumme', pruefsumme), ('Vorlage', vorlage),
+                ('Versuchsart', versuchsart), ('Referenz', referenz)])]
+
+    return manifest
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DateiPruefsumme(dateiname):
+    """Gibt die Pruefsumme des Inhalts der Datei dateiname zurueck oder None, falls die Datei nicht
+    gelesen werden kann.
+    """
+    from .zwischenspeicher import Pruefsumme
+
+    try:
+        with open(dateiname, 'rb') as datei:
+            return Pruefsumme(daten=datei.read())
+    except OSError:
+        return None
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ManifestSpeichern(datensatz, dateiname):
+    """Speichert fuer alle Boeden in datensatz ein Manifest der eingelesenen Dateien (siehe
+    ManifestErstellen) als JSON-formatierte Datei neben dem Datensatz dateiname.
+    """
+    manifest = dict()
+    for bodenname in datensatz.keys():
+        manifest.update([(bodenname, ManifestErstellen(bodendaten=datensatz[bodenname]))])
+
+    _DatensatzSpeichern(datensatz=manifest, dateiname=_Manifestdateiname(dateiname=dateiname))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ManifestEinlesen(dateiname):
+    """Liest das Manifest zum Datensatz dateiname ein und gibt es zurueck (oder None, falls es
+    nicht existiert oder nicht eingelesen werden kann).
+    """
+    manifestdatei = _Manifestdateiname(dateiname=dateiname)
+    if (not ExistiertDatei(manifestdatei)):
+        return None
+
+    return _JSONDateiEinlesen(manifestdatei, bezeichnung='Manifest')
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DateiUnveraendert(dateiname, eintrag):
+    """Prueft anhand eines Manifesteintrags, ob die Datei dateiname seit dem letzten Einlesen
+    unveraendert geblieben ist. Stimmen Groesse und Zeitpunkt der letzten Aenderung ueberein, wird
+    die Datei als unveraendert angesehen. Bei gleicher Groesse aber anderem Zeitpunkt entscheidet die
+    Pruefsumme des Dateiinhalts. Zusaetzlich muessen die verwendeten Vorlagen unveraendert sein.
+    """
+    from .xlshilfen import VorlagenpruefsummeVersuchsart
+    from .zwischenspeicher import Dateikennung
+
+    dateikennung = Dateikennung(dateiname=dateiname)
+    if ((dateikennung is None) or (eintrag.get('Pruefsumme', None) is None)):
+        return False
+
+    if (dateikennung[1] != eintrag['Groesse']):
+        return False
+
+    if (eintrag['Vorlage'] != ''):
+        if (eintrag['Vorlage'] != VorlagenpruefsummeVersuchsart(versuchsart=eintrag['Versuchsart'])):
+            return False
+
+    if (dateikennung[2] == eintrag['Aenderung']):
+        return True
+
+    return (_DateiPruefsumme(dateiname=dateiname) == eintrag['Pruefsumme'])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def BodendatenAktualisieren(bodenname, dateiliste, altdaten, manifest, verarbeitet=True, prozesse=1,
+    xlsxmodul='openpyxl'):
+    """Aktualisiert die (mit gespeicherten Rohdaten) eingelesenen altdaten eines Bodens bodenname,
+    so dass sie den Dateien in dateiliste entsprechen. Dazu werden anhand der Eintraege aus dem
+    manifest (siehe ManifestErstellen) nur neue oder veraenderte Dateien eingelesen, waehrend die
+    Daten unveraenderter Dateien aus altdaten uebernommen werden. Die Kennwerte werden nur fuer
+    Versuchsarten neu berechnet, deren Dateien sich geaendert haben, sowie fuer alle Versuchsarten,
+    die von deren Kennwerten abhaengen. Das Ergebnis entspricht dem von BodendatenDateilisteEinlesen
+    und wird in einer Struktur mit dem Schluessel bodenname zurueckgegeben (oder None, falls keine
+    Daten eingelesen werden koennen).
+    """
+    from os import path as os_path
+    from .konstanten import debugmodus
+    from .datenstruktur import Datenstruktur
+    from .kennwerte import Kennwertberechnungen, BetroffeneVorlagen
+
+    if (manifest is None):
+        manifest = []
+
+    manifesteintraege = dict([(eintrag['Dateiname'], eintrag) for eintrag in manifest])
+    uebernommen = dict()
+    einzulesen = []
+    for dateiname in dateiliste:
+        eintrag = manifesteintraege.get(os_path.abspath(dateiname), None)
+        if (eintrag is not None):
+            try:
+                altstruktur = altdaten[eintrag['Versuchsart']][eintrag['Referenz']]
+            except:
+                altstruktur = None
+
+            if ((altstruktur is not None) and _DateiUnveraendert(dateiname=dateiname, eintrag=eintrag)):
+                # Die Datei entspricht weiterhin den uebernommenen Daten
+                _DateikennungenMerken(dateiliste=[dateiname])
+                uebernommen.update([(dateiname, Datenstruktur({eintrag['Versuchsart']: altstruktur}))])
+                continue
+
+        einzulesen += [dateiname]
+
+    if (debugmodus):
+        print('# --- ' + bodenname + ': ' + str(len(einzulesen)) + ' von ' + str(len(dateiliste))
+            + ' Dateien neu einzulesen')
+
+    _DateikennungenMerken(dateiliste=einzulesen)
+    neu_eingelesen = dict(zip(einzulesen, _DateienEinlesen(dateiliste=einzulesen, prozesse=prozesse,
+        xlsxmodul=xlsxmodul)))
+
+    bodendaten = Datenstruktur()
+    alte_dateien = dict()
+    neue_dateien = dict()
+    geaendert = set()
+    for eintrag in manifest:
+        alte_dateien.update([(eintrag['Versuchsart'], alte_dateien.get(eintrag['Versuchsart'], [])
+            + [[eintrag['Referenz'], eintrag['Dateiname']]])])
+
+    for dateiname in dateiliste:
+        if (dateiname in uebernommen):
+            eingelesen = uebernommen[dateiname]
+        else:
+            eingelesen = neu_eingelesen[dateiname]
+
+        if (eingelesen is None):
+            continue
+
+        if (len(eingelesen.keys()) == 0):
+            print('# Warnung: Keine Daten aus aktueller Datei eingelesen')
+            continue
+
+        schluesselliste = list(eingelesen.keys())
+        if (len(schluesselliste) > 1):
+            print('# Warnung: Mehrere Schluessel in einer Datei nicht unterstuetzt - ignoriere Eintraege')
+            continue
+
+        schluessel = schluesselliste[0]
+        referenz = StrukturZuSchluesselInBasisstrukturHinzufuegen(basisstruktur=bodendaten,
+            schluessel=schluessel, struktur=eingelesen[schluessel])
+        neue_dateien.update([(schluessel, neue_dateien.get(schluessel, [])
+            + [[referenz, os_path.abspath(dateiname)]])])
+        if (dateiname not in uebernommen):
+            geaendert.add(schluessel)
+
+    if (len(bodendaten.keys()) == 0):
+        return None
+
+    # Versuchsarten mit hinzugekommenen, entfernten oder umsortierten Dateien
+    for schluessel in set(list(alte_dateien.keys()) + list(neue_dateien.keys())):
+        if (sorted(alte_dateien.get(schluessel, [])) != neue_dateien.get(schluessel, [])):
+            geaendert.add(schluessel)
+
+    neu_berechnen = BetroffeneVorlagen(geaenderte_vorlagen=geaendert)
+    if (verarbeitet):
+        # Bereits berechnete Kennwerte unveraenderter Versuchsarten uebernehmen
+        for schluessel in bodendaten.keys():
+            if (schluessel in neu_berechnen):
+                continue
+
+            for eintrag in altdaten[schluessel].keys():
+                if (not eintrag.startswith('_Ref_')):
+                    bodendaten[schluessel].update([(eintrag, altdaten[schluessel][eintrag])])
+
+    bodendaten.update([('Basisordner', BasispfadErmitteln(dateiliste))])
+
+    if (verarbeitet and (neu_berechnen != [])):
+        if (debugmodus):
+            print('# --- Berechne Kennwerte zu ' + bodenname + ' neu: ' + ', '.join(neu_berechnen))
+
+        if (not Kennwertberechnungen(daten=bodendaten, auswahl=neu_berechnen, prozesse=prozesse)):
+            print('# Warnung: Es konnten nicht alle Kennwerte fuer Boden ' + bodenname + ' berechnet werden')
+
+    boden = Datenstruktur()
+    boden.update([(bodenname, bodendaten)])
+    return boden
+
+
+
+# -------------------------------------------------------------------------------------------------
+def DatensatzMitMusterAktualisieren(dateiname, muster, schluessel=None, ignoriere=['rohdaten',
+    '.dta', '.eax', '.gds', '.tvc'], verarbeitet=True, prozesse=1):
+    """Liest den mit DatensatzSpeichern(..., manifest=True) gespeicherten Datensatz dateiname und
+    das zugehoerige Manifest ein und aktualisiert alle Boeden aus muster (bzw. nur diejenigen aus
+    schluessel) mit BodendatenAktualisieren. Boeden ohne Eintrag im Datensatz werden vollstaendig
+    eingelesen. Gibt den aktualisierten Datensatz zurueck, der anschliessend wieder mit
+    DatensatzSpeichern(..., manifest=True) gespeichert werden kann.
+    """
+    from .datenstruktur import Datenstruktur
+
+    if (schluessel is None):
+        schluessel = muster.keys()
+
+    altdatensatz = None
+    if (ExistiertDatei(dateiname)):
+        altdatensatz = DatensatzEinlesen(dateiname=dateiname)
+
+    if (altdatensatz is None):
+        altdatensatz = Datenstruktur()
+
+    altmanifest = ManifestEinlesen(dateiname=dateiname)
+    if (altmanifest is None):
+        altmanifest = dict()
+
+    verzeichnisindex = _VerzeichnisindexAusMuster(muster=muster, schluessel=schluessel)
+    bodendaten = Datenstruktur()
+    for bodenname in schluessel:
+        try:
+            dateimuster, zielordner = muster[bodenname]
+        except:
+            print('# Warnung: ' + bodenname + ' ist kein gueltiger Schluessel fuer die uebergebenen Muster')
+            continue
+
+        dateiliste = _BodendateienAuswaehlen(dateimuster=dateimuster, zielordner=zielordner,
+            ignoriere=ignoriere, verzeichnisindex=verzeichnisindex)
+        tempboden = None
+        if (dateiliste != []):
+            tempboden = BodendatenAktualisieren(bodenname=bodenname, dateiliste=dateiliste,
+                altdaten=altdatensatz.get(bodenname, Datenstruktur()),
+                manifest=altmanifest.get(bodenname, None), verarbeitet=verarbeitet, prozesse=prozesse)
+
+        if (tempboden is None):
+            print('# Warnung: Boden ' + bodenname + ' ungueltig (Pfad/Muster korrekt?)')
+            continue
+
+        bodendaten.update(tempboden)
+
+    return bodendaten
+
 
@@ -20,20 +20,149 @@ datenstruktur.py   v0.3 (2023-09)
 # You should have received a copy of the GNU General Public License
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+
+
+# -------------------------------------------------------------------------------------------------
+class Messreihe(array):
+    """Kompakte Spalte aus Gleitkommazahlen (array mit Typcode d), die sich beim Lesen wie eine Liste
+    verhaelt. Gegenueber einer Liste aus float-Objekten wird nur etwa ein Drittel des Speichers
+    benoetigt. Vergleiche und Verkettungen mit Listen sind moeglich; enthaelt die verkettete Liste
+    nicht nur Gleitkommazahlen, wird eine Liste zurueckgegeben. Anders als in einer Liste koennen
+    keine anderen Werte (bspw. None oder Text) gespeichert werden und beim Speichern als JSON wird
+    der DatenstrukturEncoder benoetigt. Deshalb werden nur eingelesene Messdaten (siehe
+    MessreihenErstellen) und die berechneten Verlaeufe der Auswertungsfunktionen (siehe bspw.
+    verarbeitung_oedometer) als Messreihe gespeichert.
+    """
+    def __new__(cls, werte=()):
+        return super().__new__(cls, 'd', werte)
+
+    def __eq__(self, anderes):
+        if (isinstance(anderes, list)):
+            return self.tolist() == anderes
+
+        return super().__eq__(anderes)
+
+    def __ne__(self, anderes):
+        return not self.__eq__(anderes)
+
+    def __add__(self, anderes):
+        if (isinstance(anderes, array) or _NurGleitkommazahlen(liste=anderes)):
+            verkettet = Messreihe(self)
+            verkettet.extend(anderes)
+            return verkettet
+
+        return self.tolist() + list(anderes)
+
+    def __radd__(self, anderes):
+        if (_NurGleitkommazahlen(liste=anderes)):
+            verkettet = Messreihe(anderes)
+            verkettet.extend(self)
+            return verkettet
+
+        return list(anderes) + self.tolist()
+
+    def __iadd__(self, anderes):
+        self.extend(anderes)
+        return self
+
+    def __mul__(self, anzahl):
+        return Messreihe(super().__mul__(anzahl))
+
+    def __rmul__(self, anzahl):
+        return Messreihe(super().__mul__(anzahl))
+
+    def clear(self):
+        del self[:]
+
+    def __getitem__(self, idx):
+        if (isinstance(idx, slice)):
+            return Messreihe(super().__getitem__(idx))
+
+        return super().__getitem__(idx)
+
+    def __setitem__(self, idx, wert):
+        if (isinstance(idx, slice) and (not isinstance(wert, array))):
+            wert = array('d', wert)
+
+        super().__setitem__(idx, wert)
+
+    def copy(self):
+        return Messreihe(self)
+
+    def sort(self, key=None, reverse=False):
+        self[:] = array('d', sorted(self, key=key, reverse=reverse))
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __reduce_ex__(self, protokoll):
+        return (Messreihe, (array('d', self),))
+
+    def __deepcopy__(self, memo):
+        return Messreihe(self)
+
+
 
 # -------------------------------------------------------------------------------------------------
 class Datenstruktur(dict):
     """Mini-Klasse zur Verwaltung von dict-Datenstrukturen mit angepasster Darstellung bei der
     Ausgabe (sortierte Schluessel, Unterstrukturen nicht automatisch aufklappen, Zeilenumbruch bei
-    print-Befehlen).
+    print-Befehlen). Die sortierten Schluessel werden erst bei Bedarf bestimmt und bis zur naechsten
+    Aenderung zwischengespeichert, keys() gibt davon jeweils eine neue Liste zurueck. Die Attribute
+    sind ueber __slots__ festgelegt, so dass keine Struktur ein eigenes Attribut-dict benoetigt.
     """
+    __slots__ = ('_sortierte_schluessel', 'komplettausgabe', 'max_eintraege')
+
     def __init__(self, daten=None):
+        self._sortierte_schluessel = None
         if (daten is not None):
             self.update(daten)
 
         self.komplettausgabe = False
         self.max_eintraege = 6
 
+    def __setitem__(self, schluessel, wert):
+        self._sortierte_schluessel = None
+        super().__setitem__(schluessel, wert)
+
+    def __delitem__(self, schluessel):
+        self._sortierte_schluessel = None
+        super().__delitem__(schluessel)
+
+    def __ior__(self, daten):
+        self._sortierte_schluessel = None
+        return super().__ior__(daten)
+
+    def update(self, *args, **kwargs):
+        self._sortierte_schluessel = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, schluessel, standardwert=None):
+        self._sortierte_schluessel = None
+        return super().setdefault(schluessel, standardwert)
+
+    def pop(self, *args):
+        self._sortierte_schluessel = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._sortierte_schluessel = None
+        return super().popitem()
+
+    def clear(self):
+        self._sortierte_schluessel = None
+        super().clear()
+
+    def __getstate__(self):
+        # Zwischengespeicherte Schluessel werden nicht mit gespeichert/kopiert
+        return {'komplettausgabe': self.komplettausgabe, 'max_eintraege': self.max_eintraege}
+
+    def __setstate__(self, zustand):
+        self._sortierte_schluessel = None
+        self.komplettausgabe = zustand.get('komplettausgabe', False)
+        self.max_eintraege = zustand.get('max_eintraege', 6)
+
     def __repr__(self):
         return self.show(newline=False)
 
@@ -61,7 +190,7 @@ class Datenstruktur(dict):
                 if isinstance(aktueller_wert, str):
                     wert = '\'' + str(aktueller_wert) + '\''
                 elif ((not self.komplettausgabe) and \
-                        ((isinstance(aktueller_wert, list) or isinstance(aktueller_wert, tuple)))):
+                        ((isinstance(aktueller_wert, (list, Messreihe)) or isinstance(aktueller_wert, tuple)))):
                     if (len(aktueller_wert) > self.max_eintraege):
                         wert = '[' + ', '.join([str(aktueller_wert[idx]) for idx in range(self.max_eintraege)]) + ', ...]'
                     else:
@@ -77,13 +206,82 @@ class Datenstruktur(dict):
             return '{' + ', '.join(eintraege) + '}'
 
     def keys(self):
-        return sorted(super().keys())
+        sortierte_schluessel = getattr(self, '_sortierte_schluessel', None)
+        if (sortierte_schluessel is None):
+            sortierte_schluessel = tuple(sorted(super().keys()))
+            self._sortierte_schluessel = sortierte_schluessel
+
+        return list(sortierte_schluessel)
 
     def togglefull(self):
         self.komplettausgabe = not self.komplettausgabe
 
 
 
+# -------------------------------------------------------------------------------------------------
+class Vorlagenstruktur(Datenstruktur):
+    """Basisklasse der aus einer Vorlage erzeugten Klassen (siehe vorlagen.Vorlagenklasse). In felder
+    sind alle Schluessel der Vorlage mit der Art ihres Eintrags gespeichert: str fuer Einzelwerte,
+    list fuer Zellbereiche, Messreihe fuer die Zahlenwerte aus Datengruppen oder eine weitere
+    Unterklasse von Vorlagenstruktur. Neue Instanzen werden mit diesen Feldern angelegt (ausser mit
+    geruest=False). Beim Zuweisen werden Listen aus Gleitkommazahlen in Messreihe-Feldern als
+    Messreihe und dicts in Feldern mit Unterstruktur als deren Klasse gespeichert, alle anderen
+    Eintraege (auch unbekannte Schluessel) unveraendert wie in einer Datenstruktur.
+    Kopien behalten ihre Klasse, beim Speichern mit pickle werden Instanzen aber als gewoehnliche
+    Datenstruktur abgelegt, da die erzeugten Klassen nicht ueber ihren Namen importiert werden koennen.
+    """
+    __slots__ = ()
+    felder = ()
+    feldarten = dict()
+
+    def __init__(self, daten=None, geruest=True):
+        super().__init__()
+        if (geruest):
+            for schluessel, art in self.felder:
+                dict.__setitem__(self, schluessel, art())
+
+        if (daten is not None):
+            self.update(daten)
+
+    def _Feldwert(self, schluessel, wert):
+        art = self.feldarten.get(schluessel, None)
+        if (art is None):
+            return wert
+
+        if (art is Messreihe):
+            if ((type(wert) is list) and (len(wert) > 0) and _NurGleitkommazahlen(liste=wert)):
+                return Messreihe(wert)
+        elif (isinstance(art, type) and issubclass(art, Vorlagenstruktur)):
+            if (isinstance(wert, dict) and (not isinstance(wert, art))):
+                return art(daten=wert, geruest=False)
+
+        return wert
+
+    def __setitem__(self, schluessel, wert):
+        super().__setitem__(schluessel, self._Feldwert(schluessel=schluessel, wert=wert))
+
+    def update(self, *args, **kwargs):
+        eintraege = dict(*args, **kwargs)
+        super().update([(schluessel, self._Feldwert(schluessel=schluessel, wert=wert))
+            for schluessel, wert in eintraege.items()])
+
+    def __deepcopy__(self, memo):
+        import copy
+
+        kopie = type(self)(geruest=False)
+        memo[id(self)] = kopie
+        for schluessel, wert in self.items():
+            dict.__setitem__(kopie, schluessel, copy.deepcopy(wert, memo))
+
+        kopie.komplettausgabe = self.komplettausgabe
+        kopie.max_eintraege = self.max_eintraege
+        return kopie
+
+    def __reduce_ex__(self, protokoll):
+        return (Datenstruktur, (dict(self),))
+
+
+
 # -------------------------------------------------------------------------------------------------
 def DictStrukturGleichOderTeilmenge(ref_dict, test_dict, warnung=True):
     """Erwartet ein ref_dict (Referenz) und test_dict und vergleicht diese. Gibt True zurueck,
@@ -92,7 +290,7 @@ def DictStrukturGleichOderTeilmenge(ref_dict, test_dict, warnung=True):
     """
     rueckgabe = True
     for schluessel in ref_dict.keys():
-        if (schluessel not in test_dict.keys()):
+        if (schluessel not in test_dict):
             if (warnung):
                 print('# Warnung: Fehlender Eintrag in dict (' + schluessel + ')')
 
@@ -120,7 +318,7 @@ def DictStrukturPruefenUndAngleichen(ref_dict, test_dict, warnung=True):
 
     rueckgabe = True
     for schluessel in ref_dict.keys():
-        if (schluessel not in test_dict.keys()):
+        if (schluessel not in test_dict):
             if ('[' in schluessel):
                 # Pruefen, ob der schluessel "Bezeichnung [Einheit]" entspricht
                 gefunden = False
@@ -134,7 +332,7 @@ def DictStrukturPruefenUndAngleichen(ref_dict, test_dict, warnung=True):
                     faktor = PraefixUmrechnungsfaktor(von=testschluessel, zu=schluessel)
                     if (faktor is not None):
                         zielwert = test_dict[testschluessel]
-                        if (isinstance(zielwert, list)):
+                        if (isinstance(zielwert, (list, Messreihe))):
                             test_dict.update([(schluessel, [faktor*wert for wert in zielwert])])
                         else:
                             test_dict.update([(schluessel, faktor*zielwert)])
@@ -176,7 +374,7 @@ def GleichartigesDictListenErgaenzen(altes_dict, neues_dict, skalar_zu_liste=Tru
     """
     rueckgabe = True
     for schluessel in neues_dict.keys():
-        if (schluessel not in altes_dict.keys()):
+        if (schluessel not in altes_dict):
             print('# Warnung: Fehlender Eintrag in Referenz-dict (' + schluessel + ')')
             return False
         else:
@@ -184,7 +382,7 @@ def GleichartigesDictListenErgaenzen(altes_dict, neues_dict, skalar_zu_liste=Tru
                 rueckgabe = GleichartigesDictListenErgaenzen(altes_dict=altes_dict[schluessel],
                     neues_dict=neues_dict[schluessel], skalar_zu_liste=skalar_zu_liste, listenlaenge=listenlaenge)
             else:
-                if (not isinstance(neues_dict[schluessel], list)):
+                if (not isinstance(neues_dict[schluessel], (list, Messreihe))):
                     ergaenzung = ''
                     if (not skalar_zu_liste):
                         ergaenzung = ' (skalar_zu_liste ist False)'
@@ -196,7 +394,7 @@ def GleichartigesDictListenErgaenzen(altes_dict, neues_dict, skalar_zu_liste=Tru
                 if ((len(neues_dict[schluessel]) == 0) and (not skalar_zu_liste)):
                     neues_dict.update([(schluessel, alter_eintrag)])
                 else:
-                    if (not isinstance(alter_eintrag, list)):
+                    if (not isinstance(alter_eintrag, (list, Messreihe))):
                         if (listenlaenge == []):
                             alter_eintrag = [alter_eintrag]
                         else:
@@ -234,21 +432,28 @@ def DatenstrukturExtrahieren(daten, refstruktur, listenlaenge=[], refwahl=''):
     struktur_neu = copy.deepcopy(refstruktur)
     schluesselliste = list(daten.keys())
     fehlerfrei = True
-    for schluessel in schluesselliste:
-        if (not schluessel.startswith('_Ref_')):
-            continue
-
-        if (schluessel == refwahl):
-            if (not GleichartigesDictListenErgaenzen(altes_dict=daten[schluessel], neues_dict=struktur_neu,
-                skalar_zu_liste=False, listenlaenge=listenlaenge)):
-                fehlerfrei = False
-                break
-        elif (refwahl == ''):
-            if (not GleichartigesDictListenErgaenzen(altes_dict=daten[schluessel], neues_dict=struktur_neu,
-                skalar_zu_liste=True, listenlaenge=listenlaenge)):
+    if (refwahl == ''):
+        # Die Teile aller _Ref_###-Strukturen zuerst sammeln und jede Liste am Ende nur einmal
+        # zusammenfuegen, statt sie fuer jede Referenz erneut zu verlaengern
+        teile = dict()
+        for schluessel in schluesselliste:
+            if (not schluessel.startswith('_Ref_')):
+                continue
+
+            if (not _ListenteileSammeln(altes_dict=daten[schluessel], neues_dict=struktur_neu,
+                teile=teile, listenlaenge=listenlaenge)):
                 fehlerfrei = False
                 break
 
+        if (fehlerfrei):
+            _ListenteileZusammenfuegen(neues_dict=struktur_neu, teile=teile)
+    elif ((refwahl in schluesselliste) and refwahl.startswith('_Ref_')):
+        if (not GleichartigesDictListenErgaenzen(altes_dict=daten[refwahl], neues_dict=struktur_neu,
+            skalar_zu_liste=False, listenlaenge=listenlaenge)):
+            fehlerfrei = False
+    else:
+        print('# Warnung: Ausgewaehlte Referenz ' + refwahl + ' ist kein _Ref_###-Eintrag der Daten')
+
     if (not fehlerfrei):
         print('# Warnung: Datenstruktur aufgrund von Warnungen nicht aktualisiert')
         return False
@@ -258,6 +463,87 @@ def DatenstrukturExtrahieren(daten, refstruktur, listenlaenge=[], refwahl=''):
 
 
 
+# -------------------------------------------------------------------------------------------------
+def _ListenteileSammeln(altes_dict, neues_dict, teile, listenlaenge=[]):
+    """Sammelt die Eintraege aus altes_dict fuer alle (verschachtelten) Schluessel von neues_dict in
+    der Struktur teile, ohne neues_dict zu veraendern. Fuer jede Liste in neues_dict enthaelt teile
+    eine Liste mit dem urspruenglichen Wert und allen bisher gesammelten Ergaenzungen. Skalare Werte
+    werden wie in GleichartigesDictListenErgaenzen (mit skalar_zu_liste=True) zu Listen erweitert.
+    Gibt False zurueck und bricht ab, falls in neues_dict mindestens ein Schluessel nicht in
+    altes_dict vorkommt, ansonsten True.
+    """
+    for schluessel in neues_dict.keys():
+        if (schluessel not in altes_dict):
+            print('# Warnung: Fehlender Eintrag in Referenz-dict (' + schluessel + ')')
+            return False
+
+        if (isinstance(neues_dict[schluessel], dict)):
+            if (not _ListenteileSammeln(altes_dict=altes_dict[schluessel],
+                neues_dict=neues_dict[schluessel], teile=teile.setdefault(schluessel, dict()),
+                listenlaenge=listenlaenge)):
+                return False
+
+            continue
+
+        if (not isinstance(neues_dict[schluessel], (list, Messreihe))):
+            print('# Warnung: Unterstruktur (' + schluessel + ') ist keine Liste')
+            return False
+
+        alter_eintrag = altes_dict[schluessel]
+        if (not isinstance(alter_eintrag, (list, Messreihe))):
+            if (listenlaenge == []):
+                alter_eintrag = [alter_eintrag]
+            else:
+                max_laenge = 1
+                for laengeneintrag in listenlaenge:
+                    try:
+                        temp_laenge = len(altes_dict[laengeneintrag])
+                        max_laenge = max(max_laenge, temp_laenge)
+                    except:
+                        pass
+
+                alter_eintrag = [alter_eintrag for x in range(max_laenge)]
+
+        if (schluessel not in teile):
+            teile.update([(schluessel, [neues_dict[schluessel]])])
+
+        teile[schluessel] += [alter_eintrag]
+
+    return True
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _ListenteileZusammenfuegen(neues_dict, teile):
+    """Fuegt alle mit _ListenteileSammeln gesammelten teile zusammen und speichert sie unter dem
+    jeweiligen Schluessel in neues_dict. Das Ergebnis ist eine Messreihe, wenn mindestens ein Teil
+    eine Messreihe ist und alle anderen Teile nur Gleitkommazahlen enthalten, sonst eine Liste.
+    """
+    for schluessel, eintrag in teile.items():
+        if (isinstance(eintrag, dict)):
+            _ListenteileZusammenfuegen(neues_dict=neues_dict[schluessel], teile=eintrag)
+            continue
+
+        als_messreihe = False
+        for teil in eintrag:
+            if (isinstance(teil, Messreihe)):
+                als_messreihe = True
+            elif (not (isinstance(teil, array) or _NurGleitkommazahlen(liste=teil))):
+                als_messreihe = False
+                break
+
+        if (als_messreihe):
+            zusammengefuegt = Messreihe()
+        else:
+            zusammengefuegt = []
+
+        for teil in eintrag:
+            zusammengefuegt.extend(teil)
+
+        neues_dict.update([(schluessel, zusammengefuegt)])
+
+
+
 # -------------------------------------------------------------------------------------------------
 def ZielgroesseFindenUndAktualisieren(daten, bezeichnung, einheit):
     """Ueberpruefe die Eintraege in der ersten Ebene des dicts daten, ob sie den Eintrag
@@ -286,7 +572,7 @@ def ZielgroesseFindenUndAktualisieren(daten, bezeichnung, einheit):
         return False
     else:
         startwert = daten[startschluessel]
-        if (isinstance(startwert, list)):
+        if (isinstance(startwert, (list, Messreihe))):
             daten.update([(zielschluessel, [faktor*wert for wert in startwert])])
         else:
             daten.update([(zielschluessel, faktor*startwert)])
@@ -364,3 +650,69 @@ def EintraegeEntfernen(mod_struktur, entfernen_start=[]):
         del mod_struktur[schluessel]
 
 
+
+# -------------------------------------------------------------------------------------------------
+def _NurGleitkommazahlen(liste):
+    """Gibt True zurueck, falls liste eine Liste ist, die nur Gleitkommazahlen enthaelt.
+    """
+    if (not isinstance(liste, list)):
+        return False
+
+    for wert in liste:
+        if (type(wert) is not float):
+            return False
+
+    return True
+
+
+
+# -------------------------------------------------------------------------------------------------
+def MessreihenErstellen(daten, pfade=None):
+    """Ersetzt alle nicht-leeren Listen in der (verschachtelten) Struktur daten, die nur aus
+    Gleitkommazahlen bestehen, durch eine Messreihe. Listen mit anderen Eintraegen (bspw. ganzen
+    Zahlen oder Text) bleiben unveraendert, werden aber selbst nach umwandelbaren Listen durchsucht.
+    Falls eine Liste pfade (Tupel aus Schluesseln) uebergeben wird, werden nur die Listen an diesen
+    Stellen in daten umgewandelt. Gibt die (veraenderte) Struktur daten zurueck.
+    """
+    if (pfade is not None):
+        for pfad in pfade:
+            eltern = daten
+            for schluessel in pfad[:-1]:
+                if (not isinstance(eltern, dict)):
+                    break
+
+                eltern = eltern.get(schluessel, None)
+
+            if (not isinstance(eltern, dict)):
+                continue
+
+            wert = eltern.get(pfad[-1], None)
+            if (isinstance(wert, list) and (len(wert) > 0) and _NurGleitkommazahlen(liste=wert)):
+                eltern[pfad[-1]] = Messreihe(wert)
+
+        return daten
+
+    if (isinstance(daten, dict)):
+        eintraege = daten.items()
+    elif (isinstance(daten, list)):
+        eintraege = enumerate(daten)
+    else:
+        return daten
+
+    ersetzen = []
+    for schluessel, wert in eintraege:
+        if (isinstance(wert, list)):
+            if ((len(wert) > 0) and _NurGleitkommazahlen(liste=wert)):
+                ersetzen += [(schluessel, Messreihe(wert))]
+            else:
+                MessreihenErstellen(daten=wert)
+        elif (isinstance(wert, dict)):
+            MessreihenErstellen(daten=wert)
+
+    for schluessel, wert in ersetzen:
+        daten[schluessel] = wert
+
+    return daten
+
+
+
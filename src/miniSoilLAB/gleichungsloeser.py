@@ -56,28 +56,58 @@ def QuadratischesAusgleichsproblem(x, y):
 
 
 # -------------------------------------------------------------------------------------------------
-def WinkelTangenteAnKreisboegen(x_min, x_max, y_0, winkeldelta=0.05):
+def WinkelTangenteAnKreisboegen(x_min, x_max, y_0, winkeldelta=0.05, winkeltol=1e-6, raster=False):
     """Bildet Halbkreise aus den gegebenen x_min und x_max, die auf der x-Achse liegen.
     (x_min[i] und x_max[i] sind je Schnittpunkte von einem Kreis mit Radius (x_min[i]+x_max[i])/2.0)
     Findet die Gerade, die fuer x=0 den gegebenen y-Achsen-Abstand y_0 hat und alle Halbkreise
     moeglichst nur tangiert. Minimiert den Abstand zwischen dem idealen Tangentenpunkt jedes
     Halbkreises und der Geraden. Gibt den Winkel (in Grad) zurueck, fuer den der Fehler minimal ist.
+
+    Standardmaessig wird das Minimum im Suchbereich zuerst auf ein Grad genau eingegrenzt und dann
+    mit dem Goldenen Schnitt bis auf winkeltol (in Grad) bestimmt. Falls raster True ist, werden
+    stattdessen (als Referenz) alle Winkel im Abstand von winkeldelta (in Grad) ausgewertet. In
+    beiden Faellen ist der Suchbereich auf 15 Grad begrenzt.
     """
-    from math import sin, cos, asin
+    from math import asin
     from .konstanten import grad2rad
 
-    minabstand = None
-    bester_winkel = None
-
     num_werte = len(x_min)
     mittelpunkte = [(x_max[idx] + x_min[idx])/2.0 for idx in range(num_werte)]
     radien = [(x_max[idx] - x_min[idx])/2.0 for idx in range(num_werte)]
-    # Eine Abschaetzung fuer den minimalen/maximalen Winkel. Der mit steigendem y_0 kleiner werdende
-    # maximale Winkel wird dabei zusaetzlich mit einem Puffer zum min_winkel abgeschaetzt, um
-    # unnoetige Rechenoperationen einzusparen.
+    # Eine Abschaetzung fuer den minimalen/maximalen Winkel
     min_winkel = min([asin((radien[idx]-y_0)/mittelpunkte[idx]) for idx in range(num_werte)])
-    max_winkel = min(min_winkel+15.0*grad2rad, max([asin(radien[idx]/mittelpunkte[idx]) for idx in range(num_werte)]))
+    max_winkel = max(min_winkel, max([asin(radien[idx]/mittelpunkte[idx]) for idx in range(num_werte)]))
+
+    # Der mit steigendem y_0 kleiner werdende maximale Winkel wird zusaetzlich mit einem Puffer zum
+    # min_winkel abgeschaetzt, um unnoetige Rechenoperationen einzusparen.
+    max_winkel = min(min_winkel+15.0*grad2rad, max_winkel)
+    if (raster):
+        return _WinkelTangenteRaster(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0,
+            min_winkel=min_winkel, max_winkel=max_winkel, winkeldelta=winkeldelta)
+
+    winkel = _WinkelMitFestemAchsenabstand(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0,
+        tol=winkeltol*grad2rad, min_winkel=min_winkel, max_winkel=max_winkel,
+        winkelschritte=max(1, int((max_winkel-min_winkel)/grad2rad + 1.0)))
+    minabstand = sum([abstand**2 for abstand in _TangentenabstaendeKreisboegen(mittelpunkte=mittelpunkte,
+        radien=radien, y_0=y_0, winkel=winkel)])
+    return [minabstand, winkel/grad2rad]
+
+
 
+# -------------------------------------------------------------------------------------------------
+def _WinkelTangenteRaster(mittelpunkte, radien, y_0, min_winkel, max_winkel, winkeldelta):
+    """Wertet die Summe der quadrierten Abstaende zwischen den Halbkreisen (mittelpunkte, radien)
+    und der Geraden mit y-Achsen-Abstand y_0 fuer alle Winkel von min_winkel bis max_winkel (im
+    Bogenmass) im Abstand von winkeldelta (in Grad) aus. Gibt [minabstand, winkel (in Grad)] fuer
+    den kleinsten Fehler zurueck.
+    """
+    from math import sin, cos
+    from .konstanten import grad2rad
+
+    minabstand = None
+    bester_winkel = None
+
+    num_werte = len(mittelpunkte)
     winkeldelta_rad = winkeldelta*grad2rad
     schritte = int((max_winkel-min_winkel)/winkeldelta_rad + 1.0)
     for idx_winkel in range(schritte):
@@ -92,6 +122,195 @@ def WinkelTangenteAnKreisboegen(x_min, x_max, y_0, winkeldelta=0.05):
 
 
 
+# -------------------------------------------------------------------------------------------------
+def WinkelTangentenAnKreisbogengruppen(x_min_liste, x_max_liste, y_0, winkeldelta=0.05,
+    winkeltol=1e-6, raster=False):
+    """Bestimmt fuer jede Gruppe von Halbkreisen (x_min_liste[i], x_max_liste[i]) den Winkel der
+    Tangente mit dem y-Achsen-Abstand y_0 (ein Wert fuer alle oder eine Liste mit einem Wert je
+    Gruppe) wie in WinkelTangenteAnKreisboegen. Gibt eine Liste mit [minabstand, winkel (in Grad)]
+    fuer jede Gruppe zurueck.
+    """
+    if (isinstance(y_0, (int, float))):
+        y_0 = [y_0 for idx in range(len(x_min_liste))]
+
+    return [WinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max, y_0=einzel_y_0,
+        winkeldelta=winkeldelta, winkeltol=winkeltol, raster=raster)
+        for x_min, x_max, einzel_y_0 in zip(x_min_liste, x_max_liste, y_0)]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _GoldenerSchnittMinimum(funktion, links, rechts, tol):
+    """Bestimmt das Minimum der (im Intervall [links, rechts] unimodalen) funktion durch
+    Intervallschachtelung nach dem Goldenen Schnitt, bis das Intervall kleiner als tol ist.
+    Gibt die Stelle des Minimums zurueck.
+    """
+    from math import sqrt
+
+    verhaeltnis = (sqrt(5.0) - 1.0)/2.0
+    x_1 = rechts - verhaeltnis*(rechts - links)
+    x_2 = links + verhaeltnis*(rechts - links)
+    f_1 = funktion(x_1)
+    f_2 = funktion(x_2)
+    while (rechts - links > tol):
+        if (f_1 < f_2):
+            rechts = x_2
+            x_2, f_2 = x_1, f_1
+            x_1 = rechts - verhaeltnis*(rechts - links)
+            f_1 = funktion(x_1)
+        else:
+            links = x_1
+            x_1, f_1 = x_2, f_2
+            x_2 = links + verhaeltnis*(rechts - links)
+            f_2 = funktion(x_2)
+
+    return (links + rechts)/2.0
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _TangentenabstaendeKreisboegen(mittelpunkte, radien, y_0, winkel):
+    """Gibt fuer jeden Halbkreis (mittelpunkte, radien) den (vorzeichenbehafteten) Abstand zwischen
+    dem Halbkreis und der Geraden mit y-Achsen-Abstand y_0 und Winkel (im Bogenmass) zurueck.
+    """
+    from math import sin, cos
+
+    sinus = sin(winkel)
+    y_0_cosinus = y_0*cos(winkel)
+    return [mittelpunkt*sinus + y_0_cosinus - radius for mittelpunkt, radius in zip(mittelpunkte, radien)]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _WinkelMitFestemAchsenabstand(mittelpunkte, radien, y_0, tol, min_winkel=None, max_winkel=None,
+    winkelschritte=180):
+    """Bestimmt fuer den festen y-Achsen-Abstand y_0 den Winkel (im Bogenmass) der Geraden mit der
+    kleinsten Summe der quadrierten Abstaende zu den Halbkreisen (mittelpunkte, radien). Das Minimum
+    wird zuerst auf winkelschritte gleichmaessigen Abschnitten zwischen min_winkel und max_winkel
+    (standardmaessig -90 bis 90 Grad) eingegrenzt und anschliessend mit dem Goldenen Schnitt bis auf
+    tol bestimmt.
+    """
+    from math import pi
+
+    def Fehlerquadratsumme(winkel):
+        return sum([abstand**2 for abstand in _TangentenabstaendeKreisboegen(mittelpunkte=mittelpunkte,
+            radien=radien, y_0=y_0, winkel=winkel)])
+
+    if (min_winkel is None):
+        min_winkel = -pi/2.0
+
+    if (max_winkel is None):
+        max_winkel = pi/2.0
+
+    schrittweite = (max_winkel - min_winkel)/winkelschritte
+    stuetzstellen = [min_winkel + idx*schrittweite for idx in range(winkelschritte+1)]
+    fehler = [Fehlerquadratsumme(winkel=winkel) for winkel in stuetzstellen]
+    idx_min = fehler.index(min(fehler))
+    links = stuetzstellen[max(idx_min-1, 0)]
+    rechts = stuetzstellen[min(idx_min+1, winkelschritte)]
+    winkel = _GoldenerSchnittMinimum(funktion=Fehlerquadratsumme, links=links, rechts=rechts, tol=tol)
+    # Liegt das Minimum auf dem Rand des Suchbereichs, kann die beste Stuetzstelle genauer sein
+    if (Fehlerquadratsumme(winkel=winkel) > fehler[idx_min]):
+        winkel = stuetzstellen[idx_min]
+
+    return winkel
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _AchsenabstandMitGrenzen(mittelpunkte, radien, y_0_min, y_0_max, tol, achsenschritte=50):
+    """Bestimmt den y-Achsen-Abstand y_0 zwischen y_0_min und y_0_max und den Winkel (im Bogenmass)
+    der Geraden mit der kleinsten Summe der quadrierten Abstaende zu den Halbkreisen (mittelpunkte,
+    radien), wenn das lineare Ausgleichsproblem keine verwendbare Loesung liefert. Fuer jedes y_0
+    wird der beste Winkel mit _WinkelMitFestemAchsenabstand bestimmt. Das Minimum ueber y_0 wird
+    zuerst auf achsenschritte gleichmaessigen Abschnitten eingegrenzt und anschliessend mit dem
+    Goldenen Schnitt bis auf tol (relativ zur Breite des Suchbereichs) bestimmt.
+    Gibt [y_0, winkel] zurueck.
+    """
+    def WinkelUndFehlerquadratsumme(y_0):
+        winkel = _WinkelMitFestemAchsenabstand(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0,
+            tol=tol)
+        return [winkel, sum([abstand**2 for abstand in _TangentenabstaendeKreisboegen(
+            mittelpunkte=mittelpunkte, radien=radien, y_0=y_0, winkel=winkel)])]
+
+    if (y_0_max <= y_0_min):
+        return [y_0_min, WinkelUndFehlerquadratsumme(y_0=y_0_min)[0]]
+
+    schrittweite = (y_0_max - y_0_min)/achsenschritte
+    stuetzstellen = [y_0_min + idx*schrittweite for idx in range(achsenschritte+1)]
+    ergebnisse = [WinkelUndFehlerquadratsumme(y_0=y_0) for y_0 in stuetzstellen]
+    fehler = [ergebnis[1] for ergebnis in ergebnisse]
+    idx_min = fehler.index(min(fehler))
+    links = stuetzstellen[max(idx_min-1, 0)]
+    rechts = stuetzstellen[min(idx_min+1, achsenschritte)]
+    y_0 = _GoldenerSchnittMinimum(funktion=lambda y_0: WinkelUndFehlerquadratsumme(y_0=y_0)[1],
+        links=links, rechts=rechts, tol=tol*(y_0_max - y_0_min))
+    winkel, temp_fehler = WinkelUndFehlerquadratsumme(y_0=y_0)
+    # Liegt das Minimum auf dem Rand des Suchbereichs, kann die beste Stuetzstelle genauer sein
+    if (temp_fehler > fehler[idx_min]):
+        return [stuetzstellen[idx_min], ergebnisse[idx_min][0]]
+
+    return [y_0, winkel]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def AchsenabstandUndWinkelTangenteAnKreisboegen(x_min, x_max, y_0_min=0.0, y_0_max=None, tol=1e-10):
+    """Bildet Halbkreise aus den gegebenen x_min und x_max (wie WinkelTangenteAnKreisboegen) und
+    bestimmt den y-Achsen-Abstand y_0 (zwischen y_0_min und y_0_max) und den Winkel der Geraden
+    gemeinsam so, dass die Summe der quadrierten Abstaende zu allen Halbkreisen minimal ist.
+
+    Mit a = sin(Winkel) und b = y_0*cos(Winkel) ist der Abstand jedes Halbkreises zur Geraden
+    a*Mittelpunkt + b - Radius, so dass das Minimum ohne Grenzen direkt aus einem linearen
+    Ausgleichsproblem folgt. Liegt das zugehoerige y_0 ausserhalb der Grenzen, liegt das Minimum auf
+    der ueberschrittenen Grenze und der Winkel wird dort bis auf tol (im Bogenmass) bestimmt. Ist das
+    Ausgleichsproblem nicht eindeutig loesbar oder entspricht die Loesung keinem Winkel (|a| >= 1),
+    werden y_0 und Winkel mit _AchsenabstandMitGrenzen gesucht (ohne y_0_max bis zum groessten Radius).
+    Gibt [minabstand, winkel (in Grad), y_0, abstaende] zurueck, wobei minabstand die Summe der
+    quadrierten Abstaende und abstaende die einzelnen (vorzeichenbehafteten) Abstaende sind.
+    """
+    from math import asin, sqrt
+    from .konstanten import grad2rad
+
+    num_werte = len(x_min)
+    mittelpunkte = [(einzel_max + einzel_min)/2.0 for einzel_min, einzel_max in zip(x_min, x_max)]
+    radien = [(einzel_max - einzel_min)/2.0 for einzel_min, einzel_max in zip(x_min, x_max)]
+
+    y_0 = None
+    if (num_werte > 1):
+        summe_m = sum(mittelpunkte)
+        summe_r = sum(radien)
+        nenner = num_werte*sum([mittelpunkt**2 for mittelpunkt in mittelpunkte]) - summe_m**2
+        if (abs(nenner) > 1e-12*max(1.0, summe_m**2)):
+            summe_mr = sum([mittelpunkt*radius for mittelpunkt, radius in zip(mittelpunkte, radien)])
+            a = (num_werte*summe_mr - summe_m*summe_r)/nenner
+            b = (summe_r - a*summe_m)/num_werte
+            if (abs(a) < 1.0):
+                winkel = asin(a)
+                y_0 = b/sqrt(1.0 - a**2)
+
+    if (y_0 is None):
+        # Ohne eindeutige Loesung (bspw. bei nur einem Kreis oder Kreisen mit gleichem Mittelpunkt)
+        # wird im gesamten zulaessigen Bereich von y_0 gesucht
+        if (y_0_max is None):
+            y_0_max = max(y_0_min, max(radien))
+
+        y_0, winkel = _AchsenabstandMitGrenzen(mittelpunkte=mittelpunkte, radien=radien,
+            y_0_min=y_0_min, y_0_max=y_0_max, tol=tol)
+    elif (y_0 < y_0_min):
+        y_0 = y_0_min
+        winkel = _WinkelMitFestemAchsenabstand(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0, tol=tol)
+    elif ((y_0_max is not None) and (y_0 > y_0_max)):
+        y_0 = y_0_max
+        winkel = _WinkelMitFestemAchsenabstand(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0, tol=tol)
+
+    abstaende = _TangentenabstaendeKreisboegen(mittelpunkte=mittelpunkte, radien=radien, y_0=y_0,
+        winkel=winkel)
+    minabstand = sum([abstand**2 for abstand in abstaende])
+    return [minabstand, winkel/grad2rad, y_0, abstaende]
+
+
+
 # -------------------------------------------------------------------------------------------------
 def LinearInterpoliertenIndexUndFaktor(vergleichswert, vergleichswertliste):
     """Bestimme die Position von einem vergleichswert in einer (streng monoton steigenden)
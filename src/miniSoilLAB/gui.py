@@ -54,6 +54,9 @@ class GUIbasis(object):
         self.tabs = None
         self.auswahlliste = ()
         self.boden = None
+        # Manifeste der aus Datensaetzen geoeffneten Boeden (fuer im Programm eingelesene Boeden
+        # wird das Manifest bei Bedarf aus den eingelesenen Dateien erstellt)
+        self.manifeste = dict()
         self.bodenname = ''  # als StringVar mit get() auf den Inhalt zugreifen
         self.plotcmd = ''    # als StringVar mit get() auf den Inhalt zugreifen
         self.plotcmdidx = 0
@@ -190,7 +193,7 @@ class GUIbasis(object):
 
             if (len(self.boden.keys()) > 0):
                 tempbodenname = self.bodenname.get()
-                if ((tempbodenname != '') and (tempbodenname in self.boden.keys())):
+                if ((tempbodenname != '') and (tempbodenname in self.boden)):
                     pass
                 else:
                     # Waehle den ersten Schluessel (alphabetisch) aus
@@ -381,7 +384,7 @@ class GUIbasis(object):
                 self.tabs['KVS'].NeuerEintrag(text=dateiname)
                 for idx_sieb in range(8):
                     siebname = 'Sieblinie ' + str(idx_sieb)
-                    if (siebname not in self.boden[bodenname]['KVS'].keys()):
+                    if (siebname not in self.boden[bodenname]['KVS']):
                         break
 
                     refsiebung = self.boden[bodenname]['KVS'][siebname]
@@ -742,14 +745,19 @@ class GUIbasis(object):
         if (zielordner == ''):
             zielordner = './'
 
+        altdaten = None
         if (self.boden is not None):
-            if (bodenname in self.boden.keys()):
-                messagebox.showwarning(parent=unterfenster, title='Daten Einlesen',
-                    message='Bodenname ' + bodenname + ' existiert bereits')
-                return
+            if (bodenname in self.boden):
+                aktualisieren = messagebox.askyesno(parent=unterfenster, title='Daten Einlesen',
+                    message='Bodenname ' + bodenname + ' existiert bereits. Nur neue und geänderte Dateien einlesen?')
+                if (not aktualisieren):
+                    return
+
+                altdaten = self.boden[bodenname]
 
         daten = BodendatenEinlesen(bodenname=bodenname, dateimuster=dateimaske, zielordner=zielordner,
-            ignoriere=self.ignoriertedaten)
+            ignoriere=self.ignoriertedaten, altdaten=altdaten,
+            manifest=self.manifeste.get(bodenname, None))
         if (daten is None):
             messagebox.showwarning(parent=unterfenster, title='Daten Einlesen',
                 message='Dateiname oder Dateimuster ungültig')
@@ -761,7 +769,12 @@ class GUIbasis(object):
                 self.boden = dict()
 
             self.boden.update(daten)
+            # Alle Dateien des Bodens sind jetzt im aktuellen Programmlauf eingelesen oder geprueft
+            self.manifeste.pop(bodenname, None)
             self._BodenlisteAktualisieren()
+            if (self.bodenname.get() == bodenname):
+                self._TabsAktualisieren(bodenname=bodenname)
+
             unterfenster.destroy()
 
     def _DatensatzSpeichern(self, unterfenster, dateiname, auswahlbox, saveall=False):
@@ -812,6 +825,7 @@ class GUIbasis(object):
                 self.boden.clear()
 
             self.boden = None
+            self.manifeste.clear()
             self.bodenname.set('')
         else:
             bodenauswahl = [auswahlbox.get(elem) for elem in auswahlbox.curselection()]
@@ -822,6 +836,7 @@ class GUIbasis(object):
 
             for datensatz in bodenauswahl:
                 del self.boden[datensatz]
+                self.manifeste.pop(datensatz, None)
                 if (datensatz == self.bodenname.get()):
                     self.bodenname.set('')
 
@@ -929,6 +944,7 @@ class GUIbasis(object):
                 self.boden = dict()
 
             self.boden.update(bodendaten)
+            self.manifeste.pop(einzelboden, None)
             self._BodenlisteAktualisieren()
 
         unterfenster.destroy()
@@ -949,6 +965,9 @@ class GUIbasis(object):
             return
 
         self.zwischenspeicher_listendateieinlesen[0] = os_path.dirname(listendatei)
+        for bodenname in eingelesen.keys():
+            self.manifeste.pop(bodenname, None)
+
         if (self.boden is None):
             self.boden = eingelesen
         else:
@@ -1006,7 +1025,7 @@ class GUIbasis(object):
 
     def _FensterDatensatzOeffnen(self):
         from os import path as os_path
-        from .dateneinlesen import DatensatzEinlesen
+        from .dateneinlesen import DatensatzEinlesen, ManifestEinlesen
 
         datensatz = filedialog.askopenfilename(title='Datei auswählen',
             initialdir=self.zwischenspeicher_datensatz[0])
@@ -1019,6 +1038,14 @@ class GUIbasis(object):
                 message='Fehler beim Einlesen des Datensatzes aus ' + datensatz)
             return
 
+        # Ohne gespeichertes Manifest werden beim Aktualisieren alle Dateien neu eingelesen
+        manifest = ManifestEinlesen(dateiname=datensatz)
+        if (manifest is None):
+            manifest = dict()
+
+        for bodenname in eingelesen.keys():
+            self.manifeste.update([(bodenname, manifest.get(bodenname, []))])
+
         self.zwischenspeicher_datensatz[0] = os_path.dirname(datensatz)
         if (self.boden is None):
             self.boden = eingelesen
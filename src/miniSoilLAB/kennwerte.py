@@ -21,6 +21,35 @@ kennwerte.py   v0.4 (2023-09)
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
 
+# Kennwerte, die eine Vorlage fuer die Berechnung anderer Vorlagen bereitstellt
+_referenzwerte = {
+    'Korndichte': ['Korndichte [g/cm^3]'],
+    'Atterberg': ['Fliessgrenze [%]', 'Ausrollgrenze [%]', 'Ueberkornanteil > 0,4mm [%]'],
+    'LoDi': ['Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]'],
+}
+# Kennwerte, die zur Berechnung einer Vorlage erforderlich sind
+_voraussetzungen = {
+    'LoDi': ['Korndichte [g/cm^3]'],
+    'Oedo': ['Korndichte [g/cm^3]'],
+    'Oedo-CRL': ['Korndichte [g/cm^3]'],
+    'Oedo-CRS': ['Korndichte [g/cm^3]'],
+    'Oedo-CRS-Visko': ['Korndichte [g/cm^3]'],
+    'Triax-CU': ['Korndichte [g/cm^3]', 'Fliessgrenze [%]', 'Ausrollgrenze [%]', 'Ueberkornanteil > 0,4mm [%]'],
+    'Triax-D': ['Korndichte [g/cm^3]', 'Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]'],
+    'Triax-p-q': ['Korndichte [g/cm^3]', 'Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]'],
+}
+# Kennwerte, die bei der Berechnung einer Vorlage verwendet werden, falls sie vorhanden sind
+_optionale_voraussetzungen = {
+    'Oedo': ['Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]'],
+}
+# Vorlagen, deren einzelne Versuche in mehreren Prozessen ausgewertet werden koennen
+_parallele_versuche = ['Triax-CU', 'Triax-D', 'Triax-p-q']
+# Zuletzt berechnete Ergebnisse je Vorlage (Schluessel ist die Pruefsumme der Eingangsdaten, siehe
+# _Kennwertschluessel)
+_kennwertspeicher = dict()
+_kennwertspeicher_max_eintraege = 64
+
+
 # -------------------------------------------------------------------------------------------------
 def Vorbereitung(daten, vorlage):
     """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der uebergebenen vorlage und
@@ -59,27 +88,30 @@ def Vorbereitung(daten, vorlage):
 
 
 # -------------------------------------------------------------------------------------------------
-def Kennwertberechnungen(daten, vorlage=None):
+def Kennwertberechnungen(daten, vorlage=None, auswahl=None, prozesse=1, wiederverwenden=True):
     """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der uebergebenen vorlage und
     speichere sie in der uebergebenen Struktur daten, sofern diese den gueltigen Vorgaben entspricht.
     Falls keine vorlage uebergeben wird, werden die Kennwerte aller Unterstrukturen ermittelt.
+    Falls eine Liste auswahl uebergeben wird, werden nur die Kennwerte der darin enthaltenen
+    Vorlagen neu berechnet. Fuer alle anderen Vorlagen werden nur die bereits berechneten
+    Referenzwerte (bspw. Korndichte) fuer die nachfolgenden Berechnungen uebernommen.
+
+    Eine Vorlage wird berechnet, sobald alle Vorlagen abgeschlossen sind, deren Referenzwerte sie
+    benoetigt (siehe Berechnungsgraph). Falls prozesse groesser als eins ist, werden alle Vorlagen,
+    deren Voraussetzungen erfuellt sind, parallel in (maximal) prozesse Prozessen berechnet
+    (prozesse=None verwendet alle verfuegbaren Prozessoren). Ansonsten werden die Vorlagen in der
+    Reihenfolge von gueltige_vorlagen nacheinander berechnet und prozesse wird stattdessen fuer die
+    Auswertung der einzelnen Versuche einer Vorlage (siehe _parallele_versuche) verwendet.
+
+    Falls wiederverwenden True ist, werden die Ergebnisse jeder Vorlage im Kennwertspeicher
+    abgelegt. Stimmen die Daten einer Vorlage (inklusive ihrer Einstellungen) und die verwendeten
+    Referenzwerte bei einer erneuten Berechnung mit einem gespeicherten Eintrag ueberein, wird
+    dessen Ergebnis uebernommen statt die Kennwerte neu zu berechnen (siehe KennwertspeicherLeeren).
     """
-    from .konstanten import gueltige_vorlagen, debugmodus
+    import os
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    from .konstanten import gueltige_vorlagen, debugmodus, EinstellungenAusgeben, EinstellungenSetzen
     from .datenstruktur import Datenstruktur
-    from .verarbeitung_kvs import KennwerteKVS
-    from .verarbeitung_korndichte import KennwerteKorndichte
-    from .verarbeitung_lodi import KennwerteLoDi
-    from .verarbeitung_atterberg import KennwerteAtterberg
-    from .verarbeitung_hypo import KennwerteHypo
-    from .verarbeitung_oedo import KennwerteOedo
-    from .verarbeitung_oedocrl import KennwerteOedoCRL
-    from .verarbeitung_oedocrs import KennwerteOedoCRS
-    from .verarbeitung_oedocrsvisko import KennwerteOedoCRSVisko
-    from .verarbeitung_triaxd import KennwerteTriaxD
-    from .verarbeitung_triaxcu import KennwerteTriaxCU
-    from .verarbeitung_triaxpq import KennwerteTriaxpq
-
-    status = False
 
     if (vorlage is not None):
         vorlagenliste = [vorlage]
@@ -100,88 +132,389 @@ def Kennwertberechnungen(daten, vorlage=None):
             print('# Warnung: Keine gueltigen Vorlagen in Struktur gefunden')
             return False
 
-    # Die Reihenfolge entspricht der Abfolge in gueltige_vorlagen. Dadurch koennen die Eintraege
-    # hintereinander geprueft werden. Fuer die Kennwertbestimmung zu bearbeitungsliste_eins
-    # sind auch keine zusaetzlichen Abhaenigkeiten noetig und lediglich "Korndichte" speichert
-    # ein zusaetzliches Ergebnis in der Hauptstruktur
-    idx = 0
-    num_vorlagen = len(vorlagenliste)
+    for kenn_name in vorlagenliste:
+        if (kenn_name not in daten):
+            print('# Warnung: ' + kenn_name + ' nicht wie erwartet in uebergebenen daten')
+            return False
 
-    bearbeitungsliste = [
-        ('KVS', KennwerteKVS, []),
-        ('Korndichte', KennwerteKorndichte, []),
-        ('Atterberg', KennwerteAtterberg, []),
-        ('Auswertung-Hypoplastisch', KennwerteHypo, []),
-        ('LoDi', KennwerteLoDi, ['Korndichte [g/cm^3]']),
-        ('Oedo', KennwerteOedo, ['Korndichte [g/cm^3]']),
-        ('Oedo-CRL', KennwerteOedoCRL, ['Korndichte [g/cm^3]']),
-        ('Oedo-CRS', KennwerteOedoCRS, ['Korndichte [g/cm^3]']),
-        ('Oedo-CRS-Visko', KennwerteOedoCRSVisko, ['Korndichte [g/cm^3]']),
-        ('Triax-CU', KennwerteTriaxCU, ['Korndichte [g/cm^3]', 'Fliessgrenze [%]', 'Ausrollgrenze [%]', 'Ueberkornanteil > 0,4mm [%]']),
-        ('Triax-D', KennwerteTriaxD, ['Korndichte [g/cm^3]', 'Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]']),
-        ('Triax-p-q', KennwerteTriaxpq, ['Korndichte [g/cm^3]', 'Trockendichte-min [g/cm^3]', 'Trockendichte-max [g/cm^3]']),
-    ]
+    if (prozesse is None):
+        prozesse = os.cpu_count() or 1
+
+    abhaengigkeiten = Berechnungsgraph(vorlagenliste=vorlagenliste)
     refwerte = Datenstruktur()
     fehlerfrei = True
-    for kenn_name, kenn_aufruf, voraussetzungen in bearbeitungsliste:
-        if (vorlagenliste[idx] == kenn_name):
-            if (kenn_name not in daten):
-                print('# Warnung: ' + kenn_name + ' nicht wie erwartet in uebergebenen daten')
-                return False
-
-            if (debugmodus):
-                print('# Debug: Bearbeite Kennwerte ' + kenn_name)
-
-            for ref_voraus in voraussetzungen:
-                if (ref_voraus not in refwerte):
-                    if (ref_voraus in daten):
-                        print('# Hinweis: Verwende Vorgabewert zu ' + ref_voraus)
-                        refwerte.update([(ref_voraus, daten[ref_voraus])])
-                    else:
-                        gefunden = False
-                        schluesselliste = list(daten.keys())
-                        for schluessel in schluesselliste:
-                            try:
-                                wert = daten[schluessel][daten[schluessel]['_Refwahl']][ref_voraus]
-                            except:
-                                continue
-
-                            gefunden = True
-                            print('# Hinweis: Verwende Vorgabewert zu ' + ref_voraus + ' aus ' + schluessel)
-                            refwerte.update([(ref_voraus, wert)])
-                            break
-
-                        if (not gefunden):
-                            try:
-                                # Versuche, den erforderlichen Wert aus dem ersten Datensatz der zu verarbeitenden Daten zu extrahieren
-                                wert = daten[kenn_name]['_Ref_001'][ref_voraus]
-                                refwerte.update([(ref_voraus, wert)])
-                            except:
-                                print('# Warnung: Allgemeiner Eintrag ' + ref_voraus + ' fehlt zur Berechnung von ' + kenn_name)
-                                return False
-
-            if (kenn_aufruf(daten=daten[kenn_name], refwerte=refwerte)):
-                if (kenn_name == 'Korndichte'):
-                    refwerte.update([('Korndichte [g/cm^3]', daten['Korndichte']['Korndichte [g/cm^3]'])])
-                elif (kenn_name == 'Atterberg'):
-                    refwerte.update([('Fliessgrenze [%]', daten['Atterberg']['Fliessgrenze [%]'])])
-                    refwerte.update([('Ausrollgrenze [%]', daten['Atterberg']['Ausrollgrenze [%]'])])
-                    refwerte.update([('Ueberkornanteil > 0,4mm [%]', daten['Atterberg']['Ueberkornanteil > 0,4mm [%]'])])
-                elif (kenn_name == 'LoDi'):
-                    refwerte.update([('Trockendichte-min [g/cm^3]', daten['LoDi']['Trockendichte-min [g/cm^3]'])])
-                    refwerte.update([('Trockendichte-max [g/cm^3]', daten['LoDi']['Trockendichte-max [g/cm^3]'])])
+    offen = list(vorlagenliste)
+    abgeschlossen = set()
+    laufend = dict()
+    kennwertschluessel = dict()
+    prozesspool = None
+    if (min(prozesse, len(vorlagenliste)) > 1):
+        prozesspool = ProcessPoolExecutor(max_workers=min(prozesse, len(vorlagenliste)),
+            initializer=EinstellungenSetzen, initargs=(EinstellungenAusgeben(),))
+
+    try:
+        while ((len(offen) > 0) or (len(laufend) > 0)):
+            for kenn_name in list(offen):
+                if (not (abhaengigkeiten[kenn_name] <= abgeschlossen)):
+                    continue
+
+                offen.remove(kenn_name)
+                if ((auswahl is not None) and (kenn_name not in auswahl)):
+                    # Bereits berechnete Kennwerte nicht erneut bestimmen, aber Referenzwerte uebernehmen
+                    try:
+                        _ReferenzwerteUebernehmen(daten=daten, kenn_name=kenn_name, refwerte=refwerte)
+                    except KeyError:
+                        pass
+
+                    abgeschlossen.add(kenn_name)
+                    continue
+
+                if (debugmodus):
+                    print('# Debug: Bearbeite Kennwerte ' + kenn_name)
+
+                if (not _VoraussetzungenBereitstellen(daten=daten, kenn_name=kenn_name, refwerte=refwerte)):
+                    return False
+
+                if (wiederverwenden):
+                    schluessel = _Kennwertschluessel(daten=daten, kenn_name=kenn_name, refwerte=refwerte)
+                    gespeichert = _KennwertspeicherLesen(schluessel=schluessel)
+                    if (gespeichert is not None):
+                        if (debugmodus):
+                            print('# Debug: Verwende unveraenderte Kennwerte ' + kenn_name)
+
+                        status, ergebnis = gespeichert
+                        daten.update([(kenn_name, ergebnis)])
+                        if (not _BerechnungAbschliessen(daten=daten, kenn_name=kenn_name,
+                            refwerte=refwerte, status=status)):
+                            fehlerfrei = False
+
+                        abgeschlossen.add(kenn_name)
+                        continue
+
+                    kennwertschluessel.update([(kenn_name, schluessel)])
+
+                if (prozesspool is None):
+                    status, _ = _KennwerteBerechnen(kenn_name=kenn_name, daten=daten[kenn_name],
+                        refwerte=refwerte, prozesse=prozesse)
+                    if (wiederverwenden):
+                        _KennwertspeicherSchreiben(schluesselliste=[kennwertschluessel[kenn_name],
+                            _Kennwertschluessel(daten=daten, kenn_name=kenn_name, refwerte=refwerte)],
+                            status=status, daten=daten[kenn_name])
+
+                    if (not _BerechnungAbschliessen(daten=daten, kenn_name=kenn_name, refwerte=refwerte,
+                        status=status)):
+                        fehlerfrei = False
+
+                    abgeschlossen.add(kenn_name)
+                else:
+                    laufend.update([(prozesspool.submit(_KennwerteBerechnen, kenn_name, daten[kenn_name],
+                        Datenstruktur(refwerte)), kenn_name)])
+
+            if (len(laufend) == 0):
+                if (len(offen) > 0):
+                    print('# Warnung: Abhaengigkeiten der Vorlagen nicht aufloesbar - Code pruefen')
+                    return False
+
+                break
+
+            fertig, _ = wait(list(laufend.keys()), return_when=FIRST_COMPLETED)
+            # Ergebnisse unabhaengig von der Laufzeit in der Reihenfolge der Vorlagen uebernehmen
+            for zukunft in sorted(fertig, key=lambda x: vorlagenliste.index(laufend[x])):
+                kenn_name = laufend.pop(zukunft)
+                status, ergebnis = zukunft.result()
+                daten.update([(kenn_name, ergebnis)])
+                if (wiederverwenden):
+                    _KennwertspeicherSchreiben(schluesselliste=[kennwertschluessel[kenn_name],
+                        _Kennwertschluessel(daten=daten, kenn_name=kenn_name, refwerte=refwerte)],
+                        status=status, daten=ergebnis)
+
+                if (not _BerechnungAbschliessen(daten=daten, kenn_name=kenn_name, refwerte=refwerte,
+                    status=status)):
+                    fehlerfrei = False
+
+                abgeschlossen.add(kenn_name)
+    finally:
+        if (prozesspool is not None):
+            prozesspool.shutdown(cancel_futures=True)
+
+    return fehlerfrei
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Kennwertschluessel(daten, kenn_name, refwerte):
+    """Gibt eine Pruefsumme ueber alle Eingangsdaten der Berechnung von kenn_name zurueck. Dazu
+    zaehlen die eingelesenen Versuche (_Ref_###), alle Einstellungen und Auswahlen (_Refwahl) in
+    daten[kenn_name] und die dafuer verwendeten Referenzwerte aus refwerte. Die sonstigen von der
+    Berechnung geschriebenen Eintraege gehen nicht ein.
+    """
+    import hashlib
+
+    eingaben = [[schluessel, daten[kenn_name][schluessel]] for schluessel in daten[kenn_name].keys()
+        if (str(schluessel).startswith('_Ref_'))]
+    eingaben += _Einstellungen(daten=daten[kenn_name])
+    verwendete_refwerte = [[ref_name, refwerte[ref_name]] for ref_name in _Voraussetzungen(vorlage=kenn_name)
+        if (ref_name in refwerte)]
+    pruefsumme = hashlib.sha1()
+    _PruefsummeErgaenzen(pruefsumme=pruefsumme, daten=[kenn_name, eingaben, verwendete_refwerte])
+    return pruefsumme.hexdigest()
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Einstellungen(daten, pfad=()):
+    """Gibt alle Eintraege namens Einstellungen oder _Refwahl (samt ihrem Pfad) aus daten und deren
+    Unterstrukturen zurueck. Die eingelesenen Versuche (_Ref_###) werden nicht durchsucht.
+    """
+    einstellungen = []
+    for schluessel in daten.keys():
+        if (schluessel in ['Einstellungen', '_Refwahl']):
+            einstellungen += [[pfad + (schluessel,), daten[schluessel]]]
+        elif (isinstance(daten[schluessel], dict) and (not str(schluessel).startswith('_Ref_'))):
+            einstellungen += _Einstellungen(daten=daten[schluessel], pfad=pfad + (schluessel,))
+
+    return einstellungen
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _PruefsummeErgaenzen(pruefsumme, daten):
+    """Ergaenzt die (hashlib-)pruefsumme um die Struktur daten. Messreihen werden direkt ueber ihre
+    Binaerdaten erfasst, Listen ohne Unterstrukturen ueber ihre Darstellung als Text.
+    """
+    from array import array
+
+    if (isinstance(daten, dict)):
+        pruefsumme.update(b'{')
+        for schluessel in sorted(daten.keys(), key=str):
+            pruefsumme.update(repr(schluessel).encode('utf-8') + b':')
+            _PruefsummeErgaenzen(pruefsumme=pruefsumme, daten=daten[schluessel])
+
+        pruefsumme.update(b'}')
+    elif (isinstance(daten, array)):
+        pruefsumme.update(b'<' + str(len(daten)).encode('utf-8') + b'>')
+        pruefsumme.update(daten.tobytes())
+    elif (isinstance(daten, (list, tuple))):
+        if (any([isinstance(eintrag, (dict, list, tuple, array)) for eintrag in daten])):
+            pruefsumme.update(b'[')
+            for eintrag in daten:
+                _PruefsummeErgaenzen(pruefsumme=pruefsumme, daten=eintrag)
+
+            pruefsumme.update(b']')
+        else:
+            pruefsumme.update(repr(list(daten)).encode('utf-8'))
+    else:
+        pruefsumme.update(repr(daten).encode('utf-8') + b';')
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _KennwertspeicherLesen(schluessel):
+    """Gibt eine Kopie des unter schluessel im Kennwertspeicher abgelegten Ergebnisses als Liste aus
+    Rueckgabewert und berechneter Struktur zurueck oder None, falls kein Eintrag existiert. Bei einem
+    Treffer wird der Eintrag als zuletzt verwendet markiert.
+    """
+    import copy
+
+    eintrag = _kennwertspeicher.pop(schluessel, None)
+    if (eintrag is None):
+        return None
+
+    _kennwertspeicher.update([(schluessel, eintrag)])
+    return [eintrag[0], copy.deepcopy(eintrag[1])]
+
+
 
+# -------------------------------------------------------------------------------------------------
+def _KennwertspeicherSchreiben(schluesselliste, status, daten):
+    """Legt eine Kopie der berechneten Struktur daten mit dem Rueckgabewert status unter allen
+    Schluesseln aus schluesselliste im Kennwertspeicher ab (bspw. vor und nach der Berechnung, da
+    dabei fehlende Einstellungen mit Vorgabewerten ergaenzt werden). Falls danach mehr als die
+    erlaubte Anzahl an Eintraegen existiert, werden die am laengsten nicht verwendeten Eintraege
+    entfernt.
+    """
+    import copy
+
+    if (_kennwertspeicher_max_eintraege < 1):
+        return
+
+    eintrag = [status, copy.deepcopy(daten)]
+    for schluessel in schluesselliste:
+        _kennwertspeicher.pop(schluessel, None)
+        _kennwertspeicher.update([(schluessel, eintrag)])
+
+    while (len(_kennwertspeicher) > _kennwertspeicher_max_eintraege):
+        del _kennwertspeicher[next(iter(_kennwertspeicher))]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def KennwertspeicherLeeren(max_eintraege=None):
+    """Entfernt alle Eintraege aus dem Kennwertspeicher, so dass alle Kennwerte bei der naechsten
+    Berechnung neu bestimmt werden. Falls max_eintraege uebergeben wird, werden anschliessend maximal
+    so viele Ergebnisse vorgehalten (0 deaktiviert den Kennwertspeicher).
+    """
+    global _kennwertspeicher_max_eintraege
+
+    _kennwertspeicher.clear()
+    if (max_eintraege is not None):
+        _kennwertspeicher_max_eintraege = max_eintraege
+
+
+
+# -------------------------------------------------------------------------------------------------
+def Berechnungsgraph(vorlagenliste):
+    """Gibt fuer jede Vorlage aus vorlagenliste die Menge der Vorlagen aus vorlagenliste zurueck, die
+    vorher berechnet werden muessen, weil sie (ggfs. optionale) Referenzwerte fuer diese Vorlage
+    bereitstellen.
+    """
+    erzeuger = dict()
+    for vorlage in vorlagenliste:
+        for ref_name in _referenzwerte.get(vorlage, []):
+            erzeuger.update([(ref_name, vorlage)])
+
+    abhaengigkeiten = dict()
+    for vorlage in vorlagenliste:
+        abhaengigkeiten.update([(vorlage, set([erzeuger[ref_voraus]
+            for ref_voraus in _Voraussetzungen(vorlage=vorlage) if (ref_voraus in erzeuger)]))])
+
+    return abhaengigkeiten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Voraussetzungen(vorlage):
+    """Gibt alle (erforderlichen und optionalen) Referenzwerte zurueck, die bei der Berechnung der
+    Kennwerte von vorlage verwendet werden.
+    """
+    return _voraussetzungen.get(vorlage, []) + _optionale_voraussetzungen.get(vorlage, [])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _VoraussetzungenBereitstellen(daten, kenn_name, refwerte):
+    """Stellt sicher, dass alle fuer die Berechnung von kenn_name erforderlichen Referenzwerte in
+    refwerte vorhanden sind. Fehlende Werte werden (in dieser Reihenfolge) aus der Hauptebene von
+    daten, aus dem gewaehlten Datensatz einer anderen Vorlage oder aus dem ersten Datensatz von
+    kenn_name uebernommen. Gibt False zurueck, falls ein Wert nicht gefunden werden kann, sonst True.
+    """
+    for ref_voraus in _voraussetzungen.get(kenn_name, []):
+        if (ref_voraus not in refwerte):
+            if (ref_voraus in daten):
+                print('# Hinweis: Verwende Vorgabewert zu ' + ref_voraus)
+                refwerte.update([(ref_voraus, daten[ref_voraus])])
             else:
-                print('# Warnung: Bearbeitung von ' + kenn_name + ' fehlgeschlagen')
-                fehlerfrei = False
+                gefunden = False
+                schluesselliste = list(daten.keys())
+                for schluessel in schluesselliste:
+                    try:
+                        wert = daten[schluessel][daten[schluessel]['_Refwahl']][ref_voraus]
+                    except:
+                        continue
+
+                    gefunden = True
+                    print('# Hinweis: Verwende Vorgabewert zu ' + ref_voraus + ' aus ' + schluessel)
+                    refwerte.update([(ref_voraus, wert)])
+                    break
+
+                if (not gefunden):
+                    try:
+                        # Versuche, den erforderlichen Wert aus dem ersten Datensatz der zu verarbeitenden Daten zu extrahieren
+                        wert = daten[kenn_name]['_Ref_001'][ref_voraus]
+                        refwerte.update([(ref_voraus, wert)])
+                    except:
+                        print('# Warnung: Allgemeiner Eintrag ' + ref_voraus + ' fehlt zur Berechnung von ' + kenn_name)
+                        return False
+
+    return True
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _KennwerteBerechnen(kenn_name, daten, refwerte, prozesse=1):
+    """Bestimme die Kennwerte der Vorlage kenn_name fuer die Struktur daten mit den uebergebenen
+    refwerte. Gibt den Rueckgabewert der Berechnung und die (veraenderte) Struktur daten zurueck,
+    damit die Berechnung auch in einem anderen Prozess erfolgen kann. Fuer Vorlagen aus
+    _parallele_versuche werden die einzelnen Versuche mit bis zu prozesse Prozessen ausgewertet.
+    """
+    from .verarbeitung_kvs import KennwerteKVS
+    from .verarbeitung_korndichte import KennwerteKorndichte
+    from .verarbeitung_lodi import KennwerteLoDi
+    from .verarbeitung_atterberg import KennwerteAtterberg
+    from .verarbeitung_hypo import KennwerteHypo
+    from .verarbeitung_oedo import KennwerteOedo
+    from .verarbeitung_oedocrl import KennwerteOedoCRL
+    from .verarbeitung_oedocrs import KennwerteOedoCRS
+    from .verarbeitung_oedocrsvisko import KennwerteOedoCRSVisko
+    from .verarbeitung_triaxd import KennwerteTriaxD
+    from .verarbeitung_triaxcu import KennwerteTriaxCU
+    from .verarbeitung_triaxpq import KennwerteTriaxpq
+
+    bearbeitungsliste = dict([
+        ('KVS', KennwerteKVS),
+        ('Korndichte', KennwerteKorndichte),
+        ('Atterberg', KennwerteAtterberg),
+        ('Auswertung-Hypoplastisch', KennwerteHypo),
+        ('LoDi', KennwerteLoDi),
+        ('Oedo', KennwerteOedo),
+        ('Oedo-CRL', KennwerteOedoCRL),
+        ('Oedo-CRS', KennwerteOedoCRS),
+        ('Oedo-CRS-Visko', KennwerteOedoCRSVisko),
+        ('Triax-CU', KennwerteTriaxCU),
+        ('Triax-D', KennwerteTriaxD),
+        ('Triax-p-q', KennwerteTriaxpq),
+    ])
+    if (kenn_name in _parallele_versuche):
+        status = bearbeitungsliste[kenn_name](daten=daten, refwerte=refwerte, prozesse=prozesse)
+    else:
+        status = bearbeitungsliste[kenn_name](daten=daten, refwerte=refwerte)
+
+    return [status, daten]
 
-            idx += 1
-            if (idx >= num_vorlagen):
-                return fehlerfrei
 
-    # Wenn der folgende Code erreicht wird, entspricht die angenommene Reihenfolge der Vorlagen
-    # nicht gueltige_vorlagen
-    print('# Warnung: Interne Reihenfolge der Vorlagen nicht wie erwartet - Code pruefen')
+
+# -------------------------------------------------------------------------------------------------
+def _BerechnungAbschliessen(daten, kenn_name, refwerte, status):
+    """Uebernimmt nach einer erfolgreichen Berechnung (status) die Referenzwerte von kenn_name in
+    refwerte. Gibt False zurueck, falls die Berechnung fehlgeschlagen ist, sonst True.
+    """
+    if (status):
+        _ReferenzwerteUebernehmen(daten=daten, kenn_name=kenn_name, refwerte=refwerte)
+        return True
+
+    print('# Warnung: Bearbeitung von ' + kenn_name + ' fehlgeschlagen')
     return False
 
 
+
+# -------------------------------------------------------------------------------------------------
+def _ReferenzwerteUebernehmen(daten, kenn_name, refwerte):
+    """Uebernimmt die Kennwerte aus daten[kenn_name], die fuer die Berechnung anderer Vorlagen
+    benoetigt werden (bspw. die Korndichte), in refwerte.
+    """
+    for ref_name in _referenzwerte.get(kenn_name, []):
+        refwerte.update([(ref_name, daten[kenn_name][ref_name])])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def BetroffeneVorlagen(geaenderte_vorlagen):
+    """Ermittelt zu den Vorlagen in geaenderte_vorlagen alle Vorlagen, deren Kennwerte (direkt oder
+    indirekt) von den Referenzwerten der geaenderten Vorlagen abhaengen. Gibt eine Liste aller
+    geaenderten und davon abhaengigen Vorlagen in der Reihenfolge von gueltige_vorlagen zurueck.
+    """
+    from .konstanten import gueltige_vorlagen
+
+    betroffen = set(geaenderte_vorlagen)
+    # gueltige_vorlagen ist so sortiert, dass Abhaengigkeiten immer vor einer Vorlage stehen
+    for vorlage in gueltige_vorlagen:
+        for erzeuger in list(betroffen):
+            if (any([ref_name in _Voraussetzungen(vorlage=vorlage)
+                for ref_name in _referenzwerte.get(erzeuger, [])])):
+                betroffen.add(vorlage)
+                break
+
+    return [vorlage for vorlage in gueltige_vorlagen if (vorlage in betroffen)]
+
+
+
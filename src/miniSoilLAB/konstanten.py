@@ -32,6 +32,9 @@ gueltige_vorlagen = ['KVS', 'Korndichte', 'Atterberg', 'Auswertung-Hypoplastisch
     'Oedo', 'Oedo-CRL', 'Oedo-CRS', 'Oedo-CRS-Visko', 'Triax-CU', 'Triax-D', 'Triax-p-q']
 debugmodus = False
 basispfad = './Vorlagen'
+# Ordner fuer den persistenten Zwischenspeicher eingelesener Dateien (None: deaktiviert)
+zwischenspeicherpfad = None
+zwischenspeicher_max_eintraege = 1000
 
 
 # -------------------------------------------------------------------------------------------------
@@ -59,3 +62,47 @@ def Standardpfad(pfad='.'):
     basispfad = pfad + os.sep + 'Vorlagen' + os.sep
 
 
+
+# -------------------------------------------------------------------------------------------------
+def Zwischenspeicher(pfad=None, max_eintraege=1000):
+    """Setze den Ordner pfad, in dem eingelesene Excel-Dateien persistent zwischengespeichert werden
+    sollen. Es werden maximal max_eintraege Dateien vorgehalten, wobei die am laengsten nicht mehr
+    verwendeten Eintraege zuerst entfernt werden. Mit pfad=None wird der Zwischenspeicher
+    deaktiviert (Standard).
+    """
+    global zwischenspeicherpfad
+    global zwischenspeicher_max_eintraege
+
+    zwischenspeicherpfad = pfad
+    zwischenspeicher_max_eintraege = max_eintraege
+
+
+
+# -------------------------------------------------------------------------------------------------
+def EinstellungenAusgeben():
+    """Gibt die aktuellen globalen Einstellungen (Vorlagenpfad, Debug-Modus und Zwischenspeicher)
+    als dict zurueck, bspw. um sie an neu gestartete Prozesse zu uebergeben.
+    """
+    return dict([('basispfad', basispfad), ('debugmodus', debugmodus),
+        ('zwischenspeicherpfad', zwischenspeicherpfad),
+        ('zwischenspeicher_max_eintraege', zwischenspeicher_max_eintraege)])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def EinstellungenSetzen(einstellungen):
+    """Setzt die globalen Einstellungen aus einem mit EinstellungenAusgeben() erstellten dict
+    einstellungen.
+    """
+    global basispfad
+    global debugmodus
+    global zwischenspeicherpfad
+    global zwischenspeicher_max_eintraege
+
+    basispfad = einstellungen['basispfad']
+    debugmodus = einstellungen['debugmodus']
+    zwischenspeicherpfad = einstellungen['zwischenspeicherpfad']
+    zwischenspeicher_max_eintraege = einstellungen['zwischenspeicher_max_eintraege']
+
+
+
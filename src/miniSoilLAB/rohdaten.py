@@ -21,207 +21,417 @@ rohdaten.py   v0.4 (2013-09)
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
 
+# Anzahl an Zeilen, die beim spaltenweisen Einlesen gemeinsam umgewandelt werden
+_blockgroesse = 10000
+
+
 # -------------------------------------------------------------------------------------------------
-def LeseEAXDaten(dateiname):
-    """Lese und interpretiere eax-Dateien, die nach folgendem Schema aufgebaut sind:
-    Die Datei ist in die beiden Abschnitte [Eingaben] und [Daten] unterteilt. Alle Felder im
-    ersten Abschnitt folgen dem Muster schluessel=wert und werden entsprechend eingelesen und
-    gespeichert (ausgewaehlte Felder als float, der Rest als Strings).
-    Der zweite Abschnitt startet nach [Daten] mit einer Kopfzeile. Anschliessend folgen mehrere
-    Zeilen an Messdaten, wobei die einzelnen Felder jeweils durch Semikolons getrennt sind.
-    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Einax zurueck.
+def _SpaltenbloeckeAusZeilen(zeilen, spaltenanzahl, textspalten=[], blockgroesse=None, auswahl=None,
+    mindestlaenge=None):
+    """Erwartet ein iterierbares Objekt zeilen, das fuer jede Datenzeile eine Liste an Strings
+    liefert. Die Zeilen werden blockweise (mit jeweils blockgroesse Zeilen) gelesen, in Spalten
+    umsortiert und alle Spalten, deren Index nicht in textspalten enthalten ist, gemeinsam in
+    Gleitkommazahlen umgewandelt (mit Komma oder Punkt als Dezimaltrennzeichen). Liefert fuer jeden
+    Block eine Liste mit spaltenanzahl Spalten, wobei Zahlenspalten als array('d') und Textspalten
+    als Listen von Strings gespeichert werden.
+    Falls eine Liste an Spaltenindizes auswahl uebergeben wird, werden nur diese Spalten (in der
+    Reihenfolge von auswahl) umgewandelt und zurueckgegeben.
+    Leere Zeilen werden ignoriert, zusaetzliche Eintraege einer Zeile abgeschnitten und Zeilen mit
+    weniger als mindestlaenge (standardmaessig spaltenanzahl) Eintraegen mit einer Warnung
+    uebersprungen. Eine kleinere mindestlaenge ist nur fuer Zeilen gedacht, die bei einer auswahl
+    nur teilweise zerlegt werden und deren Vollstaendigkeit bereits geprueft worden ist.
     """
-    import csv
+    from array import array
+    from itertools import islice
+    from operator import itemgetter
+
+    if (blockgroesse is None):
+        blockgroesse = _blockgroesse
+
+    if (auswahl is None):
+        auswahl = list(range(spaltenanzahl))
+
+    if (mindestlaenge is None):
+        mindestlaenge = spaltenanzahl
+
+    zeilen = iter(zeilen)
+    while (True):
+        rohblock = list(islice(zeilen, blockgroesse))
+        if (rohblock == []):
+            break
+
+        block = []
+        for zeile in rohblock:
+            if (len(zeile) >= mindestlaenge):
+                block += [zeile]
+            elif (len(zeile) > 0):
+                print('# Warnung: Datenzeile mit ' + str(len(zeile)) + ' statt ' + str(mindestlaenge)
+                    + ' Eintraegen wird ignoriert')
+
+        if (block == []):
+            continue
+
+        spalten = []
+        for idx_spalte in auswahl:
+            werte = list(map(itemgetter(idx_spalte), block))
+            if (idx_spalte in textspalten):
+                spalten += [werte]
+            else:
+                # Alle Werte einer Spalte gemeinsam vom Dezimalkomma befreien und umwandeln
+                spalten += [array('d', map(float, '\n'.join(werte).replace(',', '.').split('\n')))]
+
+        yield spalten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _SpaltenAusZeilen(zeilen, spaltenanzahl, textspalten=[], blockgroesse=None, auswahl=None,
+    mindestlaenge=None):
+    """Wie _SpaltenbloeckeAusZeilen, aber gibt die Spalten aller Bloecke zusammengefuegt als eine
+    Liste von Spalten zurueck, wobei Zahlenspalten als Messreihe gespeichert werden.
+    """
+    from .datenstruktur import Messreihe
+
+    if (auswahl is None):
+        auswahl = list(range(spaltenanzahl))
+
+    spalten = [[] if (idx_spalte in textspalten) else Messreihe() for idx_spalte in auswahl]
+    for block in _SpaltenbloeckeAusZeilen(zeilen=zeilen, spaltenanzahl=spaltenanzahl,
+        textspalten=textspalten, blockgroesse=blockgroesse, auswahl=auswahl,
+        mindestlaenge=mindestlaenge):
+        for spalte, teilspalte in zip(spalten, block):
+            spalte.extend(teilspalte)
+
+    return spalten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _SpaltenauswahlIndizes(spaltennamen, spaltenauswahl, dateiname):
+    """Gibt die (sortierten) Indizes der Spalten aus spaltenauswahl in spaltennamen und die
+    dazugehoerigen Namen zurueck. Ohne spaltenauswahl wird fuer die Indizes None und fuer die Namen
+    die vollstaendige Liste spaltennamen zurueckgegeben. Nicht vorhandene Spalten werden mit einer
+    Warnung ignoriert.
+    """
+    if (spaltenauswahl is None):
+        return None, spaltennamen
+
+    for name in spaltenauswahl:
+        if (name not in spaltennamen):
+            print('# Warnung: Spalte ' + name + ' nicht in ' + dateiname + ' vorhanden')
+
+    auswahl = [idx_spalte for idx_spalte, name in enumerate(spaltennamen) if (name in spaltenauswahl)]
+    return auswahl, [spaltennamen[idx_spalte] for idx_spalte in auswahl]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _SpaltenZuMessdaten(spaltennamen, spalten, als_array=False):
+    """Speichert die spalten unter den dazugehoerigen spaltennamen in einer Datenstruktur und gibt
+    diese zurueck. Falls als_array=False ist, werden Zahlenspalten als Listen gespeichert (wie bei
+    allen anderen eingelesenen Daten), sonst unveraendert (als Messreihe, siehe _SpaltenAusZeilen).
+    """
+    from array import array
     from .datenstruktur import Datenstruktur
 
-    daten = Datenstruktur()
+    messdaten = Datenstruktur()
+    for name, spalte in zip(spaltennamen, spalten):
+        if ((not als_array) and isinstance(spalte, array)):
+            spalte = spalte.tolist()
+
+        messdaten.update([(name, spalte)])
+
+    return messdaten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _BloeckeAusduennen(bloecke, startzeile=0, schrittweite=1, huellengroesse=None,
+    idx_huellenspalte=None):
+    """Duennt die Spaltenbloecke aus bloecke (siehe _SpaltenbloeckeAusZeilen) waehrend des Einlesens
+    aus. Die ersten startzeile Zeilen werden verworfen. Mit schrittweite n wird von den restlichen
+    Zeilen nur jede n-te Zeile (bezogen auf alle Bloecke) behalten. Mit
+    huellengroesse m werden jeweils m aufeinanderfolgende Zeilen zusammengefasst und davon nur die
+    Zeilen mit dem kleinsten und dem groessten Wert der Spalte idx_huellenspalte behalten (in ihrer
+    urspruenglichen Reihenfolge), so dass Spitzenwerte erhalten bleiben. Liefert die ausgeduennten
+    Bloecke, wobei nie mehr als ein Block und ein unvollstaendiger Abschnitt gespeichert werden.
+    """
+    zeilen_bisher = 0
+    rest = None
+    for block in bloecke:
+        if (block == []):
+            continue
+
+        if (startzeile > 0):
+            idx_start = min(startzeile, len(block[0]))
+            startzeile -= idx_start
+            block = [spalte[idx_start:] for spalte in block]
+
+        if (schrittweite > 1):
+            idx_start = (-zeilen_bisher) % schrittweite
+            zeilen_bisher += len(block[0])
+            block = [spalte[idx_start::schrittweite] for spalte in block]
+
+        if ((huellengroesse is None) or (idx_huellenspalte is None)):
+            if (len(block[0]) > 0):
+                yield block
+
+            continue
+
+        if (rest is not None):
+            block = [restspalte + spalte for restspalte, spalte in zip(rest, block)]
+
+        num_vollstaendig = len(block[0]) - len(block[0]) % huellengroesse
+        rest = [spalte[num_vollstaendig:] for spalte in block]
+        if (num_vollstaendig > 0):
+            yield _Huelle(block=[spalte[:num_vollstaendig] for spalte in block],
+                huellengroesse=huellengroesse, idx_huellenspalte=idx_huellenspalte)
+
+    if ((rest is not None) and (len(rest[0]) > 0)):
+        yield _Huelle(block=rest, huellengroesse=huellengroesse, idx_huellenspalte=idx_huellenspalte)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Huelle(block, huellengroesse, idx_huellenspalte):
+    """Behaelt aus jeweils huellengroesse aufeinanderfolgenden Zeilen der Spalten in block nur die
+    Zeilen mit dem kleinsten und groessten Wert der Spalte idx_huellenspalte und gibt die so
+    reduzierten Spalten zurueck.
+    """
+    from array import array
+
+    referenz = block[idx_huellenspalte]
+    indizes = []
+    for idx_start in range(0, len(referenz), huellengroesse):
+        abschnitt = referenz[idx_start:idx_start+huellengroesse]
+        idx_min = idx_start + abschnitt.index(min(abschnitt))
+        idx_max = idx_start + abschnitt.index(max(abschnitt))
+        indizes += sorted(set([idx_min, idx_max]))
+
+    huelle = []
+    for spalte in block:
+        werte = [spalte[idx] for idx in indizes]
+        if (isinstance(spalte, array)):
+            werte = array('d', werte)
+
+        huelle += [werte]
+
+    return huelle
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _EAXDatenquelle(eingabe, daten, spaltenauswahl=None, dateiname=''):
+    """Liest den Header einer geoeffneten eax-Datei eingabe in daten ein (siehe LeseEAXDaten) und
+    gibt ein dict mit den Eintraegen Spaltennamen (der ausgewaehlten Spalten), Zeilen (Generator
+    der noch nicht umgewandelten Datenzeilen), Spaltenanzahl, Textspalten und Auswahl zurueck.
+    """
+    import csv
+
     headerzahlen = ['Probenhoehe', 'Probendurchmesser', 'Probenmasse', 'Setzungsdifferenz',
                     'delta Sigma', 'Zeit', 'Aufnehmernummer', 'Versuchsende', 'Schergeschwindigkeit']
     spaltennamen = []
-    versuchsdaten = []
-    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
-        eingelesen = csv.reader(eingabe, delimiter=';')
-        datenbereich = False
+
+    def _HeaderEintrag(zeile):
+        """Speichert einen Eintrag der Form schluessel=wert in daten.
+        """
+        if (zeile[0][0] == '['):
+            return
+
+        schluessel, wert = zeile[0].split('=')
+        if (schluessel in headerzahlen):
+            daten.update([(schluessel, float(wert.replace(',', '.')))])
+        else:
+            daten.update([(schluessel, wert)])
+
+    def _Datenzeilen(eingelesen):
+        """Liefert alle Datenzeilen und verarbeitet dabei (einzelne) Headerzeilen.
+        """
         for zeile in eingelesen:
             # Header gesondert betrachten
             if (len(zeile) == 1):
-                if (zeile[0][0] == '['):
-                    continue
-
-                schluessel, wert = zeile[0].split('=')
-                if (schluessel in headerzahlen):
-                    daten.update([(schluessel, float(wert.replace(',', '.')))])
-                else:
-                    daten.update([(schluessel, wert)])
-
+                _HeaderEintrag(zeile=zeile)
                 continue
 
-            if (not datenbereich):
-                spaltennamen = zeile
-                datenbereich = True
-                continue
+            yield zeile
 
-            temp_daten = []
-            for idx_wert, wert in enumerate(zeile):
-                if (idx_wert == 1):
-                    temp_daten += [wert]
-                else:
-                    temp_daten += [float(wert.replace(',', '.'))]
+    eingelesen = csv.reader(eingabe, delimiter=';')
+    for zeile in eingelesen:
+        # Header gesondert betrachten
+        if (len(zeile) == 1):
+            _HeaderEintrag(zeile=zeile)
+            continue
 
-            versuchsdaten += [temp_daten]
+        spaltennamen = zeile
+        break
 
-    messdaten = Datenstruktur()
-    for idx_eintrag, name in enumerate(spaltennamen):
-        messdaten.update([(name, [datenzeile[idx_eintrag] for datenzeile in versuchsdaten])])
-
-    daten.update([('Daten', messdaten)])
-    daten.update([('Dateiname', dateiname)])
-    rueckgabe = Datenstruktur()
-    rueckgabe.update([('EAX', daten)])
-    return rueckgabe
+    spaltenanzahl = len(spaltennamen)
+    auswahl, spaltennamen = _SpaltenauswahlIndizes(spaltennamen=spaltennamen,
+        spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+    return dict([('Spaltennamen', spaltennamen), ('Zeilen', _Datenzeilen(eingelesen=eingelesen)),
+        ('Spaltenanzahl', spaltenanzahl), ('Textspalten', [1]), ('Auswahl', auswahl)])
 
 
 
 # -------------------------------------------------------------------------------------------------
-def LeseDTADaten(dateiname):
-    """Lese und interpretiere dta-Dateien, die nach folgendem Schema aufgebaut sind:
-    Die Datei ist in die beiden Abschnitte [Versuchsdaten] und [Daten] unterteilt. Alle Felder im
-    ersten Abschnitt folgen dem Muster schluessel=wert und werden entsprechend eingelesen und
-    gespeichert (ausgewaehlte Felder als float, der Rest als Strings).
-    Der zweite Abschnitt startet nach [Daten] mit einer Kopfzeile. Anschliessend folgen mehrere
-    Zeilen an Messdaten, wobei die einzelnen Felder jeweils durch Tabulatoren getrennt sind.
-    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Einax zurueck.
+def _DTADatenquelle(eingabe, daten, spaltenauswahl=None, dateiname=''):
+    """Liest den Header einer geoeffneten dta-Datei eingabe in daten ein (siehe LeseDTADaten) und
+    gibt ein dict wie _EAXDatenquelle zurueck.
     """
     import csv
-    from .datenstruktur import Datenstruktur
 
-    daten = Datenstruktur()
     headerzahlen = ['Durchmesser', 'Einbauprobenfeuchtmasse', 'Anfangshöhe', 'Masse Kopfplatte']
     spaltennamen = []
-    versuchsdaten = []
-    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
-        eingelesen = csv.reader(eingabe, delimiter='\t')
-        datenbereich = False
+
+    def _HeaderEintrag(zeile):
+        """Speichert einen Eintrag der Form schluessel=wert in daten.
+        """
+        if (zeile[0][0] == '['):
+            return
+
+        schluessel, wert = zeile[0].split('=')
+        schluessel = schluessel.strip()
+        if (schluessel in headerzahlen):
+            daten.update([(schluessel, float(wert.replace(',', '.')))])
+        else:
+            daten.update([(schluessel, wert)])
+
+    def _Datenzeilen(eingelesen):
+        """Liefert alle Datenzeilen und verarbeitet dabei (einzelne) Headerzeilen.
+        """
         for zeile in eingelesen:
             # Header gesondert betrachten
             if (len(zeile) == 1):
-                if (zeile[0][0] == '['):
-                    continue
+                _HeaderEintrag(zeile=zeile)
+                continue
 
-                schluessel, wert = zeile[0].split('=')
-                schluessel = schluessel.strip()
-                if (schluessel in headerzahlen):
-                    daten.update([(schluessel, float(wert.replace(',', '.')))])
-                else:
-                    daten.update([(schluessel, wert)])
+            yield zeile
 
-                continue
+    eingelesen = csv.reader(eingabe, delimiter='\t')
+    for zeile in eingelesen:
+        # Header gesondert betrachten
+        if (len(zeile) == 1):
+            _HeaderEintrag(zeile=zeile)
+            continue
 
-            if (not datenbereich):
-                spaltennamen = zeile
-                datenbereich = True
-                continue
+        spaltennamen = zeile
+        break
 
-            temp_daten = []
-            for idx_wert, wert in enumerate(zeile):
-                if ((idx_wert == 1) or (idx_wert >= 6)):
-                    temp_daten += [wert]
-                else:
-                    temp_daten += [float(wert.replace(',', '.'))]
+    spaltenanzahl = len(spaltennamen)
+    auswahl, spaltennamen = _SpaltenauswahlIndizes(spaltennamen=spaltennamen,
+        spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+    return dict([('Spaltennamen', spaltennamen), ('Zeilen', _Datenzeilen(eingelesen=eingelesen)),
+        ('Spaltenanzahl', spaltenanzahl), ('Textspalten', [1] + list(range(6, spaltenanzahl))),
+        ('Auswahl', auswahl)])
 
-            versuchsdaten += [temp_daten]
 
-    messdaten = Datenstruktur()
-    for idx_eintrag, name in enumerate(spaltennamen):
-        messdaten.update([(name, [datenzeile[idx_eintrag] for datenzeile in versuchsdaten])])
 
-    daten.update([('Daten', messdaten)])
-    daten.update([('Dateiname', dateiname)])
-    rueckgabe = Datenstruktur()
-    rueckgabe.update([('DTA', daten)])
-    return rueckgabe
+# Headereintraege von gds-Dateien, die als float gespeichert werden
+_gds_headerzahlen = ['Initial Height (mm)', 'Initial Diameter (mm)', 'Ram Diameter',
+    'Specific Gravity (kN/m³):', 'Depth:', 'Initial mass (g):', 'Initial dry mass (g):',
+    'Specific Gravity (ass/meas):', 'Final Mass:', 'Final Dry Mass:', 'Cell No.:',
+    'Membrane Thickness (mm):', 'Start of Repeated Data']
+
+
+# -------------------------------------------------------------------------------------------------
+def _GDSZeileZerlegen(zeile, maxsplit=-1):
+    """Gibt die Eintraege einer Zeile aus einer gds-Datei (ohne Anfuehrungszeichen) als Liste zurueck.
+    Mit maxsplit wird die Zeile nur in die ersten maxsplit+1 Teile zerlegt (siehe str.split).
+    """
+    return zeile.rstrip('\r\n')[1:-1].split('","', maxsplit)
 
 
 
 # -------------------------------------------------------------------------------------------------
-def LeseGDSDaten(dateiname):
-    """Lese und interpretiere gds-Dateien, die nach folgendem Schema aufgebaut sind:
-    Alle Eintraege sind in doppelten Anfuehrungszeichen und mit Kommata voneinander getrennt. Im
-    Header der Datei steht immer ein Wert und ein Schluessel, die alle eingelesen werden
-    (ausgewaehlte Felder als float, der Rest als Strings).
-    Der Header wird vom Rest durch eine Zeile getrennt, die mehr als zwei Eintraege enthaelt (die
-    Bezeichnungen fuer die folgenden Messdaten). Anschliessend folgen Zeilen an Messdaten,
-    die wiederum in Anfuehrungszeichen stehen und durch Kommata voneinander getrennt sind.
-    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Triax zurueck.
+def _GDSHeaderEintrag(daten, zeile):
+    """Speichert einen Headereintrag zeile aus Schluessel und Wert einer gds-Datei in daten.
     """
-    from .datenstruktur import Datenstruktur
+    if ((zeile[0] in _gds_headerzahlen) and (zeile[1] != '')):
+        daten.update([(zeile[0], float(zeile[1].replace(',', '.')))])
+    else:
+        daten.update([(zeile[0], zeile[1])])
 
-    daten = Datenstruktur()
-    headerzahlen = ['Initial Height (mm)', 'Initial Diameter (mm)', 'Ram Diameter',
-                    'Specific Gravity (kN/m³):', 'Depth:', 'Initial mass (g):', 'Initial dry mass (g):',
-                    'Specific Gravity (ass/meas):', 'Final Mass:', 'Final Dry Mass:', 'Cell No.:',
-                    'Membrane Thickness (mm):', 'Start of Repeated Data']
+
+
+# -------------------------------------------------------------------------------------------------
+def _GDSDatenquelle(eingabe, daten, spaltenauswahl=None, dateiname=''):
+    """Liest den Header einer geoeffneten gds-Datei eingabe in daten ein (siehe LeseGDSDaten) und
+    gibt ein dict wie _EAXDatenquelle zurueck. Bei einer spaltenauswahl werden die Datenzeilen nur
+    bis zur letzten ausgewaehlten Spalte zerlegt. Unvollstaendige Zeilen werden dann bereits hier
+    ignoriert und unter Mindestlaenge die Anzahl der Eintraege der teilweise zerlegten Zeilen
+    zurueckgegeben, die fuer die ausgewaehlten Spalten noetig ist.
+    """
     spaltennamen = []
-    versuchsdaten = []
-    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
-        datenbereich = False
-        for ganzezeile in eingabe:
-            ganzezeile = ganzezeile.rstrip('\r\n')
-            ganzezeile = ganzezeile[1:-1]
-            zeile = ganzezeile.split('","')
-            # Header gesondert betrachten
-            if (len(zeile) == 2):
-                if ((zeile[0] in headerzahlen) and (zeile[1] != '')):
-                    daten.update([(zeile[0], float(zeile[1].replace(',', '.')))])
-                else:
-                    daten.update([(zeile[0], zeile[1])])
 
+    def _Datenzeilen(maxsplit):
+        """Liefert alle (ggfs. nur teilweise zerlegten) Datenzeilen und verarbeitet dabei
+        (einzelne) Headerzeilen.
+        """
+        for zeile in eingabe:
+            # Header gesondert betrachten
+            if (zeile.count('","') == 1):
+                _GDSHeaderEintrag(daten=daten, zeile=_GDSZeileZerlegen(zeile=zeile))
                 continue
 
-            if (not datenbereich):
-                spaltennamen = zeile
-                datenbereich = True
-                continue
+            # Teilweise zerlegte Zeilen muessen trotzdem wie beim vollstaendigen Einlesen alle
+            # Eintraege enthalten
+            if (maxsplit != -1):
+                anzahl = zeile.count('","') + 1
+                if (anzahl < spaltenanzahl):
+                    print('# Warnung: Datenzeile mit ' + str(anzahl) + ' statt '
+                          + str(spaltenanzahl) + ' Eintraegen wird ignoriert')
+                    continue
 
-            versuchsdaten += [[float(wert.replace(',', '.')) for wert in zeile]]
+            yield _GDSZeileZerlegen(zeile=zeile, maxsplit=maxsplit)
 
-    messdaten = Datenstruktur()
-    for idx_eintrag, name in enumerate(spaltennamen):
-        messdaten.update([(name, [datenzeile[idx_eintrag] for datenzeile in versuchsdaten])])
+    for zeile in eingabe:
+        zeile = _GDSZeileZerlegen(zeile=zeile)
+        # Header gesondert betrachten
+        if (len(zeile) == 2):
+            _GDSHeaderEintrag(daten=daten, zeile=zeile)
+            continue
 
-    daten.update([('Daten', messdaten)])
-    daten.update([('Dateiname', dateiname)])
+        spaltennamen = zeile
+        break
 
-    rueckgabe = Datenstruktur()
-    rueckgabe.update([('GDS', daten)])
-    return rueckgabe
+    spaltenanzahl = len(spaltennamen)
+    auswahl, spaltennamen = _SpaltenauswahlIndizes(spaltennamen=spaltennamen,
+        spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+    maxsplit = -1
+    mindestlaenge = spaltenanzahl
+    if (auswahl is not None):
+        maxsplit = max(auswahl, default=-1) + 1
+        mindestlaenge = maxsplit
+
+    return dict([('Spaltennamen', spaltennamen), ('Zeilen', _Datenzeilen(maxsplit=maxsplit)),
+        ('Spaltenanzahl', spaltenanzahl), ('Textspalten', []), ('Auswahl', auswahl),
+        ('Mindestlaenge', mindestlaenge)])
 
 
 
 # -------------------------------------------------------------------------------------------------
-def LeseTVCDaten(dateiname):
-    """Lese und interpretiere tvc-Dateien, die nach folgendem Schema aufgebaut sind:
-    Im Header der Datei steht immer ein Wert und ein Schluessel durch ein Gleichheitszeichen
-    getrennt, die alle eingelesen werden (ausgewaehlte Felder als float, der Rest als Strings).
-    Der Header wird vom Rest durch eine Ende-Zeile getrennt, und anschliessend folgen betitelte
-    Abschnitte mit Messdaten (ohne Header). Die Messdaten aus allen Abschnitten werden
-    zusammengefuegt, aber die Indizes zum Start jedes (neuen) Abschnitts werden ebenfalls
-    gespeichert. Gibt die eingelesenen Daten als Struktur mit dem Schluessel Triax zurueck.
+def _TVCDatenquelle(eingabe, daten, spaltenauswahl=None, dateiname=''):
+    """Liest den Header einer geoeffneten tvc-Datei eingabe in daten ein (siehe LeseTVCDaten) und
+    gibt ein dict wie _EAXDatenquelle zurueck. Zusaetzlich ist unter Messdatenzusatz ein dict mit
+    dem Eintrag Schritte enthalten, das waehrend des Einlesens der Zeilen gefuellt wird.
     """
-    from .datenstruktur import Datenstruktur
-
-    daten = Datenstruktur()
     headerzahlen = ['Intervall', 'Zelle', 'Hoehe', 'Durchmesser', 'Anf-Feuchtmasse', 'Trockenmasse',
                     'End-Feuchtmasse', 'Sättigungsdruck', 'Zelldruch', 'Schergeschwindigkeit',
                     'Korndichte', 'Fläche-Beginn', 'Höhe-Beginn', 'TA - Spannungskreise']
     spaltennamen = ['Datum/Zeit', 'Radialdruck [kN/m^2]', 'Porenwasserdruck [kN/m^2]',
                     'Druck_undef [kN/m^2]', 'Axialkraft [kN]', 'Stauchung [mm]',
                     'Stauchung_undef [mm]', 'Stauchung_undef(2) [mm]']
-    versuchsdaten = []
-    header = True
-    idx_daten = 0
     schritte = []
-    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
+    spaltenanzahl = len(spaltennamen)
+    auswahl, spaltennamen = _SpaltenauswahlIndizes(spaltennamen=spaltennamen,
+        spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+
+    def _Datenzeilen():
+        """Liest den Header und liefert danach alle Datenzeilen mit Datum und Uhrzeit als einem
+        gemeinsamen ersten Eintrag. Der Beginn jedes Abschnitts wird in schritte gespeichert.
+        """
+        header = True
+        idx_daten = 0
         for zeile in eingabe:
             zeile = zeile.rstrip('\r\n')
             if (header):
@@ -240,37 +450,422 @@ def LeseTVCDaten(dateiname):
                     continue
 
             if ('---' in zeile):
-                schritte += [[zeile[4:-4], idx_daten]]
+                schritte.append([zeile[4:-4], idx_daten])
+                continue
+
+            tempzeile = zeile.split()
+            if (tempzeile == []):
                 continue
 
             idx_daten += 1
+            yield [' '.join(tempzeile[:2])] + tempzeile[2:]
 
-            tempzeile = zeile.split()
-            temp_daten = []
-            for idx_wert, wert in enumerate(tempzeile):
-                if (idx_wert == 0):
-                    continue
-                if (idx_wert == 1):
-                    temp_daten += [tempzeile[0] + ' ' + tempzeile[1]]
-                else:
-                    temp_daten += [float(wert.replace(',', '.'))]
+    return dict([('Spaltennamen', spaltennamen), ('Zeilen', _Datenzeilen()),
+        ('Spaltenanzahl', spaltenanzahl), ('Textspalten', [0]), ('Auswahl', auswahl),
+        ('Messdatenzusatz', dict([('Schritte', schritte)]))])
 
-            versuchsdaten += [temp_daten]
 
-    messdaten = Datenstruktur()
-    for idx_eintrag, name in enumerate(spaltennamen):
-        messdaten.update([(name, [datenzeile[idx_eintrag] for datenzeile in versuchsdaten])])
 
-    messdaten.update([('Schritte', schritte)])
+# Datenquelle und Schluessel der unterstuetzten Rohdatenformate je Dateiendung
+_rohdatenformate = {
+    'eax': (_EAXDatenquelle, 'EAX'),
+    'dta': (_DTADatenquelle, 'DTA'),
+    'gds': (_GDSDatenquelle, 'GDS'),
+    'tvc': (_TVCDatenquelle, 'TVC'),
+}
+
+
+# -------------------------------------------------------------------------------------------------
+def _LeseRohdaten(dateiname, endung, als_array=False, spaltenauswahl=None):
+    """Liest die Rohdatendatei dateiname im Format endung (siehe _rohdatenformate) vollstaendig ein
+    und gibt die Daten als Struktur unter dem Schluessel des Formats zurueck.
+    """
+    from .datenstruktur import Datenstruktur
+
+    datenquelle, schluessel = _rohdatenformate[endung]
+    daten = Datenstruktur()
+    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
+        quelle = datenquelle(eingabe=eingabe, daten=daten, spaltenauswahl=spaltenauswahl,
+            dateiname=dateiname)
+        spalten = _SpaltenAusZeilen(zeilen=quelle['Zeilen'], spaltenanzahl=quelle['Spaltenanzahl'],
+            textspalten=quelle['Textspalten'], auswahl=quelle['Auswahl'],
+            mindestlaenge=quelle.get('Mindestlaenge'))
+
+    messdaten = _SpaltenZuMessdaten(spaltennamen=quelle['Spaltennamen'], spalten=spalten,
+        als_array=als_array)
+    messdaten.update(quelle.get('Messdatenzusatz', dict()))
     daten.update([('Daten', messdaten)])
     daten.update([('Dateiname', dateiname)])
 
     rueckgabe = Datenstruktur()
-    rueckgabe.update([('TVC', daten)])
+    rueckgabe.update([(schluessel, daten)])
     return rueckgabe
 
 
 
+# -------------------------------------------------------------------------------------------------
+def _Spaltenindex(spaltennamen, name):
+    """Gibt den Index von name in spaltennamen zurueck oder None, falls name None ist oder nicht
+    in spaltennamen enthalten ist (mit einer Warnung).
+    """
+    if (name is None):
+        return None
+
+    if (name not in spaltennamen):
+        print('# Warnung: Spalte ' + name + ' nicht in den eingelesenen Spalten vorhanden')
+        return None
+
+    return spaltennamen.index(name)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def RohdatenBlockweiseLesen(dateiname, blockgroesse=None, spaltenauswahl=None, startzeile=0,
+    schrittweite=1, huellengroesse=None, huellenspalte=None, kopfdaten=None, stufen=None,
+    stufenindex=None):
+    """Generator, der die Messdaten einer Rohdatendatei dateiname (eax, dta, gds oder tvc) in
+    Bloecken von (maximal) blockgroesse Zeilen liefert, ohne die gesamte Datei im Speicher zu
+    halten. Jeder Block ist eine Datenstruktur mit den (ausgewaehlten) Spaltennamen als Schluessel
+    und den Werten als array('d') (bzw. Liste von Strings fuer Textspalten).
+    Waehrend des Einlesens koennen die ersten startzeile Zeilen verworfen und mit schrittweite nur
+    jede n-te Zeile behalten werden oder mit huellengroesse und huellenspalte aus jeweils
+    huellengroesse Zeilen nur die Zeilen mit dem kleinsten und groessten Wert von huellenspalte
+    (siehe _BloeckeAusduennen).
+    Die Headereintraege werden in der (optional uebergebenen) Struktur kopfdaten gespeichert, bei
+    tvc-Dateien nach dem letzten Block auch die Schritte (bezogen auf die nicht ausgeduennten Daten).
+    Bei gds-Dateien koennen ueber stufen (und ggfs. stufenindex) nur ausgewaehlte Versuchsstufen
+    gelesen werden. Die Informationen zu allen Stufen werden dann vor dem ersten Block unter Stufen
+    in kopfdaten abgelegt (siehe _LeseGDSStufen).
+    """
+    from .datenstruktur import Datenstruktur
+
+    if (kopfdaten is None):
+        kopfdaten = Datenstruktur()
+
+    endung = dateiname.split('.')[-1].lower()
+    if (endung not in _rohdatenformate):
+        print('# Warnung: Nicht unterstuetztes Rohdatenformat fuer ' + dateiname)
+        return
+
+    if ((endung == 'gds') and (stufen is not None)):
+        bloecke = _GDSStufenBlockweiseLesen(dateiname=dateiname, kopfdaten=kopfdaten,
+            stufen=stufen, stufenindex=stufenindex, spaltenauswahl=spaltenauswahl,
+            blockgroesse=blockgroesse, startzeile=startzeile, schrittweite=schrittweite,
+            huellengroesse=huellengroesse, huellenspalte=huellenspalte)
+        for block in bloecke:
+            yield block
+
+        return
+
+    datenquelle, schluessel = _rohdatenformate[endung]
+    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
+        quelle = datenquelle(eingabe=eingabe, daten=kopfdaten, spaltenauswahl=spaltenauswahl,
+            dateiname=dateiname)
+        bloecke = _SpaltenbloeckeAusZeilen(zeilen=quelle['Zeilen'],
+            spaltenanzahl=quelle['Spaltenanzahl'], textspalten=quelle['Textspalten'],
+            blockgroesse=blockgroesse, auswahl=quelle['Auswahl'],
+            mindestlaenge=quelle.get('Mindestlaenge'))
+        for block in _BloeckeAusduennen(bloecke=bloecke, startzeile=startzeile,
+            schrittweite=schrittweite, huellengroesse=huellengroesse,
+            idx_huellenspalte=_Spaltenindex(spaltennamen=quelle['Spaltennamen'],
+            name=huellenspalte)):
+            yield Datenstruktur(zip(quelle['Spaltennamen'], block))
+
+    kopfdaten.update(quelle.get('Messdatenzusatz', dict()))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def LeseEAXDaten(dateiname, als_array=False, spaltenauswahl=None):
+    """Lese und interpretiere eax-Dateien, die nach folgendem Schema aufgebaut sind:
+    Die Datei ist in die beiden Abschnitte [Eingaben] und [Daten] unterteilt. Alle Felder im
+    ersten Abschnitt folgen dem Muster schluessel=wert und werden entsprechend eingelesen und
+    gespeichert (ausgewaehlte Felder als float, der Rest als Strings).
+    Der zweite Abschnitt startet nach [Daten] mit einer Kopfzeile. Anschliessend folgen mehrere
+    Zeilen an Messdaten, wobei die einzelnen Felder jeweils durch Semikolons getrennt sind.
+    Die Messdaten werden spaltenweise eingelesen (siehe _SpaltenAusZeilen). Mit als_array=True
+    werden die Zahlenspalten als Messreihe statt als Listen zurueckgegeben. Falls eine Liste an
+    Spaltennamen spaltenauswahl uebergeben wird, werden nur diese Spalten umgewandelt und gespeichert.
+    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Einax zurueck.
+    """
+    return _LeseRohdaten(dateiname=dateiname, endung='eax', als_array=als_array,
+        spaltenauswahl=spaltenauswahl)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def LeseDTADaten(dateiname, als_array=False, spaltenauswahl=None):
+    """Lese und interpretiere dta-Dateien, die nach folgendem Schema aufgebaut sind:
+    Die Datei ist in die beiden Abschnitte [Versuchsdaten] und [Daten] unterteilt. Alle Felder im
+    ersten Abschnitt folgen dem Muster schluessel=wert und werden entsprechend eingelesen und
+    gespeichert (ausgewaehlte Felder als float, der Rest als Strings).
+    Der zweite Abschnitt startet nach [Daten] mit einer Kopfzeile. Anschliessend folgen mehrere
+    Zeilen an Messdaten, wobei die einzelnen Felder jeweils durch Tabulatoren getrennt sind.
+    Die Messdaten werden spaltenweise eingelesen (siehe _SpaltenAusZeilen). Mit als_array=True
+    werden die Zahlenspalten als Messreihe statt als Listen zurueckgegeben. Falls eine Liste an
+    Spaltennamen spaltenauswahl uebergeben wird, werden nur diese Spalten umgewandelt und gespeichert.
+    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Einax zurueck.
+    """
+    return _LeseRohdaten(dateiname=dateiname, endung='dta', als_array=als_array,
+        spaltenauswahl=spaltenauswahl)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def LeseGDSDaten(dateiname, als_array=False, stufen=None, stufenindex=None, spaltenauswahl=None):
+    """Lese und interpretiere gds-Dateien, die nach folgendem Schema aufgebaut sind:
+    Alle Eintraege sind in doppelten Anfuehrungszeichen und mit Kommata voneinander getrennt. Im
+    Header der Datei steht immer ein Wert und ein Schluessel, die alle eingelesen werden
+    (ausgewaehlte Felder als float, der Rest als Strings).
+    Der Header wird vom Rest durch eine Zeile getrennt, die mehr als zwei Eintraege enthaelt (die
+    Bezeichnungen fuer die folgenden Messdaten). Anschliessend folgen Zeilen an Messdaten,
+    die wiederum in Anfuehrungszeichen stehen und durch Kommata voneinander getrennt sind.
+    Die Messdaten werden spaltenweise eingelesen (siehe _SpaltenAusZeilen). Mit als_array=True
+    werden alle Spalten als Messreihe statt als Listen zurueckgegeben, was bei langen Versuchen
+    deutlich weniger Speicher benoetigt.
+    Falls eine Liste stufen uebergeben wird, werden nur die Messdaten der Versuchsstufen (Stage
+    Number) aus stufen eingelesen (siehe _LeseGDSStufen). Der dafuer benoetigte Stufenindex kann
+    optional als stufenindex uebergeben werden (siehe GDSStufenindex). Falls eine Liste an
+    Spaltennamen spaltenauswahl uebergeben wird, werden nur diese Spalten gespeichert. Die Zeilen
+    werden dann nur bis zur letzten ausgewaehlten Spalte zerlegt und nur die ausgewaehlten Spalten
+    umgewandelt.
+    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Triax zurueck.
+    """
+    if (stufen is not None):
+        return _LeseGDSStufen(dateiname=dateiname, stufen=stufen, als_array=als_array,
+            stufenindex=stufenindex, spaltenauswahl=spaltenauswahl)
+
+    return _LeseRohdaten(dateiname=dateiname, endung='gds', als_array=als_array,
+        spaltenauswahl=spaltenauswahl)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def GDSStufenindex(dateiname, stufenspalte='Stage Number'):
+    """Durchsucht die gds-Datei dateiname einmal nach den Grenzen der Versuchsstufen, ohne die
+    Messdaten umzuwandeln. Gibt ein dict mit den Headereintraegen (Header), den Spaltennamen und
+    einer Liste an Abschnitten zurueck (oder None, falls die Spalte stufenspalte nicht existiert).
+    Jeder Abschnitt ist eine Liste aus Stufe, Index der ersten Datenzeile, Anzahl der Datenzeilen
+    sowie der Byte-Position der ersten und der letzten Zeile des Abschnitts in der Datei.
+    Falls ein persistenter Zwischenspeicher aktiviert ist, wird der Index dort abgelegt und
+    wiederverwendet, solange die Datei unveraendert ist.
+    """
+    from os import path as os_path
+    from .zwischenspeicher import Dateikennung, ZwischenspeicherLesen, ZwischenspeicherSchreiben
+
+    zwischenspeicherschluessel = ['GDSStufenindex', os_path.abspath(dateiname), stufenspalte]
+    dateikennung = Dateikennung(dateiname=dateiname)
+    gespeichert = ZwischenspeicherLesen(schluessel=zwischenspeicherschluessel)
+    if ((gespeichert is not None) and (gespeichert['Dateikennung'] == dateikennung)):
+        return gespeichert['Index']
+
+    header = []
+    spaltennamen = None
+    abschnitte = []
+    with open(dateiname, 'rb') as eingabe:
+        position = 0
+        idx_datenzeile = 0
+        letzte_stufe = None
+        for zeile in eingabe:
+            zeilenstart = position
+            position += len(zeile)
+            anzahl_eintraege = zeile.count(b'","') + 1
+            # Header gesondert betrachten
+            if (anzahl_eintraege == 2):
+                header += [_GDSZeileZerlegen(zeile=zeile.decode('iso-8859-15'))]
+                continue
+
+            if (spaltennamen is None):
+                spaltennamen = _GDSZeileZerlegen(zeile=zeile.decode('iso-8859-15'))
+                if (stufenspalte not in spaltennamen):
+                    print('# Warnung: Spalte ' + stufenspalte + ' nicht in ' + dateiname + ' gefunden')
+                    return None
+
+                idx_stufenspalte = spaltennamen.index(stufenspalte)
+                continue
+
+            # Unvollstaendige Zeilen werden auch beim Einlesen ignoriert
+            if (anzahl_eintraege < len(spaltennamen)):
+                continue
+
+            stufe = zeile.rstrip(b'\r\n')[1:-1].split(b'","', idx_stufenspalte+1)[idx_stufenspalte]
+            if (stufe != letzte_stufe):
+                letzte_stufe = stufe
+                stufe = float(stufe.replace(b',', b'.'))
+                if ((abschnitte == []) or (stufe != abschnitte[-1][0])):
+                    abschnitte += [[stufe, idx_datenzeile, 0, zeilenstart, zeilenstart]]
+
+            abschnitte[-1][2] += 1
+            abschnitte[-1][4] = zeilenstart
+            idx_datenzeile += 1
+
+    if (spaltennamen is None):
+        spaltennamen = []
+
+    stufenindex = dict([('Header', header), ('Spaltennamen', spaltennamen),
+        ('Abschnitte', abschnitte)])
+    if (dateikennung is not None):
+        ZwischenspeicherSchreiben(schluessel=zwischenspeicherschluessel,
+            inhalt=dict([('Dateikennung', dateikennung), ('Index', stufenindex)]))
+
+    return stufenindex
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _GDSBereichszeilen(eingabe, bereiche, spaltenanzahl, maxsplit=-1):
+    """Liefert die zerlegten Datenzeilen aller bereiche (Byte-Position der ersten und der letzten
+    Zeile eines Bereichs) aus der binaer geoeffneten gds-Datei eingabe.
+    """
+    for startposition, endposition in bereiche:
+        eingabe.seek(startposition)
+        position = startposition
+        for zeile in eingabe:
+            if (position > endposition):
+                break
+
+            position += len(zeile)
+            # Unvollstaendige Zeilen und Header sind im Stufenindex nicht mitgezaehlt
+            if (zeile.count(b'","') + 1 >= spaltenanzahl):
+                yield _GDSZeileZerlegen(zeile=zeile.decode('iso-8859-15'), maxsplit=maxsplit)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _GDSStufenVorbereiten(eingabe, daten, stufen, stufenindex, spaltenauswahl, dateiname):
+    """Speichert die Headereintraege aus stufenindex in daten und wertet fuer alle Abschnitte der
+    binaer geoeffneten gds-Datei eingabe nur die erste und letzte Zeile aus (siehe _LeseGDSStufen).
+    Gibt ein dict mit Spaltennamen, Spaltenanzahl, Auswahl, Maxsplit und Mindestlaenge (fuer das
+    Zerlegen der Zeilen, siehe _GDSDatenquelle), den Informationen zu allen Abschnitten (Stufen) und den Byte-Bereichen der Abschnitte
+    mit einer Stufe aus stufen (Bereiche) zurueck.
+    """
+    from .datenstruktur import Datenstruktur
+
+    for zeile in stufenindex['Header']:
+        _GDSHeaderEintrag(daten=daten, zeile=zeile)
+
+    spaltenanzahl = len(stufenindex['Spaltennamen'])
+    auswahl, spaltennamen = _SpaltenauswahlIndizes(spaltennamen=stufenindex['Spaltennamen'],
+        spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+    maxsplit = -1
+    mindestlaenge = spaltenanzahl
+    if (auswahl is not None):
+        maxsplit = max(auswahl, default=-1) + 1
+        mindestlaenge = maxsplit
+
+    stufeninfo = []
+    einzulesen = []
+    idx_daten = 0
+    for stufe, startindex, anzahl, startposition, endposition in stufenindex['Abschnitte']:
+        randwerte = _SpaltenAusZeilen(zeilen=_GDSBereichszeilen(eingabe=eingabe,
+            bereiche=[(startposition, startposition), (endposition, endposition)],
+            spaltenanzahl=spaltenanzahl, maxsplit=maxsplit), spaltenanzahl=spaltenanzahl,
+            auswahl=auswahl, mindestlaenge=mindestlaenge)
+        datenindex = None
+        if (stufe in stufen):
+            datenindex = idx_daten
+            idx_daten += anzahl
+            einzulesen += [(startposition, endposition)]
+
+        stufeninfo += [Datenstruktur([('Stufe', stufe), ('Startindex', startindex),
+            ('Anzahl', anzahl), ('Datenindex', datenindex),
+            ('Erste Zeile', Datenstruktur([(name, werte[0]) for name, werte in zip(spaltennamen, randwerte)])),
+            ('Letzte Zeile', Datenstruktur([(name, werte[-1]) for name, werte in zip(spaltennamen, randwerte)]))])]
+
+    return dict([('Spaltennamen', spaltennamen), ('Spaltenanzahl', spaltenanzahl),
+        ('Auswahl', auswahl), ('Maxsplit', maxsplit), ('Mindestlaenge', mindestlaenge),
+        ('Stufen', stufeninfo),
+        ('Bereiche', einzulesen)])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _LeseGDSStufen(dateiname, stufen, als_array=False, stufenindex=None, spaltenauswahl=None):
+    """Liest aus der gds-Datei dateiname nur die Messdaten aller Abschnitte ein, deren Stufe in der
+    Liste stufen enthalten ist. Mithilfe des stufenindex (siehe GDSStufenindex) werden dazu nur die
+    entsprechenden Bereiche der Datei gelesen. Alle anderen Abschnitte werden uebersprungen, nur
+    deren erste und letzte Zeile wird ausgewertet. Gibt eine Struktur wie LeseGDSDaten zurueck, in der
+    zusaetzlich unter Stufen fuer jeden Abschnitt Stufe, Startindex und Anzahl (bezogen auf alle
+    Datenzeilen der Datei), Datenindex (Startindex in den eingelesenen Daten oder None) sowie die
+    Werte von Erste Zeile und Letzte Zeile gespeichert sind. Mit spaltenauswahl werden wie bei
+    LeseGDSDaten nur die ausgewaehlten Spalten eingelesen.
+    """
+    from .datenstruktur import Datenstruktur
+
+    if (stufenindex is None):
+        stufenindex = GDSStufenindex(dateiname=dateiname)
+        if (stufenindex is None):
+            return Datenstruktur()
+
+    daten = Datenstruktur()
+    with open(dateiname, 'rb') as eingabe:
+        vorbereitet = _GDSStufenVorbereiten(eingabe=eingabe, daten=daten, stufen=stufen,
+            stufenindex=stufenindex, spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+        spalten = _SpaltenAusZeilen(zeilen=_GDSBereichszeilen(eingabe=eingabe,
+            bereiche=vorbereitet['Bereiche'], spaltenanzahl=vorbereitet['Spaltenanzahl'],
+            maxsplit=vorbereitet['Maxsplit']), spaltenanzahl=vorbereitet['Spaltenanzahl'],
+            auswahl=vorbereitet['Auswahl'], mindestlaenge=vorbereitet['Mindestlaenge'])
+
+    messdaten = _SpaltenZuMessdaten(spaltennamen=vorbereitet['Spaltennamen'], spalten=spalten,
+        als_array=als_array)
+    daten.update([('Daten', messdaten)])
+    daten.update([('Stufen', vorbereitet['Stufen'])])
+    daten.update([('Dateiname', dateiname)])
+
+    rueckgabe = Datenstruktur()
+    rueckgabe.update([('GDS', daten)])
+    return rueckgabe
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _GDSStufenBlockweiseLesen(dateiname, kopfdaten, stufen, stufenindex=None, spaltenauswahl=None,
+    blockgroesse=None, startzeile=0, schrittweite=1, huellengroesse=None, huellenspalte=None):
+    """Wie _LeseGDSStufen, aber liefert die Messdaten der ausgewaehlten Stufen blockweise (siehe
+    RohdatenBlockweiseLesen). Header und Stufen werden vor dem ersten Block in kopfdaten gespeichert.
+    """
+    from .datenstruktur import Datenstruktur
+
+    if (stufenindex is None):
+        stufenindex = GDSStufenindex(dateiname=dateiname)
+        if (stufenindex is None):
+            return
+
+    with open(dateiname, 'rb') as eingabe:
+        vorbereitet = _GDSStufenVorbereiten(eingabe=eingabe, daten=kopfdaten, stufen=stufen,
+            stufenindex=stufenindex, spaltenauswahl=spaltenauswahl, dateiname=dateiname)
+        kopfdaten.update([('Stufen', vorbereitet['Stufen'])])
+        bloecke = _SpaltenbloeckeAusZeilen(zeilen=_GDSBereichszeilen(eingabe=eingabe,
+            bereiche=vorbereitet['Bereiche'], spaltenanzahl=vorbereitet['Spaltenanzahl'],
+            maxsplit=vorbereitet['Maxsplit']), spaltenanzahl=vorbereitet['Spaltenanzahl'],
+            blockgroesse=blockgroesse, auswahl=vorbereitet['Auswahl'],
+            mindestlaenge=vorbereitet['Mindestlaenge'])
+        for block in _BloeckeAusduennen(bloecke=bloecke, startzeile=startzeile,
+            schrittweite=schrittweite, huellengroesse=huellengroesse,
+            idx_huellenspalte=_Spaltenindex(spaltennamen=vorbereitet['Spaltennamen'],
+            name=huellenspalte)):
+            yield Datenstruktur(zip(vorbereitet['Spaltennamen'], block))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def LeseTVCDaten(dateiname, als_array=False, spaltenauswahl=None):
+    """Lese und interpretiere tvc-Dateien, die nach folgendem Schema aufgebaut sind:
+    Im Header der Datei steht immer ein Wert und ein Schluessel durch ein Gleichheitszeichen
+    getrennt, die alle eingelesen werden (ausgewaehlte Felder als float, der Rest als Strings).
+    Der Header wird vom Rest durch eine Ende-Zeile getrennt, und anschliessend folgen betitelte
+    Abschnitte mit Messdaten (ohne Header). Die Messdaten aus allen Abschnitten werden
+    zusammengefuegt, aber die Indizes zum Start jedes (neuen) Abschnitts werden ebenfalls
+    gespeichert. Die Messdaten werden spaltenweise eingelesen (siehe _SpaltenAusZeilen). Mit
+    als_array=True werden die Zahlenspalten als Messreihe statt als Listen zurueckgegeben. Falls eine
+    Liste an Spaltennamen spaltenauswahl uebergeben wird, werden nur diese Spalten gespeichert.
+    Gibt die eingelesenen Daten als Struktur mit dem Schluessel Triax zurueck.
+    """
+    return _LeseRohdaten(dateiname=dateiname, endung='tvc', als_array=als_array,
+        spaltenauswahl=spaltenauswahl)
+
+
+
 # -------------------------------------------------------------------------------------------------
 def Interpolationsblock_Aus_KVSdaten(korndurchmesser, sum_masseprozent, interpolationspunkte=24,
     nursiebung=True):
@@ -309,6 +904,21 @@ def Interpolationsblock_Aus_KVSdaten(korndurchmesser, sum_masseprozent, interpol
 
 
 
+# Die letzten vier Zeilen vor dem Beginn einer Koernungslinie in kvs-Dateien. 5 und 6 sind in diesen
+# Dateien Schalter fuer True/Aktiviert (5) oder False/Deaktiviert (6). Der Wert gibt an, ob fuer
+# Siebung und Schlaemmung die gleiche Trockenmasse verwendet wird. Die Folge '5', '', '6', '6'
+# beschreibt scheinbar deaktivierte, d.h. nur als Flaeche eingezeichnete Daten
+_kvs_startfolgen = {
+    ('', '5', '6', '6'): False,
+    ('', '6', '6', '6'): True,
+}
+# Anzahl an Leerzeilen, mit denen eine Koernungslinie endet (alternativ mit einer Zeile MINCAD)
+_kvs_endleerzeilen = 4
+_kvs_textschluessel = ['Ort', 'Entnahmestelle', 'Tiefe', 'Bodenart']
+_kvs_araeometerbezeichnungen = ['Volumen Birne [cm^3]', 'Flaeche Messzylinder [cm^2]',
+    'Laenge Birne [cm]', 'Laenge Skala [cm]', 'Abstand Birne-Skala [cm]', 'Meniskuskorrektur']
+
+
 # -------------------------------------------------------------------------------------------------
 def LeseKVSDaten(dateiname):
     """Lese und interpretiere kvs-Dateien, die mit der Software GGU Sieve erstellt worden sind.
@@ -320,198 +930,253 @@ def LeseKVSDaten(dateiname):
     charakteristische Werte fuer jede Koernungslinie bestimmt. Gibt die eingelesenen und berechneten
     Daten als Struktur mit dem Schluessel Kornverteilung zurueck.
     """
-    from math import sqrt
     from .datenstruktur import Datenstruktur
 
-    daten = Datenstruktur()
+    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
+        zeilen = eingabe.read().split('\n')
 
-    zeile_Ignorieren = True
-    # 5 und 6 sind in diesen Dateien Schalter fuer True/Aktiviert (5) oder False/Deaktiviert (6)
-    start_Code = ['\n5\n6\n6\n', '\n6\n6\n6\n']
-    # start_Code '5\n\n6\n6\n' sind scheinbar die deaktivierten, d.h. nur als Flaeche eingezeichneten Daten
-    end_Code = '\n\n\n\n'
-    codefolge = ['', '', '', '']
-    len_folge = len(codefolge)
+    # Nach dem letzten Zeilenumbruch folgt keine weitere Zeile
+    if (zeilen[-1] == ''):
+        del zeilen[-1]
 
-    araeometerbezeichnungen = ['Volumen Birne [cm^3]', 'Flaeche Messzylinder [cm^2]',
-        'Laenge Birne [cm]', 'Laenge Skala [cm]', 'Abstand Birne-Skala [cm]', 'Meniskuskorrektur']
+    daten = _KVSZeilenAuswerten(zeilen=zeilen)
+    daten.update([('Dateiname', dateiname)])
 
-    idx_blockzeile = -1
-    teilsiebung = False
-    idx_block = 0
-    with open(dateiname, 'r', encoding='iso-8859-15') as eingabe:
-        for idx_zeile, zeile in enumerate(eingabe):
-            zeile = zeile.rstrip('\n')
-            zeile = zeile.rstrip('\r')
-            zeile += '\n'
-            codefolge[idx_zeile % len_folge] = zeile
-            code = ''.join([codefolge[(1 + idx_eintrag + idx_zeile) % len_folge] for idx_eintrag in range(len_folge)])
-            #print(repr(code))
-            if (code in start_Code) and (zeile_Ignorieren):
-                gleichemassen = True
-                if (code == '\n5\n6\n6\n'):
-                    gleichemassen = False
+    rueckgabe = Datenstruktur()
+    rueckgabe.update([('KVS', daten)])
+    return rueckgabe
+
+
+
+# -------------------------------------------------------------------------------------------------
+def LeseKVSDateien(dateinamen, prozesse=1):
+    """Liest alle kvs-Dateien aus der Liste dateinamen ein (siehe LeseKVSDaten) und gibt eine Liste
+    der eingelesenen Strukturen in der gleichen Reihenfolge wie dateinamen zurueck. Falls prozesse
+    groesser als eins ist, werden die Dateien auf (maximal) prozesse Prozesse verteilt
+    (prozesse=None verwendet alle verfuegbaren Prozessoren).
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
 
+    if (prozesse is None):
+        prozesse = os.cpu_count() or 1
+
+    prozesse = min(prozesse, len(dateinamen))
+    if (prozesse <= 1):
+        return [LeseKVSDaten(dateiname=dateiname) for dateiname in dateinamen]
+
+    # Viele kleine Dateien gebuendelt an die Prozesse uebergeben
+    buendelgroesse = max(1, len(dateinamen)//(4*prozesse))
+    with ProcessPoolExecutor(max_workers=prozesse) as prozesspool:
+        return list(prozesspool.map(LeseKVSDaten, dateinamen, chunksize=buendelgroesse))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _KVSZeilenAuswerten(zeilen):
+    """Durchlaeuft alle zeilen einer kvs-Datei (ohne Zeilenumbrueche) genau einmal. Ausserhalb einer
+    Koernungslinie wird nur auf eine der _kvs_startfolgen gewartet, innerhalb einer Koernungslinie
+    wird jede Zeile anhand ihrer Position im Block interpretiert, bis die Koernungslinie endet. Gibt
+    eine Struktur mit allen ausgewerteten Koernungslinien zurueck (siehe _KVSKoernungslinieBerechnen).
+    """
+    from .datenstruktur import Datenstruktur
+
+    daten = Datenstruktur()
+    im_block = False
+    idx_block = 0
+    # Die drei vorherigen Zeilen und die Anzahl direkt aufeinanderfolgender Leerzeilen
+    vorvorvorzeile = None
+    vorvorzeile = None
+    vorzeile = None
+    leerzeilen = 0
+    for zeile in zeilen:
+        letzte_zeilen = (vorvorvorzeile, vorvorzeile, vorzeile, zeile)
+        vorvorvorzeile, vorvorzeile, vorzeile = vorvorzeile, vorzeile, zeile
+        if (zeile == ''):
+            leerzeilen += 1
+        else:
+            leerzeilen = 0
+
+        if (not im_block):
+            if (letzte_zeilen in _kvs_startfolgen):
+                gleichemassen = _kvs_startfolgen[letzte_zeilen]
                 temp_block = Datenstruktur()
                 idx_block += 1
+                idx_blockzeile = -1
                 siebwerte = []
                 siebung = False
                 schlaemmwerte = []
                 schlaemmung = False
                 teilsiebung = False
                 temp_araeometer = Datenstruktur()
-                zeile_Ignorieren = False
-                continue
+                im_block = True
+
+            continue
+
+        if ((leerzeilen >= _kvs_endleerzeilen) or ('MINCAD' in zeile)):
+            _KVSKoernungslinieBerechnen(block=temp_block, siebwerte=siebwerte,
+                schlaemmwerte=schlaemmwerte, araeometer=temp_araeometer, siebung=siebung,
+                schlaemmung=schlaemmung, gleichemassen=gleichemassen)
+            daten.update([('Sieblinie ' + str(idx_block), temp_block)])
+            im_block = False
+            continue
+
+        # Hier angekommen befinden wir uns im aktuellen Block
+        idx_blockzeile += 1
+        if (idx_blockzeile > 43):
+            continue
+
+        if ('\t' in zeile):
+            zeile = zeile[0:zeile.index('\t')]
+
+        if (idx_blockzeile > 11):
+            zeilenstuecke = zeile.split()
+            if (len(zeilenstuecke) == 3):
+                if (zeilenstuecke[2] == '5'):
+                    siebwerte += [(float(zeilenstuecke[0]), float(zeilenstuecke[1]))]
+
+            elif (len(zeilenstuecke) == 4):
+                stunden = float(zeilenstuecke[0])
+                if (stunden >= 0.0):
+                    schlaemmwerte += [(stunden*60.0 + float(zeilenstuecke[1]), float(zeilenstuecke[2]), float(zeilenstuecke[3]))]
+
+        elif (idx_blockzeile < 4):
+            temp_block.update([(_kvs_textschluessel[idx_blockzeile], zeile)])
+        elif (idx_blockzeile == 4):
+            # Trockenmasse Siebung und Trockenmasse Schlaemmung
+            temp_block.update([('Trockenmassen [g]', [float(eintrag) for eintrag in zeile.split()])])
+        elif (idx_blockzeile == 5):
+            temp_block.update([('Korndichte [g/cm^3]', float(zeile))])
+        elif (idx_blockzeile == 6):
+            if ('5' in zeile):
+                teilsiebung = True
+        elif (idx_blockzeile == 7):
+            if (teilsiebung):
+                temp_block.update([('Teilsiebung-Durchmesser [mm]', float(zeile))])
+        elif (idx_blockzeile == 8):
+            if (teilsiebung):
+                temp_block.update([('Teilsiebung-Masse [g]', float(zeile))])
+        elif (idx_blockzeile == 10):
+            araeometerdaten = [float(eintrag) for eintrag in zeile.split()]
+            for bezeichnung, wert in zip(_kvs_araeometerbezeichnungen, araeometerdaten):
+                temp_araeometer.update([(bezeichnung, wert)])
+
+        elif (idx_blockzeile == 11):
+            schalter = zeile.split()
+            if (schalter[0] == '5'):
+                siebung = True
+
+            if (schalter[1] == '5'):
+                schlaemmung = True
+
+    return daten
 
-            if ((code == end_Code) or ('MINCAD' in zeile)) and (not zeile_Ignorieren):
-                siebdurchmesser = []
-                schlaemmdurchmesser = []
-                sum_masseprozent = []
-                if (siebung):
-                    trockenmasse_sieb = temp_block['Trockenmassen [g]'][0]
-                    siebdurchmesser = [eintrag[0] for eintrag in siebwerte]
-                    siebdurchmesser = list(reversed(siebdurchmesser[:-1]))
-                    temp_block.update([('Siebdurchmesser [mm]', siebdurchmesser)])
-
-                    siebmassen = [eintrag[1] for eintrag in siebwerte]
-                    siebmassen = list(reversed(siebmassen[1:]))
-                    temp_block.update([('Siebmassen [g]', siebmassen)])
-
-                    sum_massen = [sum(siebmassen[:idx+1]) for idx in range(len(siebmassen))]
-                    if ('Teilsiebung-Durchmesser [mm]' in temp_block):
-                        teilsiebunggroesse = temp_block['Teilsiebung-Durchmesser [mm]']
-                        teilsiebungmasse = temp_block['Teilsiebung-Masse [g]']
-                        idx_teilsieb = None
-                        for idx_sieb, temp_siebgroesse in enumerate(siebdurchmesser):
-                            if (temp_siebgroesse > teilsiebunggroesse):
-                                idx_teilsieb = idx_sieb
-                                break
-
-                        prozentrest = 1.0 - sum([einzelmasse for einzelmasse in siebmassen[idx_teilsieb:]])/trockenmasse_sieb
-                        for idx_sieb, temp_siebgroesse in enumerate(siebdurchmesser):
-                            if (idx_sieb <= idx_teilsieb):
-                                sum_masseprozent += [100.0*sum_massen[idx_sieb]/teilsiebungmasse*prozentrest]
-                            else:
-                                sum_masseprozent += [sum_masseprozent[idx_teilsieb] + 100.0*(sum_massen[idx_sieb]-sum_massen[idx_teilsieb])/trockenmasse_sieb]
-
-                    else:
-                        sum_masseprozent = [100.0*sum_massen[idx]/sum_massen[-1] for idx in range(len(siebmassen))]
-
-                if (schlaemmung):
-                    temp_korndichte = temp_block['Korndichte [g/cm^3]']
-                    trockenmasse_schlaemm = temp_block['Trockenmassen [g]'][1]
-                    if (gleichemassen):
-                        if (siebung):
-                            trockenmasse_schlaemm = sum_massen[0]
-                        else:
-                            print('# Warnung: Die Referenzmasse bei der Schlaemmung ist uneindeutig')
-
-                    schlaemmzeiten = [eintrag[0] for eintrag in schlaemmwerte]
-                    schlaemmzeiten = list(reversed(schlaemmzeiten))
-                    schlaemmtemperaturen = [eintrag[1] for eintrag in schlaemmwerte]
-                    schlaemmtemperaturen = list(reversed(schlaemmtemperaturen))
-                    schlaemmdichten = [eintrag[2] for eintrag in schlaemmwerte] # Sind bei uns schon die R-Werte der Norm
-                    schlaemmdichten = list(reversed(schlaemmdichten))
-
-                    # Formeln (4) und (5) sowie Stokessche Gleichung aus Bild 3 von DIN 18123
-                    zaehigkeit_w = [0.00178/(1.0 + 0.0337*temp + 0.00022*temp**2) for temp in schlaemmtemperaturen]
-                    dichte_w = [1.0/(1.0+((2.31*temp-2.0)**2 -182.0)*1e-6) for temp in schlaemmtemperaturen]
-
-                    h_s = [temp_araeometer['Laenge Skala [cm]'] / (1.03 - 0.995)*(1.03 - (wert/1000.0 + 1.0)) for wert in schlaemmdichten]
-                    refhoehen = [einzel_h_s + temp_araeometer['Abstand Birne-Skala [cm]'] \
-                        + 0.5*(temp_araeometer['Laenge Birne [cm]'] - temp_araeometer['Volumen Birne [cm^3]']/temp_araeometer['Flaeche Messzylinder [cm^2]']) for einzel_h_s in h_s]
-                    refdurchmesser = [sqrt(18.35*zaehigkeit_w[idx]/(temp_korndichte - dichte_w[idx])*refhoehen[idx]/(60.0*schlaemmzeiten[idx])) for idx in range(len(schlaemmzeiten))]
-                    schlaemmdurchmesser = [round(refwert*1e4)/1e4 for refwert in refdurchmesser]
-
-                    # Formel fuer Temperaturkorrekturwert aus Tabelle 3 von DIN 18123
-                    massetempkorrektur = [0.0053*schlaemmtemperaturen[idx]**2-0.0082*schlaemmtemperaturen[idx]-1.9568 for idx in range(len(schlaemmtemperaturen))]
-                    masse_korrigiert = [schlaemmdichten[idx] + temp_araeometer['Meniskuskorrektur'] + massetempkorrektur[idx] for idx in range(len(schlaemmtemperaturen))]
-                    masseprozent = [100.0/trockenmasse_schlaemm*temp_korndichte/(temp_korndichte - 1.0)*masse for masse in masse_korrigiert]
-
-                    temp_block.update([('Schlaemmzeiten [min]', schlaemmzeiten)])
-                    temp_block.update([('Schlaemmtemperaturen [C]', schlaemmtemperaturen)])
-                    temp_block.update([('Schlaemmdichten [g/cm^3]', schlaemmdichten)])
-                    temp_block.update([('Schlaemmdurchmesser [mm]', schlaemmdurchmesser)])
-                    temp_block.update([('Schlaemmmasse-korrigiert [g]', masse_korrigiert)])
-                    temp_block.update([('Schlaemm-Masseprozent [%]', masseprozent)])
-
-                    temp_block.update([('Araeometerdaten', temp_araeometer)])
-
-                    if (siebung):
-                        while (schlaemmdurchmesser[-1] > siebdurchmesser[0]):
-                            schlaemmdurchmesser = schlaemmdurchmesser[:-1]
-                            masseprozent = masseprozent[:-1]
-
-                        sum_masseprozent = [sum_massen[0]/trockenmasse_sieb*temp_masse for temp_masse in masseprozent] + sum_masseprozent
-                    else:
-                        sum_masseprozent = [100.0/masseprozent[-1]*temp_masse for temp_masse in masseprozent]
 
-                korndurchmesser = schlaemmdurchmesser + siebdurchmesser
-                temp_block.update([('Korndurchmesser [mm]', korndurchmesser)])
-                temp_block.update([('Summierte Masseanteile Gesamtmenge [%]', sum_masseprozent)])
-
-                daten.update([('Sieblinie ' + str(idx_block), temp_block)])
-                idx_blockzeile = -1
-                zeile_Ignorieren = True
-                continue
-
-            if (zeile_Ignorieren):
-                continue
 
-            # Hier angekommen befinden wir uns im aktuellen Block
-            mod_zeile = zeile[:-1]
-            if ('\t' in mod_zeile):
-                mod_zeile = mod_zeile[0:mod_zeile.index('\t')]
-
-            idx_blockzeile += 1
-            if (idx_blockzeile < 4):
-                schluesselliste = ['Ort', 'Entnahmestelle', 'Tiefe', 'Bodenart']
-                temp_block.update([(schluesselliste[idx_blockzeile], mod_zeile)])
-            elif (idx_blockzeile == 4):
-                # Trockenmasse Siebung und Trockenmasse Schlaemmung
-                temp_block.update([('Trockenmassen [g]', [float(eintrag) for eintrag in mod_zeile.split()])])
-            elif (idx_blockzeile == 5):
-                temp_block.update([('Korndichte [g/cm^3]', float(mod_zeile))])
-            elif (idx_blockzeile == 6):
-                if ('5' in mod_zeile):
-                    teilsiebung = True
-            elif (idx_blockzeile == 7):
-                if (teilsiebung):
-                    temp_block.update([('Teilsiebung-Durchmesser [mm]', float(mod_zeile))])
-            elif (idx_blockzeile == 8):
-                if (teilsiebung):
-                    temp_block.update([('Teilsiebung-Masse [g]', float(mod_zeile))])
-            elif (idx_blockzeile == 9):
-                continue
-            elif (idx_blockzeile == 10):
-                araeometerdaten = [float(eintrag) for eintrag in mod_zeile.split()]
-                for idx_wert in range(len(araeometerbezeichnungen)):
-                    temp_araeometer.update([(araeometerbezeichnungen[idx_wert], araeometerdaten[idx_wert])])
-
-            elif (idx_blockzeile == 11):
-                schalter = mod_zeile.split()
-                if (schalter[0] == '5'):
-                    siebung = True
-
-                if (schalter[1] == '5'):
-                    schlaemmung = True
-
-            elif ((idx_blockzeile > 10) and (idx_blockzeile < 44)):
-                zeilenstuecke = mod_zeile.split()
-                if (len(zeilenstuecke) == 3):
-                    if (zeilenstuecke[2] == '5'):
-                        siebwerte += [(float(zeilenstuecke[0]), float(zeilenstuecke[1]))]
-
-                elif (len(zeilenstuecke) == 4):
-                    stunden = float(zeilenstuecke[0])
-                    if (stunden >= 0.0):
-                        schlaemmwerte += [(stunden*60.0 + float(zeilenstuecke[1]), float(zeilenstuecke[2]), float(zeilenstuecke[3]))]
-
-    daten.update([('Dateiname', dateiname)])
+# -------------------------------------------------------------------------------------------------
+def _KVSKoernungslinieBerechnen(block, siebwerte, schlaemmwerte, araeometer, siebung, schlaemmung,
+    gleichemassen):
+    """Rechnet die eingelesenen siebwerte (Durchmesser und Masse) und schlaemmwerte (Zeit, Temperatur
+    und Dichte) einer Koernungslinie in Korndurchmesser und summierte Masseanteile an der Gesamtmenge
+    um und speichert diese zusammen mit den Zwischenergebnissen in block. Alle Werte einer Messreihe
+    werden dazu jeweils in einem gemeinsamen Durchlauf berechnet.
+    """
+    from itertools import accumulate
+    from math import sqrt
 
-    rueckgabe = Datenstruktur()
-    rueckgabe.update([('KVS', daten)])
-    return rueckgabe
+    siebdurchmesser = []
+    schlaemmdurchmesser = []
+    sum_masseprozent = []
+    if (siebung):
+        trockenmasse_sieb = block['Trockenmassen [g]'][0]
+        siebdurchmesser = [eintrag[0] for eintrag in reversed(siebwerte[:-1])]
+        block.update([('Siebdurchmesser [mm]', siebdurchmesser)])
+
+        siebmassen = [eintrag[1] for eintrag in reversed(siebwerte[1:])]
+        block.update([('Siebmassen [g]', siebmassen)])
+
+        sum_massen = list(accumulate(siebmassen))
+        if ('Teilsiebung-Durchmesser [mm]' in block):
+            teilsiebunggroesse = block['Teilsiebung-Durchmesser [mm]']
+            teilsiebungmasse = block['Teilsiebung-Masse [g]']
+            idx_teilsieb = None
+            for idx_sieb, temp_siebgroesse in enumerate(siebdurchmesser):
+                if (temp_siebgroesse > teilsiebunggroesse):
+                    idx_teilsieb = idx_sieb
+                    break
+
+            prozentrest = 1.0 - sum(siebmassen[idx_teilsieb:])/trockenmasse_sieb
+            for idx_sieb, summe in enumerate(sum_massen):
+                if (idx_sieb <= idx_teilsieb):
+                    sum_masseprozent += [100.0*summe/teilsiebungmasse*prozentrest]
+                else:
+                    sum_masseprozent += [sum_masseprozent[idx_teilsieb] + 100.0*(summe-sum_massen[idx_teilsieb])/trockenmasse_sieb]
+
+        else:
+            sum_masseprozent = [100.0*summe/sum_massen[-1] for summe in sum_massen]
+
+    if (schlaemmung):
+        temp_korndichte = block['Korndichte [g/cm^3]']
+        trockenmasse_schlaemm = block['Trockenmassen [g]'][1]
+        if (gleichemassen):
+            if (siebung):
+                trockenmasse_schlaemm = sum_massen[0]
+            else:
+                print('# Warnung: Die Referenzmasse bei der Schlaemmung ist uneindeutig')
+
+        # Alle Groessen, die nicht von den einzelnen Messwerten abhaengen, nur einmal bestimmen
+        skalenfaktor = araeometer['Laenge Skala [cm]'] / (1.03 - 0.995)
+        abstand = araeometer['Abstand Birne-Skala [cm]']
+        birnenanteil = 0.5*(araeometer['Laenge Birne [cm]'] - araeometer['Volumen Birne [cm^3]']/araeometer['Flaeche Messzylinder [cm^2]'])
+        meniskuskorrektur = araeometer['Meniskuskorrektur']
+        massefaktor = 100.0/trockenmasse_schlaemm*temp_korndichte/(temp_korndichte - 1.0)
+
+        schlaemmzeiten = []
+        schlaemmtemperaturen = []
+        schlaemmdichten = []
+        masse_korrigiert = []
+        masseprozent = []
+        # Schlaemmdichten sind bei uns schon die R-Werte der Norm
+        for zeit, temp, wert in reversed(schlaemmwerte):
+            # Formeln (4) und (5) sowie Stokessche Gleichung aus Bild 3 von DIN 18123
+            zaehigkeit_w = 0.00178/(1.0 + 0.0337*temp + 0.00022*temp**2)
+            dichte_w = 1.0/(1.0+((2.31*temp-2.0)**2 -182.0)*1e-6)
+            refhoehe = skalenfaktor*(1.03 - (wert/1000.0 + 1.0)) + abstand + birnenanteil
+            refdurchmesser = sqrt(18.35*zaehigkeit_w/(temp_korndichte - dichte_w)*refhoehe/(60.0*zeit))
+            # Formel fuer Temperaturkorrekturwert aus Tabelle 3 von DIN 18123
+            massetempkorrektur = 0.0053*temp**2-0.0082*temp-1.9568
+            korrigiert = wert + meniskuskorrektur + massetempkorrektur
+
+            schlaemmzeiten += [zeit]
+            schlaemmtemperaturen += [temp]
+            schlaemmdichten += [wert]
+            schlaemmdurchmesser += [round(refdurchmesser*1e4)/1e4]
+            masse_korrigiert += [korrigiert]
+            masseprozent += [massefaktor*korrigiert]
+
+        block.update([('Schlaemmzeiten [min]', schlaemmzeiten)])
+        block.update([('Schlaemmtemperaturen [C]', schlaemmtemperaturen)])
+        block.update([('Schlaemmdichten [g/cm^3]', schlaemmdichten)])
+        block.update([('Schlaemmdurchmesser [mm]', schlaemmdurchmesser)])
+        block.update([('Schlaemmmasse-korrigiert [g]', masse_korrigiert)])
+        block.update([('Schlaemm-Masseprozent [%]', masseprozent)])
+
+        block.update([('Araeometerdaten', araeometer)])
+
+        if (siebung):
+            # Nur Schlaemmwerte unterhalb des kleinsten Siebdurchmessers verwenden
+            num_schlaemm = len(schlaemmdurchmesser)
+            while ((num_schlaemm > 0) and (schlaemmdurchmesser[num_schlaemm-1] > siebdurchmesser[0])):
+                num_schlaemm -= 1
+
+            schlaemmdurchmesser = schlaemmdurchmesser[:num_schlaemm]
+            sum_masseprozent = [sum_massen[0]/trockenmasse_sieb*temp_masse for temp_masse in masseprozent[:num_schlaemm]] + sum_masseprozent
+        else:
+            sum_masseprozent = [100.0/masseprozent[-1]*temp_masse for temp_masse in masseprozent]
+
+    korndurchmesser = schlaemmdurchmesser + siebdurchmesser
+    block.update([('Korndurchmesser [mm]', korndurchmesser)])
+    block.update([('Summierte Masseanteile Gesamtmenge [%]', sum_masseprozent)])
 
 
 
@@ -21,6 +21,50 @@ rohdatenverarbeitung.py   v0.3 (2023-09)
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
 
+# -------------------------------------------------------------------------------------------------
+def _RohdatenSpalten(vorlage):
+    """Durchsucht die (verschachtelte) Rohdatenvorlage vorlage nach allen Eintraegen, deren erstes
+    Element kein Zellbereich (wie "B16:D16"), sondern der Name einer Spalte der Rohdaten ist. Gibt
+    ein dict mit den Bezeichnungen dieser Eintraege und den dazugehoerigen Spaltennamen zurueck.
+    Damit muessen beim Einlesen der Rohdaten nur die tatsaechlich benoetigten Spalten verarbeitet
+    werden.
+    """
+    from re import fullmatch as re_fullmatch
+
+    spalten = dict()
+    for bezeichnung in vorlage.keys():
+        eintrag = vorlage[bezeichnung]
+        if (isinstance(eintrag, dict)):
+            neue_spalten = _RohdatenSpalten(vorlage=eintrag)
+        elif (re_fullmatch('[A-Z]+[0-9]+(:[A-Z]+-?[0-9]+)?', eintrag[0]) is None):
+            neue_spalten = dict([(bezeichnung, eintrag[0])])
+        else:
+            continue
+
+        for neue_bezeichnung in neue_spalten.keys():
+            if (spalten.get(neue_bezeichnung, neue_spalten[neue_bezeichnung]) != neue_spalten[neue_bezeichnung]):
+                print('# Warnung: Unterschiedliche Rohdatenspalten fuer ' + neue_bezeichnung + ' in Vorlage')
+
+            spalten.update([(neue_bezeichnung, neue_spalten[neue_bezeichnung])])
+
+    return spalten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Spaltenauswahl(rohdatenspalten):
+    """Gibt die Liste der (eindeutigen) Spaltennamen aus rohdatenspalten (siehe _RohdatenSpalten)
+    zurueck, die beim Einlesen der Rohdaten benoetigt werden.
+    """
+    spaltenauswahl = []
+    for spalte in rohdatenspalten.values():
+        if (spalte not in spaltenauswahl):
+            spaltenauswahl += [spalte]
+
+    return spaltenauswahl
+
+
+
 # -------------------------------------------------------------------------------------------------
 def _RohdatensatzGruppePruefen(daten, vorlage, position):
     """Die in position definierte Struktur in daten entspricht einer Gruppe, die gemeinsam bearbeitet
@@ -83,7 +127,7 @@ def _RohdatensatzPruefen(daten, vorlage, position):
     vorlage sind (und schneide sie ggfs. ab). Mithilfe von position wird das aktuelle Element der
     Struktur uebergeben, um nacheinander alle Eintraege abzuarbeiten.
     """
-    from .datenstruktur import Datenstruktur
+    from .datenstruktur import Datenstruktur, Messreihe
     from .konstanten import debugmodus
     from .gleichungsloeser import WertInZulaessigemBereich, LetzterIndexMitWertKleinerAls
 
@@ -120,7 +164,7 @@ def _RohdatensatzPruefen(daten, vorlage, position):
         if (len(cur_vorlage) < 2):
             return True
 
-        if (isinstance(cur_daten, list)):
+        if (isinstance(cur_daten, (list, Messreihe))):
             cur_list = cur_daten
         else:
             cur_list = [cur_daten]
@@ -162,13 +206,46 @@ def _DatenErgaenzen(daten, schluessel, zusatzwerte):
 
 
 # -------------------------------------------------------------------------------------------------
-def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte):
+def _BloeckeSammeln(bloecke, spaltenauswahl):
+    """Haengt die Spalten aller bloecke (siehe rohdaten.RohdatenBlockweiseLesen) aneinander und gibt
+    ein dict mit allen Spalten aus spaltenauswahl zurueck. Zahlenspalten werden direkt in einer
+    Messreihe gesammelt, so dass der Speicherbedarf auch bei sehr langen Dateien dem der
+    (ausgeduennten) Bloecke entspricht. Textspalten werden als Liste gespeichert.
+    """
+    from array import array
+    from .datenstruktur import Messreihe
+
+    messdaten = dict()
+    for block in bloecke:
+        for spalte in block:
+            if (spalte not in messdaten):
+                if (isinstance(block[spalte], array)):
+                    messdaten.update([(spalte, Messreihe())])
+                else:
+                    messdaten.update([(spalte, [])])
+
+            messdaten[spalte].extend(block[spalte])
+
+    for spalte in spaltenauswahl:
+        if (spalte not in messdaten):
+            messdaten.update([(spalte, [])])
+
+    return messdaten
+
+
+
+# -------------------------------------------------------------------------------------------------
+def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte, schrittweite=1, huellengroesse=None):
     """Liest eine/mehrere gds-Datei fuer einen drainierten Triaxialversuch (Triax-D) ein und
     erzeugt eine interne Struktur der Daten. Dazu werden die dateinamen der Rohdaten sowie die
     korndichte (in [g/cm^3]) erwartet. dateinamen ist eine Liste mit bis zu drei Eintraegen.
+    Die Messdaten werden blockweise eingelesen (siehe RohdatenBlockweiseLesen). Bei sehr langen
+    Versuchen koennen sie dabei mit schrittweite auf jede n-te Zeile oder mit huellengroesse auf die
+    Zeilen mit der kleinsten und groessten Axialkraft je huellengroesse Zeilen reduziert werden.
     Gibt eine Datenstruktur mit den Versuchsdaten zurueck.
     """
-    from .rohdaten import LeseGDSDaten
+    from .datenstruktur import Datenstruktur, Messreihe
+    from .rohdaten import RohdatenBlockweiseLesen, GDSStufenindex
     from .kennwerte import Vorbereitung
     from .vorlagen import VorlagenstrukturZuDatenstruktur
 
@@ -177,6 +254,7 @@ def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte):
         dateinamen = dateinamen[:3]
 
     # FIXME: Triax-D_01 als Vorlage verwenden?
+    # Die Eintraege der Messdaten enthalten statt eines Zellbereichs die Spalte der gds-Datei
     triaxvorlage = {
         'Tabelle': {
             'Projektname': ['B4'],
@@ -205,51 +283,80 @@ def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte):
         'Versuch01': {
             'Versuch 1': {
                 '[Einzelversuch1]': {
-                    'Zeit [s]': ['A5:A-1', [0.0, 1.21e6]],
-                    'Radialdruck [kN/m^2]': ['B5:B-1', [5.0, 5000.0]],
-                    'Radialvolumen [mm^3]': ['C5:C-1', [-200000.0, 200000.0]],
-                    'Porenwasserdruck [kN/m^2]': ['D5:D-1', [5.0, 5000.0]],
-                    'Porenwasservolumen [mm^3]': ['E5:E-1', [-200000.0, 200000.0]],
-                    'Axialkraft [kN]': ['F5:F-1', [0.0, 100.0], 'min_schnitt'],
-                    'Porendruck [kN/m^2]': ['G5:G-1', [5.0, 5000.0]],
-                    'Stauchung [mm]': ['H5:H-1', [0.0, 500.0], 'min_schnitt']
+                    'Zeit [s]': ['Time since start of stage (s)', [0.0, 1.21e6]],
+                    'Radialdruck [kN/m^2]': ['Radial Pressure (kPa)', [5.0, 5000.0]],
+                    'Radialvolumen [mm^3]': ['Radial Volume (mm³)', [-200000.0, 200000.0]],
+                    'Porenwasserdruck [kN/m^2]': ['Back Pressure (kPa)', [5.0, 5000.0]],
+                    'Porenwasservolumen [mm^3]': ['Back Volume (mm³)', [-200000.0, 200000.0]],
+                    'Axialkraft [kN]': ['Load Cell (kN)', [0.0, 100.0], 'min_schnitt'],
+                    'Porendruck [kN/m^2]': ['Pore Pressure (kPa)', [5.0, 5000.0]],
+                    'Stauchung [mm]': ['Axial Displacement (mm)', [0.0, 500.0], 'min_schnitt']
                 }
             }
         },
         'Versuch02': {
             'Versuch 2': {
                 '[Einzelversuch2]': {
-                    'Zeit [s]': ['A5:A-1', [0.0, 1.21e6]],
-                    'Radialdruck [kN/m^2]': ['B5:B-1', [5.0, 5000.0]],
-                    'Radialvolumen [mm^3]': ['C5:C-1', [-200000.0, 200000.0]],
-                    'Porenwasserdruck [kN/m^2]': ['D5:D-1', [5.0, 5000.0]],
-                    'Porenwasservolumen [mm^3]': ['E5:E-1', [-200000.0, 200000.0]],
-                    'Axialkraft [kN]': ['F5:F-1', [0.0, 100.0], 'min_schnitt'],
-                    'Porendruck [kN/m^2]': ['G5:G-1', [5.0, 5000.0]],
-                    'Stauchung [mm]': ['H5:H-1', [0.0, 500.0], 'min_schnitt']
+                    'Zeit [s]': ['Time since start of stage (s)', [0.0, 1.21e6]],
+                    'Radialdruck [kN/m^2]': ['Radial Pressure (kPa)', [5.0, 5000.0]],
+                    'Radialvolumen [mm^3]': ['Radial Volume (mm³)', [-200000.0, 200000.0]],
+                    'Porenwasserdruck [kN/m^2]': ['Back Pressure (kPa)', [5.0, 5000.0]],
+                    'Porenwasservolumen [mm^3]': ['Back Volume (mm³)', [-200000.0, 200000.0]],
+                    'Axialkraft [kN]': ['Load Cell (kN)', [0.0, 100.0], 'min_schnitt'],
+                    'Porendruck [kN/m^2]': ['Pore Pressure (kPa)', [5.0, 5000.0]],
+                    'Stauchung [mm]': ['Axial Displacement (mm)', [0.0, 500.0], 'min_schnitt']
                 }
             }
         },
         'Versuch03': {
             'Versuch 3': {
                 '[Einzelversuch3]': {
-                    'Zeit [s]': ['A5:A-1', [0.0, 1.21e6]],
-                    'Radialdruck [kN/m^2]': ['B5:B-1', [5.0, 5000.0]],
-                    'Radialvolumen [mm^3]': ['C5:C-1', [-200000.0, 200000.0]],
-                    'Porenwasserdruck [kN/m^2]': ['D5:D-1', [5.0, 5000.0]],
-                    'Porenwasservolumen [mm^3]': ['E5:E-1', [-200000.0, 200000.0]],
-                    'Axialkraft [kN]': ['F5:F-1', [0.0, 100.0], 'min_schnitt'],
-                    'Porendruck [kN/m^2]': ['G5:G-1', [5.0, 5000.0]],
-                    'Stauchung [mm]': ['H5:H-1', [0.0, 500.0], 'min_schnitt']
+                    'Zeit [s]': ['Time since start of stage (s)', [0.0, 1.21e6]],
+                    'Radialdruck [kN/m^2]': ['Radial Pressure (kPa)', [5.0, 5000.0]],
+                    'Radialvolumen [mm^3]': ['Radial Volume (mm³)', [-200000.0, 200000.0]],
+                    'Porenwasserdruck [kN/m^2]': ['Back Pressure (kPa)', [5.0, 5000.0]],
+                    'Porenwasservolumen [mm^3]': ['Back Volume (mm³)', [-200000.0, 200000.0]],
+                    'Axialkraft [kN]': ['Load Cell (kN)', [0.0, 100.0], 'min_schnitt'],
+                    'Porendruck [kN/m^2]': ['Pore Pressure (kPa)', [5.0, 5000.0]],
+                    'Stauchung [mm]': ['Axial Displacement (mm)', [0.0, 500.0], 'min_schnitt']
                 }
             }
         }
     }
     triax = VorlagenstrukturZuDatenstruktur(vorlage=triaxvorlage)
+    # Die Werte aus Saettigung und Konsolidierung stammen aus denselben Spalten wie die Messdaten
+    rohdatenspalten = _RohdatenSpalten(vorlage=triaxvorlage)
+    spaltenauswahl = _Spaltenauswahl(rohdatenspalten=rohdatenspalten)
 
     for idx_datei, dateiname in enumerate(dateinamen):
-        tempgds = LeseGDSDaten(dateiname=dateiname)
-        gds = tempgds['GDS']
+        # Zuerst nur die Grenzen der Versuchsstufen bestimmen, damit anschliessend nur die Messdaten
+        # ab dem Abscheren (Stage 4) eingelesen werden muessen. Von Saettigung und Konsolidierung
+        # werden nur die Werte der ersten und letzten Zeile benoetigt
+        stufenindex = GDSStufenindex(dateiname=dateiname)
+        if (stufenindex is None):
+            print('# Fehler: Stages in ' + dateiname + ' konnten nicht bestimmt werden')
+            return None
+
+        abschnittstufen = [abschnitt[0] for abschnitt in stufenindex['Abschnitte']]
+        try:
+            idx_abschnitt2 = abschnittstufen.index(2.0)
+            idx_abschnitt3 = abschnittstufen.index(3.0)
+            idx_abschnitt4 = abschnittstufen.index(4.0)
+        except:
+            print('# Fehler: Stages in ' + dateiname + ' sind nicht wie erwartet von 1 bis 4')
+            return None
+
+        # Messdaten blockweise (und ggfs. ausgeduennt) einlesen, so dass nie die gesamte Datei im
+        # Speicher gehalten werden muss. Vorherige Abschnitte mit denselben Stufen werden verworfen
+        stufenauswahl = list(set(abschnittstufen[idx_abschnitt4:]))
+        idx_phase4 = sum([abschnitt[2] for abschnitt in stufenindex['Abschnitte'][:idx_abschnitt4]
+            if (abschnitt[0] in stufenauswahl)])
+        gds = Datenstruktur()
+        messdaten = _BloeckeSammeln(bloecke=RohdatenBlockweiseLesen(dateiname=dateiname,
+            spaltenauswahl=spaltenauswahl, startzeile=idx_phase4, schrittweite=schrittweite,
+            huellengroesse=huellengroesse, huellenspalte=rohdatenspalten['Axialkraft [kN]'],
+            kopfdaten=gds, stufen=stufenauswahl, stufenindex=stufenindex),
+            spaltenauswahl=spaltenauswahl)
 
         if (idx_datei == 0):
             triax.update([('Projektname', 'GDS-Rohdaten')])
@@ -276,39 +383,34 @@ def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte):
         trockenmasse = float(trockenmasse)
         _DatenErgaenzen(daten=triax['1-Probenherstellung'], schluessel='Trockenmasse [g]', zusatzwerte=trockenmasse)
 
-        stage_number = gds['Daten']['Stage Number']
-
-        try:
-            idx_phase2 = stage_number.index(2.0)
-            idx_phase3 = stage_number.index(3.0)
-            idx_phase4 = stage_number.index(4.0)
-        except:
-            print('# Fehler: Stages in ' + dateiname + ' sind nicht wie erwartet von 1 bis 4')
-            return None
-
-        dauer = gds['Daten']['Time since start of stage (s)']
+        stufen = gds['Stufen']
+        start_phase2 = stufen[idx_abschnitt2]['Erste Zeile']
+        ende_phase2 = stufen[idx_abschnitt3-1]['Letzte Zeile']
+        ende_phase3 = stufen[idx_abschnitt4-1]['Letzte Zeile']
+        ende_phase5 = stufen[-1]['Letzte Zeile']
 
-        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Zelldruck [kN/m^2]', zusatzwerte=gds['Daten']['Radial Pressure (kPa)'][idx_phase2])
-        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Saettigungsdruck [kN/m^2]', zusatzwerte=gds['Daten']['Back Pressure (kPa)'][idx_phase2])
-        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Dauer [h]', zusatzwerte=round(20.0*dauer[idx_phase3-1]/3600.0)/20.0)
-        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Backvolume-Start [mm^3]', zusatzwerte=gds['Daten']['Back Volume (mm³)'][idx_phase2])
-        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=gds['Daten']['Back Volume (mm³)'][idx_phase3-1])
+        zeit = rohdatenspalten['Zeit [s]']
+        radialdruck = rohdatenspalten['Radialdruck [kN/m^2]']
+        porenwasserdruck = rohdatenspalten['Porenwasserdruck [kN/m^2]']
+        porenwasservolumen = rohdatenspalten['Porenwasservolumen [mm^3]']
+        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Zelldruck [kN/m^2]', zusatzwerte=start_phase2[radialdruck])
+        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Saettigungsdruck [kN/m^2]', zusatzwerte=start_phase2[porenwasserdruck])
+        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Dauer [h]', zusatzwerte=round(20.0*ende_phase2[zeit]/3600.0)/20.0)
+        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Backvolume-Start [mm^3]', zusatzwerte=start_phase2[porenwasservolumen])
+        _DatenErgaenzen(daten=triax['2-Saettigung'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=ende_phase2[porenwasservolumen])
 
-        _DatenErgaenzen(daten=triax['3-Konsolidation'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=gds['Daten']['Back Volume (mm³)'][idx_phase4-1])
+        _DatenErgaenzen(daten=triax['3-Konsolidation'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=ende_phase3[porenwasservolumen])
 
-        _DatenErgaenzen(daten=triax['5-Abscheren'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=gds['Daten']['Back Volume (mm³)'][-1])
+        _DatenErgaenzen(daten=triax['5-Abscheren'], schluessel='Backvolume-Ende [mm^3]', zusatzwerte=ende_phase5[porenwasservolumen])
 
         versuch = 'Versuch ' + str(idx_datei+1)
-        triax[versuch].update([('Zeit [s]', gds['Daten']['Time since start of stage (s)'][idx_phase4:])])
-        triax[versuch].update([('Radialdruck [kN/m^2]', gds['Daten']['Radial Pressure (kPa)'][idx_phase4:])])
-        triax[versuch].update([('Radialvolumen [mm^3]', gds['Daten']['Radial Volume (mm³)'][idx_phase4:])])
-        triax[versuch].update([('Porenwasserdruck [kN/m^2]', gds['Daten']['Back Pressure (kPa)'][idx_phase4:])])
-        triax[versuch].update([('Porenwasservolumen [mm^3]', gds['Daten']['Back Volume (mm³)'][idx_phase4:])])
-        triax[versuch].update([('Axialkraft [kN]', gds['Daten']['Load Cell (kN)'][idx_phase4:])])
-        triax[versuch].update([('Porendruck [kN/m^2]', gds['Daten']['Pore Pressure (kPa)'][idx_phase4:])])
+        for bezeichnung, spalte in rohdatenspalten.items():
+            triax[versuch].update([(bezeichnung, messdaten[spalte])])
 
-        stauchung = gds['Daten']['Axial Displacement (mm)'][idx_phase4:]
-        triax[versuch].update([('Stauchung [mm]', [x-stauchung[0] for x in stauchung])])
+        # Bezugswert aus der ersten Zeile des Abscherens, die beim Ausduennen entfallen kann
+        stauchung = rohdatenspalten['Stauchung [mm]']
+        stauchung_start = stufen[idx_abschnitt4]['Erste Zeile'][stauchung]
+        triax[versuch].update([('Stauchung [mm]', Messreihe([x-stauchung_start for x in messdaten[stauchung]]))])
 
     if (len(dateinamen) < 3):
         del triax['Versuch 3']
@@ -326,25 +428,29 @@ def VerarbeitungRohdatenGDSTriaxD(dateinamen, korndichte):
 
 
 # -------------------------------------------------------------------------------------------------
-def VerarbeitungRohdatenEAXOedoCRS(dateiname_l, dateiname_d):
+def VerarbeitungRohdatenEAXOedoCRS(dateiname_l, dateiname_d, schrittweite=1, huellengroesse=None):
     """Liest eine EAX-Datei fuer einen Oedometerversuch ein und erzeugt eine interne Struktur
     der Daten. Dazu werden (Dateinamen zu) Rohdaten für einen lockeren Oedometerversuch
     (dateiname_l) und einen dichten Oedometerversuch (dateiname_d) erwartet.
+    Die Messdaten werden blockweise eingelesen und koennen wie bei VerarbeitungRohdatenGDSTriaxD mit
+    schrittweite oder huellengroesse (bezogen auf die Kraft) ausgeduennt werden.
     Gibt eine Datenstruktur mit den Versuchsdaten zurueck.
     """
-    from .rohdaten import LeseEAXDaten
+    from .datenstruktur import Datenstruktur
+    from .rohdaten import RohdatenBlockweiseLesen
     from .kennwerte import Vorbereitung
     from .vorlagen import VorlagenstrukturZuDatenstruktur
 
     # FIXME: Oedo-CRS_01 als Vorlage verwenden?
+    # Die Eintraege der Messdaten enthalten statt eines Zellbereichs die Spalte der eax-Datei
     oedovorlage = {
         'Versuch': {
             'Oedo-locker': {
                 '[Gruppe Dehnung-Kraft]': {
-                    'Datum': ['B23:B-1'],
-                    'Uhrzeit': ['C23:C-1'],
-                    'Weg [mm]': ['D23:D-1', [0.0, 100.0], 'min_schnitt'],
-                    'Kraft [kN]': ['E23:E-1', [0.0, 5000.0], 'min_schnitt']
+                    'Datum': ['Datum/zeit'],
+                    'Uhrzeit': ['Datum/zeit'],
+                    'Weg [mm]': ['Weg[mm]', [0.0, 100.0], 'min_schnitt'],
+                    'Kraft [kN]': ['Kraft[kN]', [0.0, 5000.0], 'min_schnitt']
                 },
                 'Hoehe [mm]': ['B12', [5.0, 500.0]],
                 'Durchmesser [mm]': ['B13', [5.0, 500.0]],
@@ -353,10 +459,10 @@ def VerarbeitungRohdatenEAXOedoCRS(dateiname_l, dateiname_d):
             },
             'Oedo-dicht': {
                 '[Gruppe Dehnung-Kraft]': {
-                    'Datum': ['B23:B-1'],
-                    'Uhrzeit': ['C23:C-1'],
-                    'Weg [mm]': ['D23:D-1', [0.0, 100.0], 'min_schnitt'],
-                    'Kraft [kN]': ['E23:E-1', [0.0, 5000.0], 'min_schnitt']
+                    'Datum': ['Datum/zeit'],
+                    'Uhrzeit': ['Datum/zeit'],
+                    'Weg [mm]': ['Weg[mm]', [0.0, 100.0], 'min_schnitt'],
+                    'Kraft [kN]': ['Kraft[kN]', [0.0, 5000.0], 'min_schnitt']
                 },
                 'Hoehe [mm]': ['B12', [5.0, 500.0]],
                 'Durchmesser [mm]': ['B13', [5.0, 500.0]],
@@ -366,9 +472,14 @@ def VerarbeitungRohdatenEAXOedoCRS(dateiname_l, dateiname_d):
         }
     }
     oedo = VorlagenstrukturZuDatenstruktur(vorlage=oedovorlage)
+    rohdatenspalten = _RohdatenSpalten(vorlage=oedovorlage)
+    spaltenauswahl = _Spaltenauswahl(rohdatenspalten=rohdatenspalten)
     for dateiname, lagerungsdichte in [(dateiname_l, 'Oedo-locker'), (dateiname_d, 'Oedo-dicht')]:
-        tempeax = LeseEAXDaten(dateiname=dateiname)
-        eax = tempeax['EAX']
+        eax = Datenstruktur()
+        messdaten = _BloeckeSammeln(bloecke=RohdatenBlockweiseLesen(dateiname=dateiname,
+            spaltenauswahl=spaltenauswahl, schrittweite=schrittweite,
+            huellengroesse=huellengroesse, huellenspalte=rohdatenspalten['Kraft [kN]'],
+            kopfdaten=eax), spaltenauswahl=spaltenauswahl)
 
         oedo[lagerungsdichte].update([('Projektname', 'EAX-Rohdaten')])
         oedo[lagerungsdichte].update([('Dateiname', dateiname)])
@@ -377,17 +488,19 @@ def VerarbeitungRohdatenEAXOedoCRS(dateiname_l, dateiname_d):
         oedo[lagerungsdichte].update([('Masse [g]', eax['Probenmasse'])])
         oedo[lagerungsdichte].update([('Schergeschwindigkeit [mm/min]', eax['Schergeschwindigkeit'])])
 
+        for bezeichnung, spalte in rohdatenspalten.items():
+            oedo[lagerungsdichte].update([(bezeichnung, messdaten[spalte])])
+
+        # Datum und Uhrzeit sind in den Rohdaten in einer Spalte gespeichert
         datum = []
         uhrzeit = []
-        for elem in eax['Daten']['Datum/zeit']:
+        for elem in messdaten[rohdatenspalten['Datum']]:
             temp = elem.split()
             datum += [temp[0]]
             uhrzeit += [temp[1]]
 
         oedo[lagerungsdichte].update([('Datum', datum)])
         oedo[lagerungsdichte].update([('Uhrzeit', uhrzeit)])
-        oedo[lagerungsdichte].update([('Weg [mm]', eax['Daten']['Weg[mm]'])])
-        oedo[lagerungsdichte].update([('Kraft [kN]', eax['Daten']['Kraft[kN]'])])
 
     oedo.update([('Dateiname', oedo['Oedo-dicht']['Dateiname'] + ' (+1)')])
     # Pruefe zulaessige Werte, gueltigen Bereich und min_schnitt anhand der Oedo-CRS-Vorlage
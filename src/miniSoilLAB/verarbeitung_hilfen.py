@@ -21,6 +21,23 @@ verarbeitung_hilfen.py   v0.3 (2023-09)
 # along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
 
 
+# Bezeichnung fuer Zeitwerte als fortlaufende Tage seit dem 30.12.1899 (Rohdatum aus Excel)
+excel_zeitformat = 'Excel'
+# Regulaere Ausdruecke fuer die Platzhalter, die ohne strptime umgewandelt werden koennen
+# (entsprechen den von strptime akzeptierten Eingaben)
+_zeitplatzhalter = {
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'y': r'(?P<y>\d\d)',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+}
+# Bereits erstellte Umwandlungsfunktionen je Zeitformat
+_zeitumwandlungen = dict()
+
+
 # -------------------------------------------------------------------------------------------------
 def ImportiertesDatumFormatieren(datum, ausgabeformat='%d.%m.%Y',
     formatliste=['%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d', '%Y%m%d']):
@@ -61,44 +78,214 @@ def ImportiertesDatumFormatieren(datum, ausgabeformat='%d.%m.%Y',
 
 
 # -------------------------------------------------------------------------------------------------
-def SekundenAusDatumsangabenExtrahieren(daten, formatliste=[]):
-    """Erwartet eine Liste an Datum-String daten, deren Eintraege entweder eine Gleitkommazahl
-    repraesentieren (typischerweise Rohdatum aus Excel) oder bereits ein gueltiges Datum in
-    einem der angegebenen datumformate erhaelt. Aus allen Eintraegen werden die vergangenen Sekunden
-    relativ zum ersten Eintrag extrahiert. Gibt eine Liste der Differenzen in Sekunden bei
-    erfolgreicher Verarbeitung zurueck, sonst None.
+def _Zeitumwandlung(zeitformat, abschneiden=False):
+    """Gibt eine Funktion zurueck, die einen Zeitwert im zeitformat (ein Format fuer strptime oder
+    excel_zeitformat) in ein datetime-Objekt umwandelt und bei ungueltigen Werten einen Fehler
+    ausloest. Formate, die nur aus den Platzhaltern in _zeitplatzhalter und festen Zeichen bestehen,
+    werden mit einem einmalig erstellten regulaeren Ausdruck ausgewertet, alle anderen mit strptime.
+    Mit abschneiden=True wird bei Formaten fuer strptime alles ab dem ersten Punkt des Zeitwerts
+    ignoriert (z.B. Sekundenbruchteile).
     """
     import datetime
-
-    startdatum = datetime.datetime(year=1899, month=12, day=30)
-    sekunden = [0.0 for x in daten]
-    refzeit = None
-    for idx_datum, datum in enumerate(daten):
-        zeitpunkt = None
-        for idx_none in range(1):
-            try:
-                zeitpunkt = startdatum + datetime.timedelta(days=float(datum))
+    import re
+
+    if ((zeitformat, abschneiden) in _zeitumwandlungen):
+        return _zeitumwandlungen[(zeitformat, abschneiden)]
+
+    if (zeitformat == excel_zeitformat):
+        startdatum = datetime.datetime(year=1899, month=12, day=30)
+
+        def _Umwandlung(wert):
+            return startdatum + datetime.timedelta(days=float(wert))
+
+        _zeitumwandlungen[(zeitformat, abschneiden)] = _Umwandlung
+        return _Umwandlung
+
+    if (abschneiden):
+        umwandlung = _Zeitumwandlung(zeitformat=zeitformat)
+
+        def _Umwandlung(wert):
+            return umwandlung(wert.split('.')[0])
+
+        _zeitumwandlungen[(zeitformat, abschneiden)] = _Umwandlung
+        return _Umwandlung
+
+    muster = ''
+    reihenfolge = []
+    idx_zeichen = 0
+    while (idx_zeichen < len(zeitformat)):
+        zeichen = zeitformat[idx_zeichen]
+        if (zeichen == '%'):
+            platzhalter = zeitformat[idx_zeichen+1:idx_zeichen+2]
+            if (platzhalter == '%'):
+                muster += '%'
+            elif ((platzhalter in _zeitplatzhalter) and (platzhalter not in reihenfolge)):
+                muster += _zeitplatzhalter[platzhalter]
+                reihenfolge += [platzhalter]
+            else:
+                muster = None
                 break
-            except:
-                pass
 
-            for datumformat in formatliste:
-                try:
-                    zeitpunkt = datetime.datetime.strptime(datum.split('.')[0], datumformat)
-                    break
-                except:
-                    pass
+            idx_zeichen += 2
+            continue
+
+        if (zeichen.isspace()):
+            # Wie bei strptime passen Leerzeichen auf beliebig viele Leerzeichen
+            while ((idx_zeichen < len(zeitformat)) and (zeitformat[idx_zeichen].isspace())):
+                idx_zeichen += 1
+
+            muster += r'\s+'
+            continue
+
+        muster += re.escape(zeichen)
+        idx_zeichen += 1
+
+    if (('Y' in reihenfolge) and ('y' in reihenfolge)):
+        muster = None
+
+    if (muster is None):
+        def _Umwandlung(wert):
+            return datetime.datetime.strptime(wert, zeitformat)
+    else:
+        muster = re.compile(muster, re.IGNORECASE)
+        kurzes_jahr = ('y' in reihenfolge)
+        # Position jedes Eintrags von datetime (Jahr bis Sekunde) in den gefundenen Gruppen
+        positionen = [reihenfolge.index(platzhalter) if (platzhalter in reihenfolge) else None
+            for platzhalter in [('y' if kurzes_jahr else 'Y'), 'm', 'd', 'H', 'M', 'S']]
+        standardwerte = [1900, 1, 1, 0, 0, 0]
+
+        def _Umwandlung(wert):
+            gefunden = muster.fullmatch(wert)
+            if (gefunden is None):
+                raise ValueError('Zeitwert passt nicht zum Format ' + zeitformat)
+
+            gruppen = gefunden.groups()
+            teile = [standardwert if (position is None) else int(gruppen[position])
+                for position, standardwert in zip(positionen, standardwerte)]
+            if (kurzes_jahr):
+                teile[0] += 2000 if (teile[0] <= 68) else 1900
+
+            return datetime.datetime(*teile)
+
+    _zeitumwandlungen[(zeitformat, abschneiden)] = _Umwandlung
+    return _Umwandlung
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _ZeitwertEinzelnUmwandeln(wert, formatliste=[], abschneiden=False):
+    """Versucht wert zuerst als Excel-Zeitwert und dann mit jedem Format aus formatliste in ein
+    datetime-Objekt umzuwandeln (siehe _Zeitumwandlung). Gibt das erste erfolgreich umgewandelte
+    Ergebnis zurueck oder None.
+    """
+    for zeitformat in [excel_zeitformat] + formatliste:
+        try:
+            return _Zeitumwandlung(zeitformat=zeitformat, abschneiden=abschneiden)(wert)
+        except Exception:
+            pass
+
+    return None
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZeitformatErmitteln(daten, formatliste=[], stichprobe=10, abschneiden=False):
+    """Ermittelt anhand von (maximal) stichprobe gleichmaessig verteilten Eintraegen aus daten
+    (inklusive dem ersten und letzten) das erste Zeitformat, mit dem alle diese Eintraege umgewandelt
+    werden koennen. Dabei wird zuerst excel_zeitformat und dann jedes Format aus formatliste geprueft.
+    Gibt das ermittelte Format zurueck oder None, falls kein passendes Format gefunden werden kann.
+    """
+    if (len(daten) == 0):
+        return None
+
+    schrittweite = max(1, (len(daten)-1)//max(1, stichprobe-1))
+    indizes = sorted(set(list(range(0, len(daten), schrittweite))[:stichprobe-1] + [len(daten)-1]))
+    auswahl = [daten[idx] for idx in indizes]
 
+    for zeitformat in [excel_zeitformat] + formatliste:
+        umwandlung = _Zeitumwandlung(zeitformat=zeitformat, abschneiden=abschneiden)
+        try:
+            for wert in auswahl:
+                umwandlung(wert)
+        except Exception:
+            continue
+
+        return zeitformat
+
+    return None
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZeitspalteUmwandeln(daten, formatliste=[], abschneiden=False):
+    """Wandelt alle Zeitwerte aus der Liste daten in datetime-Objekte um. Die Eintraege sind entweder
+    Excel-Zeitwerte (fortlaufende Tage) oder Strings in einem der Formate aus formatliste. Das Format
+    wird nur einmal anhand einer Stichprobe ermittelt (siehe ZeitformatErmitteln) und dann auf alle
+    Eintraege angewendet, so dass das Ergebnis nicht von vorher umgewandelten Spalten abhaengt.
+    Mit abschneiden=True werden Sekundenbruchteile ignoriert (siehe _Zeitumwandlung).
+    Nur falls nicht alle Eintraege dasselbe Format haben, wird jeder Eintrag einzeln umgewandelt.
+    Gibt eine Liste der datetime-Objekte zurueck oder None, falls nicht alle Eintraege umgewandelt
+    werden konnten.
+    """
+    zeitformat = ZeitformatErmitteln(daten=daten, formatliste=formatliste, abschneiden=abschneiden)
+    if (zeitformat is not None):
+        try:
+            return list(map(_Zeitumwandlung(zeitformat=zeitformat, abschneiden=abschneiden), daten))
+        except Exception:
+            pass
+
+    # Unterschiedliche Formate innerhalb der Spalte
+    zeitpunkte = []
+    for wert in daten:
+        zeitpunkt = _ZeitwertEinzelnUmwandeln(wert=wert, formatliste=formatliste,
+            abschneiden=abschneiden)
         if (zeitpunkt is None):
-            print('# Warnung: Konnte nicht alle Zeitstempel konvertieren')
             return None
 
-        if (refzeit is None):
-            refzeit = zeitpunkt
+        zeitpunkte += [zeitpunkt]
+
+    return zeitpunkte
+
+
+
+# -------------------------------------------------------------------------------------------------
+def DatumsangabenFormatieren(daten, ausgabeformat='%d.%m.%Y', formatliste=['%d.%m.%Y', '%d/%m/%Y',
+    '%Y-%m-%d', '%Y%m%d']):
+    """Wie ImportiertesDatumFormatieren, aber fuer eine ganze Liste an Datumsangaben daten, die
+    gemeinsam umgewandelt werden (siehe ZeitspalteUmwandeln). Gibt eine Liste mit den Datumsangaben
+    im ausgabeformat zurueck, wobei nicht erkannte Eintraege unveraendert uebernommen werden.
+    """
+    if (ausgabeformat not in formatliste):
+        formatliste = formatliste + [ausgabeformat]
+
+    zeitpunkte = ZeitspalteUmwandeln(daten=daten, formatliste=formatliste)
+    if (zeitpunkte is None):
+        return [ImportiertesDatumFormatieren(datum=datum, ausgabeformat=ausgabeformat,
+            formatliste=formatliste) for datum in daten]
+
+    return [zeitpunkt.strftime(ausgabeformat) for zeitpunkt in zeitpunkte]
+
 
-        sekunden[idx_datum] = (zeitpunkt - refzeit).total_seconds()
 
-    return sekunden
+# -------------------------------------------------------------------------------------------------
+def SekundenAusDatumsangabenExtrahieren(daten, formatliste=[]):
+    """Erwartet eine Liste an Datum-String daten, deren Eintraege entweder eine Gleitkommazahl
+    repraesentieren (typischerweise Rohdatum aus Excel) oder bereits ein gueltiges Datum in
+    einem der angegebenen datumformate erhaelt. Aus allen Eintraegen werden die vergangenen Sekunden
+    relativ zum ersten Eintrag extrahiert. Die Eintraege werden gemeinsam umgewandelt (siehe
+    ZeitspalteUmwandeln).
+    Gibt eine Liste der Differenzen in Sekunden bei erfolgreicher Verarbeitung zurueck, sonst None.
+    """
+    zeitpunkte = ZeitspalteUmwandeln(daten=daten, formatliste=formatliste, abschneiden=True)
+    if (zeitpunkte is None):
+        print('# Warnung: Konnte nicht alle Zeitstempel konvertieren')
+        return None
+
+    if (zeitpunkte == []):
+        return []
+
+    refzeit = zeitpunkte[0]
+    return [(zeitpunkt - refzeit).total_seconds() for zeitpunkt in zeitpunkte]
 
 
 
@@ -123,7 +310,7 @@ def SekundenOhneOffsetBereitstellen(daten, formatliste=[]):
         uhrzeit = daten['Uhrzeit']
         zeit = None
         try:
-            zeitwerte = [str(float(x)+float(y)) for x, y in zip(datum, uhrzeit)]
+            zeitwerte = [float(x)+float(y) for x, y in zip(datum, uhrzeit)]
             zeit = SekundenAusDatumsangabenExtrahieren(daten=zeitwerte)
         except:
             pass
@@ -136,6 +323,23 @@ def SekundenOhneOffsetBereitstellen(daten, formatliste=[]):
 
 
 
+# -------------------------------------------------------------------------------------------------
+def AnnaeherndNull(werte, tol, bezugswert=0.0):
+    """Gibt True zurueck, falls mindestens ein Eintrag aus werte um weniger als tol von bezugswert
+    abweicht (also die Differenz annaehernd Null ist), sonst False.
+    """
+    if (len(werte) == 0):
+        return False
+
+    # Liegen alle Werte auf einer Seite ausserhalb von (bezugswert-tol, bezugswert+tol), ist keine
+    # Einzelpruefung noetig
+    if ((min(werte) - bezugswert >= tol) or (max(werte) - bezugswert <= -tol)):
+        return False
+
+    return any([(abs(wert - bezugswert) < tol) for wert in werte])
+
+
+
 # -------------------------------------------------------------------------------------------------
 def GespeicherterWertOderUebergabe(daten, bezeichnung, uebergabe):
     """Ueberpruefe, ob daten[bezeichnung] existiert, ansonsten erstelle es und speichere den Wert
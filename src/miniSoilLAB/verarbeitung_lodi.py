@@ -49,6 +49,8 @@ def _KennwerteLoDi(daten, refwerte):
     """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der Vorlage LoDi und speichere
     sie in der uebergebenen Struktur daten, sofern diese den Vorgaben entspricht.
     """
+    from .datenstruktur import Messreihe
+
     lo_lagerung = daten['Lockerste-Lagerung']
     di_lagerung = daten['Dichteste-Lagerung']
 
@@ -72,7 +74,7 @@ def _KennwerteLoDi(daten, refwerte):
 
     # -------------------- Lockerste Lagerung --------------------
     # Falls ein skalares Zylindervolumen existiert, verwende es fuer alle Massen
-    if (not isinstance(liste_vol_lo, list)):
+    if (not isinstance(liste_vol_lo, (list, Messreihe))):
         liste_vol_lo = [liste_vol_lo for x in liste_masse_lo]
 
     num_lo = len(liste_masse_lo)
@@ -110,13 +112,13 @@ def _KennwerteLoDi(daten, refwerte):
         print('# Warnung: Eintraege fuer Setzung und Probemasse (dichte Lagerung) muessen zueinander passen (u.a. gleiche Laenge)')
         return False
     # Skalare Groessen in Listen umwandeln
-    if (not isinstance(liste_zylinderflaeche_di, list)):
+    if (not isinstance(liste_zylinderflaeche_di, (list, Messreihe))):
         liste_zylinderflaeche_di = [liste_zylinderflaeche_di for x in num_di]
 
-    if (not isinstance(liste_zylinderhoehe_di, list)):
+    if (not isinstance(liste_zylinderhoehe_di, (list, Messreihe))):
         liste_zylinderhoehe_di = [liste_zylinderhoehe_di for x in num_di]
 
-    if (not isinstance(liste_plattenhoehe, list)):
+    if (not isinstance(liste_plattenhoehe, (list, Messreihe))):
         liste_plattenhoehe = [liste_plattenhoehe for x in num_di]
 
     for idx in range(num_di):
@@ -200,6 +202,7 @@ def VorbereitungLoDi(daten):
     import copy
     from .datenstruktur import Datenstruktur, DictStrukturPruefenUndAngleichen
     from .datenstruktur import DictStrukturGleichOderTeilmenge, ZielgroesseFindenUndAktualisieren
+    from .datenstruktur import Messreihe
 
     testdaten = copy.deepcopy(daten)
     if (not DictStrukturPruefenUndAngleichen(ref_dict=LoDiStruktur(), test_dict=testdaten, warnung=False)):
@@ -248,7 +251,7 @@ def VorbereitungLoDi(daten):
 
         if ('Setzung [mm]' in di_lagerung):
             di_setzung = di_lagerung['Setzung [mm]']
-            if (isinstance(masse_di, list)):
+            if (isinstance(masse_di, (list, Messreihe))):
                 print('# Warnung: Erwarte Skalarwert fuer dichte Probenmasse bei einer Setzungsliste in LoDi')
                 return
 
@@ -260,7 +263,7 @@ def VorbereitungLoDi(daten):
                 temp_setzung1 = di_lagerung['Setzung-1 [mm]']
                 temp_setzung2 = di_lagerung['Setzung-2 [mm]']
 
-                if (isinstance(masse_di, list)):
+                if (isinstance(masse_di, (list, Messreihe))):
                     if (len(masse_di) == 2):
                         masse_di = [masse_di[0] for x in temp_setzung1] + [masse_di[1] for x in temp_setzung2]
                     elif (len(masse_di) == 1):
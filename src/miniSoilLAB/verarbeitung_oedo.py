@@ -45,10 +45,11 @@ def _KennwerteOedo(daten, refwerte):
     """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der Vorlage Oedo und
     speichere sie in der uebergebenen Struktur daten, sofern diese den Vorgaben entspricht.
     """
-    from math import pi, log
+    from math import pi
     from .konstanten import g
     from .datenstruktur import Datenstruktur
-    from .verarbeitung_hilfen import GespeicherterWertOderUebergabe
+    from .verarbeitung_hilfen import GespeicherterWertOderUebergabe, AnnaeherndNull
+    from .verarbeitung_oedometer import OedoVerformungen, OedoSteifemodul
     from .gleichungsloeser import LoeseGleichung, LetzterIndexMitWertKleinerAls
 
     # Einstellbare Parameter fuer Oedometerversuche, falls keine Vorgaben existieren
@@ -127,17 +128,14 @@ def _KennwerteOedo(daten, refwerte):
                 ' fuer Oedo nicht vorhanden - ' + str(errormessage))
             return False
 
-        if (any([(abs(tempsetzung - anfangshoehe) < tol) for tempsetzung in setzung])):
+        if (AnnaeherndNull(werte=setzung, tol=tol, bezugswert=anfangshoehe)):
             print('# Warnung: Setzung erreicht Probenhoehe bei ' + belastungsart)
             continue
 
-        # FIXME: Richtig? (siehe auch oedo-crs)
-        #porenzahl = [porenzahl_anfang - tempsetzung/100.0 * (1.0 + porenzahl_anfang) for tempsetzung in setzung]
-        porenzahl = [(anfangshoehe - (tempsetzung-setzung[0]))/anfangshoehe * (porenzahl_anfang + 1.0) - 1.0 for tempsetzung in setzung]
-        dehnung = [log(anfangshoehe/(anfangshoehe - tempsetzung)) for tempsetzung in setzung]
-
-        belastung.update([('Porenzahl [-]', porenzahl)])
-        belastung.update([('Dehnung-axial [-]', dehnung)])
+        verformungen = OedoVerformungen(setzung=setzung, anfangshoehe=anfangshoehe,
+            porenzahl_anfang=porenzahl_anfang)
+        belastung.update(verformungen)
+        dehnung = verformungen['Dehnung-axial [-]']
 
         einstellungen = GespeicherterWertOderUebergabe(daten=daten,
             bezeichnung='Einstellungen', uebergabe=Datenstruktur())
@@ -175,8 +173,7 @@ def _KennwerteOedo(daten, refwerte):
             print('# Warnung: Erster Ausgleichs-Koeffizient bei ' + belastungsart + ' annaehernd Null')
             continue
 
-        steifemodul = [(tempspannung + b) / a/1000.0 for tempspannung in spannung]
-        belastung.update([('Steifemodul [kN/m^2]', steifemodul)])
+        belastung.update(OedoSteifemodul(spannung=spannung, a=a, b=b))
 
     return True
 
@@ -318,6 +315,7 @@ def VorbereitungOedo(daten):
     from math import pi
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import ZielgroesseFindenUndAktualisieren
+    from .verarbeitung_oedometer import SpannungAusKraft
 
     testdaten = copy.deepcopy(daten)
     if (not DictStrukturPruefenUndAngleichen(ref_dict=OedoStruktur(), test_dict=testdaten, warnung=False)):
@@ -352,7 +350,7 @@ def VorbereitungOedo(daten):
                 kraft = belastung['Kraft [kN]']
                 druckflaeche = pi*(durchmesser/2000.0)**2 # [m^2]
                 belastung.update([('Setzung [mm]', setzung)])
-                belastung.update([('Spannung [kN/m^2]', [einzelkraft/druckflaeche for einzelkraft in kraft])])
+                belastung.update(SpannungAusKraft(kraft=kraft, druckflaeche=druckflaeche))
                 del belastung['Weg [mm]']
                 del belastung['Kraft [kN]']
             except:
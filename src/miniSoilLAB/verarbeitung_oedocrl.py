@@ -57,8 +57,9 @@ def _KennwerteOedoCRL(daten, refwerte):
     """
     from .datenstruktur import Datenstruktur
     from .verarbeitung_oedo import _KennwerteOedo
-    from .verarbeitung_hilfen import ImportiertesDatumFormatieren, SekundenAusDatumsangabenExtrahieren
+    from .verarbeitung_hilfen import DatumsangabenFormatieren, SekundenAusDatumsangabenExtrahieren
     from .verarbeitung_hilfen import GespeicherterWertOderUebergabe
+    from .verarbeitung_oedometer import CRLVerformungen
     from .parameterbestimmung import _ViskohypoplastischTangentenpunkte, _ViskohypoplastischCalphaUndIv
 
     # Einstellbare Parameter fuer Oedometerversuche, falls keine Vorgaben existieren
@@ -101,7 +102,8 @@ def _KennwerteOedoCRL(daten, refwerte):
                  + str(errormessage))
             break
 
-        mod_zeitwerte = [ImportiertesDatumFormatieren(datum=wert, ausgabeformat='%d.%m.%Y %H:%M:%S') for wert in zeitwerte]
+        # Das Format der Zeitwerte wird je Laststufe nur einmal ermittelt
+        mod_zeitwerte = DatumsangabenFormatieren(daten=zeitwerte, ausgabeformat='%d.%m.%Y %H:%M:%S')
         if (all([wert is not None for wert in mod_zeitwerte])):
             oedo.update([('Zeitwerte', mod_zeitwerte)])
 
@@ -115,17 +117,16 @@ def _KennwerteOedoCRL(daten, refwerte):
         #zeitstempel = [tempzeit.strftime('%d.%m.%Y %H:%M:%S') for tempzeit in stunden]
         #oedo.update([('Zeitstempel', zeitstempel)])
 
-        hoehe = [anfangshoehe - setz for setz in setzung]
-        oedo.update([('Hoehe [mm]', hoehe)])
-        porenzahl = [einzelhoehe/hs - 1.0 for einzelhoehe in hoehe]
-        oedo.update([('Porenzahl [-]', porenzahl)])
+        verformungen = CRLVerformungen(setzung=setzung, anfangshoehe=anfangshoehe, hs=hs, tol=tol)
+        oedo.update(verformungen)
+        hoehe = verformungen['Hoehe [mm]']
+        porenzahl = verformungen['Porenzahl [-]']
 
-        if (max(setzung) - setzung[0] < tol):
+        if ('Setzung-spez [%]' not in verformungen):
             print('# Warnung: Setzung fuer ' + seite + ' ungueltig')
             break
 
-        spez_setzung = [100.0*(setz - setzung[0])/(max(setzung) - setzung[0]) for setz in setzung]
-        oedo.update([('Setzung-spez [%]', spez_setzung)])
+        spez_setzung = verformungen['Setzung-spez [%]']
 
         einstellungen = GespeicherterWertOderUebergabe(daten=daten,
             bezeichnung='Einstellungen', uebergabe=Datenstruktur())
@@ -252,6 +253,7 @@ def VorbereitungOedoCRL(daten):
     from math import pi
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import ZielgroesseFindenUndAktualisieren
+    from .verarbeitung_oedometer import SpannungAusKraft
 
     testdaten = copy.deepcopy(daten)
     if (not DictStrukturPruefenUndAngleichen(ref_dict=OedoCRLStruktur(), test_dict=testdaten, warnung=False)):
@@ -286,7 +288,7 @@ def VorbereitungOedoCRL(daten):
                 kraft = belastung['Kraft [kN]']
                 druckflaeche = pi*(durchmesser/2000.0)**2 # [m^2]
                 belastung.update([('Setzung [mm]', setzung)])
-                belastung.update([('Spannung [kN/m^2]', [einzelkraft/druckflaeche for einzelkraft in kraft])])
+                belastung.update(SpannungAusKraft(kraft=kraft, druckflaeche=druckflaeche))
                 del belastung['Weg [mm]']
                 del belastung['Kraft [kN]']
             except:
@@ -56,6 +56,7 @@ def _KennwerteOedoCRS(daten, refwerte):
     """
     from math import pi
     from .konstanten import g
+    from .verarbeitung_oedometer import SpannungMitOffset, CRSVerformungen
 
     # Extrahiere Uebergabewerte
     korndichte = refwerte['Korndichte [g/cm^3]']
@@ -81,7 +82,7 @@ def _KennwerteOedoCRS(daten, refwerte):
         if ('Kraft Startwert [kN]' in ref_oedo):
             spannungsoffset += ref_oedo['Kraft Startwert [kN]']/druckflaeche
 
-        oedo.update([('Spannung [kN/m^2]', [spannungsoffset+tmp_spannung for tmp_spannung in oedo['Spannung [kN/m^2]']])])
+        oedo.update(SpannungMitOffset(spannung=oedo['Spannung [kN/m^2]'], spannungsoffset=spannungsoffset))
 
         volumen = anfangshoehe * pi*(durchmesser/2.0)**2 / 1000.0 # [cm^3]
         if (abs(masse) < tol):
@@ -94,12 +95,8 @@ def _KennwerteOedoCRS(daten, refwerte):
 
         trockendichte = masse/volumen
         porenzahl_anfang = korndichte/trockendichte - 1.0
-        stauchung = [100.0*(temp_setzung - setzung[0])/anfangshoehe for temp_setzung in setzung]
-        oedo.update([('Stauchung [%]', stauchung)])
-        # FIXME: Richtig? (siehe auch oedo)
-        #porenzahlen = [porenzahl_anfang - (temp_setzung - setzung[0])/anfangshoehe * (1.0 + porenzahl_anfang) for temp_setzung in setzung]
-        porenzahlen = [(anfangshoehe - (tempsetzung-setzung[0]))/anfangshoehe * (porenzahl_anfang + 1.0) - 1.0 for tempsetzung in setzung]
-        oedo.update([('Porenzahl [-]', porenzahlen)])
+        oedo.update(CRSVerformungen(setzung=setzung, anfangshoehe=anfangshoehe,
+            porenzahl_anfang=porenzahl_anfang))
 
     return True
 
@@ -144,6 +141,7 @@ def VorbereitungOedoCRS(daten):
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import ZielgroesseFindenUndAktualisieren
     from .verarbeitung_hilfen import ImportiertesDatumFormatieren
+    from .verarbeitung_oedometer import SpannungAusKraft
 
     testdaten = copy.deepcopy(daten)
     if (not DictStrukturPruefenUndAngleichen(ref_dict=OedoCRSStruktur(), test_dict=testdaten, warnung=False)):
@@ -163,7 +161,7 @@ def VorbereitungOedoCRS(daten):
                 kraft = belastung['Kraft [kN]']
                 druckflaeche = pi*(durchmesser/2000.0)**2 # [m^2]
                 belastung.update([('Setzung [mm]', setzung)])
-                belastung.update([('Spannung [kN/m^2]', [einzelkraft/druckflaeche for einzelkraft in kraft])])
+                belastung.update(SpannungAusKraft(kraft=kraft, druckflaeche=druckflaeche))
                 del belastung['Weg [mm]']
                 del belastung['Kraft [kN]']
             except:
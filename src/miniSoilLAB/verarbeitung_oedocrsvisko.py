@@ -47,6 +47,7 @@ def _KennwerteOedoCRSVisko(daten, refwerte):
     from math import pi
     from .datenstruktur import Datenstruktur
     from .verarbeitung_hilfen import GespeicherterWertOderUebergabe
+    from .verarbeitung_oedometer import CRSViskoVerformungen
     from .parameterbestimmung import _ViskohypoplastischCRSPunkte
 
     # FIXME: Einstellbare Parameter
@@ -105,8 +106,10 @@ def _KennwerteOedoCRSVisko(daten, refwerte):
         return False
 
     porenzahl_e = korndichte/trockendichte - 1.0
-    porenzahl = [porenzahl_e - (1.0 + porenzahl_e)*einzelsetzung/anfangshoehe for einzelsetzung in setzung]
-    daten.update([('Porenzahl [-]', porenzahl)])
+    verformungen = CRSViskoVerformungen(setzung=setzung, anfangshoehe=anfangshoehe,
+        porenzahl_anfang=porenzahl_e)
+    daten.update(verformungen)
+    porenzahl = verformungen['Porenzahl [-]']
 
     einstellungen = GespeicherterWertOderUebergabe(daten=daten,
         bezeichnung='Einstellungen', uebergabe=Datenstruktur())
@@ -172,6 +175,7 @@ def VorbereitungOedoCRSVisko(daten):
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import ZielgroesseFindenUndAktualisieren
     from .verarbeitung_hilfen import SekundenOhneOffsetBereitstellen
+    from .verarbeitung_oedometer import SpannungAusKraft
 
     testdaten = copy.deepcopy(daten)
     if (not DictStrukturPruefenUndAngleichen(ref_dict=OedoCRSViskoStruktur(), test_dict=testdaten, warnung=False)):
@@ -196,7 +200,7 @@ def VorbereitungOedoCRSVisko(daten):
         try:
             kraft = testdaten['Kraft [kN]']
             druckflaeche = pi*(durchmesser/2000.0)**2 # [m^2]
-            testdaten.update([('Spannung [kN/m^2]', [einzelkraft/druckflaeche for einzelkraft in kraft])])
+            testdaten.update(SpannungAusKraft(kraft=kraft, druckflaeche=druckflaeche))
             del testdaten['Kraft [kN]']
         except:
             pass
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+verarbeitung_oedometer.py   v0.1 (2026-10)
+"""
+
+# Copyright 2026 Dominik Zobel.
+# All rights reserved.
+#
+# This file is part of the miniSoilLAB package.
+# miniSoilLAB is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# miniSoilLAB is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Spalten(eintraege):
+    """Erstellt aus der Liste eintraege mit (Schluessel, Verlauf)-Paaren eine Datenstruktur, in der
+    jeder Verlauf als Messreihe gespeichert ist.
+    """
+    from .datenstruktur import Datenstruktur, Messreihe
+
+    return Datenstruktur([(schluessel, verlauf if isinstance(verlauf, Messreihe)
+        else Messreihe(verlauf)) for schluessel, verlauf in eintraege])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def SpannungAusKraft(kraft, druckflaeche):
+    """Berechnet den Spannungsverlauf [kN/m^2] aus dem Verlauf kraft [kN] und der druckflaeche [m^2].
+    Gibt eine Datenstruktur mit der Messreihe "Spannung [kN/m^2]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    return _Spalten([('Spannung [kN/m^2]', Messreihe(einzelkraft/druckflaeche
+        for einzelkraft in kraft))])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def SpannungMitOffset(spannung, spannungsoffset):
+    """Verschiebt den Verlauf spannung [kN/m^2] um den konstanten Wert spannungsoffset [kN/m^2].
+    Gibt eine Datenstruktur mit der Messreihe "Spannung [kN/m^2]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    return _Spalten([('Spannung [kN/m^2]', Messreihe(spannungsoffset+einzelspannung
+        for einzelspannung in spannung))])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def OedoVerformungen(setzung, anfangshoehe, porenzahl_anfang):
+    """Berechnet die Porenzahl (bezogen auf die erste Setzung) und die logarithmische axiale
+    Dehnung aus dem Verlauf setzung [mm] einer Probe mit der anfangshoehe [mm] und der Porenzahl
+    porenzahl_anfang. Gibt eine Datenstruktur mit den Messreihen "Porenzahl [-]" und
+    "Dehnung-axial [-]" zurueck.
+    """
+    from math import log
+    from .datenstruktur import Messreihe
+
+    bezugssetzung = setzung[0]
+    porenfaktor = porenzahl_anfang + 1.0
+    porenzahl = Messreihe((anfangshoehe - (tempsetzung-bezugssetzung))/anfangshoehe*porenfaktor
+        - 1.0 for tempsetzung in setzung)
+    dehnung = Messreihe(log(anfangshoehe/(anfangshoehe - tempsetzung)) for tempsetzung in setzung)
+    return _Spalten([('Porenzahl [-]', porenzahl), ('Dehnung-axial [-]', dehnung)])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def OedoSteifemodul(spannung, a, b):
+    """Berechnet den Steifemodul [kN/m^2] fuer den Verlauf spannung [kN/m^2] aus den ersten beiden
+    Koeffizienten a und b der Ausgleichsfunktion y = a*ln(x+b)+c. Gibt eine Datenstruktur mit der
+    Messreihe "Steifemodul [kN/m^2]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    return _Spalten([('Steifemodul [kN/m^2]', Messreihe((tempspannung + b) / a/1000.0
+        for tempspannung in spannung))])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def CRSVerformungen(setzung, anfangshoehe, porenzahl_anfang):
+    """Berechnet die Stauchung in Prozent und die Porenzahl (jeweils bezogen auf die erste Setzung)
+    aus dem Verlauf setzung [mm] einer Probe mit der anfangshoehe [mm] und der Porenzahl
+    porenzahl_anfang. Gibt eine Datenstruktur mit den Messreihen "Stauchung [%]" und
+    "Porenzahl [-]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    bezugssetzung = setzung[0]
+    porenfaktor = porenzahl_anfang + 1.0
+    stauchung = Messreihe(100.0*(temp_setzung - bezugssetzung)/anfangshoehe
+        for temp_setzung in setzung)
+    porenzahlen = Messreihe((anfangshoehe - (tempsetzung-bezugssetzung))/anfangshoehe*porenfaktor
+        - 1.0 for tempsetzung in setzung)
+    return _Spalten([('Stauchung [%]', stauchung), ('Porenzahl [-]', porenzahlen)])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def CRSViskoVerformungen(setzung, anfangshoehe, porenzahl_anfang):
+    """Berechnet die Porenzahl aus dem (absoluten) Verlauf setzung [mm] einer Probe mit der
+    anfangshoehe [mm] und der Porenzahl porenzahl_anfang. Gibt eine Datenstruktur mit der Messreihe
+    "Porenzahl [-]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    porenfaktor = 1.0 + porenzahl_anfang
+    porenzahl = Messreihe(porenzahl_anfang - porenfaktor*einzelsetzung/anfangshoehe
+        for einzelsetzung in setzung)
+    return _Spalten([('Porenzahl [-]', porenzahl)])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def CRLVerformungen(setzung, anfangshoehe, hs, tol):
+    """Berechnet die Probenhoehe [mm] und die Porenzahl aus dem Verlauf setzung [mm] einer Probe mit
+    der anfangshoehe [mm] und der Hoehe der Festsubstanz hs [mm]. Falls die Setzung um mindestens
+    tol zunimmt, wird zusaetzlich die auf die Gesamtsetzung bezogene spezifische Setzung in Prozent
+    bestimmt. Gibt eine Datenstruktur mit den Messreihen "Hoehe [mm]", "Porenzahl [-]" und (falls
+    gueltig) "Setzung-spez [%]" zurueck.
+    """
+    from .datenstruktur import Messreihe
+
+    hoehe = Messreihe(anfangshoehe - setz for setz in setzung)
+    porenzahl = Messreihe(einzelhoehe/hs - 1.0 for einzelhoehe in hoehe)
+    spalten = [('Hoehe [mm]', hoehe), ('Porenzahl [-]', porenzahl)]
+
+    bezugssetzung = setzung[0]
+    gesamtsetzung = max(setzung) - bezugssetzung
+    if (gesamtsetzung < tol):
+        return _Spalten(spalten)
+
+    spez_setzung = Messreihe(100.0*(setz - bezugssetzung)/gesamtsetzung for setz in setzung)
+    spalten += [('Setzung-spez [%]', spez_setzung)]
+    return _Spalten(spalten)
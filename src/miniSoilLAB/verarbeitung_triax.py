@@ -305,167 +305,246 @@ def _KennwerteTriaxVersuchstabelle(daten, refwerte, typ):
 
 
 # -------------------------------------------------------------------------------------------------
-def _KennwerteTriaxDundCU(daten, refwerte, typ):
-    """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der Vorlage Triax-D oder
-    Triax-CU und speichere sie in der uebergebenen Struktur daten, sofern diese den Vorgaben
-    entspricht. Fuer den typ "Triax-D" werden zusaetzlich "Korndichte [g/cm^3]",
-    "Trockendichte-min [g/cm^3]" und "Trockendichte-min [g/cm^3]" in refwerte benoetigt,
-    fuer "Triax-CU" die Werte "Fliessgrenze [%]", "Ausrollgrenze [%]" und
-    "Ueberkornanteil > 0,4mm [%]". Aktualisiert die Struktur daten und gibt True bei erfolgreicher
-    Bestimmung der Kennwerte zuruck, sonst False.
+def _Versuchsanzahl(daten, mindestanzahl=3):
+    """Gibt die Anzahl der Einzelversuche "Versuch 1", "Versuch 2", ... in daten zurueck, aber
+    mindestens mindestanzahl (ueblicherweise werden drei Versuche durchgefuehrt und erwartet).
+    """
+    anzahl_versuche = mindestanzahl
+    while ('Versuch ' + str(anzahl_versuche+1) in daten):
+        anzahl_versuche += 1
+
+    return anzahl_versuche
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _VersucheAuswerten(auswertung, auftraege, prozesse=1):
+    """Rufe die Funktion auswertung fuer jeden Eintrag (ein dict mit den Argumenten) aus auftraege
+    auf und gib die Ergebnisse in der Reihenfolge der auftraege zurueck. Ist prozesse groesser als
+    Eins (oder None fuer alle verfuegbaren Prozessoren), werden die Auftraege parallel in einem
+    Prozesspool bearbeitet. Dazu muss auswertung eine Funktion auf Modulebene sein, die nur ihre
+    Argumente veraendert und die Ergebnisse zurueckgibt.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from .konstanten import EinstellungenAusgeben, EinstellungenSetzen
+
+    if (prozesse is None):
+        prozesse = os.cpu_count() or 1
+
+    prozesse = min(prozesse, len(auftraege))
+    if (prozesse <= 1):
+        return [auswertung(**auftrag) for auftrag in auftraege]
+
+    with ProcessPoolExecutor(max_workers=prozesse, initializer=EinstellungenSetzen,
+        initargs=(EinstellungenAusgeben(),)) as prozesspool:
+        laufend = [prozesspool.submit(auswertung, **auftrag) for auftrag in auftraege]
+        return [berechnung.result() for berechnung in laufend]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _TriaxVersuchAuswerten(triax, typ, hoehe_k, volumen_k, trockenmasse_e=None, korndichte=None,
+    param_spanne=1.2):
+    """Bestimme die Kennwerte eines einzelnen Versuchs triax vom typ "Triax-D" oder "Triax-CU" mit
+    der Hoehe hoehe_k und dem Volumen volumen_k der konsolidierten Probe (fuer "Triax-D" werden
+    zusaetzlich trockenmasse_e und korndichte benoetigt). Es wird nur triax veraendert, so dass die
+    Versuche unabhaengig voneinander (auch in anderen Prozessen) ausgewertet werden koennen. Gibt
+    triax und die Spannungen [sigma_1', sigma_3'] im Peakzustand zurueck (bzw. None anstelle der
+    Spannungen, falls diese nicht bestimmt werden konnten).
     """
     from math import asin, atan
     from .konstanten import grad2rad
-    from .datenstruktur import Datenstruktur
+    from .datenstruktur import Datenstruktur, Messreihe
     from .verarbeitung_hilfen import SekundenOhneOffsetBereitstellen, GespeicherterWertOderUebergabe
+    from .verarbeitung_hilfen import AnnaeherndNull
     from .gleichungsloeser import LinearesAusgleichsproblem, LinearInterpoliertenIndexUndFaktor
-    from .gleichungsloeser import WinkelTangenteAnKreisboegen
 
-    if (not _KennwerteTriaxVersuchstabelle(daten=daten, refwerte=refwerte, typ=typ)):
-        print('# Warnung: Bestimmung der Kennwerte fehlgeschlagen')
-        return False
+    tol = 1e-6
 
-    # Einstellbare Parameter fuer Triaxialversuche, falls keine Vorgaben existieren
-    param_spanne = 1.2           # Betrachteter prozentualer Bereich um die Peakdehnung
-    param_c_delta = 0.1          # Anfangsschrittweite/-genauigkeit bei der Bestimmung der Kohaesion
-    param_max_c_schritte = 800   # Max. erlaubte Schritte zur Bestimmung der Kohaesion (limitiert Schrittweite/Genauigkeit)
+    radialdruck = triax['Radialdruck [kN/m^2]']
+    porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
+    axialkraft = triax['Axialkraft [kN]']
+    stauchung = triax['Stauchung [mm]']
 
-    herstellung = daten['1-Probenherstellung']
-    trockenmasse_e = herstellung['Trockenmasse [g]']
+    if (not SekundenOhneOffsetBereitstellen(daten=triax, formatliste=['%Y-%m-%d %H:%M:%S', '%H:%M:%S'])):
+        print('# Warnung: Zeit [s] konnte nicht erfolgreich gebildet/angepasst werden')
+        return [triax, None]
 
-    konsolidation = daten['3-Konsolidation']
-    hoehe_k = konsolidation['Hoehe [mm]']
-    volumen_k = konsolidation['Volumen [cm^3]']
+    # Alle Verlaeufe werden spaltenweise in jeweils einem Durchlauf bestimmt (ohne Indexzugriffe)
+    # und gemeinsam genutzte Zwischenergebnisse (restlaenge, volumen) nur einmal berechnet. Die
+    # gespeicherten Verlaeufe sind Messreihen
+    kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
+    dehnung = Messreihe(100.0*(einzel_stauchung-stauchung[0])/hoehe_k for einzel_stauchung in stauchung)
+    restlaenge = [hoehe_k-einzel_stauchung for einzel_stauchung in stauchung]
 
-    tol = 1e-6
+    if (AnnaeherndNull(werte=restlaenge, tol=tol)):
+        print('# Warnung: Stauchung entspricht annaehernd der Hoehe der konsolidierten Probe')
+        return [triax, None]
 
-    sigma_1 = [None, None, None]
-    sigma_3 = [None, None, None]
+    if (typ == 'Triax-D'):
+        porenwasservolumen = triax['Porenwasservolumen [mm^3]']
 
-    for idx_triax, triax_versuch in enumerate(['Versuch 1', 'Versuch 2', 'Versuch 3']):
-        try:
-            triax = daten[triax_versuch]
-        except KeyError as errormessage:
-            print('# Warnung: Mindestens eine erforderliche Struktur nicht vorhanden - ' + str(errormessage))
-            continue
+        delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
+        volumen = [volumen_k+einzel_delta for einzel_delta in delta_volumen]
+        flaeche = [1000.0*einzel_volumen/einzel_laenge for einzel_volumen, einzel_laenge in zip(volumen, restlaenge)]
+        delta_v_v0 = Messreihe(100.0*einzel_delta/(volumen_k) for einzel_delta in delta_volumen)
+        triax.update([('delta V/V_0 [%]', delta_v_v0)])
+    if (typ == 'Triax-CU'):
+        flaechenfaktor = 1000.0*(volumen_k)
+        flaeche = [flaechenfaktor/einzel_laenge for einzel_laenge in restlaenge]
 
-        radialdruck = triax['Radialdruck [kN/m^2]']
-        porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
-        axialkraft = triax['Axialkraft [kN]']
-        stauchung = triax['Stauchung [mm]']
+    if (AnnaeherndNull(werte=flaeche, tol=tol)):
+        print('# Warnung: Mindestens eine Flaeche annaehernd Null')
+        return [triax, None]
 
-        if (not SekundenOhneOffsetBereitstellen(daten=triax, formatliste=['%Y-%m-%d %H:%M:%S', '%H:%M:%S'])):
-            print('# Warnung: Zeit [s] konnte nicht erfolgreich gebildet/angepasst werden')
-            continue
+    sig1sig3diff = Messreihe(1e6*einzel_kraft/einzel_flaeche/2.0 for einzel_kraft, einzel_flaeche in zip(kraft, flaeche))
+    sigma1prime = [(2.0*einzel_diff + radial) - poren for einzel_diff, radial, poren in zip(sig1sig3diff, radialdruck, porenwasserdruck)]
+    sigma3prime = [radial - poren for radial, poren in zip(radialdruck, porenwasserdruck)]
+    sig1sig3primesum = Messreihe((sig1 + sig3)/2.0 for sig1, sig3 in zip(sigma1prime, sigma3prime))
 
-        numdaten = len(triax['Zeit [s]'])
-        kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
-        dehnung = [100.0*(einzel_stauchung-stauchung[0])/hoehe_k[idx_triax] for einzel_stauchung in stauchung]
+    if (typ == 'Triax-CU'):
+        if (AnnaeherndNull(werte=sigma3prime, tol=tol)):
+            print('# Warnung: Mindestens ein sigma3\' annaehernd Null')
+            return [triax, None]
 
-        if (any([(abs(hoehe_k[idx_triax] - tempstauchung) < tol) for tempstauchung in stauchung])):
-            print('# Warnung: Stauchung entspricht annaehernd der Hoehe der konsolidierten Probe')
-            continue
+        sig1psig3p = Messreihe(sig1/sig3 for sig1, sig3 in zip(sigma1prime, sigma3prime))
+        triax.update([('sig1_prime/sig3_prime [-]', sig1psig3p)])
+        triax.update([('Porenwasserdruck-Delta [kN/m^2]', Messreihe(porendruck - porenwasserdruck[0] for porendruck in porenwasserdruck))])
 
-        if (typ == 'Triax-D'):
-            porenwasservolumen = triax['Porenwasservolumen [mm^3]']
+    try:
+        phi_prime = Messreihe(asin((sig1-sig3)/(sig1+sig3))/grad2rad for sig1, sig3 in zip(sigma1prime, sigma3prime))
+    except:
+        print('# Warnung: phi\' konnte nicht bestimmt werden')
+        return [triax, None]
 
-            delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
-            flaeche = [1000.0*(volumen_k[idx_triax]+delta_volumen[idx])/(hoehe_k[idx_triax]-stauchung[idx]) for idx in range(numdaten)]
-            delta_v_v0 = [100.0*delta_volumen[idx]/(volumen_k[idx_triax]) for idx in range(numdaten)]
-            triax.update([('delta V/V_0 [%]', delta_v_v0)])
-        if (typ == 'Triax-CU'):
-            flaeche = [1000.0*(volumen_k[idx_triax])/(hoehe_k[idx_triax]-stauchung[idx]) for idx in range(numdaten)]
+    if (typ == 'Triax-D'):
+        # Es wird bereits vorher sichergestellt, dass trockenmasse_e ungleich Null ist
+        if (AnnaeherndNull(werte=volumen, tol=tol)):
+            print('# Warnung: Differenz von mindestens einem Volumen zu Delta Volumen annaehernd Null')
+            return [triax, None]
 
-        if (any([(abs(tempflaeche) < tol) for tempflaeche in flaeche])):
-            print('# Warnung: Mindestens eine Flaeche annaehernd Null')
-            continue
+        triax_porenzahlen = Messreihe(korndichte/(trockenmasse_e/einzel_volumen)-1.0 for einzel_volumen in volumen)
+        triax.update([('Porenzahl [-]', triax_porenzahlen)])
 
-        sig1sig3diff = [1e6*kraft[idx]/flaeche[idx]/2.0 for idx in range(numdaten)]
-        sigma1prime = [(2.0*sig1sig3diff[idx] + radialdruck[idx]) - porenwasserdruck[idx] for idx in range(numdaten)]
-        sigma3prime = [radialdruck[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
-        sig1sig3primesum = [(sigma1prime[idx] + sigma3prime[idx])/2.0 for idx in range(numdaten)]
+    triax.update([('(sig_1 - sig_3)/2.0 [kN/m^2]', sig1sig3diff)])
+    triax.update([('(sig_1prime + sig_3prime)/2.0 [kN/m^2]', sig1sig3primesum)])
+    triax.update([('Reibungswinkel [Grad]', phi_prime)])
+    triax.update([('Dehnung [%]', dehnung)])
 
-        if (typ == 'Triax-CU'):
-            if (any([(abs(tempsig3) < tol) for tempsig3 in sigma3prime])):
-                print('# Warnung: Mindestens ein sigma3\' annaehernd Null')
-                continue
+    peak = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Peakzustand',
+        uebergabe=Datenstruktur())
+    if (typ == 'Triax-D'):
+        idx_peak = sig1sig3diff.index(max(sig1sig3diff))
+        peak.update([('Porenzahl [-]', triax_porenzahlen[idx_peak])])
+    elif (typ == 'Triax-CU'):
+        idx_peak = sig1psig3p.index(max(sig1psig3p))
+        peak.update([('Porenwasserdruck [kN/m^2]', porenwasserdruck[idx_peak])])
 
-            sig1psig3p = [sigma1prime[idx]/sigma3prime[idx] for idx in range(numdaten)]
-            triax.update([('sig1_prime/sig3_prime [-]', sig1psig3p)])
-            triax.update([('Porenwasserdruck-Delta [kN/m^2]', [porendruck - porenwasserdruck[0] for porendruck in porenwasserdruck])])
+    peak.update([('Index', idx_peak)])
+    peak.update([('Sigma_1_prime [kN/m^2]', sigma1prime[idx_peak])])
+    peak.update([('Sigma_3_prime [kN/m^2]', sigma3prime[idx_peak])])
+    peak.update([('Dehnung [%]', dehnung[idx_peak])])
 
-        try:
-            phi_prime = [asin((sigma1prime[idx]-sigma3prime[idx])/(sigma1prime[idx]+sigma3prime[idx]))/grad2rad for idx in range(numdaten)]
-        except:
-            print('# Warnung: phi\' konnte nicht bestimmt werden')
-            continue
+    peakspannungen = [sigma1prime[idx_peak], sigma3prime[idx_peak]]
 
-        if (typ == 'Triax-D'):
-            # Es wird bereits vorher sichergestellt, dass trockenmasse_e ungleich Null ist
-            if (any([(abs(volumen_k[idx_triax]+temp_vol) < tol) for temp_vol in delta_volumen])):
-                print('# Warnung: Differenz von mindestens einem Volumen zu Delta Volumen annaehernd Null')
-                continue
+    if (typ == 'Triax-D'):
+        einstellungen = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Einstellungen',
+            uebergabe=Datenstruktur())
 
-            korndichte = refwerte['Korndichte [g/cm^3]']
-            triax_porenzahlen = [korndichte/(trockenmasse_e[idx_triax]/(volumen_k[idx_triax]+delta_volumen[idx]))-1.0 for idx in range(numdaten)]
-            triax.update([('Porenzahl [-]', triax_porenzahlen)])
+        spanne = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Spanne',
+            uebergabe=param_spanne)
 
-        triax.update([('(sig_1 - sig_3)/2.0 [kN/m^2]', sig1sig3diff)])
-        triax.update([('(sig_1prime + sig_3prime)/2.0 [kN/m^2]', sig1sig3primesum)])
-        triax.update([('Reibungswinkel [Grad]', phi_prime)])
-        triax.update([('Dehnung [%]', dehnung)])
+        maxspanne = max(min(dehnung), dehnung[idx_peak]-spanne)
+        minspanne = min(max(dehnung), dehnung[idx_peak]+spanne)
+        idx_dehnstart, faks = LinearInterpoliertenIndexUndFaktor(vergleichswert=maxspanne,
+            vergleichswertliste=dehnung)
+        idx_dehnende, faks = LinearInterpoliertenIndexUndFaktor(vergleichswert=minspanne,
+            vergleichswertliste=dehnung)
 
-        peak = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Peakzustand',
-            uebergabe=Datenstruktur())
-        if (typ == 'Triax-D'):
-            idx_peak = sig1sig3diff.index(max(sig1sig3diff))
-            peak.update([('Porenzahl [-]', triax_porenzahlen[idx_peak])])
-        elif (typ == 'Triax-CU'):
-            idx_peak = sig1psig3p.index(max(sig1psig3p))
-            peak.update([('Porenwasserdruck [kN/m^2]', porenwasserdruck[idx_peak])])
+        einstellungen.update([('Dehnungsspanne (min/max)', [minspanne, maxspanne])])
 
-        peak.update([('Index', idx_peak)])
-        peak.update([('Sigma_1_prime [kN/m^2]', sigma1prime[idx_peak])])
-        peak.update([('Sigma_3_prime [kN/m^2]', sigma3prime[idx_peak])])
-        peak.update([('Dehnung [%]', dehnung[idx_peak])])
+        if ((idx_dehnstart is None) or (idx_dehnende is None)):
+            return [triax, peakspannungen]
 
-        sigma_1[idx_triax] = sigma1prime[idx_peak]
-        sigma_3[idx_triax] = sigma3prime[idx_peak]
+        steigung, offset = LinearesAusgleichsproblem(x=dehnung[idx_dehnstart:idx_dehnende],
+            y=delta_v_v0[idx_dehnstart:idx_dehnende])
 
-        if (typ == 'Triax-D'):
-            einstellungen = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Einstellungen',
-                uebergabe=Datenstruktur())
+        if (steigung < -1.0):
+            print('# Warnung: Steigung sollte positiv (und muss groesser als -1) sein')
+            return [triax, peakspannungen]
 
-            spanne = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Spanne',
-                uebergabe=param_spanne)
+        geradenwinkel = atan(steigung)/grad2rad
+        dilatanzwinkel = asin(steigung/(2.0+steigung))/grad2rad
+        peak.update([('Geradenwinkel [Grad]', geradenwinkel)])
+        peak.update([('Dilatanzwinkel [Grad]', dilatanzwinkel)])
 
-            maxspanne = max(min(dehnung), dehnung[idx_peak]-spanne)
-            minspanne = min(max(dehnung), dehnung[idx_peak]+spanne)
-            idx_dehnstart, faks = LinearInterpoliertenIndexUndFaktor(vergleichswert=maxspanne,
-                vergleichswertliste=dehnung)
-            idx_dehnende, faks = LinearInterpoliertenIndexUndFaktor(vergleichswert=minspanne,
-                vergleichswertliste=dehnung)
+    return [triax, peakspannungen]
 
-            einstellungen.update([('Dehnungsspanne (min/max)', [minspanne, maxspanne])])
 
-            if ((idx_dehnstart is None) or (idx_dehnende is None)):
-                continue
 
-            steigung, offset = LinearesAusgleichsproblem(x=dehnung[idx_dehnstart:idx_dehnende],
-                y=delta_v_v0[idx_dehnstart:idx_dehnende])
+# -------------------------------------------------------------------------------------------------
+def _KennwerteTriaxDundCU(daten, refwerte, typ, prozesse=1):
+    """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der Vorlage Triax-D oder
+    Triax-CU und speichere sie in der uebergebenen Struktur daten, sofern diese den Vorgaben
+    entspricht. Fuer den typ "Triax-D" werden zusaetzlich "Korndichte [g/cm^3]",
+    "Trockendichte-min [g/cm^3]" und "Trockendichte-min [g/cm^3]" in refwerte benoetigt,
+    fuer "Triax-CU" die Werte "Fliessgrenze [%]", "Ausrollgrenze [%]" und
+    "Ueberkornanteil > 0,4mm [%]". Die einzelnen Versuche werden mit bis zu prozesse Prozessen
+    ausgewertet, die Mohr-Coulomb-Parameter erst nach Abschluss aller Versuche. Aktualisiert die
+    Struktur daten und gibt True bei erfolgreicher Bestimmung der Kennwerte zuruck, sonst False.
+    """
+    from .datenstruktur import Datenstruktur
+    from .verarbeitung_hilfen import GespeicherterWertOderUebergabe
+    from .gleichungsloeser import WinkelTangenteAnKreisboegen, AchsenabstandUndWinkelTangenteAnKreisboegen
 
-            if (steigung < -1.0):
-                print('# Warnung: Steigung sollte positiv (und muss groesser als -1) sein')
-                continue
+    if (not _KennwerteTriaxVersuchstabelle(daten=daten, refwerte=refwerte, typ=typ)):
+        print('# Warnung: Bestimmung der Kennwerte fehlgeschlagen')
+        return False
+
+    # Einstellbare Parameter fuer Triaxialversuche, falls keine Vorgaben existieren
+    param_spanne = 1.2           # Betrachteter prozentualer Bereich um die Peakdehnung
+    param_winkel_tol = 1e-10     # Genauigkeit des Reibungswinkels (Bogenmass), falls die Kohaesion an einer Grenze liegt
+
+    herstellung = daten['1-Probenherstellung']
+    trockenmasse_e = herstellung['Trockenmasse [g]']
+
+    konsolidation = daten['3-Konsolidation']
+    hoehe_k = konsolidation['Hoehe [mm]']
+    volumen_k = konsolidation['Volumen [cm^3]']
+
+    anzahl_versuche = len(hoehe_k)
+    sigma_1 = [None for idx in range(anzahl_versuche)]
+    sigma_3 = [None for idx in range(anzahl_versuche)]
+
+    versuchsindizes = []
+    auftraege = []
+    for idx_triax in range(anzahl_versuche):
+        triax_versuch = 'Versuch ' + str(idx_triax+1)
+        try:
+            triax = daten[triax_versuch]
+        except KeyError as errormessage:
+            print('# Warnung: Mindestens eine erforderliche Struktur nicht vorhanden - ' + str(errormessage))
+            continue
+
+        auftrag = dict(triax=triax, typ=typ, hoehe_k=hoehe_k[idx_triax], volumen_k=volumen_k[idx_triax],
+            param_spanne=param_spanne)
+        if (typ == 'Triax-D'):
+            auftrag.update([('trockenmasse_e', trockenmasse_e[idx_triax]),
+                ('korndichte', refwerte['Korndichte [g/cm^3]'])])
 
-            geradenwinkel = atan(steigung)/grad2rad
-            dilatanzwinkel = asin(steigung/(2.0+steigung))/grad2rad
-            peak.update([('Geradenwinkel [Grad]', geradenwinkel)])
-            peak.update([('Dilatanzwinkel [Grad]', dilatanzwinkel)])
+        versuchsindizes.append(idx_triax)
+        auftraege.append(auftrag)
 
+    ergebnisse = _VersucheAuswerten(auswertung=_TriaxVersuchAuswerten, auftraege=auftraege,
+        prozesse=prozesse)
+    for idx_triax, (triax, peakspannungen) in zip(versuchsindizes, ergebnisse):
+        daten.update([('Versuch ' + str(idx_triax+1), triax)])
+        if (peakspannungen is not None):
+            sigma_1[idx_triax], sigma_3[idx_triax] = peakspannungen
 
     if (any([(tempsig is None) for tempsig in sigma_1]) or any([(tempsig is None) for tempsig in sigma_3])):
-        print('# Warnung: Es konnten nicht alle drei Spannungen von sigma1/sigma3 erkannt werden')
+        print('# Warnung: Es konnten nicht alle Spannungen von sigma1/sigma3 erkannt werden')
         return False
 
     # --------------------- Mohr-Coulomb-Daten -------------------
@@ -481,31 +560,19 @@ def _KennwerteTriaxDundCU(daten, refwerte, typ):
         ohneKohaesion = WinkelTangenteAnKreisboegen(x_min=sigma_3, x_max=sigma_1, y_0=0)
         ohne_c.update([('Reibungswinkel-eff [Grad]', ohneKohaesion[1])])
     else:
-        mitKohaesion = [None, None, None]
-        # Es gibt wahrscheinlich bessere Abschaetzungen, aber die Kohaesion
-        # ist zumindest kleiner als der minimale radius
-        # FIXME: Am besten das Intervall erst grob und dann in immer feineren Schritten unterteilen.
-        max_kohaesion = min([(sigma_1[idx] - sigma_3[idx])/2.0 for idx in range(3)])
-
-        c_delta = param_c_delta
-        c_delta_max = int((param_max_c_schritte - 1.0)*max_kohaesion)
-        if (c_delta > c_delta_max):
-            print('# Hinweis: Verringere Iterationen zur Bestimmung der Kohaesion (ungenauerer Wert)')
-            c_delta = c_delta_max
-
-        c_schritte = int(max_kohaesion/c_delta + 1.0)
-        for idx_kohaesion in range(c_schritte):
-            c = idx_kohaesion*c_delta
-            temp_abstand, temp_winkel = WinkelTangenteAnKreisboegen(x_min=sigma_3, x_max=sigma_1, y_0=c)
-
-            if ((mitKohaesion[0] is None) or ((mitKohaesion[0] is not None) and (temp_abstand < mitKohaesion[0]))):
-                mitKohaesion = [temp_abstand, temp_winkel, c]
+        # Kohaesion und Reibungswinkel werden gemeinsam bestimmt. Die Kohaesion ist dabei zumindest
+        # nicht negativ und kleiner als der minimale Radius
+        max_kohaesion = min([(sigma_1[idx] - sigma_3[idx])/2.0 for idx in range(anzahl_versuche)])
+        minabstand, winkel, kohaesion, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+            x_min=sigma_3, x_max=sigma_1, y_0_min=0.0, y_0_max=max_kohaesion, tol=param_winkel_tol)
 
         mit_c = GespeicherterWertOderUebergabe(daten=mc, bezeichnung='Mit Kohaesion',
             uebergabe=Datenstruktur())
 
-        mit_c.update([('Reibungswinkel-eff [Grad]', mitKohaesion[1])])
-        mit_c.update([('Kohaesion [kN/m^2]', mitKohaesion[2])])
+        mit_c.update([('Reibungswinkel-eff [Grad]', winkel)])
+        mit_c.update([('Kohaesion [kN/m^2]', kohaesion)])
+        mit_c.update([('Residuen [kN/m^2]', abstaende)])
+        mit_c.update([('Fehlerquadratsumme [(kN/m^2)^2]', minabstand)])
 
     return True
 
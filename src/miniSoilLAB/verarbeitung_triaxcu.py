@@ -22,8 +22,9 @@ verarbeitung_triaxcu.py   v0.3 (2023-09)
 
 
 # -------------------------------------------------------------------------------------------------
-def TriaxCUStruktur():
-
+def TriaxCUStruktur(anzahl_versuche=3):
+    """Gibt die Referenzstruktur fuer Triax-CU mit anzahl_versuche Einzelversuchen zurueck.
+    """
     import copy
     from .datenstruktur import Datenstruktur
 
@@ -42,42 +43,31 @@ def TriaxCUStruktur():
         }),
         '5-Abscheren': Datenstruktur({
             'Trockenmasse [g]': []
-        }),
-        'Versuch 1': Datenstruktur({
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': [],
-            'Zeit [s]': []
-        }),
-        'Versuch 2': Datenstruktur({
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': [],
-            'Zeit [s]': []
-        }),
-        'Versuch 3': Datenstruktur({
+        })
+    })
+    for idx_versuch in range(anzahl_versuche):
+        struktur.update([('Versuch ' + str(idx_versuch+1), Datenstruktur({
             'Radialdruck [kN/m^2]': [],
             'Porenwasserdruck [kN/m^2]': [],
             'Axialkraft [kN]': [],
             'Stauchung [mm]': [],
             'Zeit [s]': []
-        })
-    })
+        }))])
+
     return copy.deepcopy(struktur)
 
 
 
 # -------------------------------------------------------------------------------------------------
-def KennwerteTriaxCU(daten, refwerte):
+def KennwerteTriaxCU(daten, refwerte, prozesse=1):
     """Erwartet eine JSON-Struktur daten, in der die Daten zu Triax-CU-Versuchen gespeichert sind
-    und aktualisiert/berechnet die entsprechenden Kennwerte.
+    und aktualisiert/berechnet die entsprechenden Kennwerte. Die einzelnen Versuche koennen mit
+    prozesse > 1 parallel ausgewertet werden.
     """
     from .konstanten import debugmodus
     from .datenstruktur import DatenstrukturExtrahieren
     from .verarbeitung_hilfen import ZusatzdatenKopieren
-    from .verarbeitung_triax import _KennwerteTriaxDundCU
+    from .verarbeitung_triax import _KennwerteTriaxDundCU, _Versuchsanzahl
 
     erfolgreich = False
 
@@ -87,11 +77,14 @@ def KennwerteTriaxCU(daten, refwerte):
 
         daten.update([('_Refwahl', '_Ref_001')])
 
-    extrahierte_daten = DatenstrukturExtrahieren(daten=daten, refstruktur=TriaxCUStruktur(), refwahl=daten['_Refwahl'])
+    anzahl_versuche = _Versuchsanzahl(daten=daten.get(daten['_Refwahl'], dict()))
+    extrahierte_daten = DatenstrukturExtrahieren(daten=daten,
+        refstruktur=TriaxCUStruktur(anzahl_versuche=anzahl_versuche), refwahl=daten['_Refwahl'])
     if (extrahierte_daten):
         daten.update(extrahierte_daten)
         ZusatzdatenKopieren(quelle=daten[daten['_Refwahl']], ziel=daten)
-        erfolgreich = _KennwerteTriaxDundCU(daten=daten, refwerte=refwerte, typ='Triax-CU')
+        erfolgreich = _KennwerteTriaxDundCU(daten=daten, refwerte=refwerte, typ='Triax-CU',
+            prozesse=prozesse)
 
     return erfolgreich
 
@@ -108,13 +101,17 @@ def VorbereitungTriaxCU(daten):
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import EintraegeAusUnterstrukturenInHauptstruktur, ZielgroesseFindenUndAktualisieren
     from .verarbeitung_hilfen import SekundenOhneOffsetBereitstellen
+    from .verarbeitung_triax import _Versuchsanzahl
 
     testdaten = copy.deepcopy(daten)
-    if (not DictStrukturPruefenUndAngleichen(ref_dict=TriaxCUStruktur(), test_dict=testdaten, warnung=False)):
+    anzahl_versuche = _Versuchsanzahl(daten=testdaten)
+    versuche = ['Versuch ' + str(idx_versuch+1) for idx_versuch in range(anzahl_versuche)]
+    if (not DictStrukturPruefenUndAngleichen(ref_dict=TriaxCUStruktur(anzahl_versuche=anzahl_versuche),
+        test_dict=testdaten, warnung=False)):
         # Zusammengesetzte Einzelversuche haben die Tabellendaten ggfs. an anderer Stelle. Extrahiere diese
         # Daten aus Substrukturen (falls sie nicht schon dort gespeichert sind)
         EintraegeAusUnterstrukturenInHauptstruktur(daten=testdaten,
-            unterstrukturen=['Versuch 1', 'Versuch 2', 'Versuch 3'], eintraege=['1-Probenherstellung',
+            unterstrukturen=versuche, eintraege=['1-Probenherstellung',
             '2-Saettigung', '3-Konsolidation', '4-Nach Konsolidation', '5-Abscheren'])
         # Zielgroessen aus Alternativgroessen berechnen (falls erforderlich)
         try:
@@ -135,10 +132,11 @@ def VorbereitungTriaxCU(daten):
         except:
             pass
 
-        for versuch in ['Versuch 1', 'Versuch 2', 'Versuch 3']:
+        for versuch in versuche:
             SekundenOhneOffsetBereitstellen(daten=testdaten[versuch])
 
-    if (DictStrukturGleichOderTeilmenge(ref_dict=TriaxCUStruktur(), test_dict=testdaten, warnung=True)):
+    if (DictStrukturGleichOderTeilmenge(ref_dict=TriaxCUStruktur(anzahl_versuche=anzahl_versuche),
+        test_dict=testdaten, warnung=True)):
         # Referenz an daten zu den modifizierten Daten aendern
         daten.clear()
         daten.update(testdaten)
@@ -22,8 +22,9 @@ verarbeitung_triaxd.py   v0.3 (2023-09)
 
 
 # -------------------------------------------------------------------------------------------------
-def TriaxDStruktur():
-
+def TriaxDStruktur(anzahl_versuche=3):
+    """Gibt die Referenzstruktur fuer Triax-D mit anzahl_versuche Einzelversuchen zurueck.
+    """
     import copy
     from .datenstruktur import Datenstruktur
 
@@ -44,32 +45,18 @@ def TriaxDStruktur():
         }),
         '5-Abscheren': Datenstruktur({
             'Backvolume-Ende [mm^3]': []
-        }),
-        'Versuch 1': Datenstruktur({
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Porenwasservolumen [mm^3]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': [],
-            'Zeit [s]': []
-        }),
-        'Versuch 2': Datenstruktur({
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Porenwasservolumen [mm^3]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': [],
-            'Zeit [s]': []
-        }),
-        'Versuch 3': Datenstruktur({
+        })
+    })
+    for idx_versuch in range(anzahl_versuche):
+        struktur.update([('Versuch ' + str(idx_versuch+1), Datenstruktur({
             'Radialdruck [kN/m^2]': [],
             'Porenwasserdruck [kN/m^2]': [],
             'Porenwasservolumen [mm^3]': [],
             'Axialkraft [kN]': [],
             'Stauchung [mm]': [],
             'Zeit [s]': []
-        })
-    })
+        }))])
+
     return copy.deepcopy(struktur)
 
 
@@ -131,14 +118,15 @@ def LagerungsdichtenTriaxDBestimmen(daten, refwerte, grenzen_min=[-0.1, 0.6], gr
 
 
 # -------------------------------------------------------------------------------------------------
-def KennwerteTriaxD(daten, refwerte):
+def KennwerteTriaxD(daten, refwerte, prozesse=1):
     """Erwartet eine JSON-Struktur daten, in der die Daten zu Triax-D-Versuchen gespeichert sind
-    und aktualisiert/berechnet die entsprechenden Kennwerte.
+    und aktualisiert/berechnet die entsprechenden Kennwerte. Die einzelnen Versuche koennen mit
+    prozesse > 1 parallel ausgewertet werden.
     """
     from .konstanten import debugmodus
     from .datenstruktur import Datenstruktur, DatenstrukturExtrahieren
     from .verarbeitung_hilfen import GespeicherterWertOderUebergabe, ZusatzdatenKopieren
-    from .verarbeitung_triax import _KennwerteTriaxDundCU
+    from .verarbeitung_triax import _KennwerteTriaxDundCU, _Versuchsanzahl
 
     triax_locker, triax_dicht = LagerungsdichtenTriaxDBestimmen(daten=daten, refwerte=refwerte)
     for variante, kandidaten in [('locker', triax_locker), ('dicht', triax_dicht)]:
@@ -165,12 +153,14 @@ def KennwerteTriaxD(daten, refwerte):
 
         triax_variante.update([('_Refwahl', auswahl)])
 
-        extrahierte_daten = DatenstrukturExtrahieren(daten=daten, refstruktur=TriaxDStruktur(),
-            refwahl=triax_variante['_Refwahl'])
+        anzahl_versuche = _Versuchsanzahl(daten=daten[triax_variante['_Refwahl']])
+        extrahierte_daten = DatenstrukturExtrahieren(daten=daten,
+            refstruktur=TriaxDStruktur(anzahl_versuche=anzahl_versuche), refwahl=triax_variante['_Refwahl'])
         if (extrahierte_daten):
             triax_variante.update(extrahierte_daten)
             ZusatzdatenKopieren(quelle=daten[triax_variante['_Refwahl']], ziel=triax_variante)
-            erfolgreich = _KennwerteTriaxDundCU(daten=triax_variante, refwerte=refwerte, typ='Triax-D')
+            erfolgreich = _KennwerteTriaxDundCU(daten=triax_variante, refwerte=refwerte, typ='Triax-D',
+                prozesse=prozesse)
 
         if (not erfolgreich):
             return False
@@ -189,13 +179,17 @@ def VorbereitungTriaxD(daten):
     from math import pi
     from .datenstruktur import DictStrukturPruefenUndAngleichen, DictStrukturGleichOderTeilmenge
     from .datenstruktur import EintraegeAusUnterstrukturenInHauptstruktur, ZielgroesseFindenUndAktualisieren
+    from .verarbeitung_triax import _Versuchsanzahl
 
     testdaten = copy.deepcopy(daten)
-    if (not DictStrukturPruefenUndAngleichen(ref_dict=TriaxDStruktur(), test_dict=testdaten, warnung=False)):
+    anzahl_versuche = _Versuchsanzahl(daten=testdaten)
+    versuche = ['Versuch ' + str(idx_versuch+1) for idx_versuch in range(anzahl_versuche)]
+    if (not DictStrukturPruefenUndAngleichen(ref_dict=TriaxDStruktur(anzahl_versuche=anzahl_versuche),
+        test_dict=testdaten, warnung=False)):
         # Zusammengesetzte Einzelversuche haben die Tabellendaten ggfs. an anderer Stelle. Extrahiere diese
         # Daten aus Substrukturen (falls sie nicht schon dort gespeichert sind)
         EintraegeAusUnterstrukturenInHauptstruktur(daten=testdaten,
-            unterstrukturen=['Versuch 1', 'Versuch 2', 'Versuch 3'], eintraege=['1-Probenherstellung',
+            unterstrukturen=versuche, eintraege=['1-Probenherstellung',
             '2-Saettigung', '3-Konsolidation', '4-Nach Konsolidation', '5-Abscheren'])
 
         # Zielgroessen aus Alternativgroessen berechnen (falls erforderlich)
@@ -224,7 +218,8 @@ def VorbereitungTriaxD(daten):
             except:
                 pass
 
-    if (DictStrukturGleichOderTeilmenge(ref_dict=TriaxDStruktur(), test_dict=testdaten, warnung=True)):
+    if (DictStrukturGleichOderTeilmenge(ref_dict=TriaxDStruktur(anzahl_versuche=anzahl_versuche),
+        test_dict=testdaten, warnung=True)):
         # Referenz an daten zu den modifizierten Daten aendern
         daten.clear()
         daten.update(testdaten)
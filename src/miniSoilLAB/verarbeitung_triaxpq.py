@@ -22,8 +22,9 @@ verarbeitung_triaxpq.py   v0.3 (2023-09)
 
 
 # -------------------------------------------------------------------------------------------------
-def TriaxpqStruktur():
-
+def TriaxpqStruktur(anzahl_versuche=3):
+    """Gibt die Referenzstruktur fuer Triax-p-q mit anzahl_versuche Einzelversuchen zurueck.
+    """
     import copy
     from .datenstruktur import Datenstruktur
 
@@ -53,45 +54,146 @@ def TriaxpqStruktur():
                 'Druck-isotrop-eff [kN/m^2]': [],
                 'Hauptspannungsdifferenz [kN/m^2]': []
             })
-        }),
-        'Versuch 1': Datenstruktur({
-            'Stage': [],
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Porenwasservolumen [mm^3]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': []
-        }),
-        'Versuch 2': Datenstruktur({
-            'Stage': [],
-            'Radialdruck [kN/m^2]': [],
-            'Porenwasserdruck [kN/m^2]': [],
-            'Porenwasservolumen [mm^3]': [],
-            'Axialkraft [kN]': [],
-            'Stauchung [mm]': []
-        }),
-        'Versuch 3': Datenstruktur({
+        })
+    })
+    for idx_versuch in range(anzahl_versuche):
+        struktur.update([('Versuch ' + str(idx_versuch+1), Datenstruktur({
             'Stage': [],
             'Radialdruck [kN/m^2]': [],
             'Porenwasserdruck [kN/m^2]': [],
             'Porenwasservolumen [mm^3]': [],
             'Axialkraft [kN]': [],
             'Stauchung [mm]': []
-        })
-    })
+        }))])
+
     return copy.deepcopy(struktur)
 
 
 
 # -------------------------------------------------------------------------------------------------
-def _KennwerteTriaxpq(daten, refwerte, typ):
+def _TriaxpqVersuchAuswerten(triax, hoehe_k, volumen_k, param_offset=0, param_glaettungswert=10,
+    param_refspanne=3):
+    """Bestimme die Kennwerte eines einzelnen Triax-p-q-Versuchs triax mit der Hoehe hoehe_k und dem
+    Volumen volumen_k der konsolidierten Probe. Es wird nur triax veraendert, so dass die Versuche
+    unabhaengig voneinander (auch in anderen Prozessen) ausgewertet werden koennen. Gibt triax und
+    [Index des Spannungspfads (0, 90 oder 180 Grad), geglaettete Dehnung, geglaetteter E-Modul]
+    zurueck (bzw. None anstelle der Liste, falls der Versuch nicht ausgewertet werden konnte).
+    """
+    from .datenstruktur import Datenstruktur, Messreihe
+    from .verarbeitung_hilfen import GespeicherterWertOderUebergabe, AnnaeherndNull
+    from .parameterbestimmung import _ErweiterteHypoParamHilfsfunktion
+
+    tol = 1e-6
+
+    stage = triax['Stage']
+    porenwasservolumen = triax['Porenwasservolumen [mm^3]']
+    radialdruck = triax['Radialdruck [kN/m^2]']
+    porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
+    # Bei p-q-Pfaden sind bei Axialkraft und Stauchung auch negative Bereiche erlaubt
+    axialkraft = triax['Axialkraft [kN]']
+    stauchung = triax['Stauchung [mm]']
+
+    # Alle Verlaeufe werden wie in _TriaxVersuchAuswerten spaltenweise in jeweils einem Durchlauf
+    # bestimmt (ohne Indexzugriffe), die gespeicherten Verlaeufe sind Messreihen
+    kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
+    dehnung = Messreihe((einzel_stauchung-stauchung[0])/hoehe_k for einzel_stauchung in stauchung)
+    delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
+    restlaenge = [hoehe_k-einzel_stauchung for einzel_stauchung in stauchung]
+
+    if (AnnaeherndNull(werte=restlaenge, tol=tol)):
+        print('# Warnung: Stauchung entspricht annaehernd der Hoehe der konsolidierten Probe')
+        return [triax, None]
+
+    flaeche = [1000.0*(volumen_k+einzel_delta)/einzel_laenge for einzel_delta, einzel_laenge in zip(delta_volumen, restlaenge)]
+
+    if (AnnaeherndNull(werte=flaeche, tol=tol)):
+        print('# Warnung: Mindestens eine Flaeche annaehernd Null')
+        return [triax, None]
+
+    sig1sig3diff = [1e6*einzel_kraft/einzel_flaeche/2.0 for einzel_kraft, einzel_flaeche in zip(kraft, flaeche)]
+    sigma1 = [2.0*einzel_diff + radial for einzel_diff, radial in zip(sig1sig3diff, radialdruck)]
+    sigma1prime = [sig1 - poren for sig1, poren in zip(sigma1, porenwasserdruck)]
+    sigma3prime = [radial - poren for radial, poren in zip(radialdruck, porenwasserdruck)]
+
+    triax.update([('Dehnung [-]', dehnung)])
+    q = Messreihe(sig1 - radial for sig1, radial in zip(sigma1, radialdruck))
+    triax.update([('Hauptspannungsdifferenz [kN/m^2]', q)])
+    p_prime = Messreihe((sig1 + 2.0*sig3)/3.0 for sig1, sig3 in zip(sigma1prime, sigma3prime))
+    triax.update([('Druck-isotrop-eff [kN/m^2]', p_prime)])
+
+    # Statt den Stagenamen nur den Index einer Aenderung speichern
+    stage_idxlist = []
+    letzte_stage = 0
+    for idx_stage, stagenum in enumerate(stage):
+        if (stagenum > letzte_stage):
+            stage_idxlist += [idx_stage]
+            letzte_stage = stagenum
+
+    if (len(stage_idxlist) < 2):
+        print('# Warnung: Mindestens zwei Stages erforderlich')
+        return [triax, None]
+
+    triax.update([('Schritte', stage_idxlist)])
+
+    geglaettet = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Glaettung',
+        uebergabe=Datenstruktur())
+    einstellungen = GespeicherterWertOderUebergabe(daten=geglaettet, bezeichnung='Einstellungen',
+        uebergabe=Datenstruktur())
+
+    offset = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Startoffset',
+        uebergabe=param_offset)
+    glaettungswert = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Glaettungspunkte',
+        uebergabe=param_glaettungswert)
+    refspanne = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Referenzspanne',
+        uebergabe=param_refspanne)
+
+    startidx = stage_idxlist[-1]+offset
+    if (startidx > len(stauchung)-1):
+        print('# Warnung: Index fuer Stage und Offset liegt hinter der Grenze des Vektors')
+        return [triax, None]
+
+    eps = [(einzelstauchung-stauchung[startidx])/(hoehe_k-stauchung[startidx]) for einzelstauchung in stauchung[startidx:]]
+    # T bzw. tau entspricht q/2
+    q2 = [x/2.0 for x in q[startidx:]]
+    eps_glatt, q_glatt, e_modul_glatt, R_max, E_max, fitoffset = _ErweiterteHypoParamHilfsfunktion(eps=eps,
+        q=q2, glaettungswert=glaettungswert, refspanne=refspanne)
+    # FIXME: Gueltigkeit der Rueckgabewerte pruefen
+
+    geglaettet.update([('Dehnung [-]', eps_glatt)])
+    geglaettet.update([('E-Modul [kN/m^2]', e_modul_glatt)])
+    geglaettet.update([('q/2 [kN/m^2]', q_glatt)])
+    geglaettet.update([('R [-]', R_max)])
+    geglaettet.update([('E-Modul-max [kN/m^2]', E_max)])
+    geglaettet.update([('Versatz', fitoffset)])
+
+    mittelq = sum(q[stage_idxlist[-2]:stage_idxlist[-1]])/(stage_idxlist[-1]-stage_idxlist[-2])
+    mittelqtendenz = int(round(mittelq/10.0))
+    if (mittelqtendenz == 0):
+        pfadname = '90 Grad'
+        pfadindex = 1
+    elif (mittelqtendenz > 0):
+        pfadname = '180 Grad'
+        pfadindex = 2
+    else:
+        pfadname = '0 Grad'
+        pfadindex = 0
+
+    triax.update([('Spannungspfad', pfadname)])
+    return [triax, [pfadindex, eps_glatt, e_modul_glatt]]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _KennwerteTriaxpq(daten, refwerte, typ, prozesse=1):
     """Bestimme die Kennwerte zu einer eingelesenen Dateistruktur nach der Vorlage Triax-p-q und
-    speichere sie in der uebergebenen Struktur daten, sofern diese den Vorgaben entspricht.
+    speichere sie in der uebergebenen Struktur daten, sofern diese den Vorgaben entspricht. Die
+    einzelnen Versuche werden mit bis zu prozesse Prozessen ausgewertet, eps_som erst nach
+    Abschluss aller Versuche.
     """
     from .datenstruktur import Datenstruktur
     from .verarbeitung_hilfen import GespeicherterWertOderUebergabe
-    from .verarbeitung_triax import _KennwerteTriaxVersuchstabelle
-    from .parameterbestimmung import _ErweiterteHypoParamHilfsfunktion, _ErweiterteHypoParamHilfsfunktionEpssom
+    from .verarbeitung_triax import _KennwerteTriaxVersuchstabelle, _VersucheAuswerten
+    from .parameterbestimmung import _ErweiterteHypoParamHilfsfunktionEpssom
 
     if (not _KennwerteTriaxVersuchstabelle(daten=daten, refwerte=refwerte, typ=typ)):
         print('# Warnung: Bestimmung der Kennwerte fehlgeschlagen')
@@ -106,113 +208,31 @@ def _KennwerteTriaxpq(daten, refwerte, typ):
     hoehe_k = konsolidation['Hoehe [mm]']
     volumen_k = konsolidation['Volumen [cm^3]']
 
-    tol = 1e-6
-
-    epsliste = [None, None, None]
-    emodulliste = [None, None, None]
-    for idx_triax, triax_versuch in enumerate(['Versuch 1', 'Versuch 2', 'Versuch 3']):
+    versuchsindizes = []
+    auftraege = []
+    for idx_triax in range(len(hoehe_k)):
+        triax_versuch = 'Versuch ' + str(idx_triax+1)
         try:
             triax = daten[triax_versuch]
         except KeyError as errormessage:
             print('# Warnung: Mindestens eine erforderliche Struktur nicht vorhanden - ' + str(errormessage))
             continue
 
-        stage = triax['Stage']
-        porenwasservolumen = triax['Porenwasservolumen [mm^3]']
-        radialdruck = triax['Radialdruck [kN/m^2]']
-        porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
-        # Bei p-q-Pfaden sind bei Axialkraft und Stauchung auch negative Bereiche erlaubt
-        axialkraft = triax['Axialkraft [kN]']
-        stauchung = triax['Stauchung [mm]']
-
-        numdaten = len(stage)
-        kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
-        dehnung = [(einzel_stauchung-stauchung[0])/hoehe_k[idx_triax] for einzel_stauchung in stauchung]
-        delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
-
-        if (any([(abs(hoehe_k[idx_triax] - tempstauchung) < tol) for tempstauchung in stauchung])):
-            print('# Warnung: Stauchung entspricht annaehernd der Hoehe der konsolidierten Probe')
-            continue
-
-        flaeche = [1000.0*(volumen_k[idx_triax]+delta_volumen[idx])/(hoehe_k[idx_triax]-stauchung[idx]) for idx in range(numdaten)]
+        versuchsindizes.append(idx_triax)
+        auftraege.append(dict(triax=triax, hoehe_k=hoehe_k[idx_triax], volumen_k=volumen_k[idx_triax],
+            param_offset=param_offset, param_glaettungswert=param_glaettungswert,
+            param_refspanne=param_refspanne))
 
-        if (any([(abs(tempflaeche) < tol) for tempflaeche in flaeche])):
-            print('# Warnung: Mindestens eine Flaeche annaehernd Null')
-            continue
-
-        sig1sig3diff = [1e6*kraft[idx]/flaeche[idx]/2.0 for idx in range(numdaten)]
-        sigma1 = [2.0*sig1sig3diff[idx] + radialdruck[idx] for idx in range(numdaten)]
-        sigma1prime = [sigma1[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
-        sigma3prime = [radialdruck[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
-
-        triax.update([('Dehnung [-]', dehnung)])
-        q = [sigma1[idx] - radialdruck[idx] for idx in range(numdaten)]
-        triax.update([('Hauptspannungsdifferenz [kN/m^2]', q)])
-        p_prime = [(sigma1prime[idx] + 2.0*sigma3prime[idx])/3.0 for idx in range(numdaten)]
-        triax.update([('Druck-isotrop-eff [kN/m^2]', p_prime)])
-
-        # Statt den Stagenamen nur den Index einer Aenderung speichern
-        stage_idxlist = []
-        letzte_stage = 0
-        for idx_stage, stagenum in enumerate(stage):
-            if (stagenum > letzte_stage):
-                stage_idxlist += [idx_stage]
-                letzte_stage = stagenum
-
-        if (len(stage_idxlist) < 2):
-            print('# Warnung: Mindestens zwei Stages erforderlich')
-            continue
-
-        triax.update([('Schritte', stage_idxlist)])
-
-        geglaettet = GespeicherterWertOderUebergabe(daten=triax, bezeichnung='Glaettung',
-            uebergabe=Datenstruktur())
-        einstellungen = GespeicherterWertOderUebergabe(daten=geglaettet, bezeichnung='Einstellungen',
-            uebergabe=Datenstruktur())
-
-        offset = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Startoffset',
-            uebergabe=param_offset)
-        glaettungswert = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Glaettungspunkte',
-            uebergabe=param_glaettungswert)
-        refspanne = GespeicherterWertOderUebergabe(daten=einstellungen, bezeichnung='Referenzspanne',
-            uebergabe=param_refspanne)
-
-        startidx = stage_idxlist[-1]+offset
-        if (startidx > len(stauchung)-1):
-            print('# Warnung: Index fuer Stage und Offset liegt hinter der Grenze des Vektors')
-            continue
-
-        eps = [(einzelstauchung-stauchung[startidx])/(hoehe_k[idx_triax]-stauchung[startidx]) for einzelstauchung in stauchung[startidx:]]
-        # T bzw. tau entspricht q/2
-        q2 = [x/2.0 for x in q[startidx:]]
-        eps_glatt, q_glatt, e_modul_glatt, R_max, E_max, fitoffset = _ErweiterteHypoParamHilfsfunktion(eps=eps,
-            q=q2, glaettungswert=glaettungswert, refspanne=refspanne)
-        # FIXME: Gueltigkeit der Rueckgabewerte pruefen
-
-        geglaettet.update([('Dehnung [-]', eps_glatt)])
-        geglaettet.update([('E-Modul [kN/m^2]', e_modul_glatt)])
-        geglaettet.update([('q/2 [kN/m^2]', q_glatt)])
-        geglaettet.update([('R [-]', R_max)])
-        geglaettet.update([('E-Modul-max [kN/m^2]', E_max)])
-        geglaettet.update([('Versatz', fitoffset)])
-
-        mittelq = sum(q[stage_idxlist[-2]:stage_idxlist[-1]])/(stage_idxlist[-1]-stage_idxlist[-2])
-        mittelqtendenz = int(round(mittelq/10.0))
-        if (mittelqtendenz == 0):
-            pfadname = '90 Grad'
-            epsliste[1] = eps_glatt
-            emodulliste[1] = e_modul_glatt
-        elif (mittelqtendenz > 0):
-            pfadname = '180 Grad'
-            epsliste[2] = eps_glatt
-            emodulliste[2] = e_modul_glatt
-        else:
-            pfadname = '0 Grad'
-            epsliste[0] = eps_glatt
-            emodulliste[0] = e_modul_glatt
-
-        triax.update([('Spannungspfad', pfadname)])
+    epsliste = [None, None, None]
+    emodulliste = [None, None, None]
+    ergebnisse = _VersucheAuswerten(auswertung=_TriaxpqVersuchAuswerten, auftraege=auftraege,
+        prozesse=prozesse)
+    for idx_triax, (triax, pfad) in zip(versuchsindizes, ergebnisse):
         daten.update([('Versuch ' + str(idx_triax+1), triax)])
+        if (pfad is not None):
+            pfadindex, eps_glatt, e_modul_glatt = pfad
+            epsliste[pfadindex] = eps_glatt
+            emodulliste[pfadindex] = e_modul_glatt
 
     if (any([(tempeps is None) for tempeps in epsliste])):
         print('# Warnung: Es konnten nicht alle drei Spannungspfade erkannt werden')
@@ -230,13 +250,15 @@ def _KennwerteTriaxpq(daten, refwerte, typ):
 
 
 # -------------------------------------------------------------------------------------------------
-def KennwerteTriaxpq(daten, refwerte):
+def KennwerteTriaxpq(daten, refwerte, prozesse=1):
     """Erwartet eine JSON-Struktur daten, in der die Daten zu Triax-p-q-Versuchen gespeichert sind
-    und aktualisiert/berechnet die entsprechenden Kennwerte.
+    und aktualisiert/berechnet die entsprechenden Kennwerte. Die einzelnen Versuche koennen mit
+    prozesse > 1 parallel ausgewertet werden.
     """
     from .konstanten import debugmodus
     from .datenstruktur import DatenstrukturExtrahieren
     from .verarbeitung_hilfen import ZusatzdatenKopieren
+    from .verarbeitung_triax import _Versuchsanzahl
 
     erfolgreich = False
 
@@ -246,11 +268,13 @@ def KennwerteTriaxpq(daten, refwerte):
 
         daten.update([('_Refwahl', '_Ref_001')])
 
-    extrahierte_daten = DatenstrukturExtrahieren(daten=daten, refstruktur=TriaxpqStruktur(), refwahl=daten['_Refwahl'])
+    anzahl_versuche = _Versuchsanzahl(daten=daten.get(daten['_Refwahl'], dict()))
+    extrahierte_daten = DatenstrukturExtrahieren(daten=daten,
+        refstruktur=TriaxpqStruktur(anzahl_versuche=anzahl_versuche), refwahl=daten['_Refwahl'])
     if (extrahierte_daten):
         daten.update(extrahierte_daten)
         ZusatzdatenKopieren(quelle=daten[daten['_Refwahl']], ziel=daten)
-        _KennwerteTriaxpq(daten=daten, refwerte=refwerte, typ='Triax-p-q')
+        _KennwerteTriaxpq(daten=daten, refwerte=refwerte, typ='Triax-p-q', prozesse=prozesse)
         erfolgreich = True
 
     return erfolgreich
@@ -266,9 +290,12 @@ def VorbereitungTriaxpq(daten):
     import copy
     from math import pi
     from .datenstruktur import DictStrukturPruefenUndAngleichen, ZielgroesseFindenUndAktualisieren
+    from .verarbeitung_triax import _Versuchsanzahl
 
     testdaten = copy.deepcopy(daten)
-    if (DictStrukturPruefenUndAngleichen(ref_dict=TriaxpqStruktur(), test_dict=testdaten, warnung=True)):
+    anzahl_versuche = _Versuchsanzahl(daten=testdaten)
+    if (DictStrukturPruefenUndAngleichen(ref_dict=TriaxpqStruktur(anzahl_versuche=anzahl_versuche),
+        test_dict=testdaten, warnung=True)):
         # Referenz an daten zu den modifizierten Daten aendern
         daten.clear()
         daten.update(testdaten)
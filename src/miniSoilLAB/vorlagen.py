@@ -25,6 +25,11 @@ vorlagen.py   v0.3 (2023-09)
 class VorlagenMuster(object):
     def __init__(self):
         self.vorlagen = dict()
+        self.pruefbericht = dict()
+        self._pruefindex = None
+        self._pruefsummen = dict()
+        self._messreihenpfade = None
+        self._vorlagenklassen = dict()
 
     def AusOrdnerEinlesen(self, ordner):
         from os import walk as os_walk
@@ -48,10 +53,14 @@ class VorlagenMuster(object):
                 vorlage = _JSONDateiEinlesen(dateiname=dateiname, bezeichnung='Vorlage')
                 if (vorlage is not None):
                     for schluessel in vorlage.keys():
-                        if (schluessel in self.vorlagen.keys()):
+                        if (schluessel in self.vorlagen):
                             print('# Warnung: Vorlage ' + schluessel + ' ist mehr als einmal definiert - wird ueberschrieben')
 
                     self.vorlagen.update(vorlage)
+                    self._pruefindex = None
+                    self._pruefsummen = dict()
+                    self._messreihenpfade = None
+                    self._vorlagenklassen = dict()
 
     def Schluessel(self):
         return sorted(self.vorlagen.keys())
@@ -79,6 +88,52 @@ class VorlagenMuster(object):
     def Datenfelder(self, schluessel):
         return self._TeilVorlage(schluessel, checks=False)
 
+    def Pruefsumme(self, schluessel=None):
+        """Gibt eine Pruefsumme der Vorlage schluessel zurueck, mit der Aenderungen an der Vorlage
+        erkannt werden koennen. Ohne schluessel wird eine Pruefsumme ueber die [Checks] aller
+        Vorlagen ermittelt (die bestimmen, welche Vorlage fuer eine Datei verwendet wird).
+        """
+        from .zwischenspeicher import Pruefsumme
+
+        if (schluessel not in self._pruefsummen):
+            if (schluessel is None):
+                daten = [[vorlage, self.Checks(schluessel=vorlage)] for vorlage in self.Schluessel()]
+            else:
+                daten = self.vorlagen[schluessel]
+
+            self._pruefsummen.update([(schluessel, Pruefsumme(daten=daten))])
+
+        return self._pruefsummen[schluessel]
+
+    def Messreihenpfade(self, versuchsart):
+        """Gibt eine Liste der Pfade (Tupel aus Schluesseln) aller Messreihen in den eingelesenen
+        Daten eines Versuchs der Art versuchsart zurueck. Messreihen sind alle Zahlenwerte, die in
+        einer der Vorlagen dieser Versuchsart in einer Datengruppe (Schluessel in eckigen Klammern)
+        eingelesen werden.
+        """
+        if (self._messreihenpfade is None):
+            self._messreihenpfade = dict()
+            for schluessel in self.Schluessel():
+                refname = self.NameReferenzvorlage(name=schluessel)
+                pfade = self._messreihenpfade.get(refname, [])
+                for pfad in _Messreihenpfade(vorlage=self.Datenfelder(schluessel=schluessel)):
+                    if (pfad not in pfade):
+                        pfade += [pfad]
+
+                self._messreihenpfade.update([(refname, pfade)])
+
+        return self._messreihenpfade.get(versuchsart, [])
+
+    def Vorlagenklasse(self, schluessel):
+        """Gibt die aus den Datenfeldern der Vorlage schluessel erzeugte Unterklasse von
+        Vorlagenstruktur zurueck (siehe Vorlagenklasse). Jede Vorlage wird nur einmal uebersetzt.
+        """
+        if (schluessel not in self._vorlagenklassen):
+            self._vorlagenklassen.update([(schluessel, Vorlagenklasse(
+                vorlage=self.Datenfelder(schluessel=schluessel), name=schluessel))])
+
+        return self._vorlagenklassen[schluessel]
+
     def NameReferenzvorlage(self, name):
         """Der uebergebene name muss zu den intern verwendeten Referenznamen passen (bspw. Atterberg,
         Oedo-CRS, Triax-D, usw). Er endet immer auf einem Buchstaben [a-z], optional gefolgt von einem
@@ -108,59 +163,100 @@ class VorlagenMuster(object):
             print('# Warnung: Vorlage ' + refname + ' entspricht keiner gueltigen Vorlage')
             return name
 
-    def Pruefen(self, workbook, tabellentyp):
-        from .konstanten import debugmodus
-        from .xlshilfen import VorhandeneTabellenseiten, EinzelEintragEinlesen
+    def _PruefindexErstellen(self):
+        """Erstellt einmalig fuer alle Vorlagen (in der Reihenfolge von Schluessel()) eine Liste mit
+        den erforderlichen Tabellenseiten und allen Pruefzellen samt Position und Sollwert.
+        """
         from .xlshilfen import ZeileUndSpalteAusZellenbezeichnung
 
-        zielvorlage = None
-        verworfeneVorlagen = ''
-        tabellenseiten = VorhandeneTabellenseiten(workbook=workbook, tabellentyp=tabellentyp)
+        self._pruefindex = []
         for schluessel in self.Schluessel():
-            naechste_vorlage = False
             ueberpruefungen = self.Checks(schluessel=schluessel)
+            pruefzellen = []
             for seite in ueberpruefungen.keys():
-                if (seite not in tabellenseiten):
-                    verworfeneVorlagen += '\n   ' + schluessel + ' verworfen, da Tabellenseite \'' \
-                        + seite + '\' nicht vorhanden'
-                    # Wenn eine erforderliche Tabellenseite nicht vorhanden ist -> naechste Vorlage
-                    naechste_vorlage = True
-                    break
-
-                aktuelleseite = ueberpruefungen[seite]
-                for pruefzelle in aktuelleseite.keys():
+                for pruefzelle in ueberpruefungen[seite].keys():
                     zeile, spalte = ZeileUndSpalteAusZellenbezeichnung(zellenname=pruefzelle)
-                    eintrag = EinzelEintragEinlesen(workbook=workbook, tabellenname=seite, zeile=zeile,
-                        spalte=spalte, name='_temp-' + seite + '-' + pruefzelle, tabellentyp=tabellentyp,
-                        inhalt='text', warnen=False)
-                    if (eintrag is None):
-                        # Leere Zellen nur akzeptieren, wenn explizit kein Inhalt gefordert ist
-                        if (aktuelleseite[pruefzelle] == ''):
-                            continue
-
-                        verworfeneVorlagen += '\n   ' + schluessel + ' verworfen, da Eintrag None != \'' \
-                            + aktuelleseite[pruefzelle] + '\''
-                        # Wenn ein Wert nicht dem Pruefwert entspricht -> naechste Vorlage
-                        naechste_vorlage = True
-                        break
-
-                    if (eintrag != aktuelleseite[pruefzelle]):
-                        verworfeneVorlagen += '\n   ' + schluessel + ' verworfen, da Eintrag \'' \
-                            + eintrag + '\' != \'' + aktuelleseite[pruefzelle] + '\''
-                        # Wenn ein Wert nicht dem Pruefwert entspricht -> naechste Vorlage
-                        naechste_vorlage = True
-                        break
-
-                if (naechste_vorlage):
-                    break
+                    pruefzellen += [(seite, (zeile, spalte), ueberpruefungen[seite][pruefzelle])]
 
-            if (naechste_vorlage):
+            self._pruefindex += [(schluessel, list(ueberpruefungen.keys()), pruefzellen)]
+
+    def Pruefen(self, workbook, tabellentyp):
+        """Ermittelt die erste Vorlage, deren [Checks] vom uebergebenen workbook erfuellt werden.
+        Dazu werden zuerst alle Vorlagen verworfen, deren Tabellenseiten nicht im workbook vorhanden
+        sind. Die Pruefzellen aller verbleibenden Vorlagen werden anschliessend gemeinsam (jede Zelle
+        nur einmal) eingelesen und mit den Sollwerten der Vorlagen verglichen. Fuer jede Vorlage wird
+        in pruefbericht gespeichert, warum sie verworfen worden ist (oder ein leerer String, falls
+        sie passt). Gibt [zielvorlage, refvorlage] zurueck.
+        """
+        from .konstanten import debugmodus
+        from .xlshilfen import VorhandeneTabellenseiten, ZellenEinlesen, _EintragUmwandeln
+
+        if (self._pruefindex is None):
+            self._PruefindexErstellen()
+
+        tabellenseiten = set(VorhandeneTabellenseiten(workbook=workbook, tabellentyp=tabellentyp))
+        self.pruefbericht = dict()
+        kandidaten = []
+        for schluessel, seiten, pruefzellen in self._pruefindex:
+            fehlende_seiten = [seite for seite in seiten if (seite not in tabellenseiten)]
+            if (len(fehlende_seiten) > 0):
+                # Wenn eine erforderliche Tabellenseite nicht vorhanden ist -> Vorlage verwerfen
+                self.pruefbericht.update([(schluessel, 'Tabellenseite \'' + fehlende_seiten[0] \
+                    + '\' nicht vorhanden')])
+            else:
+                kandidaten += [(schluessel, pruefzellen)]
+
+        # Alle Pruefzellen der verbleibenden Vorlagen nur einmal je Tabellenseite einlesen
+        benoetigte_zellen = dict()
+        for schluessel, pruefzellen in kandidaten:
+            for seite, koordinaten, sollwert in pruefzellen:
+                if (koordinaten[0] is None):
+                    continue
+
+                if (seite not in benoetigte_zellen):
+                    benoetigte_zellen.update([(seite, [])])
+
+                benoetigte_zellen[seite] += [koordinaten]
+
+        zellinhalte = dict()
+        for seite in benoetigte_zellen.keys():
+            seiteninhalte = ZellenEinlesen(workbook=workbook, tabellenname=seite,
+                zellkoordinaten=benoetigte_zellen[seite], tabellentyp=tabellentyp)
+            if (seiteninhalte is None):
                 continue
 
-            zielvorlage = schluessel
-            break
+            for koordinaten in seiteninhalte.keys():
+                zellinhalte.update([((seite, koordinaten), _EintragUmwandeln(
+                    neuerEintrag=seiteninhalte[koordinaten], name='_temp-' + seite, inhalt='text',
+                    warnen=False))])
+
+        zielvorlage = None
+        for schluessel, pruefzellen in kandidaten:
+            grund = ''
+            for seite, koordinaten, sollwert in pruefzellen:
+                eintrag = zellinhalte.get((seite, koordinaten), None)
+                if (eintrag is None):
+                    # Leere Zellen nur akzeptieren, wenn explizit kein Inhalt gefordert ist
+                    if (sollwert == ''):
+                        continue
+
+                    grund = 'Eintrag None != \'' + sollwert + '\''
+                    break
+
+                if (eintrag != sollwert):
+                    grund = 'Eintrag \'' + eintrag + '\' != \'' + sollwert + '\''
+                    break
+
+            self.pruefbericht.update([(schluessel, grund)])
+            if ((grund == '') and (zielvorlage is None)):
+                zielvorlage = schluessel
 
         if (debugmodus and (zielvorlage is None)):
+            verworfeneVorlagen = ''
+            for schluessel in self.Schluessel():
+                verworfeneVorlagen += '\n   ' + schluessel + ' verworfen, da ' \
+                    + self.pruefbericht[schluessel]
+
             print('# Debug: [Checks] von keiner Vorlage erfuellt:' + verworfeneVorlagen)
 
         return [zielvorlage, self.NameReferenzvorlage(name=zielvorlage)]
@@ -168,33 +264,102 @@ class VorlagenMuster(object):
 
 
 # -------------------------------------------------------------------------------------------------
-def VorlagenstrukturZuDatenstruktur(vorlage, ebene=0):
-    """Geht eine vorhandene Vorlagenstruktur durch, um daraus das Geruest fuer einen passenden
-    Datensatz zu ermitteln. Dabei werden die Inhalte der Tabellenseiten (Hauptebene der Vorlage) in
-    die Hauptebene der neuen Struktur eingefuegt. Alle [Checks] und deren Unterstrukturen werden
-    ignoriert. Die Inhalte aller Datengruppen (d.h. alle anderen Eintraege, die mit [ beginnen)
-    werden direkt in die Elterngruppe geschrieben.
+def _Messreihenpfade(vorlage, pfad=(), gruppe=False, ebene=0):
+    """Gibt eine Liste der Pfade aller Zahlenwerte aus Datengruppen der Vorlagenstruktur vorlage
+    zurueck (siehe VorlagenMuster.Messreihenpfade). Datengruppen (und die Tabellenseiten der
+    Hauptebene) werden wie in VorlagenstrukturZuDatenstruktur aufgeloest.
     """
     from .datenstruktur import Datenstruktur
 
-    strukturebene = Datenstruktur()
+    pfade = []
+    for schluessel in vorlage.keys():
+        eintrag = vorlage[schluessel]
+        if ((isinstance(eintrag, Datenstruktur)) or (isinstance(eintrag, dict))):
+            if (schluessel == '[Checks]'):
+                continue
+            elif (schluessel.startswith('[')):
+                pfade += _Messreihenpfade(vorlage=eintrag, pfad=pfad, gruppe=True, ebene=ebene+1)
+            elif (ebene == 0):
+                pfade += _Messreihenpfade(vorlage=eintrag, pfad=pfad, gruppe=gruppe, ebene=ebene+1)
+            else:
+                pfade += _Messreihenpfade(vorlage=eintrag, pfad=pfad + (schluessel,), gruppe=gruppe,
+                    ebene=ebene+1)
+
+        elif (gruppe and isinstance(eintrag, list) and (len(eintrag) > 1)):
+            pfade += [pfad + (schluessel,)]
+
+    return pfade
+
+
+
+# -------------------------------------------------------------------------------------------------
+def Vorlagenklasse(vorlage, ebene=0, name='Vorlage'):
+    """Uebersetzt die Vorlagenstruktur vorlage in eine Unterklasse von Vorlagenstruktur namens name,
+    deren Instanzen direkt mit dem Geruest eines passenden Datensatzes angelegt werden (siehe
+    VorlagenstrukturZuDatenstruktur). Die Zahlenwerte aus Datengruppen werden dabei zu
+    Messreihe-Feldern (siehe _Messreihenpfade), verschachtelte Strukturen zu eigenen Klassen.
+    """
+    return _KlasseAusFeldern(name=name, felder=_Vorlagenfelder(vorlage=vorlage, ebene=ebene,
+        name=name))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _KlasseAusFeldern(name, felder):
+    """Erzeugt eine Unterklasse von Vorlagenstruktur namens name mit den uebergebenen felder.
+    """
+    from .datenstruktur import Vorlagenstruktur
+
+    return type(name, (Vorlagenstruktur,), {'__slots__': (), 'felder': tuple(felder),
+        'feldarten': dict(felder)})
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _Vorlagenfelder(vorlage, ebene, name, gruppe=False):
+    """Gibt eine Liste aller Schluessel der Vorlagenstruktur vorlage mit der Art ihres Eintrags
+    zurueck (siehe Vorlagenklasse). Datengruppen (und die Tabellenseiten der Hauptebene) werden wie
+    in VorlagenstrukturZuDatenstruktur aufgeloest und ihre Eintraege direkt uebernommen.
+    """
+    from .datenstruktur import Datenstruktur, Messreihe
+
+    felder = []
     for schluessel in vorlage.keys():
         eintrag = vorlage[schluessel]
         if ((isinstance(eintrag, Datenstruktur)) or (isinstance(eintrag, dict))):
             if (schluessel == '[Checks]'):
                 continue
-            elif ((schluessel.startswith('[')) or (ebene == 0)):
-                strukturebene.update(VorlagenstrukturZuDatenstruktur(vorlage=eintrag, ebene=ebene+1))
+            elif (schluessel.startswith('[')):
+                felder += _Vorlagenfelder(vorlage=eintrag, ebene=ebene+1, name=name, gruppe=True)
+            elif (ebene == 0):
+                felder += _Vorlagenfelder(vorlage=eintrag, ebene=ebene+1, name=name, gruppe=gruppe)
             else:
-                strukturebene.update([(schluessel, VorlagenstrukturZuDatenstruktur(vorlage=eintrag,
-                    ebene=ebene+1))])
+                unterfelder = _Vorlagenfelder(vorlage=eintrag, ebene=ebene+1,
+                    name=name + '/' + schluessel, gruppe=gruppe)
+                felder += [(schluessel, _KlasseAusFeldern(name=name + '/' + schluessel,
+                    felder=unterfelder))]
 
         elif isinstance(eintrag, list):
             if (len(eintrag) == 1):
-                strukturebene.update([(schluessel, '')])
+                felder += [(schluessel, str)]
+            elif (gruppe):
+                felder += [(schluessel, Messreihe)]
             else:
-                strukturebene.update([(schluessel, [])])
+                felder += [(schluessel, list)]
+
+    return felder
 
-    return strukturebene
+
+
+# -------------------------------------------------------------------------------------------------
+def VorlagenstrukturZuDatenstruktur(vorlage, ebene=0):
+    """Geht eine vorhandene Vorlagenstruktur durch, um daraus das Geruest fuer einen passenden
+    Datensatz zu ermitteln. Dabei werden die Inhalte der Tabellenseiten (Hauptebene der Vorlage) in
+    die Hauptebene der neuen Struktur eingefuegt. Alle [Checks] und deren Unterstrukturen werden
+    ignoriert. Die Inhalte aller Datengruppen (d.h. alle anderen Eintraege, die mit [ beginnen)
+    werden direkt in die Elterngruppe geschrieben. Die Struktur ist eine Instanz der zu vorlage
+    erzeugten Vorlagenklasse, die Zahlenwerte aus Datengruppen sind darin (leere) Messreihen.
+    """
+    return Vorlagenklasse(vorlage=vorlage, ebene=ebene)()
 
 
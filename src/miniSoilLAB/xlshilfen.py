@@ -25,7 +25,7 @@ _mustervorlagen = None
 
 
 # -------------------------------------------------------------------------------------------------
-def LeseXLSDaten(dateiname, verarbeitet=True, ignoriere=['rohdaten']):
+def LeseXLSDaten(dateiname, verarbeitet=True, ignoriere=['rohdaten'], xlsxmodul='openpyxl'):
     """Lese eine Excel-Tabelle namens dateiname ein. Abhaengig von den verfuegbaren Vorlagen wird
     unterschieden, welche Art von Versuchsdaten in der Datei gespeichert sind und versucht, ebenjene
     einzulesen. Gibt bei Erfolg eine Datenstruktur mit den eingelesenen Daten unter dem Schluessel
@@ -33,44 +33,67 @@ def LeseXLSDaten(dateiname, verarbeitet=True, ignoriere=['rohdaten']):
     Lagerung oder Triax-D-dicht fuer einen drainierten Triaxialversuch mit dicht im Dateinamen).
     Wenn die Datei ignoriert wird oder nicht gefunden/geparst werden kann, wird eine leere Struktur
     zurueckgegeben (eine Datei wird ignoriert, wenn der Name (mindestens) ein Element aus der Liste
-    ignoriere enthaelt).
+    ignoriere enthaelt). Ueber xlsxmodul kann gewaehlt werden, ob xlsx-Dateien mit openpyxl oder
+    dem (nur auf der Standardbibliothek basierenden) Modul xlsxleser eingelesen werden ('intern').
+    Falls ein persistenter Zwischenspeicher aktiviert ist (siehe konstanten.Zwischenspeicher), werden
+    die eingelesenen (unverarbeiteten) Daten dort abgelegt und wiederverwendet, solange sich weder
+    die Datei noch die verwendete Vorlage geaendert haben.
     """
     import copy
     from os import path as os_path
     from .datenstruktur import Datenstruktur
-    from .vorlagen import VorlagenMuster
-    from .konstanten import basispfad
     from .kennwerte import Vorbereitung, Kennwertberechnungen
+    from .zwischenspeicher import Dateikennung, ZwischenspeicherLesen, ZwischenspeicherSchreiben
 
     bodendaten = Datenstruktur()
-    global _mustervorlagen
-    if (_mustervorlagen is None):
-        _mustervorlagen = VorlagenMuster()
-        _mustervorlagen.AusOrdnerEinlesen(ordner=basispfad)
+    VorlagenLaden()
 
     datei = os_path.basename(dateiname).lower()
     if (any([ignoriermuster in datei for ignoriermuster in ignoriere])):
         print('# - LeseXLS: Ignoriere ' + dateiname)
 
-    # FIXME: "with open" oder aehnliche Konstruktion, die automatisch das workbook wieder schliesst
-    workbook, tabellentyp = _OeffneXLSDatei(dateiname=dateiname)
-    if (workbook is None):
-        return bodendaten
-
-    zielvorlage, refvorlage = _mustervorlagen.Pruefen(workbook=workbook, tabellentyp=tabellentyp)
-    # Wenn irgendeine Vorlage erfuellt ist, dann lese die Werte fuer diese Vorlage ein
-    if (zielvorlage is None):
-        print('# - LeseXLS: Keine Vorlage passt fuer ' + dateiname)
-        return bodendaten
-
-    print('# - LeseXLS (' + zielvorlage + '): ' + dateiname)
-    musterdaten = Datenstruktur()
-    tabellenseiten = _mustervorlagen.Datenfelder(schluessel=zielvorlage)
-    for tabellenname in tabellenseiten.keys():
-        ParseXLSDaten(daten=musterdaten, workbook=workbook, tabellentyp=tabellentyp,
-            tabellenname=tabellenname, vorlage=tabellenseiten[tabellenname], verarbeitet=verarbeitet)
-
-    Vorbereitung(daten=musterdaten, vorlage=refvorlage)
+    zwischenspeicherschluessel = ['LeseXLSDaten', os_path.abspath(dateiname), verarbeitet]
+    dateikennung = Dateikennung(dateiname=dateiname)
+    gespeichert = ZwischenspeicherLesen(schluessel=zwischenspeicherschluessel)
+    if ((gespeichert is not None) and (gespeichert['Dateikennung'] == dateikennung)
+        and (gespeichert['Checks'] == _mustervorlagen.Pruefsumme())
+        and (gespeichert['Vorlage'] in _mustervorlagen.vorlagen)
+        and (gespeichert['Vorlagenpruefsumme'] == _mustervorlagen.Pruefsumme(schluessel=gespeichert['Vorlage']))):
+        zielvorlage = gespeichert['Vorlage']
+        refvorlage = _mustervorlagen.NameReferenzvorlage(name=zielvorlage)
+        print('# - LeseXLS (' + zielvorlage + ', zwischengespeichert): ' + dateiname)
+        musterdaten = _mustervorlagen.Vorlagenklasse(schluessel=zielvorlage)(daten=gespeichert['Daten'],
+            geruest=False)
+    else:
+        # FIXME: "with open" oder aehnliche Konstruktion, die automatisch das workbook wieder schliesst
+        workbook, tabellentyp = _OeffneXLSDatei(dateiname=dateiname, xlsxmodul=xlsxmodul)
+        if (workbook is None):
+            return bodendaten
+
+        zielvorlage, refvorlage = _mustervorlagen.Pruefen(workbook=workbook, tabellentyp=tabellentyp)
+        # Wenn irgendeine Vorlage erfuellt ist, dann lese die Werte fuer diese Vorlage ein
+        if (zielvorlage is None):
+            print('# - LeseXLS: Keine Vorlage passt fuer ' + dateiname)
+            return bodendaten
+
+        print('# - LeseXLS (' + zielvorlage + '): ' + dateiname)
+        musterdaten = Datenstruktur()
+        tabellenseiten = _mustervorlagen.Datenfelder(schluessel=zielvorlage)
+        for tabellenname in tabellenseiten.keys():
+            ParseXLSDaten(daten=musterdaten, workbook=workbook, tabellentyp=tabellentyp,
+                tabellenname=tabellenname, vorlage=tabellenseiten[tabellenname], verarbeitet=verarbeitet)
+
+        # Die Messdaten werden in den Messreihe-Feldern der zur Vorlage erzeugten Klasse gespeichert
+        musterdaten = _mustervorlagen.Vorlagenklasse(schluessel=zielvorlage)(daten=musterdaten,
+            geruest=False)
+        Vorbereitung(daten=musterdaten, vorlage=refvorlage)
+
+        if (dateikennung is not None):
+            ZwischenspeicherSchreiben(schluessel=zwischenspeicherschluessel, inhalt=dict([
+                ('Dateikennung', dateikennung), ('Checks', _mustervorlagen.Pruefsumme()),
+                ('Vorlage', zielvorlage),
+                ('Vorlagenpruefsumme', _mustervorlagen.Pruefsumme(schluessel=zielvorlage)),
+                ('Daten', musterdaten)]))
 
     musterdaten.update([('Dateiname', dateiname)])
 
@@ -85,9 +108,76 @@ def LeseXLSDaten(dateiname, verarbeitet=True, ignoriere=['rohdaten']):
 
 
 # -------------------------------------------------------------------------------------------------
-def _OeffneXLSDatei(dateiname):
+def VorlagenLaden():
+    """Liest die Vorlagen aus dem Vorlagenordner (konstanten.basispfad) ein, falls das noch nicht
+    geschehen ist. Kann bspw. beim Start eines neuen Prozesses aufgerufen werden, damit die Vorlagen
+    dort nur einmal und nicht fuer jede Datei eingelesen werden.
+    """
+    from .vorlagen import VorlagenMuster
+    from .konstanten import basispfad
+
+    global _mustervorlagen
+    if (_mustervorlagen is None):
+        _mustervorlagen = VorlagenMuster()
+        _mustervorlagen.AusOrdnerEinlesen(ordner=basispfad)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def MessreihenAusVorlagenErstellen(daten, versuchsart):
+    """Speichert alle Messreihen in den eingelesenen Daten daten eines Versuchs der Art versuchsart
+    (d.h. alle Zahlenwerte aus Datengruppen der Vorlagen, siehe VorlagenMuster.Messreihenpfade) als
+    Messreihe. Alle anderen Listen bleiben unveraendert. Gibt die (veraenderte) Struktur daten zurueck.
+    """
+    from .datenstruktur import MessreihenErstellen
+
+    VorlagenLaden()
+    return MessreihenErstellen(daten=daten,
+        pfade=_mustervorlagen.Messreihenpfade(versuchsart=versuchsart))
+
+
+
+# -------------------------------------------------------------------------------------------------
+def XLSZwischenspeicherEntfernen(dateiname=None):
+    """Entfernt die mit LeseXLSDaten im persistenten Zwischenspeicher abgelegten Daten der Datei
+    dateiname (fuer verarbeitete und unverarbeitete Daten). Ohne dateiname wird der gesamte
+    Zwischenspeicher geleert.
+    """
+    from os import path as os_path
+    from .zwischenspeicher import ZwischenspeicherEntfernen
+
+    if (dateiname is None):
+        ZwischenspeicherEntfernen()
+        return
+
+    for verarbeitet in [False, True]:
+        ZwischenspeicherEntfernen(schluessel=['LeseXLSDaten', os_path.abspath(dateiname), verarbeitet])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def VorlagenpruefsummeVersuchsart(versuchsart):
+    """Gibt eine Pruefsumme ueber die Checks aller Vorlagen und den vollstaendigen Inhalt aller
+    Vorlagen zur uebergebenen versuchsart (bspw. Triax-D) zurueck. Aendert sich die Pruefsumme,
+    koennen sich sowohl die Zuordnung einer Datei zu einer Vorlage als auch die daraus eingelesenen
+    Daten geaendert haben.
+    """
+    from .zwischenspeicher import Pruefsumme
+
+    VorlagenLaden()
+    vorlagenliste = [vorlage for vorlage in _mustervorlagen.Schluessel()
+        if (_mustervorlagen.NameReferenzvorlage(name=vorlage) == versuchsart)]
+    return Pruefsumme(daten=[_mustervorlagen.Pruefsumme(), [[vorlage,
+        _mustervorlagen.Pruefsumme(schluessel=vorlage)] for vorlage in vorlagenliste]])
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _OeffneXLSDatei(dateiname, xlsxmodul='openpyxl'):
     """Oeffnet eine Excel-Datei und gibt das darin enthaltene workbook und den tabellentyp (xls/xlsx)
-    zurueck.
+    zurueck. Fuer xlsx-Dateien wird standardmaessig openpyxl verwendet. Mit xlsxmodul='intern' wird
+    stattdessen eine XLSXArbeitsmappe aus xlsxleser verwendet, welche die gleiche Schnittstelle
+    bietet, aber nur die tatsaechlich angefragten Tabellenseiten und Zeilen einliest.
     """
     tabellentyp = ''
     if (dateiname[-3:].lower() == 'xls'):
@@ -103,8 +193,20 @@ def _OeffneXLSDatei(dateiname):
         except:
             print('# Fehler: Konnte .xls-Datei ' + dateiname + ' nicht finden/laden')
             return [None, None]
+    elif ((dateiname[-4:].lower() == 'xlsx') and (xlsxmodul == 'intern')):
+        tabellentyp = 'xlsx'
+        from .xlsxleser import XLSXArbeitsmappe
+
+        try:
+            workbook = XLSXArbeitsmappe(dateiname=dateiname)
+        except:
+            print('# Fehler: Konnte .xlsx-Datei ' + dateiname + ' nicht finden/laden')
+            return [None, None]
     elif (dateiname[-4:].lower() == 'xlsx'):
         tabellentyp = 'xlsx'
+        if (xlsxmodul != 'openpyxl'):
+            print('# Warnung: Unbekanntes xlsxmodul ' + xlsxmodul + ' - verwende openpyxl')
+
         try:
             import openpyxl
         except:
@@ -258,6 +360,17 @@ def _EinzelEintragEinlesen(tabellenseite, zeile, spalte, name, tabellentyp, inha
     """
     neuerEintrag = _LeseEintrag(tabellenseite=tabellenseite, zeile=zeile, spalte=spalte,
         tabellentyp=tabellentyp)
+    return _EintragUmwandeln(neuerEintrag=neuerEintrag, name=name, inhalt=inhalt, warnen=warnen)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _EintragUmwandeln(neuerEintrag, name, inhalt, warnen=True):
+    """Wandelt einen mit _LeseEintrag() oder _BereichEinlesen() gelesenen Zelleninhalt neuerEintrag
+    in den gewuenschten Typ um. Falls inhalt='zahl' wird der Zelleninhalt zu einem float umgewandelt
+    und zurueckgegeben, andernfalls als String. Fuer leere oder ungueltige Zellen wird None
+    zurueckgegeben.
+    """
     if (neuerEintrag == -1):
         return None
 
@@ -283,6 +396,151 @@ def _EinzelEintragEinlesen(tabellenseite, zeile, spalte, name, tabellentyp, inha
 
 
 
+# -------------------------------------------------------------------------------------------------
+def _BereichEinlesen(tabellenseite, zellkoordinaten, tabellentyp):
+    """Lese aus der uebergebenen tabellenseite einer eingelesenen Excel-Tabelle die Inhalte aller
+    Zellen aus zellkoordinaten [(zeile, spalte), ...] aus. Aufeinanderfolgende Zellen einer Spalte
+    oder einer Zeile werden dabei als zusammenhaengender Block in einem Durchgang gelesen, anstatt
+    jede Zelle einzeln abzufragen (was insbesondere bei xlsx-Dateien im read_only-Modus sehr langsam
+    ist). Gibt eine Liste mit dem Inhalt jeder Zelle analog zu _LeseEintrag() zurueck (String, None
+    fuer nicht vorhandene Zellen oder -1 bei Lesefehlern).
+    """
+    werte = []
+    anzahl = len(zellkoordinaten)
+    idx_start = 0
+    while (idx_start < anzahl):
+        startzeile, startspalte = zellkoordinaten[idx_start]
+        idx_ende = idx_start + 1
+        # Pruefen, ob sich ein Spalten- oder Zeilenblock an die Startzelle anschliesst
+        delta_zeile = 0
+        delta_spalte = 0
+        if (idx_ende < anzahl):
+            if (zellkoordinaten[idx_ende] == (startzeile+1, startspalte)):
+                delta_zeile = 1
+            elif (zellkoordinaten[idx_ende] == (startzeile, startspalte+1)):
+                delta_spalte = 1
+
+        if (delta_zeile + delta_spalte > 0):
+            while (idx_ende < anzahl):
+                schritt = idx_ende - idx_start
+                if (zellkoordinaten[idx_ende] != (startzeile + schritt*delta_zeile,
+                    startspalte + schritt*delta_spalte)):
+                    break
+
+                idx_ende += 1
+
+        endzeile, endspalte = zellkoordinaten[idx_ende-1]
+        werte += _BlockEinlesen(tabellenseite=tabellenseite, startzeile=startzeile,
+            startspalte=startspalte, endzeile=endzeile, endspalte=endspalte, tabellentyp=tabellentyp)
+        idx_start = idx_ende
+
+    return werte
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZellenEinlesen(workbook, tabellenname, zellkoordinaten, tabellentyp):
+    """Lese aus dem uebergebenen workbook einer eingelesenen Excel-Tabelle die Inhalte aller (nicht
+    notwendigerweise zusammenhaengenden) Zellen aus zellkoordinaten [(zeile, spalte), ...] der
+    Tabellenseite tabellenname aus. Fuer xlsx-Dateien wird dazu der umschliessende Bereich aller
+    Zellen in einem Durchgang gelesen. Gibt ein dict mit (zeile, spalte) als Schluessel und dem
+    Inhalt der Zelle analog zu _LeseEintrag() als Wert zurueck oder None, falls die Tabellenseite
+    nicht existiert.
+    """
+    tabellenseite = TabellenseiteAusgeben(workbook=workbook, tabellenname=tabellenname,
+        tabellentyp=tabellentyp)
+    if (tabellenseite is None):
+        return None
+
+    zellinhalte = dict([(koordinaten, None) for koordinaten in zellkoordinaten])
+    if (len(zellinhalte) == 0):
+        return zellinhalte
+
+    if (tabellentyp == 'xls'):
+        for zeile, spalte in zellinhalte.keys():
+            zellinhalte[(zeile, spalte)] = _LeseEintrag(tabellenseite=tabellenseite, zeile=zeile,
+                spalte=spalte, tabellentyp=tabellentyp)
+
+        return zellinhalte
+
+    startzeile = min([zeile for zeile, spalte in zellinhalte.keys()])
+    endzeile = min(max([zeile for zeile, spalte in zellinhalte.keys()]), tabellenseite.max_row-1)
+    startspalte = min([spalte for zeile, spalte in zellinhalte.keys()])
+    endspalte = min(max([spalte for zeile, spalte in zellinhalte.keys()]), tabellenseite.max_column-1)
+    if ((startzeile > endzeile) or (startspalte > endspalte)):
+        return zellinhalte
+
+    try:
+        zeilen = tabellenseite.iter_rows(min_row=startzeile+1, max_row=endzeile+1,
+            min_col=startspalte+1, max_col=endspalte+1, values_only=True)
+        for idx_zeile, zeilenwerte in enumerate(zeilen):
+            for idx_spalte, wert in enumerate(zeilenwerte):
+                koordinaten = (startzeile+idx_zeile, startspalte+idx_spalte)
+                if ((wert is not None) and (koordinaten in zellinhalte)):
+                    zellinhalte[koordinaten] = str(wert)
+
+    except:
+        print('# Fehler: Konnte Werte aus angegebenem Bereich nicht auslesen')
+        for koordinaten in zellinhalte.keys():
+            zellinhalte[koordinaten] = -1
+
+    return zellinhalte
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _BlockEinlesen(tabellenseite, startzeile, startspalte, endzeile, endspalte, tabellentyp):
+    """Lese aus der uebergebenen tabellenseite einen zusammenhaengenden Block einer Spalte oder
+    einer Zeile von (startzeile, startspalte) bis einschliesslich (endzeile, endspalte) in einem
+    Durchgang aus. Fuer xls-Dateien werden dazu col_values/row_values verwendet, fuer xlsx-Dateien
+    iter_rows mit entsprechenden Grenzen. Gibt eine Liste mit dem Inhalt jeder Zelle analog zu
+    _LeseEintrag() zurueck.
+    """
+    breite = endspalte - startspalte + 1
+    block = [None for idx in range((endzeile - startzeile + 1)*breite)]
+    if (tabellentyp == 'xls'):
+        if ((startzeile >= tabellenseite.nrows) or (startspalte >= tabellenseite.ncols)):
+            return block
+
+        try:
+            if (startspalte == endspalte):
+                letzte = min(endzeile+1, tabellenseite.nrows)
+                werte = tabellenseite.col_values(startspalte, startzeile, letzte)
+                typen = tabellenseite.col_types(startspalte, startzeile, letzte)
+            else:
+                letzte = min(endspalte+1, tabellenseite.ncols)
+                werte = tabellenseite.row_values(startzeile, startspalte, letzte)
+                typen = tabellenseite.row_types(startzeile, startspalte, letzte)
+
+        except:
+            print('# Fehler: Konnte Werte aus angegebenem Bereich nicht auslesen')
+            return [-1 for eintrag in block]
+
+        for idx_wert, wert in enumerate(werte):
+            # Excel-interne Fehlercodes: nichts zurueckgeben
+            if (typen[idx_wert] != 5):
+                block[idx_wert] = str(wert)
+    else:
+        if ((startzeile > tabellenseite.max_row) or (startspalte > tabellenseite.max_column)):
+            return block
+
+        try:
+            zeilen = tabellenseite.iter_rows(min_row=startzeile+1,
+                max_row=min(endzeile+1, tabellenseite.max_row), min_col=startspalte+1,
+                max_col=min(endspalte+1, tabellenseite.max_column), values_only=True)
+            for idx_zeile, zeilenwerte in enumerate(zeilen):
+                for idx_spalte, wert in enumerate(zeilenwerte[:breite]):
+                    if (wert is not None):
+                        block[idx_zeile*breite + idx_spalte] = str(wert)
+
+        except:
+            print('# Fehler: Konnte Werte aus angegebenem Bereich nicht auslesen')
+            return [-1 for eintrag in block]
+
+    return block
+
+
+
 # -------------------------------------------------------------------------------------------------
 def EinzelEintragHinzufuegen(datenbank, workbook, tabellenname, zeile, spalte, name, tabellentyp,
     inhalt, grenzen=None):
@@ -311,12 +569,13 @@ def GelesenenEintragHinzufuegen(datenbank, name, daten, grenzen=None):
     Fuer Zahlen kann auch eine Ueberpruefung der grenzen erfolgen (sofern diese nicht None sind).
     Nur erfolgreich gepruefte daten werden gespeichert.
     """
+    from .datenstruktur import Messreihe
     from .gleichungsloeser import WertInZulaessigemBereich
 
     if (grenzen is None):
         datenbank.update([(name, daten)])
     else:
-        if (isinstance(daten, list) or isinstance(daten, tuple)):
+        if (isinstance(daten, (list, Messreihe)) or isinstance(daten, tuple)):
             grenze_eingehalten = WertInZulaessigemBereich(name=name, liste=daten, minmax=grenzen)
         else:
             grenze_eingehalten = WertInZulaessigemBereich(name=name, liste=[daten], minmax=grenzen)
@@ -537,6 +796,9 @@ def _GruppeEinlesen(daten, workbook, tabellentyp, tabellenname, vorlage, gruppe,
     # Tabellenseite existieren, da ansonsten schon abgebrochen worden waere
     tabellenseite = TabellenseiteAusgeben(workbook=workbook, tabellenname=tabellenname,
         tabellentyp=tabellentyp)
+    # Alle Bereiche der Gruppe blockweise einlesen und erst bei der Auswertung umwandeln
+    zellinhalte = [_BereichEinlesen(tabellenseite=tabellenseite, zellkoordinaten=zellkoordinaten,
+        tabellentyp=tabellentyp) for zellkoordinaten in zielbereiche]
     wertliste = [[None for num in range(intervallgroesse)] for eintrag in eintraege]
     num_gute_werte = 0
     verwerfe_Rest = False
@@ -545,11 +807,8 @@ def _GruppeEinlesen(daten, workbook, tabellentyp, tabellenname, vorlage, gruppe,
     for idx_intervall in range(intervallgroesse):
         for idx_eintrag, eintrag in enumerate(eintraege):
             idx_tempstart = 0
-            zellkoordinaten = zielbereiche[idx_eintrag]
-            zeile, spalte = zellkoordinaten[idx_intervall]
-            tempwert = _EinzelEintragEinlesen(tabellenseite=tabellenseite, zeile=zeile,
-                spalte=spalte, name=eintrag, tabellentyp=tabellentyp, inhalt=inhalte[idx_eintrag],
-                warnen=False)
+            tempwert = _EintragUmwandeln(neuerEintrag=zellinhalte[idx_eintrag][idx_intervall],
+                name=eintrag, inhalt=inhalte[idx_eintrag], warnen=False)
             if (tempwert is None):
                 if (num_gute_werte > 0):
                     verwerfe_Rest = True
@@ -635,11 +894,16 @@ def _EinzelreiheEinlesen(daten, workbook, tabellentyp, tabellenname, vorlage, ei
             tabellenname=tabellenname, zeile=zellkoordinaten[0][0], spalte=zellkoordinaten[0][1],
             name=eintrag, tabellentyp=tabellentyp, inhalt=inhalt, grenzen=grenzen)
     else:
+        tabellenseite = TabellenseiteAusgeben(workbook=workbook, tabellenname=tabellenname,
+            tabellentyp=tabellentyp)
+        if (tabellenseite is None):
+            return
+
         werte = []
         # Beendet den Lesevorgang bei einem None-Wert
-        for zeile, spalte in zellkoordinaten:
-            tempwert = EinzelEintragEinlesen(workbook=workbook, tabellenname=tabellenname,
-                zeile=zeile, spalte=spalte, name=eintrag, tabellentyp=tabellentyp, inhalt=inhalt,
+        for neuerEintrag in _BereichEinlesen(tabellenseite=tabellenseite,
+            zellkoordinaten=zellkoordinaten, tabellentyp=tabellentyp):
+            tempwert = _EintragUmwandeln(neuerEintrag=neuerEintrag, name=eintrag, inhalt=inhalt,
                 warnen=False)
             if (tempwert is None):
                 break
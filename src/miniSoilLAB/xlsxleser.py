@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""
+xlsxleser.py   v0.1 (2026-10)
+"""
+
+# Copyright 2026 Dominik Zobel.
+# All rights reserved.
+#
+# This file is part of the miniSoilLAB package.
+# miniSoilLAB is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# miniSoilLAB is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
+
+
+# Vordefinierte Zahlenformate von Excel, die ein Datum/eine Uhrzeit bzw. eine Zeitdauer darstellen
+_datumsformate = set([14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47])
+_zeitdauerformate = set([46])
+
+
+# -------------------------------------------------------------------------------------------------
+class XLSXArbeitsmappe(object):
+    """Schlanker Ersatz fuer ein mit openpyxl im read_only-Modus geoeffnetes workbook, der nur auf
+    zipfile und xml.etree der Standardbibliothek aufbaut. Es werden nur die von xlshilfen genutzten
+    Zugriffe (sheetnames, workbook[tabellenname], max_row, max_column, cell und iter_rows)
+    bereitgestellt. Die Tabelle der gemeinsam genutzten Strings und die Zellformate werden einmalig
+    beim Oeffnen eingelesen, die einzelnen Tabellenseiten erst bei Bedarf und nur soweit wie noetig.
+    """
+    def __init__(self, dateiname):
+        import zipfile
+
+        self.archiv = zipfile.ZipFile(dateiname)
+        self.sheetnames = []
+        self._seitenpfade = dict()
+        self._tabellenseiten = dict()
+        self.datumsstile = set()
+        self.zeitdauerstile = set()
+        self.epoche_1904 = False
+        self.strings = []
+        self._ArbeitsmappeEinlesen()
+        self._StileEinlesen()
+        self._StringsEinlesen()
+
+    def __getitem__(self, tabellenname):
+        if (tabellenname not in self._seitenpfade):
+            raise KeyError('Tabellenseite ' + tabellenname + ' existiert nicht')
+
+        if (tabellenname not in self._tabellenseiten):
+            self._tabellenseiten.update([(tabellenname, XLSXTabellenseite(arbeitsmappe=self,
+                pfad=self._seitenpfade[tabellenname]))])
+
+        return self._tabellenseiten[tabellenname]
+
+    def close(self):
+        for tabellenseite in self._tabellenseiten.values():
+            tabellenseite.Schliessen()
+
+        self.archiv.close()
+
+    def _Pfad(self, ziel):
+        if (ziel.startswith('/')):
+            return ziel[1:]
+        else:
+            return 'xl/' + ziel
+
+    def _ArbeitsmappeEinlesen(self):
+        import xml.etree.ElementTree as ET
+
+        verknuepfungen = dict()
+        for element in ET.fromstring(self.archiv.read('xl/_rels/workbook.xml.rels')):
+            verknuepfungen.update([(element.get('Id'), element.get('Target'))])
+
+        for element in ET.fromstring(self.archiv.read('xl/workbook.xml')).iter():
+            tag = _OhneNamensraum(element.tag)
+            if (tag == 'workbookPr'):
+                self.epoche_1904 = (element.get('date1904', 'false').lower() in ['1', 'true'])
+            elif (tag == 'sheet'):
+                name = element.get('name')
+                for attribut in element.keys():
+                    if (_OhneNamensraum(attribut) == 'id'):
+                        self.sheetnames += [name]
+                        self._seitenpfade.update([(name,
+                            self._Pfad(ziel=verknuepfungen[element.get(attribut)]))])
+                        break
+
+    def _StileEinlesen(self):
+        import xml.etree.ElementTree as ET
+
+        try:
+            stile = ET.fromstring(self.archiv.read('xl/styles.xml'))
+        except KeyError:
+            return
+
+        eigene_formate = dict()
+        zellformate = []
+        for element in stile:
+            tag = _OhneNamensraum(element.tag)
+            if (tag == 'numFmts'):
+                for zahlenformat in element:
+                    eigene_formate.update([(int(zahlenformat.get('numFmtId')),
+                        zahlenformat.get('formatCode'))])
+            elif (tag == 'cellXfs'):
+                zellformate = [int(xf.get('numFmtId', 0)) for xf in element]
+
+        for idx_stil, format_id in enumerate(zellformate):
+            if (format_id in eigene_formate):
+                formatcode = eigene_formate[format_id]
+                if (_IstDatumsformat(formatcode=formatcode)):
+                    self.datumsstile.add(idx_stil)
+
+                if (_IstZeitdauerformat(formatcode=formatcode)):
+                    self.zeitdauerstile.add(idx_stil)
+            else:
+                if (format_id in _datumsformate):
+                    self.datumsstile.add(idx_stil)
+
+                if (format_id in _zeitdauerformate):
+                    self.zeitdauerstile.add(idx_stil)
+
+    def _StringsEinlesen(self):
+        import xml.etree.ElementTree as ET
+
+        if ('xl/sharedStrings.xml' not in self.archiv.namelist()):
+            return
+
+        with self.archiv.open('xl/sharedStrings.xml') as datei:
+            for ereignis, element in ET.iterparse(datei):
+                if (_OhneNamensraum(element.tag) == 'si'):
+                    self.strings += [_TextAusElement(element=element)]
+                    element.clear()
+
+
+
+# -------------------------------------------------------------------------------------------------
+class XLSXTabellenseite(object):
+    """Einzelne Tabellenseite einer XLSXArbeitsmappe. Die Zeilen werden inkrementell aus dem XML der
+    Tabellenseite gelesen und zwischengespeichert. Es wird nur soweit gelesen, bis die letzte
+    angefragte Zeile erreicht ist; spaetere Zugriffe setzen an dieser Stelle fort.
+    """
+    def __init__(self, arbeitsmappe, pfad):
+        import xml.etree.ElementTree as ET
+
+        self.arbeitsmappe = arbeitsmappe
+        self.max_row = None
+        self.max_column = None
+        self._zeilen = dict()
+        self._gelesene_zeilen = 0
+        self._tabellendaten = None
+        self._datei = arbeitsmappe.archiv.open(pfad)
+        self._parser = ET.iterparse(self._datei, events=('start', 'end'))
+        # Nur bis zum Anfang der eigentlichen Daten lesen, um die Dimension der Tabelle zu erhalten
+        for ereignis, element in self._parser:
+            tag = _OhneNamensraum(element.tag)
+            if ((ereignis == 'start') and (tag == 'sheetData')):
+                self._tabellendaten = element
+                break
+            elif ((ereignis == 'end') and (tag == 'dimension')):
+                self._DimensionSetzen(bereich=element.get('ref', ''))
+
+        if (self._tabellendaten is None):
+            self.Schliessen()
+
+        if ((self.max_row is None) or (self.max_column is None)):
+            # Ohne Angabe der Dimension muss die ganze Tabelle gelesen werden
+            self._EinlesenBis(zeile=None)
+            self.max_row = max(list(self._zeilen.keys()) + [0])
+            self.max_column = max([max(list(zeile.keys()) + [0]) for zeile in self._zeilen.values()] + [0])
+
+    def _DimensionSetzen(self, bereich):
+        endzelle = bereich.split(':')[-1]
+        zeile, spalte = _ZeileUndSpalte(zellenname=endzelle)
+        if (zeile is not None):
+            self.max_row = zeile
+            self.max_column = spalte
+
+    def Schliessen(self):
+        if (self._parser is not None):
+            self._parser = None
+            self._tabellendaten = None
+            self._datei.close()
+
+    def _EinlesenBis(self, zeile):
+        """Liest die Zeilen der Tabellenseite bis einschliesslich zeile (oder alle Zeilen, falls zeile
+        None ist) ein, sofern diese noch nicht gelesen worden sind.
+        """
+        if (self._parser is None):
+            return
+
+        if ((zeile is not None) and (self._gelesene_zeilen >= zeile)):
+            return
+
+        for ereignis, element in self._parser:
+            if ((ereignis != 'end') or (_OhneNamensraum(element.tag) != 'row')):
+                continue
+
+            idx_zeile = element.get('r')
+            if (idx_zeile is None):
+                idx_zeile = self._gelesene_zeilen + 1
+            else:
+                idx_zeile = int(idx_zeile)
+
+            self._ZeileSpeichern(idx_zeile=idx_zeile, zeilenelement=element)
+            self._gelesene_zeilen = idx_zeile
+            # Bereits verarbeitete Zeilen aus dem XML-Baum entfernen
+            self._tabellendaten.clear()
+            if ((zeile is not None) and (idx_zeile >= zeile)):
+                return
+
+        self.Schliessen()
+
+    def _ZeileSpeichern(self, idx_zeile, zeilenelement):
+        werte = dict()
+        idx_spalte = 0
+        for zelle in zeilenelement:
+            if (_OhneNamensraum(zelle.tag) != 'c'):
+                continue
+
+            zellenname = zelle.get('r')
+            if (zellenname is None):
+                idx_spalte += 1
+            else:
+                idx_spalte = _ZeileUndSpalte(zellenname=zellenname)[1]
+
+            wert = self._Zellwert(zelle=zelle)
+            if (wert is not None):
+                werte.update([(idx_spalte, wert)])
+
+        if (len(werte) > 0):
+            self._zeilen.update([(idx_zeile, werte)])
+
+    def _Zellwert(self, zelle):
+        typ = zelle.get('t', 'n')
+        wert = None
+        formel = None
+        inline = None
+        for kind in zelle:
+            tag = _OhneNamensraum(kind.tag)
+            if (tag == 'v'):
+                wert = kind.text
+            elif (tag == 'f'):
+                formel = kind.text
+            elif (tag == 'is'):
+                inline = kind
+
+        # Wie bei openpyxl (ohne data_only) wird fuer Formeln die Formel selbst zurueckgegeben
+        if (formel is not None):
+            return '=' + formel
+
+        if (typ == 'inlineStr'):
+            if (inline is None):
+                return None
+
+            return _TextAusElement(element=inline)
+
+        if (wert is None):
+            return None
+
+        if (typ == 'n'):
+            if (('.' in wert) or ('E' in wert) or ('e' in wert)):
+                wert = float(wert)
+            else:
+                wert = int(wert)
+
+            stil = int(zelle.get('s', 0))
+            if (stil in self.arbeitsmappe.datumsstile):
+                try:
+                    wert = _DatumAusSeriellerZahl(wert=wert,
+                        epoche_1904=self.arbeitsmappe.epoche_1904,
+                        zeitdauer=(stil in self.arbeitsmappe.zeitdauerstile))
+                except (OverflowError, ValueError):
+                    wert = '#VALUE!'
+
+            return wert
+        elif (typ == 's'):
+            return self.arbeitsmappe.strings[int(wert)]
+        elif (typ == 'b'):
+            return bool(int(wert))
+        elif (typ == 'd'):
+            return _DatumAusISOString(wert=wert)
+        else:
+            # str und e (Fehlercodes) werden als Text uebernommen
+            return wert
+
+    def cell(self, row, column):
+        self._EinlesenBis(zeile=row)
+        return _Zelle(wert=self._zeilen.get(row, dict()).get(column, None))
+
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=True):
+        if (min_row is None):
+            min_row = 1
+
+        if (max_row is None):
+            max_row = self.max_row
+
+        if (min_col is None):
+            min_col = 1
+
+        if (max_col is None):
+            max_col = self.max_column
+
+        self._EinlesenBis(zeile=max_row)
+        for idx_zeile in range(min_row, max_row+1):
+            werte = self._zeilen.get(idx_zeile, dict())
+            zeilenwerte = tuple([werte.get(idx_spalte, None) for idx_spalte in range(min_col, max_col+1)])
+            if (values_only):
+                yield zeilenwerte
+            else:
+                yield tuple([_Zelle(wert=wert) for wert in zeilenwerte])
+
+
+
+# -------------------------------------------------------------------------------------------------
+class _Zelle(object):
+    __slots__ = ['value']
+
+    def __init__(self, wert):
+        self.value = wert
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _OhneNamensraum(tag):
+    """Gibt den uebergebenen XML-tag ohne (ggfs. vorhandenen) Namensraum zurueck.
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _TextAusElement(element):
+    """Setzt den Text eines (Rich-)Text-Elements aus allen direkten t-Elementen und denen aus
+    r-Elementen zusammen (Phonetik-Angaben werden ignoriert).
+    """
+    text = ''
+    for kind in element:
+        tag = _OhneNamensraum(kind.tag)
+        if ((tag == 't') and (kind.text is not None)):
+            text += kind.text
+        elif (tag == 'r'):
+            for unterelement in kind:
+                if ((_OhneNamensraum(unterelement.tag) == 't') and (unterelement.text is not None)):
+                    text += unterelement.text
+
+    return text
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _ZeileUndSpalte(zellenname):
+    """Ermittelt aus einer Zellenbezeichnung wie "C14" die (bei eins beginnende) Zeile und Spalte.
+    Gibt [zeile, spalte] zurueck oder [None, None] bei ungueltigen Bezeichnungen.
+    """
+    spalte = 0
+    idx_zeichen = 0
+    for idx_zeichen, zeichen in enumerate(zellenname):
+        if (not zeichen.isalpha()):
+            break
+
+        spalte = 26*spalte + ord(zeichen.upper()) - 64
+    else:
+        return [None, None]
+
+    try:
+        zeile = int(zellenname[idx_zeichen:])
+    except ValueError:
+        return [None, None]
+
+    if (spalte == 0):
+        return [None, None]
+
+    return [zeile, spalte]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _IstDatumsformat(formatcode):
+    """Prueft, ob der uebergebene formatcode eines benutzerdefinierten Zahlenformats ein Datum oder
+    eine Uhrzeit darstellt (Ziffern fuer Tag, Monat, Jahr, Stunden oder Sekunden ausserhalb von
+    Anfuehrungszeichen und Farbangaben).
+    """
+    import re
+
+    if (formatcode is None):
+        return False
+
+    formatcode = formatcode.split(';')[0]
+    formatcode = re.sub(r'"[^"]*"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]', '', formatcode)
+    return re.search(r'(?<![_\\])[dmhysDMHYS]', formatcode) is not None
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _IstZeitdauerformat(formatcode):
+    """Prueft, ob der uebergebene formatcode eine Zeitdauer (bspw. [h]:mm:ss) darstellt.
+    """
+    import re
+
+    if (formatcode is None):
+        return False
+
+    formatcode = formatcode.split(';')[0]
+    return re.match(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?', formatcode,
+        re.IGNORECASE) is not None
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DatumAusSeriellerZahl(wert, epoche_1904=False, zeitdauer=False):
+    """Wandelt eine serielle Excel-Zahl wert in ein datetime-Objekt (bzw. time fuer reine Uhrzeiten
+    und timedelta fuer Zeitdauern) um. Das Verhalten entspricht der Umwandlung in openpyxl.
+    """
+    import datetime
+
+    if (zeitdauer):
+        dauer = datetime.timedelta(days=wert)
+        if (dauer.microseconds):
+            dauer = datetime.timedelta(seconds=dauer.total_seconds() // 1,
+                microseconds=round(dauer.microseconds, -3))
+
+        return dauer
+
+    if (epoche_1904):
+        epoche = datetime.datetime(year=1904, month=1, day=1)
+    else:
+        epoche = datetime.datetime(year=1899, month=12, day=30)
+
+    tag, bruchteil = divmod(wert, 1)
+    differenz = datetime.timedelta(milliseconds=round(bruchteil*86400*1000))
+    if ((0 <= wert < 1) and (differenz.days == 0)):
+        minuten, sekunden = divmod(differenz.seconds, 60)
+        stunden, minuten = divmod(minuten, 60)
+        return datetime.time(stunden, minuten, sekunden, differenz.microseconds)
+
+    # Excel behandelt 1900 faelschlicherweise als Schaltjahr
+    if ((0 < wert < 60) and (not epoche_1904)):
+        tag += 1
+
+    return epoche + datetime.timedelta(days=tag) + differenz
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _DatumAusISOString(wert):
+    """Wandelt ein als ISO 8601 gespeichertes Datum wert in ein datetime-Objekt um. Falls das nicht
+    moeglich ist, wird wert unveraendert zurueckgegeben.
+    """
+    import datetime
+
+    try:
+        return datetime.datetime.fromisoformat(wert.rstrip('Z'))
+    except ValueError:
+        return wert
+
+
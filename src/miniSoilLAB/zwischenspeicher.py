@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+zwischenspeicher.py   v0.1 (2026-10)
+"""
+
+# Copyright 2026 Dominik Zobel.
+# All rights reserved.
+#
+# This file is part of the miniSoilLAB package.
+# miniSoilLAB is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# miniSoilLAB is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with miniSoilLAB. If not, see <http://www.gnu.org/licenses/>.
+
+
+_dateiendung = '.pkl'
+
+
+# -------------------------------------------------------------------------------------------------
+def Pruefsumme(daten):
+    """Gibt eine Pruefsumme (als Hex-String) fuer die uebergebenen daten zurueck. Strukturen wie
+    dicts werden dazu vorher mit sortierten Schluesseln in JSON umgewandelt.
+    """
+    import hashlib
+    import json
+
+    if (not isinstance(daten, bytes)):
+        daten = json.dumps(daten, sort_keys=True, default=str).encode('utf-8')
+
+    return hashlib.sha1(daten).hexdigest()
+
+
+
+# -------------------------------------------------------------------------------------------------
+def Dateikennung(dateiname):
+    """Gibt fuer die Datei dateiname eine Liste aus absolutem Pfad, Dateigroesse und Zeitpunkt der
+    letzten Aenderung zurueck, anhand derer Veraenderungen der Datei erkannt werden koennen.
+    Falls die Datei nicht existiert, wird None zurueckgegeben.
+    """
+    import os
+
+    try:
+        dateistatus = os.stat(dateiname)
+    except OSError:
+        return None
+
+    return [os.path.abspath(dateiname), dateistatus.st_size, dateistatus.st_mtime_ns]
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _EintragPfad(schluessel):
+    """Gibt den Pfad der Datei im Zwischenspeicher zurueck, in der der Eintrag zu schluessel
+    gespeichert wird oder None, falls der Zwischenspeicher deaktiviert ist.
+    """
+    from os import path as os_path
+    from .konstanten import zwischenspeicherpfad
+
+    if (zwischenspeicherpfad is None):
+        return None
+
+    return os_path.join(zwischenspeicherpfad, Pruefsumme(daten=schluessel) + _dateiendung)
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZwischenspeicherLesen(schluessel):
+    """Gibt den unter schluessel im persistenten Zwischenspeicher abgelegten Inhalt zurueck. Falls
+    der Zwischenspeicher deaktiviert ist oder kein (lesbarer) Eintrag existiert, wird None
+    zurueckgegeben. Bei einem Treffer wird der Eintrag als zuletzt verwendet markiert.
+    """
+    import os
+    import pickle
+
+    eintragpfad = _EintragPfad(schluessel=schluessel)
+    if (eintragpfad is None):
+        return None
+
+    try:
+        with open(eintragpfad, 'rb') as datei:
+            inhalt = pickle.load(datei)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        print('# Warnung: Ungueltiger Eintrag im Zwischenspeicher wird entfernt')
+        ZwischenspeicherEntfernen(schluessel=schluessel)
+        return None
+
+    try:
+        # Zeitpunkt der letzten Aenderung dient als Zeitpunkt der letzten Verwendung
+        os.utime(eintragpfad)
+    except OSError:
+        pass
+
+    return inhalt
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZwischenspeicherSchreiben(schluessel, inhalt):
+    """Speichert inhalt unter schluessel im persistenten Zwischenspeicher, sofern dieser aktiviert
+    ist. Die Datei wird zuerst unter einem temporaeren Namen geschrieben und dann umbenannt, so dass
+    auch gleichzeitige Zugriffe mehrerer Prozesse nur vollstaendige Eintraege sehen. Falls danach
+    mehr als die erlaubte Anzahl an Eintraegen existiert, werden die am laengsten nicht verwendeten
+    Eintraege entfernt. Gibt True zurueck, falls der Eintrag gespeichert werden konnte, sonst False.
+    """
+    import os
+    import pickle
+    from .konstanten import zwischenspeicherpfad
+
+    eintragpfad = _EintragPfad(schluessel=schluessel)
+    if (eintragpfad is None):
+        return False
+
+    temppfad = eintragpfad + '.' + str(os.getpid()) + '.tmp'
+    try:
+        os.makedirs(zwischenspeicherpfad, exist_ok=True)
+        with open(temppfad, 'wb') as datei:
+            pickle.dump(inhalt, datei, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temppfad, eintragpfad)
+    except Exception:
+        print('# Warnung: Konnte Eintrag nicht im Zwischenspeicher ablegen')
+        try:
+            os.remove(temppfad)
+        except OSError:
+            pass
+
+        return False
+
+    _ZwischenspeicherBegrenzen()
+    return True
+
+
+
+# -------------------------------------------------------------------------------------------------
+def _ZwischenspeicherBegrenzen():
+    """Entfernt die am laengsten nicht verwendeten Eintraege aus dem Zwischenspeicher, bis maximal
+    die erlaubte Anzahl an Eintraegen vorhanden ist.
+    """
+    import os
+    from .konstanten import zwischenspeicherpfad, zwischenspeicher_max_eintraege
+
+    eintraege = []
+    try:
+        for dateiname in os.listdir(zwischenspeicherpfad):
+            if (dateiname.endswith(_dateiendung)):
+                eintragpfad = os.path.join(zwischenspeicherpfad, dateiname)
+                eintraege += [(os.stat(eintragpfad).st_mtime_ns, eintragpfad)]
+    except OSError:
+        return
+
+    if (len(eintraege) <= zwischenspeicher_max_eintraege):
+        return
+
+    eintraege.sort()
+    for zeitpunkt, eintragpfad in eintraege[:len(eintraege)-zwischenspeicher_max_eintraege]:
+        try:
+            os.remove(eintragpfad)
+        except OSError:
+            pass
+
+
+
+# -------------------------------------------------------------------------------------------------
+def ZwischenspeicherEntfernen(schluessel=None):
+    """Entfernt den Eintrag zu schluessel aus dem persistenten Zwischenspeicher. Falls kein schluessel
+    uebergeben wird, werden alle Eintraege entfernt.
+    """
+    import os
+    from .konstanten import zwischenspeicherpfad
+
+    if (zwischenspeicherpfad is None):
+        return
+
+    if (schluessel is not None):
+        eintragpfade = [_EintragPfad(schluessel=schluessel)]
+    else:
+        try:
+            eintragpfade = [os.path.join(zwischenspeicherpfad, dateiname)
+                for dateiname in os.listdir(zwischenspeicherpfad) if dateiname.endswith(_dateiendung)]
+        except OSError:
+            return
+
+    for eintragpfad in eintragpfade:
+        try:
+            os.remove(eintragpfad)
+        except OSError:
+            pass
+
+
+
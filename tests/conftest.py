@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+_repopfad = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_repopfad, 'src'))
+
+beispielordner = os.path.join(_repopfad, 'example_spreadsheets')
+
+
+@pytest.fixture(autouse=True, scope='session')
+def vorlagenpfad():
+    """Verwendet die mitgelieferten Vorlagen fuer alle Tests.
+    """
+    from miniSoilLAB.konstanten import Standardpfad
+
+    Standardpfad(pfad=os.path.join(_repopfad, 'miniSoilLAB'))
+
+
+def beispieldatei(dateiname):
+    """Gibt den Pfad zu einer der mitgelieferten Beispieldateien zurueck.
+    """
+    return os.path.join(beispielordner, dateiname)
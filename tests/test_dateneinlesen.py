@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import os
+import shutil
+
+from conftest import beispieldatei
+
+
+def _Bodenordner(basis, name, dateiname):
+    ordner = basis / name
+    ordner.mkdir()
+    shutil.copy(beispieldatei(dateiname), str(ordner))
+    return str(ordner) + os.sep
+
+
+def test_manifest_nach_parallelem_einlesen_erkennt_aenderungen(tmp_path):
+    from miniSoilLAB.dateneinlesen import BodendatenMitSchluesselAusMusterEinlesen
+    from miniSoilLAB.dateneinlesen import ManifestErstellen, _DateiUnveraendert
+
+    muster = dict([
+        ('A', ['Oedo-dicht', _Bodenordner(tmp_path, 'A', 'Oedo-dicht_01.xlsx')]),
+        ('B', ['Triax-D', _Bodenordner(tmp_path, 'B', 'Triax-D-dicht_01.xlsx')])])
+    boden = BodendatenMitSchluesselAusMusterEinlesen(muster=muster, verarbeitet=False,
+        bodenprozesse=2)
+    assert sorted(boden.keys()) == ['A', 'B']
+
+    # Nach dem Einlesen in den Unterprozessen veraenderte Datei
+    geaendert = os.path.join(muster['A'][1], 'Oedo-dicht_01.xlsx')
+    dateistatus = os.stat(geaendert)
+    os.utime(geaendert, ns=(dateistatus.st_atime_ns, dateistatus.st_mtime_ns + 10**9))
+
+    [eintrag_a] = ManifestErstellen(bodendaten=boden['A'])
+    assert eintrag_a['Aenderung'] == dateistatus.st_mtime_ns
+    assert eintrag_a['Pruefsumme'] is None
+    assert not _DateiUnveraendert(dateiname=geaendert, eintrag=eintrag_a)
+
+    [eintrag_b] = ManifestErstellen(bodendaten=boden['B'])
+    assert eintrag_b['Pruefsumme'] is not None
+    assert _DateiUnveraendert(dateiname=eintrag_b['Dateiname'], eintrag=eintrag_b)
+
+
+def test_bodendaten_mit_altdaten_nur_geaenderte_dateien(tmp_path):
+    from miniSoilLAB.dateneinlesen import BodendatenEinlesen
+
+    ordner = _Bodenordner(tmp_path, 'C', 'Oedo-dicht_01.xlsx')
+    shutil.copy(beispieldatei('Oedo-CRS_01.xlsx'), ordner)
+    boden = BodendatenEinlesen(bodenname='C', dateimuster='Oedo', zielordner=ordner,
+        verarbeitet=False)
+
+    aktualisiert = BodendatenEinlesen(bodenname='C', dateimuster='Oedo', zielordner=ordner,
+        verarbeitet=False, altdaten=boden['C'])
+    # Unveraenderte Dateien werden aus den Altdaten uebernommen
+    assert aktualisiert['C']['Oedo']['_Ref_001'] is boden['C']['Oedo']['_Ref_001']
+    assert aktualisiert['C']['Oedo-CRS']['_Ref_001'] is boden['C']['Oedo-CRS']['_Ref_001']
+
+    geaendert = os.path.join(ordner, 'Oedo-CRS_01.xlsx')
+    with open(geaendert, 'ab') as datei:
+        datei.write(b'\0')
+
+    aktualisiert = BodendatenEinlesen(bodenname='C', dateimuster='Oedo', zielordner=ordner,
+        verarbeitet=False, altdaten=boden['C'])
+    assert aktualisiert['C']['Oedo']['_Ref_001'] is boden['C']['Oedo']['_Ref_001']
+    assert aktualisiert['C']['Oedo-CRS']['_Ref_001'] is not boden['C']['Oedo-CRS']['_Ref_001']
+
+
+def test_rohdaten_direkt_als_messreihe(tmp_path):
+    from miniSoilLAB.dateneinlesen import DateiEinlesen
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB.rohdaten import LeseTVCDaten
+
+    zeilen = ['Zelle=1', 'Hoehe=100,0', '---- Ende ----', '--- Abscheren ---']
+    zeilen += ['01.01.2020 10:00:' + str(10+idx) + ' ' + ' '.join([str(idx_spalte+0.5*idx).replace('.', ',')
+        for idx_spalte in range(7)]) for idx in range(20)]
+    dateiname = str(tmp_path / 'Versuch.tvc')
+    with open(dateiname, 'w', encoding='iso-8859-15') as datei:
+        datei.write('\n'.join(zeilen) + '\n')
+
+    messdaten = DateiEinlesen(dateiname=dateiname)['TVC']['Daten']
+    referenz = LeseTVCDaten(dateiname=dateiname)['TVC']['Daten']
+    assert messdaten == referenz
+    for schluessel, spalte in referenz.items():
+        if (schluessel == 'Datum/Zeit'):
+            assert type(messdaten[schluessel]) is list
+        elif (schluessel != 'Schritte'):
+            assert type(spalte) is list
+            assert isinstance(messdaten[schluessel], Messreihe)
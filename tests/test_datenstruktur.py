@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import copy
+import json
+import pickle
+
+import pytest
+
+from conftest import beispieldatei
+
+
+def _Eintraege(daten, pfad=()):
+    for schluessel, wert in daten.items():
+        if (isinstance(wert, dict)):
+            yield from _Eintraege(daten=wert, pfad=pfad + (schluessel,))
+        else:
+            yield [pfad + (schluessel,), wert]
+
+
+def test_messreihe_verhaelt_sich_wie_liste():
+    from miniSoilLAB.datenstruktur import Messreihe
+
+    werte = [1.0, 2.5, -3.0]
+    reihe = Messreihe(werte)
+    assert reihe == werte
+    assert reihe[1:] == werte[1:]
+    assert isinstance(reihe[1:], Messreihe)
+    assert isinstance(reihe * 2, Messreihe) and (reihe * 2 == werte * 2)
+    assert isinstance(2 * reihe, Messreihe) and (2 * reihe == 2 * werte)
+    assert isinstance(reihe + [4.0], Messreihe) and (reihe + [4.0] == werte + [4.0])
+    assert isinstance([0.0] + reihe, Messreihe) and ([0.0] + reihe == [0.0] + werte)
+    assert reihe + ['x'] == werte + ['x']
+
+    reihe[0:2] = [7.0, 8.0]
+    assert reihe == [7.0, 8.0, -3.0]
+    reihe.sort()
+    assert reihe == [-3.0, 7.0, 8.0]
+    kopie = reihe.copy()
+    reihe.clear()
+    assert (reihe == []) and (kopie == [-3.0, 7.0, 8.0])
+
+    assert pickle.loads(pickle.dumps(kopie)) == kopie
+    assert isinstance(copy.deepcopy(kopie), Messreihe)
+
+    with pytest.raises(TypeError):
+        kopie[0] = None
+
+
+def test_messreihen_nur_an_uebergebenen_pfaden():
+    from miniSoilLAB.datenstruktur import Datenstruktur, Messreihe, MessreihenErstellen
+
+    daten = Datenstruktur([('Versuch 1', Datenstruktur([('Zeit [s]', [0.0, 1.0]),
+        ('Ergebnis', [0.5, 0.7])])), ('Hoehe [mm]', [20.0, 20.1])])
+    MessreihenErstellen(daten=daten, pfade=[('Versuch 1', 'Zeit [s]'), ('Fehlt', 'Zeit [s]')])
+    assert isinstance(daten['Versuch 1']['Zeit [s]'], Messreihe)
+    assert type(daten['Versuch 1']['Ergebnis']) is list
+    assert type(daten['Hoehe [mm]']) is list
+
+
+def test_nur_messdaten_aus_datengruppen_als_messreihe(tmp_path):
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen, DatensatzEinlesen
+    from miniSoilLAB.dateneinlesen import _DatensatzSpeichern
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB import xlshilfen
+
+    dateiliste = [beispieldatei(dateiname=dateiname) for dateiname in ['Korndichte_01.xlsx',
+        'LoDi_01.xlsx', 'Triax-D-dicht_01.xlsx']]
+    boden = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=dateiliste)['B']
+    messspalten = [pfad[-1] for pfad in xlshilfen._mustervorlagen.Messreihenpfade(versuchsart='Triax-D')]
+
+    eintraege = list(_Eintraege(daten=boden))
+    messreihen = [pfad for pfad, wert in eintraege if isinstance(wert, Messreihe)]
+    assert ('Triax-D', '_Ref_001', 'Versuch 1', 'Zeit [s]') in messreihen
+    # Eingelesene Messdaten (und daraus ausgeschnittene Abschnitte) und die berechneten Verlaeufe
+    # sind Messreihen, Einzelwerte je Probe bleiben Listen
+    assert all([pfad[-1] in messspalten for pfad in messreihen if '_Ref_001' in pfad])
+    versuch = boden['Triax-D']['Triax-D-dicht']['Versuch 1']
+    for schluessel in ['Dehnung [%]', '(sig_1 - sig_3)/2.0 [kN/m^2]', 'delta V/V_0 [%]',
+        'Porenzahl [-]', 'Reibungswinkel [Grad]']:
+        assert isinstance(versuch[schluessel], Messreihe)
+
+    assert type(boden['Triax-D']['_Ref_001']['1-Probenherstellung']['Hoehe [mm]']) is list
+    einzelwerte = boden['Triax-D']['Triax-D-dicht']['1-Probenherstellung']['Wassergehalt [%]']
+    assert type(einzelwerte) is list
+    einzelwerte[0] = None
+
+    dateiname = str(tmp_path / 'Datensatz.json')
+    _DatensatzSpeichern(datensatz=dict([('B', boden)]), dateiname=dateiname)
+    with open(dateiname, 'r', encoding='utf-8') as datei:
+        gespeichert = json.load(datei)
+
+    assert gespeichert['B']['Triax-D']['Triax-D-dicht']['Versuch 1']['Dehnung [%]'] \
+        == versuch['Dehnung [%]']
+
+    geladen = DatensatzEinlesen(dateiname=dateiname)['B']
+    assert isinstance(geladen['Triax-D']['_Ref_001']['Versuch 1']['Zeit [s]'], Messreihe)
+    assert geladen['Triax-D']['_Ref_001']['Versuch 1']['Zeit [s]'] \
+        == boden['Triax-D']['_Ref_001']['Versuch 1']['Zeit [s]']
+    assert type(geladen['Triax-D']['_Ref_001']['1-Probenherstellung']['Hoehe [mm]']) is list
+
+
+def test_keys_gibt_sortierte_liste_zurueck():
+    from miniSoilLAB.datenstruktur import Datenstruktur
+
+    daten = Datenstruktur([('b', 1), ('a', 2)])
+    schluessel = daten.keys()
+    assert (type(schluessel) is list) and (schluessel == ['a', 'b'])
+    schluessel.append('c')
+    assert daten.keys() == ['a', 'b']
+
+    daten.update([('0', 3)])
+    assert daten.keys() == ['0', 'a', 'b']
+    del daten['a']
+    assert daten.keys() == ['0', 'b']
+    assert pickle.loads(pickle.dumps(daten)).keys() == ['0', 'b']
+    assert copy.deepcopy(daten).keys() == ['0', 'b']
+
+
+def test_datenstruktur_ohne_attribut_dict():
+    from miniSoilLAB.datenstruktur import Datenstruktur
+
+    daten = Datenstruktur([('a', 1)])
+    assert not hasattr(daten, '__dict__')
+    daten.togglefull()
+    kopie = pickle.loads(pickle.dumps(daten))
+    assert (kopie == daten) and kopie.komplettausgabe
+
+    # Zustand aus Versionen vor __slots__ (inkl. zwischengespeicherter Schluessel)
+    alt = Datenstruktur.__new__(Datenstruktur)
+    alt.__setstate__({'komplettausgabe': False, 'max_eintraege': 3, '_sortierte_schluessel': ['x']})
+    assert (alt.max_eintraege == 3) and (alt.keys() == [])
+
+
+@pytest.mark.parametrize('refwahl', ['_Ref_099', 'Bodenart', '_Ref_'])
+def test_extrahieren_mit_ungueltiger_refwahl(capsys, refwahl):
+    from miniSoilLAB.datenstruktur import Datenstruktur, DatenstrukturExtrahieren
+
+    refstruktur = Datenstruktur([('Zeit [s]', []), ('Kraft [kN]', [])])
+    daten = Datenstruktur([('Bodenart', 'Sand'),
+        ('_Ref_001', Datenstruktur([('Zeit [s]', [0.0, 1.0]), ('Kraft [kN]', [0.5, 0.7])])),
+        ('_Ref_002', Datenstruktur([('Zeit [s]', [2.0]), ('Kraft [kN]', [0.9])]))])
+
+    gewaehlt = DatenstrukturExtrahieren(daten=daten, refstruktur=refstruktur, refwahl='_Ref_002')
+    assert [gewaehlt['Zeit [s]'], gewaehlt['Kraft [kN]']] == [[2.0], [0.9]]
+    alle = DatenstrukturExtrahieren(daten=daten, refstruktur=refstruktur)
+    assert [alle['Zeit [s]'], alle['Kraft [kN]']] == [[0.0, 1.0, 2.0], [0.5, 0.7, 0.9]]
+    assert capsys.readouterr().out == ''
+
+    # Eine ungueltige Auswahl liefert wie bisher nur die leere Referenzstruktur, aber mit Warnung
+    ungueltig = DatenstrukturExtrahieren(daten=daten, refstruktur=refstruktur, refwahl=refwahl)
+    assert [ungueltig['Zeit [s]'], ungueltig['Kraft [kN]']] == [[], []]
+    assert 'Ausgewaehlte Referenz ' + refwahl + ' ist kein' in capsys.readouterr().out
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+from math import cos, radians, sin
+
+import pytest
+
+# Peakspannungen [sigma_1', sigma_3'] der drei Versuche aus Triax-CU_01.xlsx
+SIGMA_1_CU = [80.8163253347821, 148.21410936303664, 258.8222699616713]
+SIGMA_3_CU = [14.7, 34.6, 67.4]
+# Peakspannungen der drei Versuche aus Triax-D-dicht_01.xlsx
+SIGMA_1_D = [226.9327563472591, 505.2995692929313, 1049.6900645992382]
+SIGMA_3_D = [50.2, 100.4, 200.9]
+
+
+def _Abstaende(x_min, x_max, y_0, winkel):
+    return [(einzel_max + einzel_min)/2.0*sin(radians(winkel)) + y_0*cos(radians(winkel))
+        - (einzel_max - einzel_min)/2.0 for einzel_min, einzel_max in zip(x_min, x_max)]
+
+
+def _RasterFehlerquadratsumme(x_min, x_max, y_0_max, schritte=200):
+    """Kleinste Summe der quadrierten Abstaende auf einem dichten Raster aus y_0 und Winkel.
+    """
+    minabstand = None
+    for idx_y_0 in range(schritte+1):
+        y_0 = idx_y_0*y_0_max/schritte
+        for idx_winkel in range(4*schritte+1):
+            winkel = -90.0 + idx_winkel*180.0/(4*schritte)
+            abstand = sum([einzel**2 for einzel in _Abstaende(x_min=x_min, x_max=x_max, y_0=y_0,
+                winkel=winkel)])
+            if ((minabstand is None) or (abstand < minabstand)):
+                minabstand = abstand
+
+    return minabstand
+
+
+def _BisherigeKohaesionssuche(x_min, x_max, c_delta=0.1):
+    """Bisherige Bestimmung von Kohaesion und Reibungswinkel fuer Triax-CU als Referenz.
+    """
+    from miniSoilLAB.gleichungsloeser import WinkelTangenteAnKreisboegen
+
+    max_kohaesion = min([(einzel_max - einzel_min)/2.0 for einzel_min, einzel_max in zip(x_min, x_max)])
+    mit_kohaesion = [None, None, None]
+    for idx_kohaesion in range(int(max_kohaesion/c_delta + 1.0)):
+        c = idx_kohaesion*c_delta
+        temp_abstand, temp_winkel = WinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max, y_0=c,
+            raster=True)
+        if ((mit_kohaesion[0] is None) or (temp_abstand < mit_kohaesion[0])):
+            mit_kohaesion = [temp_abstand, temp_winkel, c]
+
+    return mit_kohaesion
+
+
+def test_achsenabstand_und_winkel_wie_bisherige_suche():
+    from miniSoilLAB.gleichungsloeser import AchsenabstandUndWinkelTangenteAnKreisboegen
+
+    max_kohaesion = min([(sig1 - sig3)/2.0 for sig1, sig3 in zip(SIGMA_1_CU, SIGMA_3_CU)])
+    minabstand, winkel, kohaesion, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=SIGMA_3_CU, x_max=SIGMA_1_CU, y_0_min=0.0, y_0_max=max_kohaesion)
+    alt_abstand, alt_winkel, alt_kohaesion = _BisherigeKohaesionssuche(x_min=SIGMA_3_CU,
+        x_max=SIGMA_1_CU)
+
+    assert minabstand <= alt_abstand
+    assert winkel == pytest.approx(alt_winkel, abs=0.05)
+    assert kohaesion == pytest.approx(alt_kohaesion, abs=0.1)
+
+
+def test_residuen_und_fehlerquadratsumme():
+    from miniSoilLAB.gleichungsloeser import AchsenabstandUndWinkelTangenteAnKreisboegen
+
+    minabstand, winkel, kohaesion, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=SIGMA_3_CU, x_max=SIGMA_1_CU, y_0_min=0.0)
+    assert len(abstaende) == len(SIGMA_1_CU)
+    assert abstaende == pytest.approx(_Abstaende(x_min=SIGMA_3_CU, x_max=SIGMA_1_CU, y_0=kohaesion,
+        winkel=winkel), abs=1e-9)
+    assert minabstand == pytest.approx(sum([abstand**2 for abstand in abstaende]), rel=1e-12)
+    # Im Minimum des Ausgleichsproblems heben sich die Residuen auf
+    assert sum(abstaende) == pytest.approx(0.0, abs=1e-9)
+
+    # An der oberen Grenze werden Residuen und Fehlerquadratsumme fuer die Grenze ausgegeben
+    minabstand, winkel, kohaesion, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=SIGMA_3_CU, x_max=SIGMA_1_CU, y_0_min=0.0, y_0_max=1.0)
+    assert kohaesion == 1.0
+    assert abstaende == pytest.approx(_Abstaende(x_min=SIGMA_3_CU, x_max=SIGMA_1_CU, y_0=1.0,
+        winkel=winkel), abs=1e-9)
+    assert minabstand == pytest.approx(sum([abstand**2 for abstand in abstaende]), rel=1e-12)
+
+
+def test_achsenabstand_und_winkel_ein_kreis():
+    from miniSoilLAB.gleichungsloeser import AchsenabstandUndWinkelTangenteAnKreisboegen
+
+    minabstand, winkel, y_0, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=[100.0], x_max=[300.0], y_0_min=0.0, y_0_max=50.0)
+    assert 0.0 <= y_0 <= 50.0
+    assert minabstand == pytest.approx(0.0, abs=1e-12)
+
+
+def test_achsenabstand_und_winkel_gleiche_mittelpunkte():
+    from miniSoilLAB.gleichungsloeser import AchsenabstandUndWinkelTangenteAnKreisboegen
+
+    # Ohne eindeutige Loesung wird gesucht (statt nur y_0_min zu verwenden), die Gerade verlaeuft
+    # dann mittig zwischen beiden Halbkreisen
+    minabstand, winkel, y_0, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=[150.0, 100.0], x_max=[250.0, 300.0], y_0_min=0.0, y_0_max=40.0)
+    assert 0.0 <= y_0 <= 40.0
+    assert minabstand == pytest.approx(1250.0, rel=1e-9)
+
+
+@pytest.mark.parametrize('x_min, x_max, min_an_unterer_grenze', [([9.0, 7.0], [11.0, 17.0], True),
+    ([-10.0, -20.0, -35.0], [30.0, 60.0, 95.0], False)])
+def test_achsenabstand_und_winkel_ohne_winkel_im_ausgleichsproblem(x_min, x_max, min_an_unterer_grenze):
+    from miniSoilLAB.gleichungsloeser import AchsenabstandUndWinkelTangenteAnKreisboegen
+
+    # Die Radien wachsen schneller als die Mittelpunkte (|sin(Winkel)| >= 1 im Ausgleichsproblem)
+    y_0_max = max([(einzel_max - einzel_min)/2.0 for einzel_min, einzel_max in zip(x_min, x_max)])
+    minabstand, winkel, y_0, abstaende = AchsenabstandUndWinkelTangenteAnKreisboegen(
+        x_min=x_min, x_max=x_max, y_0_min=0.0, y_0_max=y_0_max)
+    assert 0.0 <= y_0 <= y_0_max
+    assert minabstand <= _RasterFehlerquadratsumme(x_min=x_min, x_max=x_max, y_0_max=y_0_max)
+    # Bisher wurde in diesem Fall immer die untere Grenze verwendet
+    untere_grenze = AchsenabstandUndWinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max,
+        y_0_min=0.0, y_0_max=0.0)
+    if (min_an_unterer_grenze):
+        assert minabstand == pytest.approx(untere_grenze[0], rel=1e-9)
+    else:
+        assert minabstand < 0.5*untere_grenze[0]
+
+
+@pytest.mark.parametrize('minimum', [-1.3, 0.0, 0.25, 2.9])
+def test_goldener_schnitt_minimum(minimum):
+    from miniSoilLAB.gleichungsloeser import _GoldenerSchnittMinimum
+
+    aufrufe = []
+
+    def Parabel(x):
+        aufrufe.append(x)
+        return (x - minimum)**2 + 3.0
+
+    stelle = _GoldenerSchnittMinimum(funktion=Parabel, links=-2.0, rechts=3.0, tol=1e-6)
+    assert stelle == pytest.approx(minimum, abs=1e-6)
+    # Je Schritt wird das Intervall um den Faktor 0.618 verkleinert und nur einmal ausgewertet
+    assert len(aufrufe) <= 35
+    assert all([(-2.0 <= x <= 3.0) for x in aufrufe])
+
+
+def test_goldener_schnitt_minimum_am_rand():
+    from miniSoilLAB.gleichungsloeser import _GoldenerSchnittMinimum
+
+    assert _GoldenerSchnittMinimum(funktion=lambda x: x, links=1.0, rechts=2.0,
+        tol=1e-9) == pytest.approx(1.0, abs=1e-9)
+    assert _GoldenerSchnittMinimum(funktion=lambda x: -x, links=1.0, rechts=2.0,
+        tol=1e-9) == pytest.approx(2.0, abs=1e-9)
+
+
+def test_winkel_tangente_wie_raster():
+    from miniSoilLAB.gleichungsloeser import WinkelTangenteAnKreisboegen
+
+    minabstand, winkel = WinkelTangenteAnKreisboegen(x_min=SIGMA_3_D, x_max=SIGMA_1_D, y_0=0)
+    raster_abstand, raster_winkel = WinkelTangenteAnKreisboegen(x_min=SIGMA_3_D, x_max=SIGMA_1_D,
+        y_0=0, raster=True)
+    fein_abstand, fein_winkel = WinkelTangenteAnKreisboegen(x_min=SIGMA_3_D, x_max=SIGMA_1_D,
+        y_0=0, raster=True, winkeldelta=1e-4)
+
+    # Bisheriger Wert im Raster von 0.05 Grad und genauerer Wert des Goldenen Schnitts
+    assert raster_winkel == pytest.approx(42.47192, abs=1e-5)
+    assert winkel == pytest.approx(42.47545, abs=1e-5)
+    assert abs(winkel - raster_winkel) < 0.05
+    assert minabstand <= raster_abstand
+    assert winkel == pytest.approx(fein_winkel, abs=1e-4)
+    assert minabstand <= fein_abstand + 1e-9
+
+
+@pytest.mark.parametrize('y_0', [0.0, 5.0, 20.0])
+def test_winkel_tangente_im_begrenzten_suchbereich(y_0):
+    from miniSoilLAB.gleichungsloeser import WinkelTangenteAnKreisboegen
+
+    for x_min, x_max in [(SIGMA_3_CU, SIGMA_1_CU), (SIGMA_3_D, SIGMA_1_D)]:
+        minabstand, winkel = WinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max, y_0=y_0)
+        raster_abstand, raster_winkel = WinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max,
+            y_0=y_0, raster=True)
+        assert minabstand <= raster_abstand
+        assert abs(winkel - raster_winkel) < 0.05
+        assert minabstand == pytest.approx(sum([abstand**2 for abstand in _Abstaende(x_min=x_min,
+            x_max=x_max, y_0=y_0, winkel=winkel)]), rel=1e-12)
+
+
+@pytest.mark.parametrize('raster', [False, True])
+def test_winkel_tangenten_an_kreisbogengruppen_wie_einzelaufrufe(raster):
+    from miniSoilLAB.gleichungsloeser import WinkelTangenteAnKreisboegen, WinkelTangentenAnKreisbogengruppen
+
+    x_min_liste = [SIGMA_3_CU, SIGMA_3_D, [100.0, 200.0]]
+    x_max_liste = [SIGMA_1_CU, SIGMA_1_D, [300.0, 560.0]]
+    for y_0 in [0.0, [5.0, 0.0, 20.0]]:
+        einzel_y_0 = y_0 if isinstance(y_0, list) else [y_0]*len(x_min_liste)
+        ergebnisse = WinkelTangentenAnKreisbogengruppen(x_min_liste=x_min_liste,
+            x_max_liste=x_max_liste, y_0=y_0, raster=raster)
+        assert ergebnisse == [WinkelTangenteAnKreisboegen(x_min=x_min, x_max=x_max, y_0=einzel,
+            raster=raster) for x_min, x_max, einzel in zip(x_min_liste, x_max_liste, einzel_y_0)]
+
+    assert WinkelTangentenAnKreisbogengruppen(x_min_liste=[], x_max_liste=[], y_0=0.0) == []
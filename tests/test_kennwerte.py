@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+from conftest import beispieldatei
+
+
+def _Aufrufe(monkeypatch):
+    from miniSoilLAB import kennwerte
+
+    aufrufe = []
+    berechnen = kennwerte._KennwerteBerechnen
+
+    def _Zaehlen(kenn_name, *args, **kwargs):
+        aufrufe.append(kenn_name)
+        return berechnen(kenn_name, *args, **kwargs)
+
+    monkeypatch.setattr(kennwerte, '_KennwerteBerechnen', _Zaehlen)
+    return aufrufe
+
+
+def test_kennwertschluessel_nur_ueber_eingaben():
+    from miniSoilLAB.datenstruktur import Datenstruktur, Messreihe
+    from miniSoilLAB.kennwerte import _Kennwertschluessel
+
+    refwerte = Datenstruktur([('Korndichte [g/cm^3]', 2.65)])
+    daten = Datenstruktur([('Oedo-CRL', Datenstruktur([
+        ('_Ref_001', Datenstruktur([('Setzung [mm]', Messreihe([0.0, 0.1, 0.2]))])),
+        ('Einstellungen', Datenstruktur([('Glaettungswert', 10)]))]))])
+    schluessel = _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte)
+
+    # Von der Berechnung geschriebene Ergebnisse aendern den Schluessel nicht
+    daten['Oedo-CRL'].update([('Porenzahl [-]', [0.7, 0.69, 0.68])])
+    assert _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte) == schluessel
+    # Unbenutzte Referenzwerte ebenfalls nicht
+    refwerte.update([('Fliessgrenze [%]', 30.0)])
+    assert _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte) == schluessel
+
+    daten['Oedo-CRL']['Einstellungen'].update([('Glaettungswert', 12)])
+    geaendert = _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte)
+    assert geaendert != schluessel
+    daten['Oedo-CRL']['_Ref_001']['Setzung [mm]'][-1] = 0.25
+    assert _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte) != geaendert
+    refwerte.update([('Korndichte [g/cm^3]', 2.66)])
+    assert _Kennwertschluessel(daten=daten, kenn_name='Oedo-CRL', refwerte=refwerte) != geaendert
+
+
+def test_kennwerte_werden_wiederverwendet(monkeypatch):
+    import copy
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen
+    from miniSoilLAB.kennwerte import Kennwertberechnungen, KennwertspeicherLeeren
+
+    dateiliste = [beispieldatei(dateiname=dateiname) for dateiname in ['Korndichte_01.xlsx',
+        'LoDi_01.xlsx', 'Oedo-CRL_01.xlsx', 'Triax-D-dicht_01.xlsx']]
+    boden = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=dateiliste, verarbeitet=False)['B']
+    KennwertspeicherLeeren()
+    aufrufe = _Aufrufe(monkeypatch=monkeypatch)
+
+    assert Kennwertberechnungen(daten=boden)
+    assert sorted(aufrufe) == ['Korndichte', 'LoDi', 'Oedo-CRL', 'Triax-D']
+    berechnet = copy.deepcopy(boden)
+
+    # Bei der ersten Berechnung ergaenzte Einstellungen verhindern keine Wiederverwendung
+    del aufrufe[:]
+    assert Kennwertberechnungen(daten=boden)
+    assert (aufrufe == []) and (boden == berechnet)
+
+    # Nur die Vorlage mit geaenderter Einstellung wird neu berechnet
+    boden['Triax-D']['Triax-D-dicht']['Versuch 1']['Einstellungen'].update([('Spanne', 1.0)])
+    assert Kennwertberechnungen(daten=boden)
+    assert aufrufe == ['Triax-D']
+
+    KennwertspeicherLeeren()
+
+
+def _Ablauf(monkeypatch):
+    """Protokolliert im aufrufenden Prozess, wann eine Vorlage gestartet (mit den dann vorhandenen
+    Referenzwerten) und wann ihr Ergebnis uebernommen wird.
+    """
+    from miniSoilLAB import kennwerte
+
+    ablauf = []
+    bereitstellen = kennwerte._VoraussetzungenBereitstellen
+    abschliessen = kennwerte._BerechnungAbschliessen
+
+    def _Bereitstellen(daten, kenn_name, refwerte):
+        ergebnis = bereitstellen(daten=daten, kenn_name=kenn_name, refwerte=refwerte)
+        ablauf.append(('Start', kenn_name, set(refwerte.keys())))
+        return ergebnis
+
+    def _Abschliessen(daten, kenn_name, refwerte, status):
+        ablauf.append(('Ende', kenn_name, None))
+        return abschliessen(daten=daten, kenn_name=kenn_name, refwerte=refwerte, status=status)
+
+    monkeypatch.setattr(kennwerte, '_VoraussetzungenBereitstellen', _Bereitstellen)
+    monkeypatch.setattr(kennwerte, '_BerechnungAbschliessen', _Abschliessen)
+    return ablauf
+
+
+def test_parallele_kennwerte_wie_sequentielle(monkeypatch):
+    import copy
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen
+    from miniSoilLAB.kennwerte import Kennwertberechnungen, Berechnungsgraph, _referenzwerte
+
+    dateiliste = [beispieldatei(dateiname=dateiname) for dateiname in ['Korndichte_01.xlsx',
+        'LoDi_01.xlsx', 'Oedo-dicht_01.xlsx', 'Oedo-CRL_01.xlsx', 'Triax-D-dicht_01.xlsx',
+        'Triax-p-q_01.xlsx']]
+    boden = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=dateiliste, verarbeitet=False)['B']
+    sequentiell = copy.deepcopy(boden)
+    assert Kennwertberechnungen(daten=sequentiell, prozesse=1, wiederverwenden=False)
+
+    ablauf = _Ablauf(monkeypatch=monkeypatch)
+    parallel = copy.deepcopy(boden)
+    assert Kennwertberechnungen(daten=parallel, prozesse=4, wiederverwenden=False)
+    assert parallel == sequentiell
+    assert list(parallel.keys()) == list(sequentiell.keys())
+
+    # Jede Vorlage startet erst, wenn alle Vorlagen mit benoetigten Referenzwerten abgeschlossen sind
+    abhaengigkeiten = dict([('Korndichte', set()), ('LoDi', set(['Korndichte'])),
+        ('Oedo', set(['Korndichte', 'LoDi'])), ('Oedo-CRL', set(['Korndichte'])),
+        ('Triax-D', set(['Korndichte', 'LoDi'])), ('Triax-p-q', set(['Korndichte', 'LoDi']))])
+    assert Berechnungsgraph(vorlagenliste=list(abhaengigkeiten.keys())) == abhaengigkeiten
+    abgeschlossen = set()
+    gestartet = []
+    max_laufend = 0
+    for ereignis, kenn_name, refwerte in ablauf:
+        if (ereignis == 'Ende'):
+            assert kenn_name in gestartet
+            abgeschlossen.add(kenn_name)
+            continue
+
+        assert abhaengigkeiten[kenn_name] <= abgeschlossen
+        for vorlage in abhaengigkeiten[kenn_name]:
+            assert set(_referenzwerte[vorlage]) <= refwerte
+
+        gestartet += [kenn_name]
+        max_laufend = max(max_laufend, len(gestartet) - len(abgeschlossen))
+
+    assert sorted(gestartet) == sorted(abhaengigkeiten.keys())
+    assert abgeschlossen == set(gestartet)
+    # Unabhaengige Vorlagen werden gleichzeitig berechnet
+    assert max_laufend > 1
@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+ZEILEN = 23
+
+
+def _Zahl(wert, komma=True):
+    text = repr(float(wert))
+    return text.replace('.', ',') if komma else text
+
+
+def _Zeitstempel(idx):
+    return '01.02.2021 10:' + str(idx // 60).zfill(2) + ':' + str(idx % 60).zfill(2)
+
+
+def _Messwerte(idx):
+    return [0.5*idx, 0.01*idx*idx - 0.3, 1.5 + 0.25*(idx % 7), -2.0 + idx/3.0]
+
+
+def _EAXDatei(pfad):
+    """Schreibt eine eax-Datei und gibt Dateiname, Headereintraege und Messdaten zurueck.
+    """
+    spaltennamen = ['Zeit', 'Datum', 'Weg', 'Kraft', 'Druck']
+    zeilen = ['[Eingaben]', 'Probenhoehe=20,5', 'Bezeichnung=Probe A', '[Daten]', ';'.join(spaltennamen)]
+    messdaten = dict([(name, []) for name in spaltennamen])
+    for idx in range(ZEILEN):
+        zeit, weg, kraft, druck = _Messwerte(idx)
+        werte = [zeit, _Zeitstempel(idx), weg, kraft, druck]
+        zeilen += [';'.join([wert if isinstance(wert, str) else _Zahl(wert) for wert in werte])]
+        for name, wert in zip(spaltennamen, werte):
+            messdaten[name] += [wert]
+
+    dateiname = str(pfad / 'versuch.eax')
+    with open(dateiname, 'w', encoding='iso-8859-15') as ausgabe:
+        ausgabe.write('\n'.join(zeilen) + '\n')
+
+    return dateiname, dict([('Probenhoehe', 20.5), ('Bezeichnung', 'Probe A')]), messdaten
+
+
+def _DTADatei(pfad):
+    """Schreibt eine dta-Datei (Textspalten 1 und ab 6) und gibt Dateiname, Headereintraege und
+    Messdaten zurueck.
+    """
+    spaltennamen = ['Zeit', 'Datum', 'Weg', 'Kraft', 'Druck', 'Temperatur', 'Stufe', 'Kommentar']
+    zeilen = ['[Versuchsdaten]', 'Durchmesser =71,4', 'Bearbeiter=XY', '[Daten]', '\t'.join(spaltennamen)]
+    messdaten = dict([(name, []) for name in spaltennamen])
+    for idx in range(ZEILEN):
+        zeit, weg, kraft, druck = _Messwerte(idx)
+        werte = [zeit, _Zeitstempel(idx), weg, kraft, druck, 20.0 + 0.1*idx, 'S' + str(idx // 5),
+            'Notiz ' + str(idx)]
+        zeilen += ['\t'.join([wert if isinstance(wert, str) else _Zahl(wert) for wert in werte])]
+        for name, wert in zip(spaltennamen, werte):
+            messdaten[name] += [wert]
+
+    dateiname = str(pfad / 'versuch.dta')
+    with open(dateiname, 'w', encoding='iso-8859-15') as ausgabe:
+        ausgabe.write('\n'.join(zeilen) + '\n')
+
+    return dateiname, dict([('Durchmesser', 71.4), ('Bearbeiter', 'XY')]), messdaten
+
+
+def _GDSDatei(pfad, stufenfolge=(1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 2, 2, 2, 4, 4, 4)):
+    """Schreibt eine gds-Datei mit einer Zeile je Eintrag aus stufenfolge (Stage Number) und gibt
+    Dateiname, Headereintraege und Messdaten zurueck. Eine unvollstaendige Zeile im Abschnitt der
+    dritten Stufe wird beim Einlesen ignoriert.
+    """
+    spaltennamen = ['Stage Number', 'Time since start of test (s)', 'Radial Pressure (kPa)',
+        'Axial Displacement (mm)', 'Deviator Stress (kPa)']
+    zeilen = ['"Station Number","3"', '"Initial Height (mm)","100.2"', '"Test Name","GDS-Test"',
+        '"' + '","'.join(spaltennamen) + '"']
+    messdaten = dict([(name, []) for name in spaltennamen])
+    for idx, stufe in enumerate(stufenfolge):
+        werte = [float(stufe)] + _Messwerte(idx)
+        zeilen += ['"' + '","'.join([_Zahl(wert, komma=False) for wert in werte]) + '"']
+        for name, wert in zip(spaltennamen, werte):
+            messdaten[name] += [wert]
+
+        if ((stufe == 3) and (stufenfolge[idx-1] == 3) and (stufenfolge[idx-2] != 3)):
+            zeilen += ['"3","' + _Zahl(0.5*idx + 0.25, komma=False) + '"," 1.0"']
+
+    dateiname = str(pfad / 'versuch.gds')
+    with open(dateiname, 'w', encoding='iso-8859-15') as ausgabe:
+        ausgabe.write('\n'.join(zeilen) + '\n')
+
+    return dateiname, dict([('Station Number', '3'), ('Initial Height (mm)', 100.2),
+        ('Test Name', 'GDS-Test')]), messdaten
+
+
+def _TVCDatei(pfad):
+    """Schreibt eine tvc-Datei mit drei Abschnitten und gibt Dateiname, Headereintraege und
+    Messdaten (inklusive Schritte) zurueck.
+    """
+    spaltennamen = ['Datum/Zeit', 'Radialdruck [kN/m^2]', 'Porenwasserdruck [kN/m^2]',
+        'Druck_undef [kN/m^2]', 'Axialkraft [kN]', 'Stauchung [mm]', 'Stauchung_undef [mm]',
+        'Stauchung_undef(2) [mm]']
+    zeilen = ['Versuch=TVC-Test', 'Hoehe=100,5', 'Zelle=', '---- Ende ----']
+    messdaten = dict([(name, []) for name in spaltennamen])
+    schritte = []
+    for idx in range(ZEILEN):
+        if (idx in [0, 8, 15]):
+            name = 'Schritt ' + str(len(schritte) + 1)
+            zeilen += ['--- ' + name + ' ---']
+            schritte += [[name, idx]]
+
+        werte = _Messwerte(idx) + [idx*0.125, -idx*0.5, 7.0]
+        zeilen += [_Zeitstempel(idx) + ' ' + ' '.join([_Zahl(wert) for wert in werte])]
+        for name, wert in zip(spaltennamen, [_Zeitstempel(idx)] + werte):
+            messdaten[name] += [wert]
+
+    messdaten.update([('Schritte', schritte)])
+    dateiname = str(pfad / 'versuch.tvc')
+    with open(dateiname, 'w', encoding='iso-8859-15') as ausgabe:
+        ausgabe.write('\n'.join(zeilen) + '\n')
+
+    return dateiname, dict([('Versuch', 'TVC-Test'), ('Hoehe', 100.5), ('Zelle', '')]), messdaten
+
+
+# Schreibfunktion, Lesefunktion, Schluessel und Textspalten der Rohdatenformate
+ROHDATENFORMATE = dict([
+    ('eax', (_EAXDatei, 'LeseEAXDaten', 'EAX', ['Datum'])),
+    ('dta', (_DTADatei, 'LeseDTADaten', 'DTA', ['Datum', 'Stufe', 'Kommentar'])),
+    ('gds', (_GDSDatei, 'LeseGDSDaten', 'GDS', [])),
+    ('tvc', (_TVCDatei, 'LeseTVCDaten', 'TVC', ['Datum/Zeit', 'Schritte'])),
+])
+
+
+def _Einlesen(format, dateiname, **optionen):
+    from miniSoilLAB import rohdaten
+
+    _, lesefunktion, schluessel, _ = ROHDATENFORMATE[format]
+    return getattr(rohdaten, lesefunktion)(dateiname=dateiname, **optionen)[schluessel]
+
+
+@pytest.mark.parametrize('als_array', [False, True])
+@pytest.mark.parametrize('format', sorted(ROHDATENFORMATE.keys()))
+def test_spaltenweises_einlesen_wie_zeilenweise_erwartet(tmp_path, monkeypatch, format, als_array):
+    from miniSoilLAB import rohdaten
+    from miniSoilLAB.datenstruktur import Messreihe
+
+    schreiben, _, _, textspalten = ROHDATENFORMATE[format]
+    dateiname, header, messdaten = schreiben(tmp_path)
+    eingelesen = _Einlesen(format, dateiname, als_array=als_array)
+    assert eingelesen == dict(header, Daten=messdaten, Dateiname=dateiname)
+    for name, spalte in eingelesen['Daten'].items():
+        if ((name in textspalten) or (not als_array)):
+            assert type(spalte) is list
+        else:
+            assert isinstance(spalte, Messreihe)
+
+    # Das Ergebnis haengt nicht davon ab, wie viele Zeilen gemeinsam umgewandelt werden
+    monkeypatch.setattr(rohdaten, '_blockgroesse', 4)
+    assert _Einlesen(format, dateiname, als_array=als_array) == eingelesen
+
+
+def _Zeilenauswahl(messdaten, indizes):
+    return dict([(name, [spalte[idx] for idx in indizes]) for name, spalte in messdaten.items()])
+
+
+def _Zeile(messdaten, idx):
+    return dict([(name, spalte[idx]) for name, spalte in messdaten.items()])
+
+
+@pytest.mark.parametrize('stufen', [[2, 4], [1], [3], [], [5]])
+def test_gds_stufen_wie_vollstaendiges_einlesen(tmp_path, stufen):
+    from miniSoilLAB.rohdaten import GDSStufenindex, LeseGDSDaten
+
+    dateiname, header, messdaten = _GDSDatei(tmp_path)
+    vollstaendig = LeseGDSDaten(dateiname=dateiname)['GDS']
+    stufenindex = GDSStufenindex(dateiname=dateiname)
+    assert stufenindex['Spaltennamen'] == list(messdaten.keys())
+    assert [abschnitt[:3] for abschnitt in stufenindex['Abschnitte']] == [[1.0, 0, 5], [2.0, 5, 8],
+        [3.0, 13, 4], [2.0, 17, 3], [4.0, 20, 3]]
+
+    for index in [None, stufenindex]:
+        eingelesen = LeseGDSDaten(dateiname=dateiname, stufen=stufen, stufenindex=index)['GDS']
+        indizes = [idx for idx, stufe in enumerate(messdaten['Stage Number']) if (stufe in stufen)]
+        assert eingelesen['Daten'] == _Zeilenauswahl(messdaten=vollstaendig['Daten'], indizes=indizes)
+        assert dict([(name, wert) for name, wert in eingelesen.items() if (name != 'Stufen')]) \
+            == dict(header, Daten=eingelesen['Daten'], Dateiname=dateiname)
+
+        datenindex = 0
+        for stufeninfo, abschnitt in zip(eingelesen['Stufen'], stufenindex['Abschnitte']):
+            stufe, startindex, anzahl = abschnitt[:3]
+            assert [stufeninfo['Stufe'], stufeninfo['Startindex'], stufeninfo['Anzahl']] == abschnitt[:3]
+            assert stufeninfo['Erste Zeile'] == _Zeile(messdaten=vollstaendig['Daten'], idx=startindex)
+            assert stufeninfo['Letzte Zeile'] == _Zeile(messdaten=vollstaendig['Daten'],
+                idx=startindex + anzahl - 1)
+            if (stufe in stufen):
+                # Der Datenindex verweist auf den Beginn des Abschnitts in den eingelesenen Daten
+                assert stufeninfo['Datenindex'] == datenindex
+                assert eingelesen['Daten']['Time since start of test (s)'][datenindex] \
+                    == vollstaendig['Daten']['Time since start of test (s)'][startindex]
+                datenindex += anzahl
+            else:
+                assert stufeninfo['Datenindex'] is None
+
+        assert len(eingelesen['Stufen']) == 5
+
+
+def test_gds_stufenindex_aus_zwischenspeicher(tmp_path, monkeypatch):
+    from miniSoilLAB import rohdaten
+    from miniSoilLAB.konstanten import Zwischenspeicher
+
+    dateiname, _, _ = _GDSDatei(tmp_path)
+    Zwischenspeicher(pfad=str(tmp_path / 'zwischenspeicher'))
+    try:
+        stufenindex = rohdaten.GDSStufenindex(dateiname=dateiname)
+        zerlegen = rohdaten._GDSZeileZerlegen
+        monkeypatch.setattr(rohdaten, '_GDSZeileZerlegen', None)
+        assert rohdaten.GDSStufenindex(dateiname=dateiname) == stufenindex
+        monkeypatch.setattr(rohdaten, '_GDSZeileZerlegen', zerlegen)
+
+        # Nach einer Aenderung der Datei wird der Index neu erstellt
+        dateiname, _, _ = _GDSDatei(tmp_path, stufenfolge=(1, 1, 2, 2, 2))
+        assert [abschnitt[:3] for abschnitt in rohdaten.GDSStufenindex(dateiname=dateiname)['Abschnitte']] \
+            == [[1.0, 0, 2], [2.0, 2, 3]]
+    finally:
+        Zwischenspeicher(pfad=None)
+
+
+def _Spaltenprojektion(messdaten, spaltenauswahl):
+    """Erwartete Messdaten bei einer spaltenauswahl (in der Reihenfolge der Datei).
+    """
+    return dict([(name, spalte) for name, spalte in messdaten.items()
+        if ((name in spaltenauswahl) or (name == 'Schritte'))])
+
+
+@pytest.mark.parametrize('auswahl', [[1, 3], [4, 0], [-1], [2, 'Fehlt'], []])
+@pytest.mark.parametrize('format', sorted(ROHDATENFORMATE.keys()))
+def test_spaltenauswahl_wie_vollstaendiges_einlesen(tmp_path, capsys, format, auswahl):
+    schreiben, _, _, _ = ROHDATENFORMATE[format]
+    dateiname, header, messdaten = schreiben(tmp_path)
+    vollstaendig = _Einlesen(format, dateiname)
+    spaltennamen = [name for name in messdaten.keys() if (name != 'Schritte')]
+    spaltenauswahl = [spaltennamen[idx] if isinstance(idx, int) else idx for idx in auswahl]
+
+    for als_array in [False, True]:
+        eingelesen = _Einlesen(format, dateiname, als_array=als_array, spaltenauswahl=spaltenauswahl)
+        assert eingelesen == dict(vollstaendig, Daten=_Spaltenprojektion(messdaten=vollstaendig['Daten'],
+            spaltenauswahl=spaltenauswahl))
+        assert list(eingelesen['Daten'].keys()) == sorted(_Spaltenprojektion(messdaten=messdaten,
+            spaltenauswahl=spaltenauswahl).keys())
+
+    assert ('Spalte Fehlt nicht in' in capsys.readouterr().out) == ('Fehlt' in auswahl)
+
+
+@pytest.mark.parametrize('spaltenauswahl', [['Deviator Stress (kPa)'],
+    ['Time since start of test (s)', 'Stage Number']])
+def test_gds_stufen_mit_spaltenauswahl(tmp_path, spaltenauswahl):
+    from miniSoilLAB.rohdaten import LeseGDSDaten
+
+    dateiname, _, _ = _GDSDatei(tmp_path)
+    stufen = LeseGDSDaten(dateiname=dateiname, stufen=[2, 3])['GDS']
+    eingelesen = LeseGDSDaten(dateiname=dateiname, stufen=[2, 3], spaltenauswahl=spaltenauswahl)['GDS']
+    assert eingelesen['Daten'] == _Spaltenprojektion(messdaten=stufen['Daten'],
+        spaltenauswahl=spaltenauswahl)
+    for stufeninfo, referenz in zip(eingelesen['Stufen'], stufen['Stufen']):
+        for zeile in ['Erste Zeile', 'Letzte Zeile']:
+            assert stufeninfo[zeile] == _Spaltenprojektion(messdaten=referenz[zeile],
+                spaltenauswahl=spaltenauswahl)
+
+        assert dict(stufeninfo, **{'Erste Zeile': None, 'Letzte Zeile': None}) \
+            == dict(referenz, **{'Erste Zeile': None, 'Letzte Zeile': None})
+
+
+def _Blockweise(dateiname, spaltennamen, **optionen):
+    """Liest dateiname mit RohdatenBlockweiseLesen und gibt die zusammengefuegten Spalten (als
+    Listen), die Kopfdaten und die Zeilenanzahl der einzelnen Bloecke zurueck.
+    """
+    from miniSoilLAB.datenstruktur import Datenstruktur
+    from miniSoilLAB.rohdaten import RohdatenBlockweiseLesen
+
+    kopfdaten = Datenstruktur()
+    daten = dict([(name, []) for name in spaltennamen])
+    blocklaengen = []
+    for block in RohdatenBlockweiseLesen(dateiname=dateiname, kopfdaten=kopfdaten, **optionen):
+        assert sorted(block.keys()) == sorted(spaltennamen)
+        blocklaengen += [len(block[spaltennamen[0]])]
+        for name in spaltennamen:
+            daten[name] += list(block[name])
+
+    return daten, kopfdaten, blocklaengen
+
+
+def _Ausgeduennt(messdaten, spaltennamen, startzeile=0, schrittweite=1, huellengroesse=None,
+    huellenspalte=None, spaltenauswahl=None):
+    """Zeilenweise ausgeduennte Messdaten als Referenz fuer RohdatenBlockweiseLesen (spaltenauswahl
+    ist bereits in spaltennamen beruecksichtigt).
+    """
+    indizes = list(range(len(messdaten[spaltennamen[0]])))[startzeile:][::schrittweite]
+    if ((huellengroesse is not None) and (huellenspalte in spaltennamen)):
+        huellenindizes = []
+        for idx_start in range(0, len(indizes), huellengroesse):
+            abschnitt = indizes[idx_start:idx_start+huellengroesse]
+            werte = [messdaten[huellenspalte][idx] for idx in abschnitt]
+            huellenindizes += sorted(set([abschnitt[werte.index(min(werte))],
+                abschnitt[werte.index(max(werte))]]))
+
+        indizes = huellenindizes
+
+    return _Zeilenauswahl(messdaten=dict([(name, messdaten[name]) for name in spaltennamen]),
+        indizes=indizes)
+
+
+def _Ausduennoptionen(optionen, alle_spalten):
+    """Ersetzt die Spaltenindizes in optionen (siehe AUSDUENNUNGEN) durch die Namen aus alle_spalten
+    und gibt die Optionen und die Namen der eingelesenen Spalten zurueck.
+    """
+    optionen = dict(optionen)
+    if (isinstance(optionen.get('huellenspalte'), int)):
+        optionen['huellenspalte'] = alle_spalten[optionen['huellenspalte']]
+
+    spaltennamen = alle_spalten
+    if ('spaltenauswahl' in optionen):
+        optionen['spaltenauswahl'] = [alle_spalten[idx] for idx in optionen['spaltenauswahl']]
+        spaltennamen = [name for name in alle_spalten if (name in optionen['spaltenauswahl'])]
+
+    return optionen, spaltennamen
+
+
+# Optionen fuer das Ausduennen mit Spaltenindizes fuer spaltenauswahl und huellenspalte
+AUSDUENNUNGEN = [
+    dict(),
+    dict(startzeile=4),
+    dict(schrittweite=3),
+    dict(startzeile=5, schrittweite=2),
+    dict(startzeile=100),
+    dict(huellengroesse=4, huellenspalte=3),
+    dict(startzeile=2, schrittweite=2, huellengroesse=3, huellenspalte=3),
+    dict(huellengroesse=5, huellenspalte=3, spaltenauswahl=[3, 0]),
+    dict(huellengroesse=4, huellenspalte='Fehlt'),
+]
+
+
+@pytest.mark.parametrize('optionen', AUSDUENNUNGEN)
+@pytest.mark.parametrize('format', sorted(ROHDATENFORMATE.keys()))
+def test_blockweises_einlesen_wie_vollstaendiges_einlesen(tmp_path, capsys, format, optionen):
+    from miniSoilLAB.datenstruktur import Datenstruktur
+
+    schreiben, _, _, _ = ROHDATENFORMATE[format]
+    dateiname, header, messdaten = schreiben(tmp_path)
+    vollstaendig = _Einlesen(format, dateiname)
+    alle_spalten = [name for name in messdaten.keys() if (name != 'Schritte')]
+    optionen, spaltennamen = _Ausduennoptionen(optionen=optionen, alle_spalten=alle_spalten)
+    referenz = _Ausgeduennt(messdaten=vollstaendig['Daten'], spaltennamen=spaltennamen, **optionen)
+    kopfreferenz = dict(header)
+    if ('Schritte' in messdaten):
+        # Die Schritte beziehen sich immer auf die nicht ausgeduennten Daten
+        kopfreferenz.update([('Schritte', vollstaendig['Daten']['Schritte'])])
+
+    for blockgroesse in [1, 3, 100]:
+        daten, kopfdaten, blocklaengen = _Blockweise(dateiname=dateiname, spaltennamen=spaltennamen,
+            blockgroesse=blockgroesse, **optionen)
+        assert daten == referenz
+        assert (type(kopfdaten) is Datenstruktur) and (kopfdaten == kopfreferenz)
+        assert 0 not in blocklaengen
+        if ('huellengroesse' not in optionen):
+            assert max(blocklaengen, default=0) <= blockgroesse
+
+    assert ('Spalte Fehlt nicht in' in capsys.readouterr().out) \
+        == (optionen.get('huellenspalte') == 'Fehlt')
+
+
+@pytest.mark.parametrize('optionen', AUSDUENNUNGEN)
+@pytest.mark.parametrize('stufen', [[2, 4], [3], [5]])
+def test_gds_stufen_blockweise_wie_stufen_einlesen(tmp_path, stufen, optionen):
+    from miniSoilLAB.rohdaten import GDSStufenindex, LeseGDSDaten
+
+    dateiname, header, messdaten = _GDSDatei(tmp_path)
+    alle_spalten = list(messdaten.keys())
+    optionen, spaltennamen = _Ausduennoptionen(optionen=optionen, alle_spalten=alle_spalten)
+    eingelesen = LeseGDSDaten(dateiname=dateiname, stufen=stufen,
+        spaltenauswahl=optionen.get('spaltenauswahl'))['GDS']
+    referenz = _Ausgeduennt(messdaten=eingelesen['Daten'], spaltennamen=spaltennamen, **optionen)
+    for index in [None, GDSStufenindex(dateiname=dateiname)]:
+        daten, kopfdaten, _ = _Blockweise(dateiname=dateiname, spaltennamen=spaltennamen,
+            blockgroesse=2, stufen=stufen, stufenindex=index, **optionen)
+        assert daten == referenz
+        assert kopfdaten == dict(header, Stufen=eingelesen['Stufen'])
+
+
+ARAEOMETER = dict([('Volumen Birne [cm^3]', 65.0), ('Flaeche Messzylinder [cm^2]', 31.2),
+    ('Laenge Birne [cm]', 15.0), ('Laenge Skala [cm]', 13.5), ('Abstand Birne-Skala [cm]', 2.5),
+    ('Meniskuskorrektur', 0.5)])
+
+
+def _KVSKopfzeilen(ort, trockenmassen, korndichte, teilsiebung, schalter):
+    """Zeilen 0 bis 11 eines Blocks einer kvs-Datei.
+    """
+    zeilen = [ort, 'Entnahme ' + ort, '1.0 - 2.0 m', 'G, s', ' '.join([str(wert) for wert in trockenmassen]),
+        str(korndichte)]
+    if (teilsiebung is None):
+        zeilen += ['6', '0', '0']
+    else:
+        zeilen += ['5', str(teilsiebung[0]), str(teilsiebung[1])]
+
+    return zeilen + ['ohne Bedeutung', ' '.join([str(wert) for wert in ARAEOMETER.values()]),
+        schalter + '\tSiebung Schlaemmung']
+
+
+def _KVSDatei(pfad, name='boden.kvs', ort='A'):
+    """Schreibt eine kvs-Datei mit einer reinen Siebung, einer deaktivierten Koernungslinie, einer
+    Siebung mit Teilsiebung und Schlaemmung (mit MINCAD am Ende) und einer reinen Schlaemmung.
+    """
+    zeilen = ['GGU-SIEVE', 'Version 9', '']
+    zeilen += ['', '5', '6', '6'] + _KVSKopfzeilen(ort=ort, trockenmassen=[200.0, 0.0],
+        korndichte=2.65, teilsiebung=None, schalter='5 6')
+    zeilen += ['63 0 5', '20 10 5', '6.3 30 5', '2 40 5', '0.63 50 5', '0.2 99 6', '0.2 30 5',
+        '', '0.063 20 5', '0 20 5\tSchale', '', '', '', '']
+    # Deaktivierte Koernungslinie
+    zeilen += ['5', '', '6', '6'] + _KVSKopfzeilen(ort='Deaktiviert', trockenmassen=[100.0, 0.0],
+        korndichte=2.65, teilsiebung=None, schalter='5 6')
+    zeilen += ['2 0 5', '0 100 5', '', '', '', '']
+    zeilen += ['6', '6', '6'] + _KVSKopfzeilen(ort=ort + '2', trockenmassen=[500.0, 50.0],
+        korndichte=2.7, teilsiebung=(2.0, 100.0), schalter='5 5')
+    zeilen += ['20 0 5', '6.3 100 5', '4 150 5', '2 0 5', '0.63 30 5', '0.2 20 5', '0.063 20 5',
+        '0 30 5', '0 0.2 20 30', '0 0.5 20 28', '0 1 20 25', '0 2 20 22', '0 5 20 18', '0 15 20 14', '0 45 20 10',
+        '2 0 20 7', '-1 0 20 5', 'MINCAD']
+    zeilen += ['', '5', '6', '6'] + _KVSKopfzeilen(ort=ort + '3', trockenmassen=[0.0, 40.0],
+        korndichte=2.6, teilsiebung=None, schalter='6 5')
+    zeilen += ['0 1 18 20', '0 4 18 16', '1 0 19 9', '', '', '', '', 'Ende']
+
+    dateiname = str(pfad / name)
+    with open(dateiname, 'w', encoding='iso-8859-15') as ausgabe:
+        ausgabe.write('\n'.join(zeilen) + '\n')
+
+    return dateiname
+
+
+def _Schlaemmwert(zeit, temp, wert, korndichte):
+    """Korndurchmesser und korrigierter Araeometerwert nach DIN 18123 fuer einen Messwert.
+    """
+    from math import sqrt
+
+    zaehigkeit_w = 0.00178/(1.0 + 0.0337*temp + 0.00022*temp**2)
+    dichte_w = 1.0/(1.0 + ((2.31*temp - 2.0)**2 - 182.0)*1e-6)
+    hoehe = ARAEOMETER['Laenge Skala [cm]']/0.035*(0.03 - wert/1000.0) \
+        + ARAEOMETER['Abstand Birne-Skala [cm]'] + 0.5*(ARAEOMETER['Laenge Birne [cm]']
+        - ARAEOMETER['Volumen Birne [cm^3]']/ARAEOMETER['Flaeche Messzylinder [cm^2]'])
+    durchmesser = sqrt(18.35*zaehigkeit_w/(korndichte - dichte_w)*hoehe/(60.0*zeit))
+    korrigiert = wert + ARAEOMETER['Meniskuskorrektur'] + 0.0053*temp**2 - 0.0082*temp - 1.9568
+    return round(durchmesser*1e4)/1e4, korrigiert
+
+
+def test_kvs_koernungslinien(tmp_path, capsys):
+    from miniSoilLAB.rohdaten import LeseKVSDaten
+
+    dateiname = _KVSDatei(tmp_path)
+    eingelesen = LeseKVSDaten(dateiname=dateiname)['KVS']
+    assert sorted(eingelesen.keys()) == ['Dateiname', 'Sieblinie 1', 'Sieblinie 2', 'Sieblinie 3']
+    assert eingelesen['Dateiname'] == dateiname
+
+    # Reine Siebung (abgewaehlte Siebe und Text nach Tabulatoren werden ignoriert)
+    sieblinie = eingelesen['Sieblinie 1']
+    assert [sieblinie[name] for name in ['Ort', 'Entnahmestelle', 'Tiefe', 'Bodenart']] \
+        == ['A', 'Entnahme A', '1.0 - 2.0 m', 'G, s']
+    assert sieblinie['Trockenmassen [g]'] == [200.0, 0.0]
+    assert sieblinie['Korndichte [g/cm^3]'] == 2.65
+    assert sieblinie['Siebdurchmesser [mm]'] == [0.063, 0.2, 0.63, 2.0, 6.3, 20.0, 63.0]
+    assert sieblinie['Siebmassen [g]'] == [20.0, 20.0, 30.0, 50.0, 40.0, 30.0, 10.0]
+    assert sieblinie['Korndurchmesser [mm]'] == sieblinie['Siebdurchmesser [mm]']
+    assert sieblinie['Summierte Masseanteile Gesamtmenge [%]'] == [10.0, 20.0, 35.0, 60.0, 80.0,
+        95.0, 100.0]
+    assert 'Teilsiebung-Durchmesser [mm]' not in sieblinie
+    assert 'Araeometerdaten' not in sieblinie
+
+    # Siebung mit Teilsiebung unter 2 mm und Schlaemmung mit der Masse der Schale als Referenz
+    sieblinie = eingelesen['Sieblinie 2']
+    assert sieblinie['Ort'] == 'A2'
+    assert [sieblinie['Teilsiebung-Durchmesser [mm]'], sieblinie['Teilsiebung-Masse [g]']] \
+        == [2.0, 100.0]
+    assert sieblinie['Araeometerdaten'] == ARAEOMETER
+    assert sieblinie['Siebdurchmesser [mm]'] == [0.063, 0.2, 0.63, 2.0, 4.0, 6.3, 20.0]
+    assert sieblinie['Siebmassen [g]'] == [30.0, 20.0, 20.0, 30.0, 0.0, 150.0, 100.0]
+    schlaemmwerte = [(120.0, 20.0, 7.0), (45.0, 20.0, 10.0), (15.0, 20.0, 14.0), (5.0, 20.0, 18.0),
+        (2.0, 20.0, 22.0), (1.0, 20.0, 25.0), (0.5, 20.0, 28.0), (0.2, 20.0, 30.0)]
+    assert sieblinie['Schlaemmzeiten [min]'] == [zeit for zeit, _, _ in schlaemmwerte]
+    assert sieblinie['Schlaemmtemperaturen [C]'] == [temp for _, temp, _ in schlaemmwerte]
+    assert sieblinie['Schlaemmdichten [g/cm^3]'] == [wert for _, _, wert in schlaemmwerte]
+    referenz = [_Schlaemmwert(zeit=zeit, temp=temp, wert=wert, korndichte=2.7)
+        for zeit, temp, wert in schlaemmwerte]
+    assert sieblinie['Schlaemmdurchmesser [mm]'] == pytest.approx([durchmesser
+        for durchmesser, _ in referenz])
+    assert sieblinie['Schlaemmmasse-korrigiert [g]'] == pytest.approx([korrigiert
+        for _, korrigiert in referenz])
+    masseprozent = [100.0/30.0*2.7/1.7*korrigiert for _, korrigiert in referenz]
+    assert sieblinie['Schlaemm-Masseprozent [%]'] == pytest.approx(masseprozent)
+    # Nur Schlaemmwerte unterhalb des kleinsten Siebdurchmessers werden uebernommen
+    num_schlaemm = len([durchmesser for durchmesser, _ in referenz if (durchmesser <= 0.063)])
+    assert 0 < num_schlaemm < len(referenz)
+    assert sieblinie['Korndurchmesser [mm]'] == sieblinie['Schlaemmdurchmesser [mm]'][:num_schlaemm] \
+        + sieblinie['Siebdurchmesser [mm]']
+    assert sieblinie['Summierte Masseanteile Gesamtmenge [%]'] == pytest.approx([30.0/500.0*masse
+        for masse in masseprozent[:num_schlaemm]] + [15.0, 25.0, 35.0, 50.0, 50.0, 80.0, 100.0])
+
+    # Reine Schlaemmung mit eigener Trockenmasse
+    sieblinie = eingelesen['Sieblinie 3']
+    assert sieblinie['Ort'] == 'A3'
+    assert 'Siebdurchmesser [mm]' not in sieblinie
+    referenz = [_Schlaemmwert(zeit=zeit, temp=temp, wert=wert, korndichte=2.6)
+        for zeit, temp, wert in [(60.0, 19.0, 9.0), (4.0, 18.0, 16.0), (1.0, 18.0, 20.0)]]
+    masseprozent = [100.0/40.0*2.6/1.6*korrigiert for _, korrigiert in referenz]
+    assert sieblinie['Korndurchmesser [mm]'] == pytest.approx([durchmesser
+        for durchmesser, _ in referenz])
+    assert sieblinie['Summierte Masseanteile Gesamtmenge [%]'] == pytest.approx([100.0*masse/masseprozent[-1]
+        for masse in masseprozent])
+    assert 'Warnung' not in capsys.readouterr().out
+
+
+def test_kvs_dateien_parallel_wie_sequentiell(tmp_path):
+    from miniSoilLAB.rohdaten import LeseKVSDaten, LeseKVSDateien
+
+    dateinamen = [_KVSDatei(tmp_path, name='boden_' + ort + '.kvs', ort=ort) for ort in 'ABCDE']
+    sequentiell = [LeseKVSDaten(dateiname=dateiname) for dateiname in dateinamen]
+    assert [daten['KVS']['Sieblinie 1']['Ort'] for daten in sequentiell] == list('ABCDE')
+    assert LeseKVSDateien(dateinamen=dateinamen) == sequentiell
+    assert LeseKVSDateien(dateinamen=dateinamen, prozesse=2) == sequentiell
+    assert LeseKVSDateien(dateinamen=dateinamen[:1], prozesse=None) == sequentiell[:1]
+    assert LeseKVSDateien(dateinamen=[], prozesse=2) == []
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+
+def test_rohdatenspalten_aus_vorlage():
+    from miniSoilLAB.rohdatenverarbeitung import _RohdatenSpalten, _Spaltenauswahl
+
+    vorlage = {
+        'Tabelle': {
+            'Datum': ['B3'],
+            'Hoehe [mm]': ['B16:D16', [5.0, 500.0]]
+        },
+        'Versuch': {
+            'Oedo-locker': {
+                '[Gruppe]': {
+                    'Datum': ['Datum/zeit'],
+                    'Uhrzeit': ['Datum/zeit'],
+                    'Kraft [kN]': ['Kraft[kN]', [0.0, 5000.0], 'min_schnitt']
+                },
+                'Masse [g]': ['B14', [10.0, 1000.0]]
+            }
+        }
+    }
+    rohdatenspalten = _RohdatenSpalten(vorlage=vorlage)
+    assert rohdatenspalten == dict([('Datum', 'Datum/zeit'), ('Uhrzeit', 'Datum/zeit'),
+        ('Kraft [kN]', 'Kraft[kN]')])
+    assert _Spaltenauswahl(rohdatenspalten=rohdatenspalten) == ['Datum/zeit', 'Kraft[kN]']
+
+
+def test_bloecke_in_messreihen_sammeln():
+    from array import array
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB.rohdatenverarbeitung import _BloeckeSammeln
+
+    bloecke = (dict([('Kraft[kN]', array('d', [float(idx), float(idx+1)])),
+        ('Datum/zeit', ['01.01.2020 10:00', '01.01.2020 10:01'])]) for idx in range(3))
+    messdaten = _BloeckeSammeln(bloecke=bloecke, spaltenauswahl=['Datum/zeit', 'Kraft[kN]', 'Weg[mm]'])
+    assert isinstance(messdaten['Kraft[kN]'], Messreihe)
+    assert messdaten['Kraft[kN]'] == [0.0, 1.0, 1.0, 2.0, 2.0, 3.0]
+    assert type(messdaten['Datum/zeit']) is list and (len(messdaten['Datum/zeit']) == 6)
+    assert messdaten['Weg[mm]'] == []
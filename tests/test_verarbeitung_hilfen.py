@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+# Zeitspalten mit passender formatliste (Zeitwerte als Strings oder Excel-Zeitwerte)
+ZEITSPALTEN = [
+    (['2021-02-01 10:00:00', '2021-02-01 10:00:30', '2021-02-02 00:05:07'], ['%Y-%m-%d %H:%M:%S']),
+    (['01.02.2021 10:00:00', '2021-02-01 10:05:00', '01.02.2021 11:00:00'],
+        ['%d.%m.%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S']),
+    # Zweistellige Jahre (bis 68 im 21. Jahrhundert, ab 69 im 20. Jahrhundert)
+    (['01.02.21 10:00', '31.12.68 23:59', '01.01.69 00:00', '29.02.00 12:30'], ['%d.%m.%y %H:%M']),
+    # Tage und Stunden ohne fuehrende Null bzw. mit Leerzeichen und mehrere Leerzeichen als Trenner
+    ([' 1.02.2021 9:05:03', '1.2.2021  10:00:00', '11.02.2021 9:5:3'], ['%d.%m.%Y %H:%M:%S']),
+    (['2021-02-01t10:00:00', '2021-02-01T10:00:01'], ['%Y-%m-%dT%H:%M:%S']),
+    (['01-Feb-2021', '03-mar-2021'], ['%d-%b-%Y']),
+    (['20210201', '20210301'], ['%Y%m%d']),
+    (['44228.5', '44228.75', 44229.0], ['%d.%m.%Y']),
+    (['2021-02-01 10:00:00.250', '2021-02-01 10:00:01.750'], ['%Y-%m-%d %H:%M:%S']),
+    # Ein Eintrag ausserhalb der Stichprobe in einem anderen Format
+    (['01.02.2021 10:00:' + str(idx).zfill(2) for idx in range(30)][:13] + ['2021-02-01 10:01:00']
+        + ['01.02.2021 10:02:' + str(idx).zfill(2) for idx in range(16)], ['%d.%m.%Y %H:%M:%S',
+        '%Y-%m-%d %H:%M:%S']),
+    # Nicht umwandelbare Eintraege
+    (['31.02.2021', '01.02.2021'], ['%d.%m.%Y']),
+    (['01.02.2021 24:00:00'], ['%d.%m.%Y %H:%M:%S']),
+    (['01.02.2021', 'unbekannt'], ['%d.%m.%Y']),
+    ([], ['%d.%m.%Y']),
+]
+
+
+def _BisherigeUmwandlung(daten, formatliste, abschneiden=False):
+    """Bisherige Umwandlung jedes einzelnen Eintrags (zuerst als Excel-Zeitwert, dann mit strptime
+    und jedem Format aus formatliste) als Referenz.
+    """
+    startdatum = datetime.datetime(year=1899, month=12, day=30)
+    zeitpunkte = []
+    for wert in daten:
+        zeitpunkt = None
+        try:
+            zeitpunkt = startdatum + datetime.timedelta(days=float(wert))
+        except Exception:
+            for zeitformat in formatliste:
+                try:
+                    zeitpunkt = datetime.datetime.strptime(wert.split('.')[0] if abschneiden else wert,
+                        zeitformat)
+                    break
+                except Exception:
+                    pass
+
+        if (zeitpunkt is None):
+            return None
+
+        zeitpunkte += [zeitpunkt]
+
+    return zeitpunkte
+
+
+def test_annaehernd_null():
+    from miniSoilLAB.verarbeitung_hilfen import AnnaeherndNull
+
+    assert not AnnaeherndNull(werte=[], tol=1e-6)
+    assert not AnnaeherndNull(werte=[1.0, 2.0], tol=1e-6)
+    assert not AnnaeherndNull(werte=[-2.0, -1.0], tol=1e-6)
+    assert not AnnaeherndNull(werte=[-1.0, 1.0], tol=1e-6)
+    assert AnnaeherndNull(werte=[-1.0, 1e-8, 1.0], tol=1e-6)
+    assert AnnaeherndNull(werte=[-1e-7], tol=1e-6)
+
+
+def test_annaehernd_null_mit_bezugswert():
+    from miniSoilLAB.verarbeitung_hilfen import AnnaeherndNull
+
+    # Setzungen [mm] gegenueber der Anfangshoehe einer Oedometerprobe
+    anfangshoehe = 20.0
+    assert not AnnaeherndNull(werte=[0.0, 0.5, 1.2], tol=1e-6, bezugswert=anfangshoehe)
+    assert not AnnaeherndNull(werte=[19.0, 21.0], tol=1e-6, bezugswert=anfangshoehe)
+    assert not AnnaeherndNull(werte=[20.5, 21.0], tol=1e-6, bezugswert=anfangshoehe)
+    assert AnnaeherndNull(werte=[0.0, 19.9999999, 1.2], tol=1e-6, bezugswert=anfangshoehe)
+    assert AnnaeherndNull(werte=[20.0], tol=1e-6, bezugswert=anfangshoehe)
+
+
+@pytest.mark.parametrize('abschneiden', [False, True])
+@pytest.mark.parametrize('daten, formatliste', ZEITSPALTEN)
+def test_zeitspalte_wie_einzelne_umwandlung(daten, formatliste, abschneiden):
+    from miniSoilLAB.verarbeitung_hilfen import ZeitspalteUmwandeln
+
+    assert ZeitspalteUmwandeln(daten=daten, formatliste=formatliste, abschneiden=abschneiden) \
+        == _BisherigeUmwandlung(daten=daten, formatliste=formatliste, abschneiden=abschneiden)
+
+
+@pytest.mark.parametrize('daten, formatliste', ZEITSPALTEN)
+def test_sekunden_aus_datumsangaben_wie_einzelne_umwandlung(capsys, daten, formatliste):
+    from miniSoilLAB.verarbeitung_hilfen import SekundenAusDatumsangabenExtrahieren
+
+    referenz = _BisherigeUmwandlung(daten=daten, formatliste=formatliste, abschneiden=True)
+    sekunden = SekundenAusDatumsangabenExtrahieren(daten=daten, formatliste=formatliste)
+    if (referenz is None):
+        assert sekunden is None
+        assert 'Konnte nicht alle Zeitstempel konvertieren' in capsys.readouterr().out
+    else:
+        assert sekunden == [(zeitpunkt - referenz[0]).total_seconds() for zeitpunkt in referenz]
+
+
+def test_zeitformat_nur_einmal_ermitteln(monkeypatch):
+    from miniSoilLAB import verarbeitung_hilfen
+
+    einzeln = []
+    umwandeln = verarbeitung_hilfen._ZeitwertEinzelnUmwandeln
+
+    def _ZeitwertEinzelnUmwandeln(wert, formatliste=[], abschneiden=False):
+        einzeln.append(wert)
+        return umwandeln(wert=wert, formatliste=formatliste, abschneiden=abschneiden)
+
+    monkeypatch.setattr(verarbeitung_hilfen, '_ZeitwertEinzelnUmwandeln', _ZeitwertEinzelnUmwandeln)
+    formatliste = ['%d.%m.%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S']
+    daten = ['2021-02-01 10:00:' + str(idx).zfill(2) for idx in range(40)]
+    assert verarbeitung_hilfen.ZeitformatErmitteln(daten=daten, formatliste=formatliste) \
+        == '%Y-%m-%d %H:%M:%S'
+    assert verarbeitung_hilfen.ZeitspalteUmwandeln(daten=daten, formatliste=formatliste) \
+        == _BisherigeUmwandlung(daten=daten, formatliste=formatliste)
+    assert einzeln == []
+
+    # Nur bei unterschiedlichen Formaten (hier ausserhalb der Stichprobe) wird jeder Eintrag einzeln
+    # umgewandelt
+    daten[21] = '01.02.2021 10:00:21'
+    assert verarbeitung_hilfen.ZeitformatErmitteln(daten=daten, formatliste=formatliste) \
+        == '%Y-%m-%d %H:%M:%S'
+    assert verarbeitung_hilfen.ZeitspalteUmwandeln(daten=daten, formatliste=formatliste) \
+        == _BisherigeUmwandlung(daten=daten, formatliste=formatliste)
+    assert einzeln == daten
+
+
+def test_zeitspalte_unabhaengig_von_vorherigen_spalten():
+    from miniSoilLAB.verarbeitung_hilfen import ZeitspalteUmwandeln
+
+    formatliste = ['%d.%m.%Y', '%m.%d.%Y']
+    mehrdeutig = ['01.02.2021', '03.02.2021']
+    referenz = ZeitspalteUmwandeln(daten=mehrdeutig, formatliste=formatliste)
+    assert referenz == [datetime.datetime(2021, 2, 1), datetime.datetime(2021, 2, 3)]
+    # Eine vorher umgewandelte Spalte, die nur zum zweiten Format passt, aendert nichts
+    assert ZeitspalteUmwandeln(daten=['12.31.2021'], formatliste=formatliste) \
+        == [datetime.datetime(2021, 12, 31)]
+    assert ZeitspalteUmwandeln(daten=mehrdeutig, formatliste=formatliste) == referenz
+
+    # Innerhalb einer Spalte wird das Format verwendet, das zu allen Eintraegen der Stichprobe passt,
+    # waehrend bei der einzelnen Umwandlung mehrdeutige Eintraege das erste Format verwenden
+    formatliste = ['%m.%d.%Y', '%d.%m.%Y']
+    daten = ['01.02.2021', '13.02.2021']
+    assert ZeitspalteUmwandeln(daten=daten, formatliste=formatliste) \
+        == [datetime.datetime(2021, 2, 1), datetime.datetime(2021, 2, 13)]
+    assert _BisherigeUmwandlung(daten=daten, formatliste=formatliste) \
+        == [datetime.datetime(2021, 1, 2), datetime.datetime(2021, 2, 13)]
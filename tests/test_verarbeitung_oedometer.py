@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from math import log
+
+import pytest
+
+from conftest import beispieldatei
+
+SETZUNG = [0.012*idx + 0.0005*(idx % 7) for idx in range(400)]
+SPANNUNG = [3.5 + 1.25*idx for idx in range(400)]
+
+
+def _SpaltenPruefen(ergebnis, referenz):
+    from miniSoilLAB.datenstruktur import Messreihe
+
+    assert sorted(ergebnis.keys()) == sorted(referenz.keys())
+    for schluessel, verlauf in referenz.items():
+        assert isinstance(ergebnis[schluessel], Messreihe)
+        assert ergebnis[schluessel] == verlauf
+
+
+def _Eintraege(daten, pfad=()):
+    for schluessel, wert in daten.items():
+        if (isinstance(wert, dict)):
+            yield from _Eintraege(daten=wert, pfad=pfad + (schluessel,))
+        else:
+            yield pfad + (schluessel,), wert
+
+
+def test_spannung_wie_listenimplementierung():
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB.verarbeitung_oedometer import SpannungAusKraft, SpannungMitOffset
+
+    spannung = SpannungAusKraft(kraft=SPANNUNG, druckflaeche=0.00312)['Spannung [kN/m^2]']
+    assert isinstance(spannung, Messreihe)
+    assert spannung == [einzelkraft/0.00312 for einzelkraft in SPANNUNG]
+
+    spannung = SpannungMitOffset(spannung=Messreihe(SPANNUNG), spannungsoffset=2.7)['Spannung [kN/m^2]']
+    assert isinstance(spannung, Messreihe)
+    assert spannung == [2.7+tmp_spannung for tmp_spannung in SPANNUNG]
+
+
+def test_verformungen_wie_listenimplementierung():
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB.verarbeitung_oedometer import OedoVerformungen, OedoSteifemodul, CRSVerformungen
+    from miniSoilLAB.verarbeitung_oedometer import CRSViskoVerformungen, CRLVerformungen
+
+    anfangshoehe = 19.8
+    porenzahl_anfang = 0.62
+    setzung = SETZUNG
+    referenz = {
+        'Porenzahl [-]': [(anfangshoehe - (tempsetzung-setzung[0]))/anfangshoehe * (porenzahl_anfang + 1.0)
+            - 1.0 for tempsetzung in setzung],
+        'Dehnung-axial [-]': [log(anfangshoehe/(anfangshoehe - tempsetzung)) for tempsetzung in setzung]}
+    _SpaltenPruefen(ergebnis=OedoVerformungen(setzung=setzung, anfangshoehe=anfangshoehe,
+        porenzahl_anfang=porenzahl_anfang), referenz=referenz)
+
+    referenz = {'Steifemodul [kN/m^2]': [(tempspannung + 4.1) / 0.03/1000.0 for tempspannung in SPANNUNG]}
+    _SpaltenPruefen(ergebnis=OedoSteifemodul(spannung=SPANNUNG, a=0.03, b=4.1), referenz=referenz)
+
+    referenz = {
+        'Stauchung [%]': [100.0*(temp_setzung - setzung[0])/anfangshoehe for temp_setzung in setzung],
+        'Porenzahl [-]': [(anfangshoehe - (tempsetzung-setzung[0]))/anfangshoehe * (porenzahl_anfang + 1.0)
+            - 1.0 for tempsetzung in setzung]}
+    _SpaltenPruefen(ergebnis=CRSVerformungen(setzung=Messreihe(setzung), anfangshoehe=anfangshoehe,
+        porenzahl_anfang=porenzahl_anfang), referenz=referenz)
+
+    referenz = {'Porenzahl [-]': [porenzahl_anfang - (1.0 + porenzahl_anfang)*einzelsetzung/anfangshoehe
+        for einzelsetzung in setzung]}
+    _SpaltenPruefen(ergebnis=CRSViskoVerformungen(setzung=setzung, anfangshoehe=anfangshoehe,
+        porenzahl_anfang=porenzahl_anfang), referenz=referenz)
+
+    hoehe = [anfangshoehe - setz for setz in setzung]
+    referenz = {
+        'Hoehe [mm]': hoehe,
+        'Porenzahl [-]': [einzelhoehe/12.2 - 1.0 for einzelhoehe in hoehe],
+        'Setzung-spez [%]': [100.0*(setz - setzung[0])/(max(setzung) - setzung[0]) for setz in setzung]}
+    _SpaltenPruefen(ergebnis=CRLVerformungen(setzung=setzung, anfangshoehe=anfangshoehe, hs=12.2,
+        tol=1e-6), referenz=referenz)
+
+    # Ohne Setzung wird keine spezifische Setzung bestimmt
+    ergebnis = CRLVerformungen(setzung=[0.3]*10, anfangshoehe=anfangshoehe, hs=12.2, tol=1e-6)
+    assert list(ergebnis.keys()) == ['Hoehe [mm]', 'Porenzahl [-]']
+
+
+@pytest.mark.parametrize('dateiname, versuchsart, spalten', [
+    ('Oedo-dicht_01.xlsx', 'Oedo', ['Porenzahl [-]', 'Dehnung-axial [-]', 'Steifemodul [kN/m^2]']),
+    ('Oedo-CRS_01.xlsx', 'Oedo-CRS', ['Stauchung [%]', 'Porenzahl [-]']),
+    ('Oedo-CRL_01.xlsx', 'Oedo-CRL', ['Hoehe [mm]', 'Porenzahl [-]'])])
+def test_berechnete_verlaeufe_als_messreihe(dateiname, versuchsart, spalten):
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen
+    from miniSoilLAB.datenstruktur import Messreihe
+
+    dateiliste = [beispieldatei(dateiname=dateiname) for dateiname in ['Korndichte_01.xlsx',
+        'LoDi_01.xlsx', dateiname]]
+    versuch = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=dateiliste)['B'][versuchsart]
+    gefunden = []
+    for pfad, wert in _Eintraege(daten=versuch):
+        if ((pfad[-1] in spalten) and isinstance(wert, (list, Messreihe))
+            and not any([schluessel.startswith('_Ref_') for schluessel in pfad])):
+            assert isinstance(wert, Messreihe)
+            gefunden += [pfad[-1]]
+
+    assert sorted(set(gefunden)) == sorted(spalten)
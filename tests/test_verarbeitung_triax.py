@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+import copy
+from math import asin, pi
+
+import pytest
+
+from conftest import beispieldatei
+
+
+def _ListenkernTriax(triax, typ, hoehe_k, volumen_k, trockenmasse_e=None, korndichte=None):
+    """Bisherige, indexbasierte Berechnung der Verlaeufe eines Triax-D/-CU-Versuchs als Referenz.
+    """
+    from miniSoilLAB.konstanten import grad2rad
+
+    radialdruck = triax['Radialdruck [kN/m^2]']
+    porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
+    axialkraft = triax['Axialkraft [kN]']
+    stauchung = triax['Stauchung [mm]']
+
+    numdaten = len(stauchung)
+    ergebnis = dict()
+    kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
+    dehnung = [100.0*(einzel_stauchung-stauchung[0])/hoehe_k for einzel_stauchung in stauchung]
+    if (typ == 'Triax-D'):
+        porenwasservolumen = triax['Porenwasservolumen [mm^3]']
+        delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
+        flaeche = [1000.0*(volumen_k+delta_volumen[idx])/(hoehe_k-stauchung[idx]) for idx in range(numdaten)]
+        ergebnis['delta V/V_0 [%]'] = [100.0*delta_volumen[idx]/(volumen_k) for idx in range(numdaten)]
+    else:
+        flaeche = [1000.0*(volumen_k)/(hoehe_k-stauchung[idx]) for idx in range(numdaten)]
+
+    sig1sig3diff = [1e6*kraft[idx]/flaeche[idx]/2.0 for idx in range(numdaten)]
+    sigma1prime = [(2.0*sig1sig3diff[idx] + radialdruck[idx]) - porenwasserdruck[idx] for idx in range(numdaten)]
+    sigma3prime = [radialdruck[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
+    if (typ == 'Triax-CU'):
+        ergebnis['sig1_prime/sig3_prime [-]'] = [sigma1prime[idx]/sigma3prime[idx] for idx in range(numdaten)]
+        ergebnis['Porenwasserdruck-Delta [kN/m^2]'] = [porendruck - porenwasserdruck[0] for porendruck in porenwasserdruck]
+    else:
+        ergebnis['Porenzahl [-]'] = [korndichte/(trockenmasse_e/(volumen_k+delta_volumen[idx]))-1.0 for idx in range(numdaten)]
+
+    ergebnis['(sig_1 - sig_3)/2.0 [kN/m^2]'] = sig1sig3diff
+    ergebnis['(sig_1prime + sig_3prime)/2.0 [kN/m^2]'] = [(sigma1prime[idx] + sigma3prime[idx])/2.0 for idx in range(numdaten)]
+    ergebnis['Reibungswinkel [Grad]'] = [asin((sigma1prime[idx]-sigma3prime[idx])/(sigma1prime[idx]+sigma3prime[idx]))/grad2rad for idx in range(numdaten)]
+    ergebnis['Dehnung [%]'] = dehnung
+    return ergebnis
+
+
+def _ListenkernTriaxpq(triax, hoehe_k, volumen_k):
+    """Bisherige, indexbasierte Berechnung der Verlaeufe eines Triax-p-q-Versuchs als Referenz.
+    """
+    porenwasservolumen = triax['Porenwasservolumen [mm^3]']
+    radialdruck = triax['Radialdruck [kN/m^2]']
+    porenwasserdruck = triax['Porenwasserdruck [kN/m^2]']
+    axialkraft = triax['Axialkraft [kN]']
+    stauchung = triax['Stauchung [mm]']
+
+    numdaten = len(triax['Stage'])
+    kraft = [einzel_axialkraft-axialkraft[0] for einzel_axialkraft in axialkraft]
+    dehnung = [(einzel_stauchung-stauchung[0])/hoehe_k for einzel_stauchung in stauchung]
+    delta_volumen = [(vol-porenwasservolumen[0])/1000.0 for vol in porenwasservolumen]
+    flaeche = [1000.0*(volumen_k+delta_volumen[idx])/(hoehe_k-stauchung[idx]) for idx in range(numdaten)]
+    sig1sig3diff = [1e6*kraft[idx]/flaeche[idx]/2.0 for idx in range(numdaten)]
+    sigma1 = [2.0*sig1sig3diff[idx] + radialdruck[idx] for idx in range(numdaten)]
+    sigma1prime = [sigma1[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
+    sigma3prime = [radialdruck[idx] - porenwasserdruck[idx] for idx in range(numdaten)]
+    return dict([('Dehnung [-]', dehnung),
+        ('Hauptspannungsdifferenz [kN/m^2]', [sigma1[idx] - radialdruck[idx] for idx in range(numdaten)]),
+        ('Druck-isotrop-eff [kN/m^2]', [(sigma1prime[idx] + 2.0*sigma3prime[idx])/3.0 for idx in range(numdaten)])])
+
+
+@pytest.fixture(scope='module')
+def boden():
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen
+
+    dateiliste = [beispieldatei(dateiname=dateiname) for dateiname in ['Korndichte_01.xlsx',
+        'LoDi_01.xlsx', 'Triax-D-dicht_01.xlsx', 'Triax-p-q_01.xlsx']]
+    return BodendatenDateilisteEinlesen(bodenname='B', dateiliste=dateiliste)['B']
+
+
+def test_triax_d_wie_listenimplementierung(boden):
+    triax_d = boden['Triax-D']['Triax-D-dicht']
+    konsolidation = triax_d['3-Konsolidation']
+    for idx_versuch in range(3):
+        versuch = triax_d['Versuch ' + str(idx_versuch+1)]
+        referenz = _ListenkernTriax(triax=versuch, typ='Triax-D',
+            hoehe_k=konsolidation['Hoehe [mm]'][idx_versuch],
+            volumen_k=konsolidation['Volumen [cm^3]'][idx_versuch],
+            trockenmasse_e=triax_d['1-Probenherstellung']['Trockenmasse [g]'][idx_versuch],
+            korndichte=boden['Korndichte']['Korndichte [g/cm^3]'])
+        for schluessel, verlauf in referenz.items():
+            assert versuch[schluessel] == verlauf
+
+
+def test_triax_cu_wie_listenimplementierung():
+    from miniSoilLAB.datenstruktur import Datenstruktur, Messreihe
+    from miniSoilLAB.xlshilfen import LeseXLSDaten
+    from miniSoilLAB.verarbeitung_triax import _TriaxVersuchAuswerten
+
+    # Das Beispiel wird nur eingelesen (ohne 5-Abscheren ist es nicht vollstaendig auswertbar), die
+    # Eingaben des Versuchs werden wie in der Vorbereitung aus den Messdaten gebildet
+    triax_cu = LeseXLSDaten(dateiname=beispieldatei(dateiname='Triax-CU_01.xlsx'),
+        verarbeitet=False)['Triax-CU']
+    herstellung = triax_cu['1-Probenherstellung']
+    for idx_versuch in range(3):
+        versuch = triax_cu['Versuch ' + str(idx_versuch+1)]
+        triax = Datenstruktur([(schluessel, copy.deepcopy(versuch[schluessel])) for schluessel in [
+            'Porenwasserdruck [kN/m^2]', 'Radialdruck [kN/m^2]', 'Stauchung [mm]']])
+        triax.update([('Axialkraft [kN]', Messreihe([kraft/1000.0 for kraft in versuch['Axialkraft [N]']]))])
+        triax.update([('Zeit [s]', Messreihe([31.0*idx for idx in range(len(triax['Stauchung [mm]']))]))])
+        hoehe_k = herstellung['Hoehe [mm]'][idx_versuch] - triax_cu['3-Konsolidation']['Delta Hoehe [mm]'][idx_versuch]
+        volumen_k = hoehe_k/10.0*pi*(herstellung['Durchmesser [mm]'][idx_versuch]/20.0)**2
+
+        referenz = _ListenkernTriax(triax=triax, typ='Triax-CU', hoehe_k=hoehe_k, volumen_k=volumen_k)
+        triax, peakspannungen = _TriaxVersuchAuswerten(triax=triax, typ='Triax-CU', hoehe_k=hoehe_k,
+            volumen_k=volumen_k)
+        assert peakspannungen is not None
+        for schluessel, verlauf in referenz.items():
+            assert triax[schluessel] == verlauf
+
+        idx_peak = referenz['sig1_prime/sig3_prime [-]'].index(max(referenz['sig1_prime/sig3_prime [-]']))
+        assert triax['Peakzustand']['Index'] == idx_peak
+
+
+def test_triax_pq_wie_listenimplementierung(boden):
+    triax_pq = boden['Triax-p-q']
+    konsolidation = triax_pq['3-Konsolidation']
+    for idx_versuch in range(3):
+        versuch = triax_pq['Versuch ' + str(idx_versuch+1)]
+        referenz = _ListenkernTriaxpq(triax=versuch, hoehe_k=konsolidation['Hoehe [mm]'][idx_versuch],
+            volumen_k=konsolidation['Volumen [cm^3]'][idx_versuch])
+        for schluessel, verlauf in referenz.items():
+            assert versuch[schluessel] == verlauf
+
+
+def _VierterVersuch(daten):
+    """Ergaenzt daten um einen vierten Versuch als Kopie des ersten (auch in allen Tabellenwerten).
+    """
+    for schluessel, wert in list(daten.items()):
+        if (schluessel.startswith('Versuch ')):
+            continue
+
+        if (isinstance(wert, dict)):
+            _VierterVersuch(daten=wert)
+        elif (isinstance(wert, list) and (len(wert) == 3)):
+            daten.update([(schluessel, wert + wert[:1])])
+
+    if ('Versuch 1' in daten):
+        daten.update([('Versuch 4', copy.deepcopy(daten['Versuch 1']))])
+
+
+@pytest.mark.parametrize('triax_art, dateien', [
+    ('Triax-D', ['Korndichte_01.xlsx', 'LoDi_01.xlsx', 'Triax-D-dicht_01.xlsx']),
+    ('Triax-CU', ['Korndichte_01.xlsx', 'Atterberg_01.xlsx', 'Triax-CU_01.xlsx']),
+    ('Triax-p-q', ['Korndichte_01.xlsx', 'LoDi_01.xlsx', 'Triax-p-q_01.xlsx'])])
+def test_triax_mit_vier_versuchen(triax_art, dateien):
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen
+    from miniSoilLAB.kennwerte import Kennwertberechnungen, Vorbereitung
+
+    boden = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=[beispieldatei(dateiname=dateiname)
+        for dateiname in dateien], verarbeitet=False)['B']
+    rohdaten = boden[triax_art]['_Ref_001']
+    if (triax_art == 'Triax-CU'):
+        # Die Beispiele fuer Atterberg und Triax-CU sind ohne diese Ergaenzungen nicht auswertbar
+        atterberg = boden['Atterberg']['_Ref_001']
+        atterberg.update([('Ueberkornanteil > 0,4mm [%]', atterberg.pop('Ueberkornanteil [%]'))])
+        rohdaten.update([('5-Abscheren', dict([(schluessel, rohdaten[schluessel]) for schluessel in [
+            'Trockenmasse mit Behaelter [g]', 'Behaeltermasse [g]']]))])
+        for idx_versuch in range(3):
+            versuch = rohdaten['Versuch ' + str(idx_versuch+1)]
+            versuch.update([('Zeit [s]', Messreihe([31.0*idx for idx in range(len(versuch['Stauchung [mm]']))]))])
+
+    _VierterVersuch(daten=rohdaten)
+    Vorbereitung(daten=rohdaten, vorlage=triax_art)
+    assert Kennwertberechnungen(daten=boden)
+
+    triax = boden[triax_art]
+    if (triax_art == 'Triax-D'):
+        triax = triax['Triax-D-dicht']
+
+    assert [schluessel for schluessel in triax.keys() if schluessel.startswith('Versuch ')] == [
+        'Versuch 1', 'Versuch 2', 'Versuch 3', 'Versuch 4']
+    assert triax['Versuch 4'] == triax['Versuch 1']
+    if (triax_art == 'Triax-p-q'):
+        assert 'eps_som [-]' in triax['Parameter']
+    else:
+        for schluessel in ['Sigma_1 [kN/m^2]', 'Sigma_3 [kN/m^2]']:
+            spannungen = triax['Mohr-Coulomb'][schluessel]
+            assert len(spannungen) == 4
+            assert spannungen[3] == spannungen[0]
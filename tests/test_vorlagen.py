@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+import copy
+import os
+import pickle
+
+import pytest
+
+from conftest import beispieldatei, beispielordner
+
+VORLAGE = {
+    'Tabelle': {
+        '[Checks]': {'Titel': ['A1', 'Versuch']},
+        'Datum': ['B3'],
+        '1-Probenherstellung': {
+            'Hoehe [mm]': ['B16:D16', [5.0, 500.0]]
+        }
+    },
+    'Versuch01': {
+        'Versuch 1': {
+            '[Einzelversuch1]': {
+                'Uhrzeit': ['A10'],
+                'Zeit [s]': ['B10:B20', [0.0, 1.21e6]],
+                'Stauchung [mm]': ['C10:C20', [0.0, 500.0], 'min_schnitt']
+            }
+        }
+    }
+}
+
+
+def _BisherigesGeruest(vorlage, ebene=0):
+    """Bisheriges Geruest aus VorlagenstrukturZuDatenstruktur als Referenz.
+    """
+    geruest = dict()
+    for schluessel, eintrag in vorlage.items():
+        if (isinstance(eintrag, dict)):
+            if (schluessel == '[Checks]'):
+                continue
+            elif ((schluessel.startswith('[')) or (ebene == 0)):
+                geruest.update(_BisherigesGeruest(vorlage=eintrag, ebene=ebene+1))
+            else:
+                geruest.update([(schluessel, _BisherigesGeruest(vorlage=eintrag, ebene=ebene+1))])
+        elif (len(eintrag) == 1):
+            geruest.update([(schluessel, '')])
+        else:
+            geruest.update([(schluessel, [])])
+
+    return geruest
+
+
+def _BisherigesPruefen(muster, workbook, tabellentyp):
+    """Bisherige Pruefung aus VorlagenMuster.Pruefen (jede Vorlage einzeln und Abbruch bei der
+    ersten passenden Vorlage) als Referenz. Gibt die passende Vorlage und die Gruende fuer alle
+    bis dahin verworfenen Vorlagen zurueck.
+    """
+    from miniSoilLAB.xlshilfen import VorhandeneTabellenseiten, EinzelEintragEinlesen
+    from miniSoilLAB.xlshilfen import ZeileUndSpalteAusZellenbezeichnung
+
+    gruende = dict()
+    tabellenseiten = VorhandeneTabellenseiten(workbook=workbook, tabellentyp=tabellentyp)
+    for schluessel in muster.Schluessel():
+        grund = ''
+        ueberpruefungen = muster.Checks(schluessel=schluessel)
+        for seite in ueberpruefungen.keys():
+            if (seite not in tabellenseiten):
+                grund = 'Tabellenseite \'' + seite + '\' nicht vorhanden'
+                break
+
+            for pruefzelle in ueberpruefungen[seite].keys():
+                sollwert = ueberpruefungen[seite][pruefzelle]
+                zeile, spalte = ZeileUndSpalteAusZellenbezeichnung(zellenname=pruefzelle)
+                eintrag = EinzelEintragEinlesen(workbook=workbook, tabellenname=seite, zeile=zeile,
+                    spalte=spalte, name='_temp-' + seite + '-' + pruefzelle, tabellentyp=tabellentyp,
+                    inhalt='text', warnen=False)
+                if (eintrag is None):
+                    if (sollwert == ''):
+                        continue
+
+                    grund = 'Eintrag None != \'' + sollwert + '\''
+                    break
+
+                if (eintrag != sollwert):
+                    grund = 'Eintrag \'' + eintrag + '\' != \'' + sollwert + '\''
+                    break
+
+            if (grund != ''):
+                break
+
+        if (grund == ''):
+            return schluessel, gruende
+
+        gruende.update([(schluessel, grund)])
+
+    return None, gruende
+
+
+def test_vorlagenklasse_mit_messreihe_feldern():
+    from miniSoilLAB.datenstruktur import Datenstruktur, Messreihe, Vorlagenstruktur
+    from miniSoilLAB.vorlagen import Vorlagenklasse, VorlagenstrukturZuDatenstruktur
+
+    klasse = Vorlagenklasse(vorlage=VORLAGE, name='Beispiel')
+    assert issubclass(klasse, Vorlagenstruktur)
+    assert dict(klasse.felder)['Datum'] is str
+    assert dict(klasse.felder)['1-Probenherstellung'].feldarten == dict([('Hoehe [mm]', list)])
+    versuchsfelder = dict(klasse.felder)['Versuch 1'].feldarten
+    assert versuchsfelder == dict([('Uhrzeit', str), ('Zeit [s]', Messreihe),
+        ('Stauchung [mm]', Messreihe)])
+
+    geruest = VorlagenstrukturZuDatenstruktur(vorlage=VORLAGE)
+    assert geruest == _BisherigesGeruest(vorlage=VORLAGE)
+    assert isinstance(geruest, Datenstruktur) and not hasattr(geruest, '__dict__')
+    assert isinstance(geruest['Versuch 1']['Zeit [s]'], Messreihe)
+    assert type(geruest['1-Probenherstellung']['Hoehe [mm]']) is list
+
+
+def test_vorlagenstruktur_wie_dict():
+    from miniSoilLAB.datenstruktur import Datenstruktur, Messreihe
+    from miniSoilLAB.vorlagen import Vorlagenklasse
+
+    klasse = Vorlagenklasse(vorlage=VORLAGE, name='Beispiel')
+    daten = klasse(daten=[('Versuch 1', dict([('Zeit [s]', [0.0, 1.5]), ('Extra', [1.0])]))],
+        geruest=False)
+    assert list(daten.keys()) == ['Versuch 1']
+    versuch = daten['Versuch 1']
+    assert isinstance(versuch, dict(klasse.felder)['Versuch 1'])
+    # Nur Listen aus Gleitkommazahlen in Messreihe-Feldern werden zur Messreihe
+    assert isinstance(versuch['Zeit [s]'], Messreihe) and (versuch['Zeit [s]'] == [0.0, 1.5])
+    assert type(versuch['Extra']) is list
+    versuch['Stauchung [mm]'] = [0.1, None]
+    assert type(versuch['Stauchung [mm]']) is list
+    versuch.update([('Stauchung [mm]', [0.1, 0.2])])
+    assert isinstance(versuch['Stauchung [mm]'], Messreihe)
+    daten.update([('1-Probenherstellung', dict([('Hoehe [mm]', [20.0, 20.1])]))])
+    assert type(daten['1-Probenherstellung']['Hoehe [mm]']) is list
+
+    kopie = copy.deepcopy(daten)
+    assert (type(kopie) is klasse) and (kopie == daten)
+    assert kopie['Versuch 1']['Zeit [s]'] is not versuch['Zeit [s]']
+
+    geladen = pickle.loads(pickle.dumps(daten))
+    assert (type(geladen) is Datenstruktur) and (geladen == daten)
+    assert isinstance(geladen['Versuch 1']['Zeit [s]'], Messreihe)
+
+
+def test_eingelesene_daten_als_instanz_der_vorlagenklasse():
+    from miniSoilLAB.datenstruktur import Messreihe
+    from miniSoilLAB import xlshilfen
+
+    daten = xlshilfen.LeseXLSDaten(dateiname=beispieldatei(dateiname='Triax-D-dicht_01.xlsx'),
+        verarbeitet=False)['Triax-D']
+    klasse = xlshilfen._mustervorlagen.Vorlagenklasse(schluessel='Triax-D_01')
+    assert klasse is xlshilfen._mustervorlagen.Vorlagenklasse(schluessel='Triax-D_01')
+    assert isinstance(daten, klasse)
+    for pfad in xlshilfen._mustervorlagen.Messreihenpfade(versuchsart='Triax-D'):
+        eintrag = daten
+        for schluessel in pfad:
+            eintrag = eintrag[schluessel]
+
+        assert isinstance(eintrag, Messreihe)
+
+
+@pytest.mark.parametrize('ohne_treffer', [False, True])
+@pytest.mark.parametrize('dateiname', sorted([dateiname for dateiname in os.listdir(beispielordner)
+    if dateiname.lower().endswith('.xlsx')]))
+def test_pruefen_wie_bisherige_pruefung(dateiname, ohne_treffer):
+    from miniSoilLAB import xlshilfen
+    from miniSoilLAB.vorlagen import VorlagenMuster
+
+    xlshilfen.VorlagenLaden()
+    muster = VorlagenMuster()
+    muster.vorlagen = copy.deepcopy(xlshilfen._mustervorlagen.vorlagen)
+    workbook, tabellentyp = xlshilfen._OeffneXLSDatei(dateiname=beispieldatei(dateiname))
+    if (ohne_treffer):
+        # Alle Pruefwerte der passenden Vorlagen verfaelschen, so dass die Datei abgelehnt wird
+        while (True):
+            zielvorlage, gruende = _BisherigesPruefen(muster=muster, workbook=workbook,
+                tabellentyp=tabellentyp)
+            if (zielvorlage is None):
+                break
+
+            for seite in muster.vorlagen[zielvorlage].values():
+                if ('[Checks]' in seite):
+                    for pruefzelle in seite['[Checks]']:
+                        seite['[Checks]'][pruefzelle] += ' (anders)'
+
+    referenz, gruende = _BisherigesPruefen(muster=muster, workbook=workbook, tabellentyp=tabellentyp)
+    assert (referenz is None) == ohne_treffer
+    zielvorlage, refvorlage = muster.Pruefen(workbook=workbook, tabellentyp=tabellentyp)
+    assert zielvorlage == referenz
+    assert refvorlage == muster.NameReferenzvorlage(name=referenz)
+    assert sorted(muster.pruefbericht.keys()) == muster.Schluessel()
+    tabellenseiten = xlshilfen.VorhandeneTabellenseiten(workbook=workbook, tabellentyp=tabellentyp)
+    for schluessel, grund in gruende.items():
+        fehlende_seiten = [seite for seite in muster.Checks(schluessel=schluessel).keys()
+            if (seite not in tabellenseiten)]
+        if (fehlende_seiten == []):
+            assert muster.pruefbericht[schluessel] == grund
+        else:
+            # Fehlende Tabellenseiten werden jetzt vor allen Pruefzellen erkannt
+            assert muster.pruefbericht[schluessel] == 'Tabellenseite \'' + fehlende_seiten[0] \
+                + '\' nicht vorhanden'
+
+    if (referenz is not None):
+        assert muster.pruefbericht[referenz] == ''
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+from conftest import beispieldatei, beispielordner
+
+BEISPIELDATEIEN = sorted([dateiname for dateiname in os.listdir(beispielordner)
+    if dateiname.lower().endswith('.xlsx')])
+
+
+@pytest.mark.parametrize('dateiname', BEISPIELDATEIEN)
+def test_internes_xlsxmodul_wie_openpyxl(dateiname):
+    from miniSoilLAB.xlshilfen import LeseXLSDaten
+
+    referenz = LeseXLSDaten(dateiname=beispieldatei(dateiname), verarbeitet=False, ignoriere=[])
+    intern = LeseXLSDaten(dateiname=beispieldatei(dateiname), verarbeitet=False, ignoriere=[],
+        xlsxmodul='intern')
+    assert len(referenz.keys()) == 1
+    assert intern == referenz
+
+
+def test_xlsxmodul_wird_durchgereicht(monkeypatch):
+    from miniSoilLAB import xlshilfen
+    from miniSoilLAB.dateneinlesen import BodendatenDateilisteEinlesen, DateiEinlesen
+
+    lesen = xlshilfen.LeseXLSDaten
+    aufrufe = []
+
+    def _LeseXLSDaten(dateiname, verarbeitet=True, ignoriere=['rohdaten'], xlsxmodul='openpyxl'):
+        aufrufe.append((os.path.basename(dateiname), xlsxmodul))
+        return lesen(dateiname=dateiname, verarbeitet=verarbeitet, ignoriere=ignoriere,
+            xlsxmodul=xlsxmodul)
+
+    monkeypatch.setattr(xlshilfen, 'LeseXLSDaten', _LeseXLSDaten)
+    DateiEinlesen(dateiname=beispieldatei('Korndichte_01.xlsx'))
+    DateiEinlesen(dateiname=beispieldatei('Korndichte_01.xlsx'), xlsxmodul='intern')
+    boden = BodendatenDateilisteEinlesen(bodenname='B', dateiliste=[beispieldatei('LoDi_01.xlsx'),
+        beispieldatei('Atterberg_01.xlsx')], xlsxmodul='intern')
+    assert sorted(boden['B'].keys()) == ['Atterberg', 'Basisordner', 'LoDi']
+    assert aufrufe == [('Korndichte_01.xlsx', 'openpyxl'), ('Korndichte_01.xlsx', 'intern'),
+        ('LoDi_01.xlsx', 'intern'), ('Atterberg_01.xlsx', 'intern')]
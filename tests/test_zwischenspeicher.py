@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+import copy
+import os
+import shutil
+
+import pytest
+
+from conftest import beispieldatei
+
+
+@pytest.fixture
+def zwischenspeicherpfad(tmp_path):
+    from miniSoilLAB.konstanten import Zwischenspeicher
+
+    pfad = str(tmp_path / 'zwischenspeicher')
+    Zwischenspeicher(pfad=pfad)
+    yield pfad
+    Zwischenspeicher(pfad=None)
+
+
+def _Eintragsdateien(pfad):
+    return sorted(os.listdir(pfad)) if os.path.isdir(pfad) else []
+
+
+def _Oeffnen(monkeypatch):
+    """Zaehlt, wie oft LeseXLSDaten eine Datei tatsaechlich oeffnet und parst.
+    """
+    from miniSoilLAB import xlshilfen
+
+    oeffnen = xlshilfen._OeffneXLSDatei
+    aufrufe = []
+
+    def _OeffneXLSDatei(dateiname, xlsxmodul='openpyxl'):
+        aufrufe.append(os.path.basename(dateiname))
+        return oeffnen(dateiname=dateiname, xlsxmodul=xlsxmodul)
+
+    monkeypatch.setattr(xlshilfen, '_OeffneXLSDatei', _OeffneXLSDatei)
+    return aufrufe
+
+
+def _GeaenderteVorlagen(monkeypatch, aenderung):
+    """Ersetzt die eingelesenen Vorlagen durch eine Kopie, die mit aenderung veraendert wird.
+    """
+    from miniSoilLAB import xlshilfen
+    from miniSoilLAB.vorlagen import VorlagenMuster
+
+    xlshilfen.VorlagenLaden()
+    muster = VorlagenMuster()
+    muster.vorlagen = copy.deepcopy(xlshilfen._mustervorlagen.vorlagen)
+    aenderung(muster.vorlagen)
+    monkeypatch.setattr(xlshilfen, '_mustervorlagen', muster)
+
+
+def test_eintraege_lesen_schreiben_entfernen(zwischenspeicherpfad):
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherLesen, ZwischenspeicherSchreiben
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherEntfernen
+
+    assert ZwischenspeicherLesen(schluessel=['A', 1]) is None
+    assert ZwischenspeicherSchreiben(schluessel=['A', 1], inhalt=dict([('Wert', [1.0, 2.0])]))
+    assert ZwischenspeicherSchreiben(schluessel=['A', 2], inhalt='zwei')
+    assert ZwischenspeicherLesen(schluessel=['A', 1]) == dict([('Wert', [1.0, 2.0])])
+    assert ZwischenspeicherLesen(schluessel=['A', 2]) == 'zwei'
+
+    ZwischenspeicherEntfernen(schluessel=['A', 1])
+    assert ZwischenspeicherLesen(schluessel=['A', 1]) is None
+    assert ZwischenspeicherLesen(schluessel=['A', 2]) == 'zwei'
+    ZwischenspeicherEntfernen()
+    assert _Eintragsdateien(zwischenspeicherpfad) == []
+
+
+def test_deaktivierter_zwischenspeicher():
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherLesen, ZwischenspeicherSchreiben
+
+    assert not ZwischenspeicherSchreiben(schluessel=['A'], inhalt='a')
+    assert ZwischenspeicherLesen(schluessel=['A']) is None
+
+
+def test_am_laengsten_nicht_verwendete_eintraege_werden_entfernt(zwischenspeicherpfad):
+    from miniSoilLAB.konstanten import Zwischenspeicher
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherLesen, ZwischenspeicherSchreiben
+    from miniSoilLAB.zwischenspeicher import _EintragPfad
+
+    Zwischenspeicher(pfad=zwischenspeicherpfad, max_eintraege=2)
+    for idx, schluessel in enumerate(['A', 'B']):
+        ZwischenspeicherSchreiben(schluessel=[schluessel], inhalt=schluessel)
+        # Eindeutige Reihenfolge unabhaengig von der Zeitaufloesung des Dateisystems
+        os.utime(_EintragPfad(schluessel=[schluessel]), ns=(10**9*(idx+1), 10**9*(idx+1)))
+
+    # Lesen markiert A als zuletzt verwendet, so dass B als aeltester Eintrag entfernt wird
+    assert ZwischenspeicherLesen(schluessel=['A']) == 'A'
+    ZwischenspeicherSchreiben(schluessel=['C'], inhalt='C')
+    assert len(_Eintragsdateien(zwischenspeicherpfad)) == 2
+    assert ZwischenspeicherLesen(schluessel=['B']) is None
+    assert ZwischenspeicherLesen(schluessel=['A']) == 'A'
+    assert ZwischenspeicherLesen(schluessel=['C']) == 'C'
+
+
+def test_eintraege_werden_atomar_ersetzt(zwischenspeicherpfad, monkeypatch):
+    import pickle
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherLesen, ZwischenspeicherSchreiben
+    from miniSoilLAB.zwischenspeicher import _EintragPfad
+
+    ZwischenspeicherSchreiben(schluessel=['A'], inhalt='alt')
+    eintragpfad = _EintragPfad(schluessel=['A'])
+    ersetzen = os.replace
+    beim_ersetzen = []
+
+    def _Ersetzen(quelle, ziel):
+        # Bis zum Umbenennen ist unter dem Eintragsnamen nur der vollstaendige alte Eintrag sichtbar
+        with open(ziel, 'rb') as datei:
+            beim_ersetzen.append(pickle.load(datei))
+
+        with open(quelle, 'rb') as datei:
+            beim_ersetzen.append(pickle.load(datei))
+
+        ersetzen(quelle, ziel)
+
+    monkeypatch.setattr(os, 'replace', _Ersetzen)
+    assert ZwischenspeicherSchreiben(schluessel=['A'], inhalt='neu')
+    assert beim_ersetzen == ['alt', 'neu']
+    assert ZwischenspeicherLesen(schluessel=['A']) == 'neu'
+    assert _Eintragsdateien(zwischenspeicherpfad) == [os.path.basename(eintragpfad)]
+
+    # Ein fehlgeschlagenes Schreiben laesst den vorhandenen Eintrag unveraendert
+    assert not ZwischenspeicherSchreiben(schluessel=['A'], inhalt=lambda: None)
+    assert ZwischenspeicherLesen(schluessel=['A']) == 'neu'
+    assert _Eintragsdateien(zwischenspeicherpfad) == [os.path.basename(eintragpfad)]
+
+
+def test_ungueltiger_eintrag_wird_entfernt(zwischenspeicherpfad):
+    from miniSoilLAB.zwischenspeicher import ZwischenspeicherLesen, ZwischenspeicherSchreiben
+    from miniSoilLAB.zwischenspeicher import _EintragPfad
+
+    ZwischenspeicherSchreiben(schluessel=['A'], inhalt='a')
+    with open(_EintragPfad(schluessel=['A']), 'wb') as datei:
+        datei.write(b'kein pickle')
+
+    assert ZwischenspeicherLesen(schluessel=['A']) is None
+    assert _Eintragsdateien(zwischenspeicherpfad) == []
+
+
+def test_lese_xls_daten_aus_zwischenspeicher(zwischenspeicherpfad, tmp_path, monkeypatch):
+    from miniSoilLAB.xlshilfen import LeseXLSDaten, XLSZwischenspeicherEntfernen
+
+    dateiname = str(tmp_path / 'Korndichte_01.xlsx')
+    shutil.copy(beispieldatei('Korndichte_01.xlsx'), dateiname)
+    aufrufe = _Oeffnen(monkeypatch)
+
+    eingelesen = LeseXLSDaten(dateiname=dateiname, verarbeitet=False)
+    assert len(_Eintragsdateien(zwischenspeicherpfad)) == 1
+    zwischengespeichert = LeseXLSDaten(dateiname=dateiname, verarbeitet=False)
+    assert aufrufe == ['Korndichte_01.xlsx']
+    assert zwischengespeichert == eingelesen
+    assert type(zwischengespeichert['Korndichte']) is type(eingelesen['Korndichte'])
+
+    # Verarbeitete Daten werden getrennt abgelegt
+    verarbeitet = LeseXLSDaten(dateiname=dateiname)
+    assert LeseXLSDaten(dateiname=dateiname) == verarbeitet
+    assert aufrufe == ['Korndichte_01.xlsx']*2
+    assert len(_Eintragsdateien(zwischenspeicherpfad)) == 2
+
+    XLSZwischenspeicherEntfernen(dateiname=dateiname)
+    assert _Eintragsdateien(zwischenspeicherpfad) == []
+    assert LeseXLSDaten(dateiname=dateiname, verarbeitet=False) == eingelesen
+    assert aufrufe == ['Korndichte_01.xlsx']*3
+
+
+def test_lese_xls_daten_nach_dateiaenderung(zwischenspeicherpfad, tmp_path, monkeypatch):
+    from miniSoilLAB.xlshilfen import LeseXLSDaten
+
+    dateiname = str(tmp_path / 'Korndichte_01.xlsx')
+    shutil.copy(beispieldatei('Korndichte_01.xlsx'), dateiname)
+    aufrufe = _Oeffnen(monkeypatch)
+    eingelesen = LeseXLSDaten(dateiname=dateiname, verarbeitet=False)
+
+    # Geaenderter Zeitpunkt der letzten Aenderung
+    dateistatus = os.stat(dateiname)
+    os.utime(dateiname, ns=(dateistatus.st_atime_ns, dateistatus.st_mtime_ns + 10**9))
+    assert LeseXLSDaten(dateiname=dateiname, verarbeitet=False) == eingelesen
+    assert len(aufrufe) == 2
+
+    # Anderer Dateiinhalt mit unveraendertem Zeitpunkt der letzten Aenderung
+    dateistatus = os.stat(dateiname)
+    shutil.copy(beispieldatei('LoDi_01.xlsx'), dateiname)
+    os.utime(dateiname, ns=(dateistatus.st_atime_ns, dateistatus.st_mtime_ns))
+    assert list(LeseXLSDaten(dateiname=dateiname, verarbeitet=False).keys()) == ['LoDi']
+    assert len(aufrufe) == 3
+    assert len(_Eintragsdateien(zwischenspeicherpfad)) == 1
+
+
+def test_lese_xls_daten_nach_vorlagenaenderung(zwischenspeicherpfad, tmp_path, monkeypatch):
+    from miniSoilLAB.xlshilfen import LeseXLSDaten
+
+    dateiname = str(tmp_path / 'Korndichte_01.xlsx')
+    shutil.copy(beispieldatei('Korndichte_01.xlsx'), dateiname)
+    aufrufe = _Oeffnen(monkeypatch)
+    eingelesen = LeseXLSDaten(dateiname=dateiname, verarbeitet=False)
+
+    # Geaenderte [Checks] einer anderen Vorlage veraendern die Gesamtpruefsumme der Checks
+    def _ChecksAendern(vorlagen):
+        vorlagen['Atterberg_01']['Tabelle']['[Checks]'].update([('Z99', 'Zusatz')])
+
+    _GeaenderteVorlagen(monkeypatch, aenderung=_ChecksAendern)
+    assert LeseXLSDaten(dateiname=dateiname, verarbeitet=False) == eingelesen
+    assert len(aufrufe) == 2
+    assert LeseXLSDaten(dateiname=dateiname, verarbeitet=False) == eingelesen
+    assert len(aufrufe) == 2
+
+    # Geaenderte Datenfelder der verwendeten Vorlage
+    def _VorlageAendern(vorlagen):
+        _ChecksAendern(vorlagen)
+        vorlagen['Korndichte_01']['Tabelle'].update([('Bemerkung', ['C1'])])
+
+    _GeaenderteVorlagen(monkeypatch, aenderung=_VorlageAendern)
+    neu_eingelesen = LeseXLSDaten(dateiname=dateiname, verarbeitet=False)
+    assert len(aufrufe) == 3
+    assert 'Bemerkung' in neu_eingelesen['Korndichte']
+    assert 'Bemerkung' not in eingelesen['Korndichte']
+
+    # Umbenannte Vorlage (die zwischengespeicherte Vorlage ist nicht mehr vorhanden)
+    def _VorlageUmbenennen(vorlagen):
+        vorlagen['Korndichte_02'] = vorlagen.pop('Korndichte_01')
+
+    _GeaenderteVorlagen(monkeypatch, aenderung=_VorlageUmbenennen)
+    assert LeseXLSDaten(dateiname=dateiname, verarbeitet=False) == neu_eingelesen
+    assert len(aufrufe) == 4